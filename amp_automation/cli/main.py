@@ -11,8 +11,10 @@ from typing import Iterable, Sequence
 
 from amp_automation.config import Config, load_master_config
 from amp_automation.utils import configure_logger
-from amp_automation.presentation.postprocess.cli import PostProcessorCLI
 from amp_automation.data.adapters import InputFormat
+from amp_automation.data import diff_exports, resolve_sources
+from amp_automation.data.cache import disable_data_cache
+from amp_automation.presentation.incremental import find_previous_deck
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
@@ -22,7 +24,8 @@ class ResolvedPaths:
     """Filesystem locations derived from CLI arguments and configuration."""
 
     template: Path
-    excel: Path
+    excel: Path | tuple[Path, ...]
+    output_base: Path
     output_dir: Path
     output_file: Path
     log_dir: Path
@@ -35,7 +38,14 @@ def build_parser() -> argparse.ArgumentParser:
         description="Generate AMP presentations from Excel data using the configured template.",
     )
     parser.add_argument("--config", help="Path to an alternative master_config.json file.")
-    parser.add_argument("--excel", help="Path to the input Excel workbook.")
+    parser.add_argument(
+        "--excel",
+        nargs="+",
+        help=(
+            "Input Excel workbook(s) or Parquet/CSV/Arrow export(s); directories contribute every source they "
+            "contain. Several sources are normalized in parallel and merged into one dataset."
+        ),
+    )
     parser.add_argument(
         "--template",
         help="Path to the PowerPoint template. Defaults to the configured template location.",
@@ -54,9 +64,17 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--format",
-        choices=["auto", "bulkplan", "flowplan"],
+        choices=[input_format.value for input_format in InputFormat],
         default="auto",
-        help="Input file format: 'auto' (detect), 'bulkplan' (BulkPlanData), 'flowplan' (Flowplan_Summaries). Default: auto.",
+        help=(
+            "Input file format: 'auto' (detect), 'bulkplan' (BulkPlanData), 'flowplan' (Flowplan_Summaries), "
+            "'bulkplan-columnar'/'flowplan-columnar' (the same layouts as Parquet, CSV or Arrow IPC). Default: auto."
+        ),
+    )
+    parser.add_argument(
+        "--no-data-cache",
+        action="store_true",
+        help="Always re-read the Excel workbook instead of reusing the cached normalized dataset.",
     )
     parser.add_argument(
         "--list-templates",
@@ -72,17 +90,37 @@ def build_parser() -> argparse.ArgumentParser:
         "--reconciliation-report",
         help="Optional output path (CSV) for reconciliation results. Defaults to the run directory.",
     )
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const="latest",
+        metavar="PREVIOUS_DECK",
+        help=(
+            "Copy the slides of unchanged market/brand/year combinations from a previous deck instead of "
+            "re-rendering them. Defaults to the most recent deck (with a manifest) under the output directory."
+        ),
+    )
+    parser.add_argument(
+        "--diff-against",
+        nargs="+",
+        help=(
+            "Previous export(s) to compare --excel against. Writes a JSON change set of added, removed and "
+            "modified market/brand/year/product combinations and exits without generating a deck."
+        ),
+    )
+    parser.add_argument(
+        "--delta-report",
+        help="Optional output path (JSON) for the --diff-against change set. Defaults to the run directory.",
+    )
     return parser
 
 
 def _parse_format(format_str: str) -> InputFormat:
     """Convert format string to InputFormat enum."""
-    format_map = {
-        "auto": InputFormat.AUTO,
-        "bulkplan": InputFormat.BULK_PLAN,
-        "flowplan": InputFormat.FLOWPLAN,
-    }
-    return format_map.get(format_str, InputFormat.AUTO)
+    try:
+        return InputFormat(format_str)
+    except ValueError:
+        return InputFormat.AUTO
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -96,6 +134,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     except Exception as exc:  # pragma: no cover - configuration errors are user facing
         parser.error(str(exc))
 
+    if args.no_data_cache:
+        disable_data_cache(config)
+
     template_search_dirs = _collect_template_dirs(config)
 
     if args.list_templates:
@@ -137,37 +178,27 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     # Parse input format
     format_type = _parse_format(args.format)
+    if args.diff_against:
+        return _run_export_delta(args, paths, config, logger, format_type)
+
     logger.info("Starting presentation build")
     logger.info("Input format: %s", format_type.value)
     logger.debug("Excel path: %s", paths.excel)
     logger.debug("Template path: %s", paths.template)
     logger.debug("Output file: %s", paths.output_file)
 
+    previous_deck = _resolve_previous_deck(args.incremental, paths, logger)
+
     success = presentation_assembly.build_presentation(
         template_path=str(paths.template),
-        excel_path=str(paths.excel),
+        excel_path=str(paths.excel) if isinstance(paths.excel, Path) else paths.excel,
         output_path=str(paths.output_file),
         format_type=format_type,
+        previous_deck=previous_deck,
     )
 
     if success:
         logger.info("Presentation generated successfully: %s", paths.output_file)
-
-        # AUTOMATIC POST-PROCESSING: Run complete workflow on generated deck
-        # This applies cell merging, font normalization, and styling
-        logger.info("Running automatic post-processing...")
-        try:
-            postprocessor = PostProcessorCLI(paths.output_file, slide_filter=None)
-            exit_code = postprocessor.process(PostProcessorCLI.POSTPROCESS_ALL_WORKFLOW)
-
-            if exit_code == 0:
-                logger.info("Post-processing completed successfully")
-            else:
-                logger.warning("Post-processing completed with warnings/errors")
-        except Exception as e:
-            logger.error(f"Post-processing failed: {e}")
-            logger.warning("Presentation generated but post-processing incomplete")
-
         print(paths.output_file)
         _run_reconciliation_if_requested(args, paths, config, logger)
         return 0
@@ -204,14 +235,15 @@ def _resolve_paths(
     """Resolve all filesystem paths needed for a single CLI invocation."""
 
     template_path = _resolve_template(args.template, config, template_dirs)
-    excel_path = _resolve_existing_file("Excel", args.excel)
+    excel_path = _resolve_sources(args.excel)
 
-    output_dir, output_file = _resolve_output_locations(args, config)
+    output_base, output_dir, output_file = _resolve_output_locations(args, config)
     log_dir = _resolve_log_directory(args, config, output_dir)
 
     return ResolvedPaths(
         template=template_path,
         excel=excel_path,
+        output_base=output_base,
         output_dir=output_dir,
         output_file=output_file,
         log_dir=log_dir,
@@ -247,8 +279,8 @@ def _resolve_template(
 def _resolve_output_locations(
     args: argparse.Namespace,
     config: Config,
-) -> tuple[Path, Path]:
-    """Determine the run directory and presentation output file path."""
+) -> tuple[Path, Path, Path]:
+    """Determine the output base, run directory and presentation output file path."""
 
     paths_section = config.section("paths")
     output_section = paths_section.get("output", {})
@@ -294,7 +326,24 @@ def _resolve_output_locations(
     if output_path.suffix.lower() != ".pptx":
         output_path = output_path.with_suffix(".pptx")
 
-    return run_dir.resolve(), output_path.resolve()
+    return base.resolve(), run_dir.resolve(), output_path.resolve()
+
+
+def _resolve_previous_deck(raw_value: str | None, paths: ResolvedPaths, logger) -> Path | None:
+    """Deck an ``--incremental`` run reuses slides from (None for a full run)."""
+
+    if not raw_value:
+        return None
+    if raw_value == "latest":
+        previous = find_previous_deck(paths.output_base, exclude=paths.output_file)
+        if previous is None:
+            logger.info("No previous deck with a manifest under %s; rendering every slide", paths.output_base)
+        return previous
+
+    previous = Path(raw_value).expanduser()
+    if not previous.is_absolute():
+        previous = PROJECT_ROOT / previous
+    return previous.resolve()
 
 
 def _resolve_log_directory(
@@ -334,6 +383,22 @@ def _resolve_existing_file(label: str, raw_path: str) -> Path:
     raise FileNotFoundError(f"{label} file not found: {candidate}")
 
 
+def _resolve_sources(raw_paths: Sequence[str]) -> Path | tuple[Path, ...]:
+    """Resolve ``--excel`` values (files or directories) into one source or a tuple of sources."""
+
+    candidates: list[Path] = []
+    for raw_path in raw_paths:
+        candidate = Path(raw_path).expanduser()
+        if not candidate.is_absolute():
+            candidate = PROJECT_ROOT / candidate
+        if not candidate.exists():
+            raise FileNotFoundError(f"Excel file not found: {candidate}")
+        candidates.append(candidate.resolve())
+
+    sources = resolve_sources(candidates)
+    return sources[0] if len(sources) == 1 else sources
+
+
 def _collect_template_dirs(config: Config) -> list[Path]:
     """Collect template search directories based on configuration defaults."""
 
@@ -374,6 +439,44 @@ def _to_absolute_path(path_like: str | Path) -> Path:
     return path.resolve()
 
 
+def _run_export_delta(
+    args: argparse.Namespace,
+    paths: ResolvedPaths,
+    config: Config,
+    logger,
+    format_type: InputFormat,
+) -> int:
+    """Write the change set between ``--diff-against`` and ``--excel``; returns the exit code."""
+
+    try:
+        previous = _resolve_sources(args.diff_against)
+    except FileNotFoundError as exc:
+        logger.error("%s", exc)
+        return 1
+
+    report_path = Path(args.delta_report) if args.delta_report else paths.output_dir / "export_delta.json"
+    if not report_path.is_absolute():
+        report_path = paths.output_dir / report_path
+
+    try:
+        delta = diff_exports(previous, paths.excel, config, logger, format_type=format_type)
+    except Exception as exc:
+        logger.error("Export delta failed: %s", exc)
+        return 1
+
+    delta.write_json(report_path)
+    if delta.has_changes:
+        logger.info(
+            "%s market/brand/year combination(s) changed; change set written to %s",
+            len(delta.touched_combinations()),
+            report_path,
+        )
+    else:
+        logger.info("No combinations changed since the previous export; change set written to %s", report_path)
+    print(report_path)
+    return 0
+
+
 def _run_reconciliation_if_requested(
     args: argparse.Namespace,
     paths: ResolvedPaths,
@@ -1,5 +1,40 @@
 """Data loading and preparation utilities."""
 
-from .ingestion import DataSet, get_month_specific_tv_metrics, load_and_prepare_data
+from .ingestion import (
+    DataSet,
+    SourceSummary,
+    TvMetricsBuilder,
+    TvMetricsIndex,
+    get_month_specific_tv_metrics,
+    get_tv_metrics_index,
+    load_and_prepare_data,
+    prime_tv_metrics_index,
+    resolve_sources,
+)
+from .cube import AggregateCube, CubeCell, aggregate_cube_for
+from .delta import ExportDelta, PartitionChange, diff_datasets, diff_exports
+from .partitions import PartitionIndex, partition_index_for
+from .workbook_probe import WorkbookProbe, probe_workbook
 
-__all__ = ["load_and_prepare_data", "DataSet", "get_month_specific_tv_metrics"]
+__all__ = [
+    "load_and_prepare_data",
+    "DataSet",
+    "SourceSummary",
+    "resolve_sources",
+    "TvMetricsBuilder",
+    "TvMetricsIndex",
+    "get_month_specific_tv_metrics",
+    "get_tv_metrics_index",
+    "prime_tv_metrics_index",
+    "AggregateCube",
+    "CubeCell",
+    "aggregate_cube_for",
+    "ExportDelta",
+    "PartitionChange",
+    "diff_datasets",
+    "diff_exports",
+    "PartitionIndex",
+    "partition_index_for",
+    "WorkbookProbe",
+    "probe_workbook",
+]
@@ -7,21 +7,29 @@ This module implements the Adapter pattern to normalize different input formats
 from __future__ import annotations
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 import numpy as np
 import pandas as pd
 
+from amp_automation.data.columnar import columnar_kind, iter_table_chunks, read_header, read_table
+from amp_automation.data.sheet_reader import ReaderOptions, iter_sheet_chunks, read_sheet
+from amp_automation.data.workbook_probe import probe_workbook
+
 
 class InputFormat(Enum):
     """Supported input format types."""
 
     BULK_PLAN = "bulkplan"
     FLOWPLAN = "flowplan"
+    # Same layouts exported as Parquet, CSV or Arrow IPC (container from the suffix)
+    BULK_PLAN_COLUMNAR = "bulkplan-columnar"
+    FLOWPLAN_COLUMNAR = "flowplan-columnar"
     AUTO = "auto"
 
 
@@ -52,13 +60,187 @@ OUTPUT_SCHEMA = [
     "Total Cost", "GRP", "Frequency", "Reach 1+", "Reach 3+", "Flight Comments",
 ]
 
+# Text dimensions every consumer filters/groups on; emitted stripped
+DIMENSION_COLUMNS = [
+    "Country", "Brand", "Product", "Media Type", "Campaign Name",
+    "Campaign Type", "Funnel Stage",
+]
+
+
+def _terminal_segment(values: pd.Series, separator: str = " | ") -> pd.Series:
+    """Return the last stripped segment of (non-null) hierarchical values."""
+    return values.astype(str).str.rpartition(separator)[2].str.strip()
+
+
+def _strip_text(values: pd.Series) -> pd.Series:
+    """Strip surrounding whitespace from string values, leaving other values untouched."""
+    replacements = {
+        value: value.strip()
+        for value in values.dropna().unique()
+        if isinstance(value, str) and value != value.strip()
+    }
+    return values.replace(replacements) if replacements else values
+
+
+def _normalize_month(months: pd.Series) -> pd.Series:
+    """Map month aliases (``Sept``, ``SEP`` ...) to the canonical abbreviations."""
+    return months.map(lambda month: MONTH_ALIAS_MAP.get(month, month))
+
+
+# TV metrics carried through aggregation (GRP summed, the rest averaged)
+TV_METRICS = ("GRP", "Frequency", "Reach 1+", "Reach 3+")
+
+_FIRST_VALUE_COLUMNS = ("_campaign_type", "_funnel_stage")
+
+
+def _partial_groups(
+    df: pd.DataFrame,
+    group_cols: list[str],
+    *,
+    cost_column: str,
+    metric_columns: dict[str, str],
+    campaign_type_column: str,
+    funnel_stage_column: str,
+) -> pd.DataFrame:
+    """Aggregate raw rows per ``group_cols`` into foldable partial aggregates.
+
+    Returns one row per group (index = group keys, null keys dropped) with
+    the summed cost, the first non-null ``Campaign Type``/``Funnel Stage`` and,
+    for each TV metric named by ``metric_columns`` that exists in ``df``, its
+    sum plus (except for ``GRP``) its non-null count. Partials of consecutive
+    row batches combine with :func:`_fold_groups`; :func:`_finalize_groups`
+    turns them into metrics.
+    """
+    aggregations = {
+        "_total_cost": (cost_column, "sum"),
+        "_campaign_type": (campaign_type_column, "first"),
+        "_funnel_stage": (funnel_stage_column, "first"),
+    }
+    for metric, source in metric_columns.items():
+        if source in df.columns:
+            aggregations[f"_{metric}_sum"] = (source, "sum")
+            if metric != "GRP":
+                aggregations[f"_{metric}_count"] = (source, "count")
+
+    return df.groupby(group_cols, sort=False).agg(**aggregations)
+
+
+def _fold_groups(partials: list[pd.DataFrame]) -> pd.DataFrame:
+    """Combine partial aggregates of consecutive row batches (in row order)."""
+    if len(partials) == 1:
+        return partials[0]
+    combined = pd.concat(partials)
+    how = {column: "first" if column in _FIRST_VALUE_COLUMNS else "sum" for column in combined.columns}
+    return combined.groupby(level=list(range(combined.index.nlevels)), sort=False).agg(how)
+
+
+def _finalize_groups(partial: pd.DataFrame) -> pd.DataFrame:
+    """Turn partial aggregates into one sorted row per group.
+
+    Columns are the group keys plus ``Total Cost``, ``Campaign Type``,
+    ``Funnel Stage`` and the TV metrics (``GRP`` summed and NaN when not
+    positive, the others averaged, NaN when the source is absent).
+    """
+    grouped = partial.sort_index().reset_index()
+
+    grouped["Total Cost"] = grouped.pop("_total_cost")
+    grouped["Campaign Type"] = grouped.pop("_campaign_type").fillna("")
+    grouped["Funnel Stage"] = grouped.pop("_funnel_stage").fillna("")
+    for metric in TV_METRICS:
+        total = grouped.pop(f"_{metric}_sum") if f"_{metric}_sum" in grouped.columns else np.nan
+        if metric != "GRP" and f"_{metric}_count" in grouped.columns:
+            total = total / grouped.pop(f"_{metric}_count")
+        grouped[metric] = total
+    grouped["GRP"] = grouped["GRP"].where(grouped["GRP"] > 0)
+    return grouped
+
+
+def _monthly_frame(
+    grouped: pd.DataFrame,
+    *,
+    country: pd.Series,
+    brand: pd.Series,
+    product: pd.Series,
+    media_type: pd.Series,
+    campaign: pd.Series,
+    year: pd.Series,
+    month: pd.Series,
+) -> pd.DataFrame:
+    """Assemble the monthly aggregate frame, dropping rows without country/brand/campaign."""
+    agg_df = pd.DataFrame({
+        "Country": country,
+        "Brand": brand,
+        "Product": product,
+        "Media Type": media_type,
+        "Campaign Name": campaign,
+        "Campaign Type": grouped["Campaign Type"],
+        "Funnel Stage": grouped["Funnel Stage"],
+        "Year": year,
+        "Month": _normalize_month(month),
+        "Total Cost": grouped["Total Cost"],
+        "GRP": grouped["GRP"],
+        "Frequency": grouped["Frequency"],
+        "Reach 1+": grouped["Reach 1+"],
+        "Reach 3+": grouped["Reach 3+"],
+    })
+
+    keep = agg_df["Country"].map(bool) & agg_df["Brand"].map(bool) & agg_df["Campaign Name"].map(bool)
+    agg_df = agg_df[keep].reset_index(drop=True)
+    return agg_df if not agg_df.empty else pd.DataFrame()
+
+
+def _pivot_months(agg_df: pd.DataFrame, group_cols: list[str]) -> pd.DataFrame:
+    """Collapse monthly rows into one row per group with a column per month.
+
+    Rows whose month is not in ``MONTHS_ORDER`` keep their group alive but do
+    not contribute to costs or metrics. Monthly costs are summed, GRPs summed
+    (NaN when not positive) and reach/frequency averaged across months.
+    """
+    groups = agg_df.groupby(group_cols).size().index
+    valid = agg_df[agg_df["Month"].isin(MONTHS_ORDER)]
+    by_group = valid.groupby(group_cols)
+
+    monthly = valid.pivot_table(
+        index=group_cols, columns="Month", values="Total Cost", aggfunc="sum", fill_value=0,
+    ).reindex(groups, fill_value=0)
+
+    result = pd.DataFrame(index=groups)
+    for month in MONTHS_ORDER:
+        result[month] = monthly[month] if month in monthly.columns else 0
+
+    result["Total Cost"] = by_group["Total Cost"].sum().reindex(groups, fill_value=0)
+    total_grp = by_group["GRP"].sum().reindex(groups, fill_value=0)
+    result["GRP"] = total_grp.where(total_grp > 0)
+    for metric in ("Frequency", "Reach 1+", "Reach 3+"):
+        result[metric] = by_group[metric].mean().reindex(groups).astype(float)
+
+    return result.reset_index()
+
 
 class InputAdapter(ABC):
     """Base class for input format adapters."""
 
-    def __init__(self, excel_path: Path, logger: Optional[logging.Logger] = None):
+    # Bump whenever the adapter's transform rules change; keys the dataset cache
+    RULES_VERSION = 2
+
+    # Worksheet holding the source rows and the columns the adapter consumes
+    SOURCE_SHEET: str = ""
+    SOURCE_COLUMNS: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        excel_path: Path,
+        logger: Optional[logging.Logger] = None,
+        *,
+        reader: Optional[ReaderOptions] = None,
+    ):
         self.excel_path = excel_path
         self.logger = logger or logging.getLogger("amp_automation.data.adapters")
+        self.reader = reader or ReaderOptions()
+        # Cleaned source rows (before aggregation), populated by load_raw_frame()
+        self.raw_frame: Optional[pd.DataFrame] = None
+        # Seconds spent in each pipeline step of the last normalize() run
+        self.step_timings: dict[str, float] = {}
 
     @abstractmethod
     def normalize(self) -> pd.DataFrame:
@@ -82,6 +264,113 @@ class InputAdapter(ABC):
         """
         pass
 
+    def normalize_chunked(
+        self,
+        chunk_size: int,
+        *,
+        on_chunk: Optional[Callable[[pd.DataFrame], None]] = None,
+    ) -> pd.DataFrame:
+        """Transform the input like :meth:`normalize` in bounded memory.
+
+        The source sheet is streamed in batches of ``chunk_size`` rows; each
+        batch is cleaned, handed to ``on_chunk`` (e.g. to fold side indexes)
+        and folded into running per-group monthly aggregates. Only one batch
+        and the aggregates are held at a time, so peak memory follows the
+        chunk size and the output size rather than the input size.
+        """
+        self.logger.info("Loading %s in chunks of %s rows", self.excel_path, chunk_size)
+        partial: Optional[pd.DataFrame] = None
+        rows = 0
+        for chunk in self._iter_source_chunks(chunk_size):
+            rows += len(chunk)
+            cleaned = self._clean_rows(chunk, quiet=True)
+            if on_chunk is not None:
+                on_chunk(cleaned)
+            batch = self._partial_monthly(cleaned)
+            partial = batch if partial is None else _fold_groups([partial, batch])
+        if partial is None:
+            raise ValueError("No data found after processing")
+        self.logger.info("Folded %s source rows into %s monthly groups", rows, len(partial))
+
+        agg_df = self._timed_step(self._monthly_from_partial, partial)
+        return self._finalize(agg_df)
+
+    @abstractmethod
+    def _clean_rows(self, df: pd.DataFrame, *, quiet: bool = False) -> pd.DataFrame:
+        """Apply the row-level cleaning steps to source rows."""
+
+    @abstractmethod
+    def _partial_monthly(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Foldable monthly partial aggregates (see ``_partial_groups``) of cleaned rows."""
+
+    @abstractmethod
+    def _monthly_from_partial(self, partial: pd.DataFrame) -> pd.DataFrame:
+        """Monthly aggregate frame from (folded) partial aggregates."""
+
+    @abstractmethod
+    def _finalize(self, agg_df: pd.DataFrame) -> pd.DataFrame:
+        """Pivot the monthly aggregates into the output schema."""
+
+    def _aggregate_to_monthly(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate raw data to monthly level."""
+        return self._monthly_from_partial(self._partial_monthly(df))
+
+    def _source_columns(self) -> Optional[tuple[str, ...]]:
+        return self.SOURCE_COLUMNS if self.reader.project_columns else None
+
+    def _read_source(self) -> pd.DataFrame:
+        """Read ``SOURCE_SHEET``, projected onto ``SOURCE_COLUMNS`` unless disabled."""
+        return read_sheet(
+            self.excel_path, self.SOURCE_SHEET, self._source_columns(), engine=self.reader.engine, logger=self.logger
+        )
+
+    def _iter_source_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Stream ``SOURCE_SHEET`` in frames of at most ``chunk_size`` rows."""
+        return iter_sheet_chunks(
+            self.excel_path,
+            self.SOURCE_SHEET,
+            self._source_columns(),
+            chunk_size=chunk_size,
+            engine=self.reader.engine,
+            logger=self.logger,
+        )
+
+    def _run_steps(
+        self,
+        steps: tuple[Callable[[pd.DataFrame], pd.DataFrame], ...],
+        df: pd.DataFrame,
+        *,
+        quiet: bool = False,
+    ) -> pd.DataFrame:
+        for step in steps:
+            df = self._timed_step(step, df, quiet=quiet)
+        return df
+
+    def _timed_step(
+        self,
+        step: Callable[[pd.DataFrame], pd.DataFrame],
+        df: pd.DataFrame,
+        *,
+        quiet: bool = False,
+    ) -> pd.DataFrame:
+        """Run one pipeline step, logging its duration and row counts.
+
+        ``quiet`` steps (per-chunk runs) accumulate their timings and log at
+        debug level instead.
+        """
+        name = step.__name__.lstrip("_")
+        rows_in = len(df)
+        started = time.perf_counter()
+        result = step(df)
+        elapsed = time.perf_counter() - started
+        if quiet:
+            self.step_timings[name] = self.step_timings.get(name, 0.0) + elapsed
+            self.logger.debug("Step %s took %.3fs (%s -> %s rows)", name, elapsed, rows_in, len(result))
+        else:
+            self.step_timings[name] = elapsed
+            self.logger.info("Step %s took %.3fs (%s -> %s rows)", name, elapsed, rows_in, len(result))
+        return result
+
     def _ensure_output_schema(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ensure DataFrame has all expected columns in correct order."""
         for column in OUTPUT_SCHEMA:
@@ -92,7 +381,10 @@ class InputAdapter(ABC):
                     df[column] = 0
                 else:
                     df[column] = ""
-        return df[OUTPUT_SCHEMA]
+        df = df[OUTPUT_SCHEMA].copy()
+        for column in DIMENSION_COLUMNS:
+            df[column] = _strip_text(df[column])
+        return df
 
 
 class BulkPlanAdapter(InputAdapter):
@@ -113,6 +405,17 @@ class BulkPlanAdapter(InputAdapter):
         "| MOR": "| Maghreb",
     }
 
+    SOURCE_SHEET = "Flight"
+    SOURCE_COLUMNS = (
+        "Plan Name", "Plan - Geography", "Plan - Year", "Plan - Brand", "Media Type",
+        "**Product Business", "**Campaign Name(s)", "**Campaign Type", "**Funnel Stage",
+        "*Cost to Client", "National GRP", "Frequency", "Reach 1+", "Reach 3+",
+        "Month", "**Flight Start Date", "Flight Comments",
+    )
+
+    # Set by the first _ensure_month_column call: Month comes from the flight start date
+    _month_from_flight_date: Optional[bool] = None
+
     # Product rename mapping
     PRODUCT_RENAMES = {
         "Panadol": "Panadol Product",
@@ -123,39 +426,65 @@ class BulkPlanAdapter(InputAdapter):
     def can_handle(cls, excel_path: Path) -> bool:
         """Check if file has 'Flight' sheet characteristic of BulkPlanData."""
         try:
-            xlsx = pd.ExcelFile(excel_path)
-            return "Flight" in xlsx.sheet_names
+            return probe_workbook(excel_path).has_sheet("Flight")
         except Exception:
             return False
 
     def normalize(self) -> pd.DataFrame:
         """Transform BulkPlanData format into common schema."""
-        self.logger.info("Loading BulkPlanData from %s", self.excel_path)
-
-        raw_df = pd.read_excel(self.excel_path, sheet_name="Flight", header=0)
-        self.logger.info("Loaded %s rows from BulkPlanData", len(raw_df))
-
-        # Extract/create Month column
-        raw_df = self._ensure_month_column(raw_df)
-
-        # Apply data cleaning transformations
-        raw_df = self._exclude_expert_campaigns(raw_df)
-        raw_df = self._normalize_geography(raw_df)
-        raw_df = self._split_panadol_brand(raw_df)
-        raw_df = self._exclude_gne_pan_asian(raw_df)
+        raw_df = self.load_raw_frame()
 
         # Aggregate to monthly level
-        agg_df = self._aggregate_to_monthly(raw_df)
+        agg_df = self._timed_step(self._aggregate_to_monthly, raw_df)
 
+        return self._finalize(agg_df)
+
+    def _finalize(self, agg_df: pd.DataFrame) -> pd.DataFrame:
         # Pivot to final row-per-campaign format
-        result_df = self._pivot_to_final_format(agg_df)
+        result_df = self._timed_step(self._pivot_to_final_format, agg_df)
 
         return self._ensure_output_schema(result_df)
 
+    def load_raw_frame(self) -> pd.DataFrame:
+        """Read the Flight sheet once and apply the row-level cleaning rules.
+
+        The cleaned frame feeds both the monthly aggregation and the TV metrics
+        index, so the sheet is parsed a single time per adapter.
+        """
+        if self.raw_frame is not None:
+            return self.raw_frame
+
+        self.logger.info("Loading BulkPlanData from %s", self.excel_path)
+
+        raw_df = self._read_source()
+        self.logger.info("Loaded %s rows from BulkPlanData", len(raw_df))
+
+        raw_df = self._clean_rows(raw_df)
+
+        self.raw_frame = raw_df
+        return raw_df
+
+    def _clean_rows(self, df: pd.DataFrame, *, quiet: bool = False) -> pd.DataFrame:
+        # Extract/create Month column, then apply data cleaning transformations
+        steps = (
+            self._ensure_month_column,
+            self._exclude_expert_campaigns,
+            self._normalize_geography,
+            self._split_panadol_brand,
+            self._exclude_gne_pan_asian,
+        )
+        return self._run_steps(steps, df, quiet=quiet)
+
     def _ensure_month_column(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Ensure Month column exists, extracting from flight date if needed."""
-        month_column = df.get("Month")
-        if month_column is None or month_column.isna().all():
+        """Ensure Month column exists, extracting from flight date if needed.
+
+        Whether to extract is decided on the first rows cleaned (the whole
+        sheet, or its first chunk) and kept for the rest of the workbook.
+        """
+        if self._month_from_flight_date is None:
+            month_column = df.get("Month")
+            self._month_from_flight_date = month_column is None or bool(month_column.isna().all())
+        if self._month_from_flight_date:
             flight_col = "**Flight Start Date"
             if flight_col in df.columns:
                 self.logger.info("Extracting Month from %s", flight_col)
@@ -176,27 +505,28 @@ class BulkPlanAdapter(InputAdapter):
         return df
 
     def _normalize_geography(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply geography normalization rules."""
+        """Apply geography normalization rules once per distinct geography value."""
         if "Plan - Geography" not in df.columns:
             return df
 
-        def normalize(geo_value):
-            if pd.isna(geo_value):
-                return geo_value
-            geo_str = str(geo_value)
-            for pattern, replacement in self.GEOGRAPHY_NORMALIZATIONS.items():
-                if pattern in geo_str:
-                    if pattern.startswith("|"):
-                        if geo_str.endswith(pattern):
-                            geo_str = geo_str.replace(pattern, replacement)
-                    else:
-                        geo_str = geo_str.replace(pattern, replacement)
-            return geo_str
-
-        df["Plan - Geography"] = df["Plan - Geography"].apply(normalize)
-        self.logger.info("Applied geography normalization")
+        geographies = df["Plan - Geography"]
+        rewrites = {value: self._normalize_geography_value(value) for value in geographies.dropna().unique()}
+        df["Plan - Geography"] = geographies.map(rewrites)
+        self.logger.info("Applied geography normalization (%s distinct values)", len(rewrites))
         return df
 
+    def _normalize_geography_value(self, geo_value) -> str:
+        """Apply GEOGRAPHY_NORMALIZATIONS to a single geography string."""
+        geo_str = str(geo_value)
+        for pattern, replacement in self.GEOGRAPHY_NORMALIZATIONS.items():
+            if pattern in geo_str:
+                if pattern.startswith("|"):
+                    if geo_str.endswith(pattern):
+                        geo_str = geo_str.replace(pattern, replacement)
+                else:
+                    geo_str = geo_str.replace(pattern, replacement)
+        return geo_str
+
     def _split_panadol_brand(self, df: pd.DataFrame) -> pd.DataFrame:
         """Split Panadol brand based on Product Business (Pain vs Cold)."""
         if "Plan - Brand" not in df.columns or "**Product Business" not in df.columns:
@@ -221,89 +551,58 @@ class BulkPlanAdapter(InputAdapter):
 
     def _exclude_gne_pan_asian(self, df: pd.DataFrame) -> pd.DataFrame:
         """Exclude GNE Pan Asian TV rows."""
-        def should_exclude(row):
-            geography = str(row.get("Plan - Geography", ""))
-            media_type = row.get("Media Type")
-            comments = str(row.get("Flight Comments", "")).strip()
-            return "GNE" in geography and media_type == "Television" and "Pan Asian TV" in comments
+        required = ("Plan - Geography", "Media Type", "Flight Comments")
+        if any(column not in df.columns for column in required):
+            self.logger.info("Filtered 0 GNE Pan Asian TV rows")
+            return df
 
-        initial_count = len(df)
-        df = df[~df.apply(should_exclude, axis=1)]
-        self.logger.info("Filtered %s GNE Pan Asian TV rows", initial_count - len(df))
+        exclude = (
+            df["Plan - Geography"].astype(str).str.contains("GNE", regex=False, na=False)
+            & (df["Media Type"] == "Television")
+            & df["Flight Comments"].astype(str).str.contains("Pan Asian TV", regex=False, na=False)
+        )
+        df = df[~exclude]
+        self.logger.info("Filtered %s GNE Pan Asian TV rows", int(exclude.sum()))
         return df
 
-    def _extract_country(self, geo_value) -> Optional[str]:
-        """Extract terminal country from hierarchical geography."""
-        if geo_value is None or pd.isna(geo_value):
-            return None
-        parts = str(geo_value).split(" | ")
-        return parts[-1].strip()
-
-    def _clean_brand(self, brand_value) -> str:
-        """Extract terminal brand from hierarchical value."""
-        if brand_value is None or pd.isna(brand_value):
-            return ""
-        brand = str(brand_value)
-        if " | " in brand:
-            return brand.split(" | ")[-1].strip()
-        return brand.strip()
-
-    def _extract_product(self, product_business) -> str:
-        """Extract product name from Product Business hierarchy."""
-        if product_business is None or pd.isna(product_business):
-            return ""
-        parts = str(product_business).split(" | ")
-        product = parts[-1].strip() if parts else ""
-        return self.PRODUCT_RENAMES.get(product, product)
+    def _extract_country(self, geo_values: pd.Series) -> pd.Series:
+        """Extract terminal country from hierarchical geography values."""
+        return _terminal_segment(geo_values)
 
-    def _aggregate_to_monthly(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Aggregate raw data to monthly level."""
+    def _clean_brand(self, brand_values: pd.Series) -> pd.Series:
+        """Extract terminal brand from hierarchical values."""
+        return _terminal_segment(brand_values)
+
+    def _extract_product(self, product_business: pd.Series) -> pd.Series:
+        """Extract product name from Product Business hierarchy values."""
+        return _terminal_segment(product_business).replace(self.PRODUCT_RENAMES)
+
+    def _partial_monthly(self, df: pd.DataFrame) -> pd.DataFrame:
         group_cols = [
             "Plan - Geography", "Plan - Brand", "**Campaign Name(s)",
             "Plan - Year", "Month", "Media Type", "**Product Business",
         ]
+        return _partial_groups(
+            df,
+            group_cols,
+            cost_column="*Cost to Client",
+            metric_columns={"GRP": "National GRP", "Frequency": "Frequency", "Reach 1+": "Reach 1+", "Reach 3+": "Reach 3+"},
+            campaign_type_column="**Campaign Type",
+            funnel_stage_column="**Funnel Stage",
+        )
 
-        processed_data = []
-        for name, group in df.groupby(group_cols):
-            geo_raw, brand_raw, campaign, year, month_raw, media_type, product_business = name
-
-            country = self._extract_country(geo_raw)
-            brand = self._clean_brand(brand_raw)
-            month = MONTH_ALIAS_MAP.get(month_raw, month_raw)
-            product = self._extract_product(product_business)
-
-            if not country or not brand or not campaign:
-                continue
-
-            total_cost = group["*Cost to Client"].sum()
-
-            # TV metrics
-            grp_sum = group["National GRP"].dropna().sum() if "National GRP" in group.columns else np.nan
-            freq_avg = group["Frequency"].dropna().mean() if "Frequency" in group.columns else np.nan
-            reach1_avg = group["Reach 1+"].dropna().mean() if "Reach 1+" in group.columns else np.nan
-            reach3_avg = group["Reach 3+"].dropna().mean() if "Reach 3+" in group.columns else np.nan
-
-            campaign_type = group["**Campaign Type"].dropna().iloc[0] if not group["**Campaign Type"].dropna().empty else ""
-            funnel_stage = group["**Funnel Stage"].dropna().iloc[0] if not group["**Funnel Stage"].dropna().empty else ""
-
-            processed_data.append({
-                "Country": country,
-                "Brand": brand,
-                "Product": product,
-                "Media Type": media_type,
-                "Campaign Name": campaign,
-                "Campaign Type": campaign_type,
-                "Funnel Stage": funnel_stage,
-                "Year": year,
-                "Month": month,
-                "Total Cost": total_cost if pd.notna(total_cost) else 0,
-                "GRP": grp_sum if grp_sum > 0 else np.nan,
-                "Frequency": freq_avg,
-                "Reach 1+": reach1_avg,
-                "Reach 3+": reach3_avg,
-            })
-
-        agg_df = pd.DataFrame(processed_data)
+    def _monthly_from_partial(self, partial: pd.DataFrame) -> pd.DataFrame:
+        grouped = _finalize_groups(partial)
+        agg_df = _monthly_frame(
+            grouped,
+            country=self._extract_country(grouped["Plan - Geography"]),
+            brand=self._clean_brand(grouped["Plan - Brand"]),
+            product=self._extract_product(grouped["**Product Business"]),
+            media_type=grouped["Media Type"],
+            campaign=grouped["**Campaign Name(s)"],
+            year=grouped["Plan - Year"],
+            month=grouped["Month"],
+        )
         self.logger.info("Created %s monthly aggregated rows", len(agg_df))
         return agg_df
 
@@ -316,53 +615,9 @@ class BulkPlanAdapter(InputAdapter):
             "Country", "Brand", "Product", "Media Type",
             "Campaign Name", "Campaign Type", "Funnel Stage", "Year",
         ]
+        result_df = _pivot_months(agg_df, final_group_cols)
+        result_df["Flight Comments"] = ""
 
-        result_rows = []
-        for name, group in agg_df.groupby(final_group_cols):
-            country, brand, product, media_type, campaign, campaign_type, funnel_stage, year = name
-
-            row = {
-                "Country": country, "Brand": brand, "Product": product,
-                "Media Type": media_type, "Campaign Name": campaign,
-                "Campaign Type": campaign_type, "Funnel Stage": funnel_stage,
-                "Year": year,
-            }
-
-            # Initialize all months to 0
-            for month in MONTHS_ORDER:
-                row[month] = 0
-
-            total_cost = 0
-            total_grp = 0
-            freq_values, reach1_values, reach3_values = [], [], []
-
-            for _, month_row in group.iterrows():
-                month = month_row["Month"]
-                if month in MONTHS_ORDER:
-                    # BUG FIX: Accumulate monthly values instead of overwriting
-                    # This ensures monthly columns match Total Cost when same month appears multiple times
-                    row[month] += month_row["Total Cost"]
-                    total_cost += month_row["Total Cost"]
-
-                    if pd.notna(month_row["GRP"]):
-                        total_grp += month_row["GRP"]
-                    if pd.notna(month_row["Frequency"]):
-                        freq_values.append(month_row["Frequency"])
-                    if pd.notna(month_row["Reach 1+"]):
-                        reach1_values.append(month_row["Reach 1+"])
-                    if pd.notna(month_row["Reach 3+"]):
-                        reach3_values.append(month_row["Reach 3+"])
-
-            row["Total Cost"] = total_cost
-            row["GRP"] = total_grp if total_grp > 0 else np.nan
-            row["Frequency"] = float(np.mean(freq_values)) if freq_values else np.nan
-            row["Reach 1+"] = float(np.mean(reach1_values)) if reach1_values else np.nan
-            row["Reach 3+"] = float(np.mean(reach3_values)) if reach3_values else np.nan
-            row["Flight Comments"] = ""
-
-            result_rows.append(row)
-
-        result_df = pd.DataFrame(result_rows)
         self.logger.info("Final BulkPlan dataset: %s rows", len(result_df))
         return result_df
 
@@ -406,17 +661,24 @@ class FlowplanAdapter(InputAdapter):
     # Brands to filter out (Expert/placeholder brands with -X suffix)
     BRAND_FILTER_PATTERN = r'\([A-Z]+-X\)$'  # Matches (OH-X), (RH-X), (PM-X), (W-X), etc.
 
+    SOURCE_SHEET = "Sheet1"
+    SOURCE_COLUMNS = (
+        "Expert", "Brand", "Country.1", "Campaign Name(s)", "Year", "Month", "Media Type",
+        "Product", "Campaign Type", "Funnel Stage", "Cost to Client (GBP) [Current]",
+        "National GRP [Current]", "Frequency [Current]", "Reach 1+ [Current]", "Reach 3+ [Current]",
+    )
+
     @classmethod
     def can_handle(cls, excel_path: Path) -> bool:
         """Check if file has Flowplan characteristics (Country.1 and [Current] columns)."""
         try:
-            xlsx = pd.ExcelFile(excel_path)
-            if "Sheet1" not in xlsx.sheet_names:
+            probe = probe_workbook(excel_path)
+            if not probe.has_sheet("Sheet1"):
                 return False
-            # Read just header to check columns
-            df = pd.read_excel(xlsx, sheet_name="Sheet1", nrows=0)
-            has_country1 = "Country.1" in df.columns
-            has_current_cost = "Cost to Client (GBP) [Current]" in df.columns
+            # Only the header row is needed to check columns
+            columns = probe.header("Sheet1")
+            has_country1 = "Country.1" in columns
+            has_current_cost = "Cost to Client (GBP) [Current]" in columns
             return has_country1 and has_current_cost
         except Exception:
             return False
@@ -425,26 +687,32 @@ class FlowplanAdapter(InputAdapter):
         """Transform Flowplan format into common schema."""
         self.logger.info("Loading Flowplan_Summaries from %s", self.excel_path)
 
-        raw_df = pd.read_excel(self.excel_path, sheet_name="Sheet1", header=0)
+        raw_df = self._read_source()
         self.logger.info("Loaded %s rows from Flowplan", len(raw_df))
 
-        # Filter out Expert campaigns
-        raw_df = self._exclude_expert_campaigns(raw_df)
+        raw_df = self._clean_rows(raw_df)
 
-        # Filter out placeholder brands with (-X) suffix
-        raw_df = self._exclude_placeholder_brands(raw_df)
+        # Aggregate to monthly level
+        agg_df = self._timed_step(self._aggregate_to_monthly, raw_df)
 
-        # Convert Month datetime to string format
-        raw_df = self._convert_month_format(raw_df)
+        return self._finalize(agg_df)
 
-        # Aggregate to monthly level
-        agg_df = self._aggregate_to_monthly(raw_df)
+    def _clean_rows(self, df: pd.DataFrame, *, quiet: bool = False) -> pd.DataFrame:
+        # Filter out Expert campaigns and placeholder brands with (-X) suffix,
+        # then convert Month datetime to string format
+        steps = (
+            self._exclude_expert_campaigns,
+            self._exclude_placeholder_brands,
+            self._convert_month_format,
+        )
+        return self._run_steps(steps, df, quiet=quiet)
 
+    def _finalize(self, agg_df: pd.DataFrame) -> pd.DataFrame:
         # Pivot to final row-per-campaign format
-        result_df = self._pivot_to_final_format(agg_df)
+        result_df = self._timed_step(self._pivot_to_final_format, agg_df)
 
         # Filter out zero-cost brand/country combinations
-        result_df = self._exclude_zero_cost_brands(result_df)
+        result_df = self._timed_step(self._exclude_zero_cost_brands, result_df)
 
         return self._ensure_output_schema(result_df)
 
@@ -460,12 +728,10 @@ class FlowplanAdapter(InputAdapter):
 
     def _exclude_placeholder_brands(self, df: pd.DataFrame) -> pd.DataFrame:
         """Exclude brands with (-X) suffix pattern like (OH-X), (RH-X), (PM-X)."""
-        import re
         if "Brand" not in df.columns:
             return df
         initial_count = len(df)
-        pattern = re.compile(self.BRAND_FILTER_PATTERN)
-        df = df[~df["Brand"].astype(str).apply(lambda x: bool(pattern.search(x)))]
+        df = df[~df["Brand"].astype(str).str.contains(self.BRAND_FILTER_PATTERN, regex=True)]
         excluded = initial_count - len(df)
         if excluded > 0:
             self.logger.info("Excluded %s placeholder brand rows (matching %s)", excluded, self.BRAND_FILTER_PATTERN)
@@ -494,16 +760,15 @@ class FlowplanAdapter(InputAdapter):
             df["Month"] = pd.to_datetime(df["Month"]).dt.strftime("%b")
         return df
 
-    def _normalize_brand(self, brand: str) -> str:
-        """Normalize brand name to match config expectations."""
-        return self.BRAND_NORMALIZATIONS.get(brand, brand)
+    def _normalize_brand(self, brands: pd.Series) -> pd.Series:
+        """Normalize brand names to match config expectations."""
+        return brands.replace(self.BRAND_NORMALIZATIONS)
 
-    def _normalize_country(self, country: str) -> str:
-        """Normalize country name (e.g., combine Gulf countries into GNE)."""
-        return self.COUNTRY_NORMALIZATIONS.get(country, country)
+    def _normalize_country(self, countries: pd.Series) -> pd.Series:
+        """Normalize country names (e.g., combine Gulf countries into GNE)."""
+        return countries.replace(self.COUNTRY_NORMALIZATIONS)
 
-    def _aggregate_to_monthly(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Aggregate raw data to monthly level."""
+    def _partial_monthly(self, df: pd.DataFrame) -> pd.DataFrame:
         group_cols = [
             "Country.1",  # Use clean country name
             "Brand",
@@ -513,54 +778,35 @@ class FlowplanAdapter(InputAdapter):
             "Media Type",
             "Product",
         ]
+        # Cost and TV metrics use the [Current] variants
+        return _partial_groups(
+            df,
+            group_cols,
+            cost_column="Cost to Client (GBP) [Current]",
+            metric_columns={
+                "GRP": "National GRP [Current]",
+                "Frequency": "Frequency [Current]",
+                "Reach 1+": "Reach 1+ [Current]",
+                "Reach 3+": "Reach 3+ [Current]",
+            },
+            campaign_type_column="Campaign Type",
+            funnel_stage_column="Funnel Stage",
+        )
 
-        processed_data = []
-        for name, group in df.groupby(group_cols):
-            country, brand, campaign, year, month, media_type, product = name
-
-            # Normalize country and brand names to match config expectations
-            country = self._normalize_country(country)
-            brand = self._normalize_brand(brand)
-            month = MONTH_ALIAS_MAP.get(month, month)
-
-            if not country or not brand or not campaign:
-                continue
-
-            # Cost - use [Current] variant
-            total_cost = group["Cost to Client (GBP) [Current]"].sum()
-
-            # TV metrics - use [Current] variants
-            grp_col = "National GRP [Current]"
-            freq_col = "Frequency [Current]"
-            reach1_col = "Reach 1+ [Current]"
-            reach3_col = "Reach 3+ [Current]"
-
-            grp_sum = group[grp_col].dropna().sum() if grp_col in group.columns else np.nan
-            freq_avg = group[freq_col].dropna().mean() if freq_col in group.columns else np.nan
-            reach1_avg = group[reach1_col].dropna().mean() if reach1_col in group.columns else np.nan
-            reach3_avg = group[reach3_col].dropna().mean() if reach3_col in group.columns else np.nan
-
-            campaign_type = group["Campaign Type"].dropna().iloc[0] if not group["Campaign Type"].dropna().empty else ""
-            funnel_stage = group["Funnel Stage"].dropna().iloc[0] if not group["Funnel Stage"].dropna().empty else ""
-
-            processed_data.append({
-                "Country": country,
-                "Brand": brand,
-                "Product": product,
-                "Media Type": media_type,
-                "Campaign Name": campaign,
-                "Campaign Type": campaign_type,
-                "Funnel Stage": funnel_stage,
-                "Year": year,
-                "Month": month,
-                "Total Cost": total_cost if pd.notna(total_cost) else 0,
-                "GRP": grp_sum if grp_sum > 0 else np.nan,
-                "Frequency": freq_avg,
-                "Reach 1+": reach1_avg,
-                "Reach 3+": reach3_avg,
-            })
-
-        agg_df = pd.DataFrame(processed_data)
+    def _monthly_from_partial(self, partial: pd.DataFrame) -> pd.DataFrame:
+        grouped = _finalize_groups(partial)
+
+        # Normalize country and brand names to match config expectations
+        agg_df = _monthly_frame(
+            grouped,
+            country=self._normalize_country(grouped["Country.1"]),
+            brand=self._normalize_brand(grouped["Brand"]),
+            product=grouped["Product"],
+            media_type=grouped["Media Type"],
+            campaign=grouped["Campaign Name(s)"],
+            year=grouped["Year"],
+            month=grouped["Month"],
+        )
         self.logger.info("Created %s monthly aggregated rows", len(agg_df))
         return agg_df
 
@@ -573,69 +819,74 @@ class FlowplanAdapter(InputAdapter):
             "Country", "Brand", "Product", "Media Type",
             "Campaign Name", "Campaign Type", "Funnel Stage", "Year",
         ]
+        result_df = _pivot_months(agg_df, final_group_cols)
+        result_df["Flight Comments"] = ""
 
-        result_rows = []
-        for name, group in agg_df.groupby(final_group_cols):
-            country, brand, product, media_type, campaign, campaign_type, funnel_stage, year = name
-
-            row = {
-                "Country": country, "Brand": brand, "Product": product,
-                "Media Type": media_type, "Campaign Name": campaign,
-                "Campaign Type": campaign_type, "Funnel Stage": funnel_stage,
-                "Year": year,
-            }
-
-            # Initialize all months to 0
-            for month in MONTHS_ORDER:
-                row[month] = 0
-
-            total_cost = 0
-            total_grp = 0
-            freq_values, reach1_values, reach3_values = [], [], []
-
-            for _, month_row in group.iterrows():
-                month = month_row["Month"]
-                if month in MONTHS_ORDER:
-                    # BUG FIX: Accumulate monthly values instead of overwriting
-                    # This ensures monthly columns match Total Cost when same month appears multiple times
-                    row[month] += month_row["Total Cost"]
-                    total_cost += month_row["Total Cost"]
-
-                    if pd.notna(month_row["GRP"]):
-                        total_grp += month_row["GRP"]
-                    if pd.notna(month_row["Frequency"]):
-                        freq_values.append(month_row["Frequency"])
-                    if pd.notna(month_row["Reach 1+"]):
-                        reach1_values.append(month_row["Reach 1+"])
-                    if pd.notna(month_row["Reach 3+"]):
-                        reach3_values.append(month_row["Reach 3+"])
-
-            row["Total Cost"] = total_cost
-            row["GRP"] = total_grp if total_grp > 0 else np.nan
-            row["Frequency"] = float(np.mean(freq_values)) if freq_values else np.nan
-            row["Reach 1+"] = float(np.mean(reach1_values)) if reach1_values else np.nan
-            row["Reach 3+"] = float(np.mean(reach3_values)) if reach3_values else np.nan
-            row["Flight Comments"] = ""
-
-            result_rows.append(row)
-
-        result_df = pd.DataFrame(result_rows)
         self.logger.info("Final Flowplan dataset: %s rows", len(result_df))
         return result_df
 
 
+class ColumnarSourceMixin:
+    """Read an adapter's source columns from a Parquet, CSV or Arrow IPC export.
+
+    Mixed into the workbook adapters so the columnar variants run the exact
+    same cleaning, aggregation and pivot steps; only the source differs.
+    """
+
+    # Columns that identify the layout in a columnar header
+    LAYOUT_COLUMNS: tuple[str, ...] = ()
+
+    @classmethod
+    def can_handle(cls, excel_path: Path) -> bool:
+        """Check for a columnar export whose header carries ``LAYOUT_COLUMNS``."""
+        if columnar_kind(excel_path) is None:
+            return False
+        try:
+            columns = read_header(excel_path)
+        except Exception:
+            return False
+        return all(column in columns for column in cls.LAYOUT_COLUMNS)
+
+    def _read_source(self) -> pd.DataFrame:
+        return read_table(self.excel_path, self._source_columns(), logger=self.logger)
+
+    def _iter_source_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        return iter_table_chunks(self.excel_path, self._source_columns(), chunk_size=chunk_size, logger=self.logger)
+
+
+class BulkPlanColumnarAdapter(ColumnarSourceMixin, BulkPlanAdapter):
+    """Adapter for BulkPlan Flight rows exported as Parquet, CSV or Arrow."""
+
+    LAYOUT_COLUMNS = ("Plan - Geography", "Plan - Brand", "*Cost to Client")
+
+
+class FlowplanColumnarAdapter(ColumnarSourceMixin, FlowplanAdapter):
+    """Adapter for Flowplan summary rows exported as Parquet, CSV or Arrow."""
+
+    LAYOUT_COLUMNS = ("Country.1", "Cost to Client (GBP) [Current]")
+
+
 # Registry of available adapters (order matters for auto-detection)
 ADAPTER_REGISTRY: list[type[InputAdapter]] = [
+    FlowplanColumnarAdapter,  # Suffix check first (cheapest)
+    BulkPlanColumnarAdapter,
     FlowplanAdapter,  # Check first (more specific)
     BulkPlanAdapter,  # Fallback
 ]
 
+ADAPTER_FORMATS: dict[InputFormat, type[InputAdapter]] = {
+    InputFormat.BULK_PLAN: BulkPlanAdapter,
+    InputFormat.FLOWPLAN: FlowplanAdapter,
+    InputFormat.BULK_PLAN_COLUMNAR: BulkPlanColumnarAdapter,
+    InputFormat.FLOWPLAN_COLUMNAR: FlowplanColumnarAdapter,
+}
+
 
 def detect_format(excel_path: Path) -> InputFormat:
     """Auto-detect the input format based on file structure.
 
     Args:
-        excel_path: Path to the Excel file.
+        excel_path: Path to the Excel workbook or columnar export.
 
     Returns:
         Detected InputFormat enum value.
@@ -643,12 +894,10 @@ def detect_format(excel_path: Path) -> InputFormat:
     Raises:
         ValueError: If format cannot be determined.
     """
+    formats = {adapter_cls: format_type for format_type, adapter_cls in ADAPTER_FORMATS.items()}
     for adapter_cls in ADAPTER_REGISTRY:
         if adapter_cls.can_handle(excel_path):
-            if adapter_cls == FlowplanAdapter:
-                return InputFormat.FLOWPLAN
-            elif adapter_cls == BulkPlanAdapter:
-                return InputFormat.BULK_PLAN
+            return formats[adapter_cls]
     raise ValueError(f"Unable to detect format for: {excel_path}")
 
 
@@ -656,13 +905,16 @@ def get_adapter(
     excel_path: Path,
     format_type: InputFormat = InputFormat.AUTO,
     logger: Optional[logging.Logger] = None,
+    *,
+    reader: Optional[ReaderOptions] = None,
 ) -> InputAdapter:
     """Get the appropriate adapter for the given file and format.
 
     Args:
-        excel_path: Path to the Excel file.
+        excel_path: Path to the Excel workbook or columnar export.
         format_type: Explicit format or AUTO for detection.
         logger: Optional logger instance.
+        reader: Source sheet reader options (engine, column projection).
 
     Returns:
         Configured InputAdapter instance.
@@ -673,13 +925,8 @@ def get_adapter(
     if format_type == InputFormat.AUTO:
         format_type = detect_format(excel_path)
 
-    adapter_map = {
-        InputFormat.BULK_PLAN: BulkPlanAdapter,
-        InputFormat.FLOWPLAN: FlowplanAdapter,
-    }
-
-    adapter_cls = adapter_map.get(format_type)
+    adapter_cls = ADAPTER_FORMATS.get(format_type)
     if adapter_cls is None:
         raise ValueError(f"No adapter for format: {format_type}")
 
-    return adapter_cls(excel_path, logger)
+    return adapter_cls(excel_path, logger, reader=reader)
@@ -0,0 +1,192 @@
+"""Persistent on-disk cache of normalized input datasets.
+
+Normalizing a Lumina/Flowplan export means parsing the workbook, which
+dominates start-up time for the CLI, the validators and the Streamlit app.
+Normalized frames (and the month-level TV metrics derived from the same
+rows) are stored as Parquet files under ``paths.temp`` keyed by the
+workbook's content hash, the input format and the adapter rules version, so
+later loads of an unchanged workbook skip Excel entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from amp_automation.config import Config
+
+__all__ = ["DataCache", "CachedDataset", "disable_data_cache", "file_content_hash"]
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Bump when the on-disk layout changes (independent of adapter rule versions)
+CACHE_LAYOUT_VERSION = 1
+
+DEFAULT_CACHE_DIRECTORY = "data_cache"
+DEFAULT_MAX_SIZE_MB = 256
+
+_DATASET_SUFFIX = ".parquet"
+_TV_METRICS_SUFFIX = ".tv.parquet"
+_HASH_CHUNK_BYTES = 1 << 20
+
+_CONTENT_HASHES: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def file_content_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of ``path`` (memoised on size + mtime)."""
+    path = Path(path)
+    stat = path.stat()
+    signature = (stat.st_size, stat.st_mtime_ns)
+    key = path.resolve()
+
+    cached = _CONTENT_HASHES.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    content_hash = digest.hexdigest()
+    _CONTENT_HASHES[key] = (signature, content_hash)
+    return content_hash
+
+
+def disable_data_cache(config: Config) -> None:
+    """Turn the dataset cache off for every consumer of ``config``."""
+    performance = config.data.setdefault("performance", {})
+    performance.setdefault("data_cache", {})["enabled"] = False
+
+
+@dataclass(slots=True)
+class CachedDataset:
+    """Frames restored from a cache entry."""
+
+    frame: pd.DataFrame
+    tv_metrics: Optional[pd.DataFrame] = None
+
+
+@dataclass(slots=True)
+class DataCache:
+    """Size-bounded Parquet cache of normalized datasets."""
+
+    directory: Path
+    max_bytes: int
+    logger: logging.Logger
+
+    @classmethod
+    def from_config(cls, config: Config, logger: Optional[logging.Logger] = None) -> Optional["DataCache"]:
+        """Build the cache described by ``performance.data_cache``.
+
+        Returns None when the cache is disabled or no Parquet engine is installed.
+        """
+        logger = logger or logging.getLogger("amp_automation.data")
+        performance = config.get("performance", {}) or {}
+        settings = performance.get("data_cache", {}) or {}
+        if not settings.get("enabled", True):
+            return None
+        if importlib.util.find_spec("pyarrow") is None:
+            logger.debug("pyarrow not installed - dataset cache disabled")
+            return None
+
+        paths_section = config.get("paths", {}) or {}
+        temp_base = Path((paths_section.get("temp", {}) or {}).get("base") or "temp")
+        if not temp_base.is_absolute():
+            temp_base = PROJECT_ROOT / temp_base
+
+        directory = Path(settings.get("directory") or DEFAULT_CACHE_DIRECTORY)
+        if not directory.is_absolute():
+            directory = temp_base / directory
+
+        max_size_mb = float(settings.get("max_size_mb", DEFAULT_MAX_SIZE_MB))
+        return cls(directory=directory, max_bytes=int(max_size_mb * 1024 * 1024), logger=logger)
+
+    @staticmethod
+    def key_for(excel_path: Path, format_name: str, rules_version: int) -> str:
+        """Cache key for a workbook/format/rules combination."""
+        content_hash = file_content_hash(excel_path)[:40]
+        return f"{content_hash}-{format_name}-r{rules_version}-v{CACHE_LAYOUT_VERSION}"
+
+    def load(self, key: str, *, require_tv_metrics: bool = False) -> Optional[CachedDataset]:
+        """Return the cached frames for ``key`` or None on a miss."""
+        dataset_path = self.directory / f"{key}{_DATASET_SUFFIX}"
+        tv_path = self.directory / f"{key}{_TV_METRICS_SUFFIX}"
+        if not dataset_path.is_file() or (require_tv_metrics and not tv_path.is_file()):
+            return None
+
+        try:
+            frame = pd.read_parquet(dataset_path)
+            tv_metrics = pd.read_parquet(tv_path) if tv_path.is_file() else None
+        except Exception as exc:  # corrupt or incompatible entry - rebuild it
+            self.logger.warning("Discarding unreadable dataset cache entry %s: %s", key, exc)
+            self._remove_entry(key)
+            return None
+
+        # Refresh recency for eviction
+        for path in (dataset_path, tv_path):
+            if path.is_file():
+                os.utime(path)
+        self.logger.info("Loaded normalized dataset from cache (%s rows)", len(frame))
+        return CachedDataset(frame=frame, tv_metrics=tv_metrics)
+
+    def store(self, key: str, frame: pd.DataFrame, tv_metrics: Optional[pd.DataFrame] = None) -> bool:
+        """Write a cache entry and evict old ones beyond the size bound."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if tv_metrics is not None:
+                self._write_atomic(tv_metrics, self.directory / f"{key}{_TV_METRICS_SUFFIX}")
+            self._write_atomic(frame, self.directory / f"{key}{_DATASET_SUFFIX}")
+        except Exception as exc:  # caching is best effort
+            self.logger.warning("Could not cache normalized dataset: %s", exc)
+            self._remove_entry(key)
+            return False
+
+        self.evict(keep=key)
+        return True
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        entries: dict[str, list[Path]] = {}
+        for path in self.directory.glob(f"*{_DATASET_SUFFIX}"):
+            entries.setdefault(_entry_key(path), []).append(path)
+
+        def last_used(paths: list[Path]) -> float:
+            return max(path.stat().st_mtime for path in paths)
+
+        total = sum(path.stat().st_size for paths in entries.values() for path in paths)
+        for key, paths in sorted(entries.items(), key=lambda item: last_used(item[1])):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= sum(path.stat().st_size for path in paths)
+            self._remove_entry(key)
+            self.logger.info("Evicted dataset cache entry %s", key)
+
+    def _remove_entry(self, key: str) -> None:
+        for suffix in (_DATASET_SUFFIX, _TV_METRICS_SUFFIX):
+            (self.directory / f"{key}{suffix}").unlink(missing_ok=True)
+
+    @staticmethod
+    def _write_atomic(frame: pd.DataFrame, target: Path) -> None:
+        temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            frame.to_parquet(temp_path, index=False)
+            os.replace(temp_path, target)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+def _entry_key(path: Path) -> str:
+    name = path.name
+    for suffix in (_TV_METRICS_SUFFIX, _DATASET_SUFFIX):
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return path.stem
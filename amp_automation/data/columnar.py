@@ -0,0 +1,150 @@
+"""Readers for columnar exports (Parquet, CSV, Arrow IPC) of the adapter layouts.
+
+The warehouse can export the Lumina Flight sheet and the Flowplan summary as
+flat files with the same column headers as the workbooks. These readers give
+the columnar adapters the frames :func:`~amp_automation.data.sheet_reader.read_sheet`
+would return for the equivalent sheet: requested columns that are missing are
+skipped and the file's column order is kept. Parquet and Arrow need
+``pyarrow``; CSV only needs pandas.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import pandas as pd
+
+__all__ = ["COLUMNAR_SUFFIXES", "columnar_kind", "iter_table_chunks", "read_header", "read_table"]
+
+# File suffix -> container kind
+COLUMNAR_SUFFIXES = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".csv": "csv",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+_logger = logging.getLogger("amp_automation.data.columnar")
+
+
+def columnar_kind(path: str | Path) -> Optional[str]:
+    """Container kind (``parquet``, ``csv`` or ``arrow``) of ``path``, None for other files."""
+    return COLUMNAR_SUFFIXES.get(Path(path).suffix.lower())
+
+
+def _require_kind(path: Path) -> str:
+    kind = columnar_kind(path)
+    if kind is None:
+        raise ValueError(f"Not a Parquet, CSV or Arrow file: {path}")
+    return kind
+
+
+def read_header(path: str | Path) -> tuple[str, ...]:
+    """Column names of a columnar export without reading its rows."""
+    path = Path(path)
+    kind = _require_kind(path)
+    if kind == "csv":
+        # read_csv de-duplicates repeated headers (``Country.1``) like read_excel
+        return tuple(pd.read_csv(path, nrows=0).columns)
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if kind == "parquet":
+        return tuple(pq.read_schema(path).names)
+    with pa.memory_map(str(path)) as source:
+        return tuple(pa.ipc.open_file(source).schema.names)
+
+
+def _present(path: Path, columns: Optional[Iterable[str]]) -> Optional[list[str]]:
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return [name for name in read_header(path) if name in wanted]
+
+
+def read_table(
+    path: str | Path,
+    columns: Optional[Iterable[str]] = None,
+    *,
+    logger: Optional[logging.Logger] = None,
+) -> pd.DataFrame:
+    """Read ``columns`` (all columns when None) of a columnar export."""
+    logger = logger or _logger
+    path = Path(path)
+    kind = _require_kind(path)
+    present = _present(path, columns)
+
+    started = time.perf_counter()
+    if kind == "csv":
+        frame = pd.read_csv(path, usecols=present)
+    elif kind == "parquet":
+        frame = pd.read_parquet(path, columns=present)
+    else:
+        frame = pd.read_feather(path, columns=present)
+    logger.info(
+        "Read %s rows x %s columns from %s (%s) in %.3fs",
+        len(frame),
+        len(frame.columns),
+        path.name,
+        kind,
+        time.perf_counter() - started,
+    )
+    return frame
+
+
+def iter_table_chunks(
+    path: str | Path,
+    columns: Optional[Iterable[str]] = None,
+    *,
+    chunk_size: int,
+    logger: Optional[logging.Logger] = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield a columnar export in frames of at most ``chunk_size`` rows.
+
+    Like :func:`~amp_automation.data.sheet_reader.iter_sheet_chunks`, dtypes
+    are inferred per chunk for CSV. Parquet is read by record batch and Arrow
+    files are memory-mapped, so neither is loaded whole.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    logger = logger or _logger
+    path = Path(path)
+    kind = _require_kind(path)
+    present = _present(path, columns)
+
+    total_rows = 0
+    for chunk in _raw_chunks(path, kind, present, chunk_size):
+        chunk.index += total_rows
+        total_rows += len(chunk)
+        yield chunk
+    logger.info("Streamed %s rows from %s (%s) in chunks of <= %s rows", total_rows, path.name, kind, chunk_size)
+
+
+def _raw_chunks(path: Path, kind: str, columns: Optional[list[str]], chunk_size: int) -> Iterator[pd.DataFrame]:
+    if kind == "csv":
+        with pd.read_csv(path, usecols=columns, chunksize=chunk_size) as reader:
+            yield from (chunk.reset_index(drop=True) for chunk in reader)
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if kind == "parquet":
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index)
+            if columns is not None:
+                batch = batch.select(columns)
+            for start in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(start, chunk_size).to_pandas()
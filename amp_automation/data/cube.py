@@ -0,0 +1,221 @@
+"""Pre-aggregated spend cube for summary tiles, charts and section ordering.
+
+Summary tiles, pie-chart preparers and the market/brand investment ordering
+all need the same handful of sums (total cost, monthly and quarterly budgets,
+spend by media type, funnel stage and campaign type) for a market/brand/year
+slice, optionally narrowed to one product. The cube aggregates the normalized
+frame once into Market -> Brand -> Year -> Product -> Campaign -> Media x
+Funnel leaves with monthly columns, then rolls those leaves up so every
+consumer reads its numbers with a dictionary lookup.
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from .adapters import MONTHS_ORDER
+
+__all__ = ["AggregateCube", "CubeCell", "aggregate_cube_for"]
+
+QUARTER_MONTHS = {
+    "q1": ("Jan", "Feb", "Mar"),
+    "q2": ("Apr", "May", "Jun"),
+    "q3": ("Jul", "Aug", "Sep"),
+    "q4": ("Oct", "Nov", "Dec"),
+}
+
+# Breakdown name -> source column; breakdown keys keep the raw column values
+BREAKDOWN_COLUMNS = {
+    "media": "Mapped Media Type",
+    "media_type": "Media Type",
+    "funnel": "Funnel Stage",
+    "campaign_type": "Campaign Type",
+}
+
+_KEY_COLUMNS = ["_country", "_brand", "_year", "_product"]
+_LEAF_COLUMNS = ["Campaign Name", *dict.fromkeys(BREAKDOWN_COLUMNS.values())]
+_VALUE_COLUMNS = ["Total Cost", *MONTHS_ORDER]
+
+
+def _normalize_key(value: object) -> str:
+    return str(value).strip()
+
+
+def _normalize_column(series: pd.Series) -> pd.Series:
+    return series.astype(str).str.strip()
+
+
+@dataclass(slots=True, frozen=True)
+class CubeCell:
+    """Aggregated spend for one slice of the cube."""
+
+    total_cost: float
+    monthly: Mapping[str, float]
+    breakdowns: Mapping[str, Optional[Mapping[object, float]]] = field(default_factory=dict)
+
+    def month(self, month: str) -> float:
+        return self.monthly.get(month, 0.0)
+
+    def quarter(self, quarter: str) -> float:
+        """Sum of the months in ``quarter`` (``"q1"`` .. ``"q4"``, case-insensitive)."""
+        return float(sum(self.month(month) for month in QUARTER_MONTHS.get(str(quarter).lower(), ())))
+
+    def breakdown(self, name: str) -> Optional[Mapping[object, float]]:
+        """Spend by raw value of a breakdown column, or None if the column is absent."""
+        return self.breakdowns.get(name)
+
+    def value(self, name: str, key: object) -> float:
+        breakdown = self.breakdowns.get(name) or {}
+        return breakdown.get(key, 0.0)
+
+    def share(self, name: str, key: object) -> float:
+        """Fraction of ``total_cost`` spent on ``key`` (0.0 when there is no spend)."""
+        if self.total_cost <= 0:
+            return 0.0
+        return self.value(name, key) / self.total_cost
+
+
+@dataclass(slots=True)
+class AggregateCube:
+    """Spend totals keyed by stripped-string Country/Brand/Year(/Product).
+
+    Keys follow the same normalisation as :class:`PartitionIndex`; product
+    keys are case-insensitive to match product-level slide filtering.
+    """
+
+    leaves: pd.DataFrame
+    _by_brand: dict[tuple[str, str], CubeCell]
+    _by_combination: dict[tuple[str, str, str], CubeCell]
+    _by_product: dict[tuple[str, str, str, str], CubeCell]
+    _by_market: dict[str, float]
+    _frame_ref: weakref.ref
+    _row_count: int
+
+    @classmethod
+    def build(cls, frame: pd.DataFrame) -> "AggregateCube":
+        """Aggregate ``frame`` into leaves and pre-compute every roll-up level."""
+        keyed = pd.DataFrame(
+            {
+                "_country": _normalize_column(frame["Country"]),
+                "_brand": _normalize_column(frame["Brand"]),
+                "_year": _normalize_column(frame["Year"]),
+                "_product": (
+                    _normalize_column(frame["Product"]).str.upper()
+                    if "Product" in frame.columns
+                    else pd.Series("", index=frame.index)
+                ),
+            },
+            index=frame.index,
+        )
+        leaf_columns = [column for column in _LEAF_COLUMNS if column in frame.columns]
+        for column in leaf_columns:
+            keyed[column] = frame[column]
+        for column in _VALUE_COLUMNS:
+            keyed[column] = frame[column] if column in frame.columns else 0.0
+
+        leaves = (
+            keyed.groupby(_KEY_COLUMNS + leaf_columns, sort=False, dropna=False, observed=True)[_VALUE_COLUMNS]
+            .sum()
+            .reset_index()
+        )
+        breakdowns = {
+            name: column for name, column in BREAKDOWN_COLUMNS.items() if column in leaf_columns
+        }
+
+        by_market = leaves.groupby("_country", sort=False, dropna=False, observed=True)["Total Cost"].sum()
+        return cls(
+            leaves=leaves,
+            _by_brand=_roll_up(leaves, ["_country", "_brand"], breakdowns),
+            _by_combination=_roll_up(leaves, ["_country", "_brand", "_year"], breakdowns),
+            _by_product=_roll_up(leaves, _KEY_COLUMNS, breakdowns),
+            _by_market={key: float(value) for key, value in by_market.items()},
+            _frame_ref=weakref.ref(frame),
+            _row_count=len(frame),
+        )
+
+    def is_current_for(self, frame: pd.DataFrame) -> bool:
+        return self._frame_ref() is frame and len(frame) == self._row_count
+
+    def cell(
+        self,
+        country: object,
+        brand: object,
+        year: object | None = None,
+        *,
+        product: object | None = None,
+    ) -> Optional[CubeCell]:
+        """Return the aggregate for a slice, or None when it has no rows."""
+        country_key = _normalize_key(country)
+        brand_key = _normalize_key(brand)
+        if year is None:
+            if product is not None:
+                raise ValueError("A product slice requires a year")
+            return self._by_brand.get((country_key, brand_key))
+        year_key = _normalize_key(year)
+        if product is None:
+            return self._by_combination.get((country_key, brand_key, year_key))
+        return self._by_product.get((country_key, brand_key, year_key, _normalize_key(product).upper()))
+
+    def total(self, country: object, brand: object, year: object | None = None) -> float:
+        """Total cost of a market/brand(/year) slice, 0.0 when it has no rows."""
+        cell = self.cell(country, brand, year)
+        return cell.total_cost if cell is not None else 0.0
+
+    def market_total(self, country: object) -> float:
+        return self._by_market.get(_normalize_key(country), 0.0)
+
+
+def _roll_up(
+    leaves: pd.DataFrame,
+    keys: list[str],
+    breakdowns: Mapping[str, str],
+) -> dict[tuple, CubeCell]:
+    measures = leaves.groupby(keys, sort=False, dropna=False, observed=True)[_VALUE_COLUMNS].sum()
+
+    split: dict[str, dict[tuple, dict[object, float]]] = {}
+    for name, column in breakdowns.items():
+        per_key: dict[tuple, dict[object, float]] = {}
+        grouped = leaves.groupby(keys + [column], sort=False, dropna=False, observed=True)["Total Cost"].sum()
+        for index, value in grouped.items():
+            per_key.setdefault(tuple(index[:-1]), {})[index[-1]] = float(value)
+        split[name] = per_key
+
+    values = measures.to_numpy(dtype=np.float64)
+    cells: dict[tuple, CubeCell] = {}
+    for position, key in enumerate(measures.index):
+        key = key if isinstance(key, tuple) else (key,)
+        row = values[position]
+        cells[key] = CubeCell(
+            total_cost=float(row[0]),
+            monthly=dict(zip(MONTHS_ORDER, map(float, row[1:]))),
+            breakdowns={
+                name: split[name].get(key, {}) if name in split else None
+                for name in BREAKDOWN_COLUMNS
+            },
+        )
+    return cells
+
+
+_AGGREGATE_CUBES: dict[int, AggregateCube] = {}
+
+
+def aggregate_cube_for(frame: pd.DataFrame) -> AggregateCube:
+    """Return the aggregate cube for ``frame``, building it on first use.
+
+    Cubes are cached per frame object like :func:`partition_index_for`.
+    """
+    key = id(frame)
+    cube = _AGGREGATE_CUBES.get(key)
+    if cube is not None and cube.is_current_for(frame):
+        return cube
+
+    cube = AggregateCube.build(frame)
+    if key not in _AGGREGATE_CUBES:
+        weakref.finalize(frame, _AGGREGATE_CUBES.pop, key, None)
+    _AGGREGATE_CUBES[key] = cube
+    return cube
@@ -0,0 +1,300 @@
+"""Change sets between two normalized exports, by market/brand/year/product.
+
+Lumina exports are re-pulled several times a week and most combinations do
+not move between pulls. :func:`diff_datasets` hashes the rows of every
+(Country, Brand, Year, Product) partition of two normalized frames, so
+unchanged partitions are recognised from one digest each, and only the
+partitions whose digests differ are compared cell by cell. The resulting
+:class:`ExportDelta` lists added, removed and modified combinations with the
+cells that moved and serialises to JSON for scripts deciding whether (and
+which slides) to regenerate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from amp_automation.config import Config
+
+from .adapters import InputFormat
+from .ingestion import MERGE_KEY_COLUMNS, load_and_prepare_data
+
+__all__ = [
+    "PARTITION_COLUMNS",
+    "CellChange",
+    "ExportDelta",
+    "PartitionChange",
+    "diff_datasets",
+    "diff_exports",
+]
+
+PARTITION_COLUMNS = ("Country", "Brand", "Year", "Product")
+
+# Columns identifying a row inside its partition
+ROW_KEY_COLUMNS = tuple(column for column in MERGE_KEY_COLUMNS if column not in PARTITION_COLUMNS)
+
+# Derived at ingestion from other columns; never reported on its own
+_DERIVED_COLUMNS = frozenset({"Mapped Media Type"})
+
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+_logger = logging.getLogger("amp_automation.data.delta")
+
+
+@dataclass(slots=True, frozen=True)
+class CellChange:
+    """One value that differs between the two exports.
+
+    Missing values (including rows present in only one export) compare as
+    zero or empty text and are reported as None, so a new campaign line
+    reports just the cells it fills.
+    """
+
+    row: tuple[str, ...]
+    column: str
+    before: object
+    after: object
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "row": dict(zip(ROW_KEY_COLUMNS, self.row)),
+            "column": self.column,
+            "before": self.before,
+            "after": self.after,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class PartitionChange:
+    """An added, removed or modified (Country, Brand, Year, Product) combination."""
+
+    key: tuple[str, str, str, str]
+    status: str
+    cells: tuple[CellChange, ...] = ()
+
+    @property
+    def combination(self) -> tuple[str, str, str]:
+        """The (Country, Brand, Year) slide combination this partition belongs to."""
+        return self.key[:3]
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            **dict(zip(PARTITION_COLUMNS, self.key)),
+            "status": self.status,
+            "cells": [cell.to_dict() for cell in self.cells],
+        }
+
+
+@dataclass(slots=True)
+class ExportDelta:
+    """Partition-level change set between a previous and a current export."""
+
+    changes: tuple[PartitionChange, ...]
+    unchanged: int
+    before: tuple[str, ...] = ()
+    after: tuple[str, ...] = ()
+    digests: dict[tuple[str, str, str, str], str] = field(default_factory=dict)
+
+    def _with_status(self, status: str) -> tuple[PartitionChange, ...]:
+        return tuple(change for change in self.changes if change.status == status)
+
+    @property
+    def added(self) -> tuple[PartitionChange, ...]:
+        return self._with_status(ADDED)
+
+    @property
+    def removed(self) -> tuple[PartitionChange, ...]:
+        return self._with_status(REMOVED)
+
+    @property
+    def modified(self) -> tuple[PartitionChange, ...]:
+        return self._with_status(MODIFIED)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changes)
+
+    def touched_combinations(self) -> list[tuple[str, str, str]]:
+        """(Country, Brand, Year) combinations whose slides the changes affect, sorted."""
+        return sorted({change.combination for change in self.changes})
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "before": list(self.before),
+            "after": list(self.after),
+            "summary": {
+                ADDED: len(self.added),
+                REMOVED: len(self.removed),
+                MODIFIED: len(self.modified),
+                "unchanged": self.unchanged,
+            },
+            "touched_combinations": [dict(zip(PARTITION_COLUMNS, key)) for key in self.touched_combinations()],
+            "changes": [change.to_dict() for change in self.changes],
+        }
+
+    def write_json(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+def _normalize_column(series: pd.Series) -> pd.Series:
+    return series.astype(str).str.strip()
+
+
+def _comparable(frame: pd.DataFrame) -> pd.DataFrame:
+    """Key columns as stripped strings, value columns as float64 or plain text."""
+    columns = {}
+    for column in frame.columns:
+        if column in _DERIVED_COLUMNS:
+            continue
+        series = frame[column]
+        if column in PARTITION_COLUMNS or column in ROW_KEY_COLUMNS:
+            columns[column] = _normalize_column(series)
+        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            columns[column] = series.astype("float64")
+        else:
+            columns[column] = series.astype(object).where(series.notna(), "").astype(str)
+    return pd.DataFrame(columns, index=frame.index).reset_index(drop=True)
+
+
+def _partition_digests(frame: pd.DataFrame) -> tuple[dict[tuple, str], dict[tuple, np.ndarray]]:
+    """Order-independent content digest and row positions of every partition."""
+    row_hashes = pd.util.hash_pandas_object(frame[sorted(frame.columns)], index=False).to_numpy()
+    positions = frame.groupby(list(PARTITION_COLUMNS), sort=False).indices
+    digests = {
+        key: hashlib.blake2b(np.sort(row_hashes[rows]).tobytes(), digest_size=16).hexdigest()
+        for key, rows in positions.items()
+    }
+    return digests, positions
+
+
+def _plain(value: object) -> object:
+    """JSON-friendly scalar; NaN becomes None."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if value.is_integer():
+            return int(value)
+    return value
+
+
+def _rows_by_key(rows: pd.DataFrame, value_columns: Sequence[str]) -> pd.DataFrame:
+    """Index rows by ``ROW_KEY_COLUMNS``, collapsing duplicates (numbers summed, text joined)."""
+    keys = list(ROW_KEY_COLUMNS)
+    if not rows.duplicated(keys).any():
+        return rows.set_index(keys)[list(value_columns)].sort_index()
+
+    grouped = rows.groupby(keys, sort=True)
+    numeric = [column for column in value_columns if pd.api.types.is_float_dtype(rows[column])]
+    text = [column for column in value_columns if column not in numeric]
+    parts = [grouped[numeric].sum(min_count=1)] if numeric else []
+    if text:
+        parts.append(grouped[text].agg(lambda values: " | ".join(sorted(set(values)))))
+    return pd.concat(parts, axis=1)[list(value_columns)]
+
+
+def _cell_changes(before: pd.DataFrame, after: pd.DataFrame) -> tuple[CellChange, ...]:
+    """Cells that differ between two partitions, rows aligned on ``ROW_KEY_COLUMNS``."""
+    value_columns = [
+        column
+        for column in dict.fromkeys([*before.columns, *after.columns])
+        if column not in PARTITION_COLUMNS and column not in ROW_KEY_COLUMNS
+    ]
+    for frame, other in ((before, after), (after, before)):
+        for column in value_columns:
+            if column not in frame.columns:
+                frame[column] = np.nan if pd.api.types.is_float_dtype(other[column]) else ""
+
+    old = _rows_by_key(before, value_columns)
+    new = _rows_by_key(after, value_columns)
+    index = old.index.union(new.index)
+    old = old.reindex(index)
+    new = new.reindex(index)
+
+    changes: list[CellChange] = []
+    for column in value_columns:
+        if pd.api.types.is_float_dtype(old[column]) and pd.api.types.is_float_dtype(new[column]):
+            differs = ~np.isclose(old[column].fillna(0.0).to_numpy(), new[column].fillna(0.0).to_numpy())
+        else:
+            differs = (old[column].fillna("").astype(str) != new[column].fillna("").astype(str)).to_numpy()
+        for position in np.flatnonzero(differs):
+            changes.append(
+                CellChange(
+                    row=tuple(index[position]),
+                    column=column,
+                    before=_plain(old[column].iloc[position]),
+                    after=_plain(new[column].iloc[position]),
+                )
+            )
+    changes.sort(key=lambda change: (change.row, value_columns.index(change.column)))
+    return tuple(changes)
+
+
+def diff_datasets(
+    before: pd.DataFrame,
+    after: pd.DataFrame,
+    *,
+    logger: Optional[logging.Logger] = None,
+) -> ExportDelta:
+    """Compare two normalized frames partition by partition."""
+    logger = logger or _logger
+    before = _comparable(before)
+    after = _comparable(after)
+    before_digests, before_rows = _partition_digests(before)
+    after_digests, after_rows = _partition_digests(after)
+
+    changes: list[PartitionChange] = []
+    unchanged = 0
+    for key in sorted(before_digests.keys() | after_digests.keys()):
+        if before_digests.get(key) == after_digests.get(key):
+            unchanged += 1
+            continue
+        old_rows = before.iloc[before_rows.get(key, _NO_ROWS)].copy()
+        new_rows = after.iloc[after_rows.get(key, _NO_ROWS)].copy()
+        status = REMOVED if key not in after_digests else ADDED if key not in before_digests else MODIFIED
+        changes.append(PartitionChange(key, status, _cell_changes(old_rows, new_rows)))
+
+    delta = ExportDelta(changes=tuple(changes), unchanged=unchanged, digests=after_digests)
+    logger.info(
+        "Export delta: %s added, %s removed, %s modified, %s unchanged partitions",
+        len(delta.added),
+        len(delta.removed),
+        len(delta.modified),
+        unchanged,
+    )
+    return delta
+
+
+def diff_exports(
+    before_path: str | Path | Sequence[str | Path],
+    after_path: str | Path | Sequence[str | Path],
+    config: Config,
+    logger: logging.Logger,
+    *,
+    format_type: InputFormat = InputFormat.AUTO,
+    use_cache: bool = True,
+) -> ExportDelta:
+    """Load two exports (each one or more sources) and diff their normalized datasets."""
+    before = load_and_prepare_data(before_path, config, logger, format_type=format_type, use_cache=use_cache)
+    after = load_and_prepare_data(after_path, config, logger, format_type=format_type, use_cache=use_cache)
+    delta = diff_datasets(before.frame, after.frame, logger=logger)
+    delta.before = tuple(str(source.path) for source in before.sources)
+    delta.after = tuple(str(source.path) for source in after.sources)
+    return delta
@@ -3,22 +3,51 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Mapping, Optional
+from typing import Iterable, Mapping, Optional, Sequence
 
 import pandas as pd
 import numpy as np
 
 from amp_automation.config import Config
+from amp_automation.data.cache import DataCache
+from amp_automation.data.columnar import COLUMNAR_SUFFIXES
+from amp_automation.data.sheet_reader import ReaderOptions
 from amp_automation.data.adapters import (
+    ADAPTER_FORMATS,
+    DIMENSION_COLUMNS,
+    BulkPlanAdapter,
+    FlowplanAdapter,
     InputFormat,
     NormalizedData,
     get_adapter,
     detect_format,
     MONTH_ALIAS_MAP,
     OUTPUT_SCHEMA,
+    _strip_text,
 )
+from amp_automation.utils.media import display_media_type
+from amp_automation.utils.parallel import max_workers, process_pool
+
+# Columns stored as ``category``: text dimensions plus derived media buckets
+CATEGORY_COLUMNS = [*DIMENSION_COLUMNS, "Mapped Media Type", "Normalized Media"]
+
+# Metrics downcast to float32 when every value round-trips exactly. Budgets
+# stay float64 because campaign/market totals exceed float32's exact range.
+FLOAT32_COLUMNS = ["GRP", "Frequency", "Reach 1+", "Reach 3+"]
+
+# Rows per batch when ``performance.optimization.enable_chunking`` is on
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Files picked up when a directory of sources is given
+SOURCE_SUFFIXES = frozenset({".xlsx", ".xlsm", ".xls", *COLUMNAR_SUFFIXES})
+
+# Normalized rows sharing these keys describe the same campaign line
+MERGE_KEY_COLUMNS = [
+    "Country", "Brand", "Product", "Media Type", "Campaign Name", "Campaign Type", "Funnel Stage", "Year",
+]
 
 
 @dataclass(slots=True)
@@ -27,6 +56,9 @@ class DataSet:
 
     frame: pd.DataFrame
     source_format: Optional[InputFormat] = None
+    from_cache: bool = False
+    # One entry per input source, in input order
+    sources: tuple["SourceSummary", ...] = ()
 
 
 def _validate_row_capacity(data_frame: pd.DataFrame, min_rows: int, logger: logging.Logger) -> None:
@@ -37,39 +69,293 @@ def _validate_row_capacity(data_frame: pd.DataFrame, min_rows: int, logger: logg
         raise ValueError("Insufficient data rows for presentation generation")
 
 
+def _optimize_dtypes(df: pd.DataFrame, logger: logging.Logger) -> pd.DataFrame:
+    """Store dimensions as categoricals and lossless metrics as float32, logging the saving."""
+
+    before = df.memory_usage(deep=True).sum()
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("category")
+
+    for column in FLOAT32_COLUMNS:
+        if column not in df.columns or df[column].dtype != np.float64:
+            continue
+        values = df[column].to_numpy()
+        downcast = values.astype(np.float32)
+        if np.array_equal(downcast.astype(np.float64), values, equal_nan=True):
+            df[column] = downcast
+
+    after = df.memory_usage(deep=True).sum()
+    logger.info(
+        "Normalized frame memory: %.2f MB -> %.2f MB (%s rows)",
+        before / (1024 * 1024),
+        after / (1024 * 1024),
+        len(df),
+    )
+    return df
+
+
+def resolve_sources(sources: str | Path | Sequence[str | Path]) -> tuple[Path, ...]:
+    """Expand an input file, a directory, or a sequence of them into source files.
+
+    Directories contribute their workbooks and columnar exports (sorted, not
+    recursive, skipping Office lock files). Repeated files are kept once.
+    """
+    entries = [sources] if isinstance(sources, (str, Path)) else list(sources)
+    resolved: dict[Path, None] = {}
+    for entry in entries:
+        path = Path(entry)
+        if path.is_dir():
+            files = sorted(
+                candidate
+                for candidate in path.iterdir()
+                if candidate.is_file()
+                and candidate.suffix.lower() in SOURCE_SUFFIXES
+                and not candidate.name.startswith("~$")
+            )
+            if not files:
+                raise FileNotFoundError(f"No Excel or columnar sources found in {path}")
+            resolved.update(dict.fromkeys(files))
+        elif path.is_file():
+            resolved[path] = None
+        else:
+            raise FileNotFoundError(f"Excel source not found: {path}")
+    if not resolved:
+        raise FileNotFoundError("No Excel sources given")
+    return tuple(resolved)
+
+
+@dataclass(slots=True)
+class SourceSummary:
+    """Per-source outcome of a (multi-workbook) load."""
+
+    path: Path
+    source_format: InputFormat
+    rows: int
+    seconds: float
+    from_cache: bool = False
+
+
+@dataclass(slots=True)
+class _NormalizedSource:
+    """One source normalized through its adapter (picklable for worker processes)."""
+
+    summary: SourceSummary
+    frame: pd.DataFrame
+    tv_index: TvMetricsIndex
+    cache_key: Optional[str] = None
+    tv_frame: Optional[pd.DataFrame] = None
+
+
+def _normalize_source(
+    excel_path: Path,
+    config: Config,
+    logger: logging.Logger,
+    format_type: InputFormat,
+    use_cache: bool,
+) -> _NormalizedSource:
+    """Normalize one source (or restore it from the dataset cache) without storing anything."""
+    started = time.perf_counter()
+
+    # Get the appropriate adapter
+    detected_format = detect_format(excel_path) if format_type == InputFormat.AUTO else format_type
+    adapter = get_adapter(excel_path, detected_format, logger, reader=ReaderOptions.from_config(config))
+    logger.info("Using %s adapter for %s", detected_format.value, excel_path.name)
+
+    optimization = (config.get("performance", {}) or {}).get("optimization", {}) or {}
+    chunk_size = int(optimization.get("chunk_size", DEFAULT_CHUNK_SIZE)) if optimization.get("enable_chunking") else None
+
+    cache = DataCache.from_config(config, logger) if use_cache else None
+    cache_key = DataCache.key_for(excel_path, detected_format.value, adapter.RULES_VERSION) if cache else None
+    cached = cache.load(cache_key, require_tv_metrics=isinstance(adapter, BulkPlanAdapter)) if cache else None
+
+    tv_frame = None
+    if cached is not None:
+        df = cached.frame
+        tv_index = (
+            TvMetricsIndex.from_frame(cached.tv_metrics) if cached.tv_metrics is not None else TvMetricsIndex.empty()
+        )
+    else:
+        tv_index = TvMetricsIndex.empty()
+        if chunk_size:
+            # Bounded memory: fold TV metrics batch by batch alongside the aggregates
+            tv_builder = TvMetricsBuilder(logger) if isinstance(adapter, BulkPlanAdapter) else None
+            df = adapter.normalize_chunked(chunk_size, on_chunk=tv_builder.add if tv_builder else None)
+            if tv_builder is not None:
+                tv_index = tv_builder.build()
+        else:
+            # Normalize data through adapter
+            df = adapter.normalize()
+
+            # Share the adapter's cleaned Flight rows with the TV metrics lookup
+            if isinstance(adapter, BulkPlanAdapter):
+                tv_index = TvMetricsIndex.from_flight_frame(adapter.load_raw_frame(), logger)
+
+        # Only BulkPlan sources persist their (month-level) TV metrics
+        if isinstance(adapter, BulkPlanAdapter):
+            tv_frame = tv_index.to_frame()
+
+    summary = SourceSummary(
+        path=excel_path,
+        source_format=detected_format,
+        rows=len(df),
+        seconds=time.perf_counter() - started,
+        from_cache=cached is not None,
+    )
+    return _NormalizedSource(
+        summary=summary,
+        frame=df,
+        tv_index=tv_index,
+        cache_key=cache_key if cached is None else None,
+        tv_frame=tv_frame,
+    )
+
+
+def _normalize_source_worker(
+    excel_path: Path,
+    config: Config,
+    logger_name: str,
+    format_type: InputFormat,
+    use_cache: bool,
+) -> _NormalizedSource:
+    """Process-pool entry point for :func:`_normalize_source`."""
+    return _normalize_source(excel_path, config, logging.getLogger(logger_name), format_type, use_cache)
+
+
+def _store_normalized(result: _NormalizedSource, config: Config, logger: logging.Logger) -> None:
+    if result.cache_key is not None:
+        DataCache.from_config(config, logger).store(result.cache_key, result.frame, result.tv_frame)
+
+
+def _normalize_sources(
+    sources: Sequence[tuple[Path, InputFormat]],
+    config: Config,
+    logger: logging.Logger,
+    use_cache: bool,
+) -> list[_NormalizedSource]:
+    """Normalize every source, in a process pool when there are several workers."""
+    workers = max_workers(config, len(sources))
+    if workers == 1:
+        return [_normalize_source(path, config, logger, source_format, use_cache) for path, source_format in sources]
+
+    logger.info("Normalizing %s sources with %s worker processes", len(sources), workers)
+    with process_pool(workers) as pool:
+        futures = [
+            pool.submit(_normalize_source_worker, path, config, logger.name, source_format, use_cache)
+            for path, source_format in sources
+        ]
+        return [future.result() for future in futures]
+
+
+def _check_mergeable(sources: Sequence[tuple[Path, InputFormat]]) -> None:
+    """Refuse to merge BulkPlan-layout and Flowplan-layout sources."""
+    families = {issubclass(ADAPTER_FORMATS[source_format], FlowplanAdapter) for _, source_format in sources}
+    if len(families) > 1:
+        formats = ", ".join(f"{path.name}={source_format.value}" for path, source_format in sources)
+        raise ValueError(f"Cannot merge BulkPlan and Flowplan sources in one run ({formats})")
+
+
+def _merge_sources(results: Sequence[_NormalizedSource], logger: logging.Logger) -> pd.DataFrame:
+    """Concatenate normalized sources, dropping rows repeated across overlapping exports.
+
+    A campaign line (``MERGE_KEY_COLUMNS``) that several sources export with
+    different values would be counted once per source, so it is rejected.
+    """
+    frame = pd.concat(
+        [result.frame.assign(_source=index) for index, result in enumerate(results)], ignore_index=True
+    )
+    values = [column for column in frame.columns if column != "_source"]
+    merged = frame.drop_duplicates(subset=values, ignore_index=True)
+    if len(merged) < len(frame):
+        logger.info("Dropped %s rows duplicated across sources", len(frame) - len(merged))
+
+    shared = merged[merged.duplicated(subset=MERGE_KEY_COLUMNS, keep=False)]
+    conflicts = [
+        (key, sorted(group["_source"].unique()))
+        for key, group in shared.groupby(MERGE_KEY_COLUMNS, observed=True, dropna=False, sort=False)
+        if group["_source"].nunique() > 1
+    ]
+    if conflicts:
+        key, sources = conflicts[0]
+        files = ", ".join(results[index].summary.path.name for index in sources)
+        raise ValueError(
+            f"{len(conflicts)} campaign lines have different values in different sources; "
+            f"first: {dict(zip(MERGE_KEY_COLUMNS, key))} in {files}"
+        )
+    return merged.drop(columns="_source")
+
+
 def load_and_prepare_data(
-    excel_path: str | Path,
+    excel_path: str | Path | Sequence[str | Path],
     config: Config,
     logger: logging.Logger,
     *,
     format_type: InputFormat = InputFormat.AUTO,
+    use_cache: bool = True,
 ) -> DataSet:
     """Load raw Excel data and return the cleaned dataset ready for slide assembly.
 
     This function uses the adapter pattern to support multiple input formats:
     - BulkPlanData (Flight sheet format from Lumina)
     - Flowplan_Summaries (aggregated report format)
+    - Either layout exported as Parquet, CSV or Arrow IPC (no xlsx decoding)
 
     Args:
-        excel_path: Path to the input Excel file.
+        excel_path: Path to the input Excel file or columnar export, a
+            directory of them, or a sequence of files/directories.
         config: Configuration object.
         logger: Logger instance.
         format_type: Explicit format or AUTO for auto-detection.
+        use_cache: Reuse/populate the on-disk normalized dataset cache
+            (``performance.data_cache``); unchanged workbooks then skip Excel.
+
+    With ``performance.optimization.enable_chunking`` the source sheet is
+    streamed in ``chunk_size`` batches (see ``InputAdapter.normalize_chunked``)
+    so the raw rows are never held in memory at once.
+
+    Several sources are normalized in parallel worker processes
+    (``performance.optimization.max_workers``, default one per CPU), then
+    merged, de-duplicated and validated as one dataset; their TV metrics are
+    merged into one index keyed by the tuple of sources.
 
     Returns:
         DataSet containing the prepared DataFrame.
     """
-    excel_path = Path(excel_path)
-    if not excel_path.is_file():
-        raise FileNotFoundError(f"Excel source not found: {excel_path}")
-
-    # Get the appropriate adapter
-    adapter = get_adapter(excel_path, format_type, logger)
-    detected_format = detect_format(excel_path) if format_type == InputFormat.AUTO else format_type
-    logger.info("Using %s adapter for %s", detected_format.value, excel_path.name)
-
-    # Normalize data through adapter
-    df = adapter.normalize()
+    sources = resolve_sources(excel_path)
+    started = time.perf_counter()
+    formats = [detect_format(path) if format_type == InputFormat.AUTO else format_type for path in sources]
+    if len(sources) > 1:
+        _check_mergeable(list(zip(sources, formats)))
+    results = _normalize_sources(list(zip(sources, formats)), config, logger, use_cache)
+    for result in results:
+        _store_normalized(result, config, logger)
+
+    if len(results) == 1:
+        tv_key: Path | tuple[Path, ...] = sources[0]
+        df = results[0].frame
+        tv_index = results[0].tv_index
+    else:
+        tv_key = sources
+        df = _merge_sources(results, logger)
+        tv_index = TvMetricsIndex.merge(result.tv_index for result in results)
+        for result in results:
+            summary = result.summary
+            logger.info(
+                "Source %s: %s rows in %.2fs (%s%s)",
+                summary.path.name,
+                summary.rows,
+                summary.seconds,
+                summary.source_format.value,
+                ", cached" if summary.from_cache else "",
+            )
+        logger.info(
+            "Merged %s sources into %s rows in %.2fs (slowest source %.2fs)",
+            len(results),
+            len(df),
+            time.perf_counter() - started,
+            max(result.summary.seconds for result in results),
+        )
+    _store_tv_metrics_index(tv_key, tv_index)
 
     # Validate minimum rows
     data_section = config.section("data")
@@ -82,18 +368,28 @@ def load_and_prepare_data(
     media_section = data_section.get("media_types", {})
     mapping = media_section.get("mapping", {})
     df["Mapped Media Type"] = df["Media Type"].map(lambda m: mapping.get(m, m))
+    df["Normalized Media"] = _map_unique(df["Mapped Media Type"], display_media_type).fillna("Other")
+
+    optimization = (config.get("performance", {}) or {}).get("optimization", {}) or {}
+    if optimization.get("optimize_dtypes", True):
+        df = _optimize_dtypes(df, logger)
 
     # Log TV metrics summary
     tv_campaigns_with_metrics = len(df[(df["Media Type"] == "Television") & df["GRP"].notna()])
     logger.info("TV campaigns with metrics: %s", tv_campaigns_with_metrics)
     logger.info("Final dataset prepared with shape %s", df.shape)
 
-    return DataSet(frame=df, source_format=detected_format)
+    return DataSet(
+        frame=df,
+        source_format=results[0].summary.source_format,
+        from_cache=all(result.summary.from_cache for result in results),
+        sources=tuple(result.summary for result in results),
+    )
 
 
-# --- Legacy function for month-specific TV metrics lookup ---
-# This function is kept for backward compatibility and TV metric lookups
-# during assembly. It only works with BulkPlanData format.
+# --- Month-specific TV metrics lookup ---
+# Used for TV metric rows during assembly. Only BulkPlanData workbooks carry
+# month-level metrics; Flowplan metrics are already in the main dataset.
 
 def _extract_country(raw_value: str | float | None, separator: str) -> Optional[str]:
     """Extract the terminal geography token from a hierarchical value."""
@@ -113,153 +409,289 @@ def _clean_brand(raw_value: str | float | None) -> str:
     return brand.strip()
 
 
-def get_month_specific_tv_metrics(
-    raw_excel_path: str | Path,
-    country: str,
-    brand: str,
-    campaign: str,
-    year: int,
-    month: str,
-    *,
-    logger: Optional[logging.Logger] = None,
-) -> dict[str, float]:
-    """Aggregate month-specific TV metrics for a campaign.
+TV_METRIC_SOURCE_COLUMNS = {
+    "National GRP": "grp_sum",
+    "Frequency": "frequency_avg",
+    "Reach 1+": "reach1_avg",
+    "Reach 3+": "reach3_avg",
+}
+
+TvMetricsKey = tuple[str, str, object, object, str]
+TV_METRICS_KEY_COLUMNS = ["country", "brand", "campaign", "year", "month"]
+
+
+def _empty_tv_metrics() -> dict[str, float]:
+    """Return the metrics payload used when no TV rows match a lookup."""
+    return {
+        "grp_sum": 0,
+        "frequency_avg": np.nan,
+        "reach1_avg": np.nan,
+        "reach3_avg": np.nan,
+    }
+
+
+def _map_unique(series: pd.Series, func) -> pd.Series:
+    """Apply ``func`` once per distinct value and broadcast the results back."""
+    uniques = series.dropna().unique()
+    lookup = {value: func(value) for value in uniques}
+    return series.map(lookup)
 
-    Note: This function currently only supports BulkPlanData format.
-    For Flowplan format, metrics are already aggregated in the main data.
+
+@dataclass(slots=True)
+class TvMetricsIndex:
+    """Month-level TV metrics keyed by (country, brand, campaign, year, month).
+
+    Built once per workbook with a single groupby so that assembly can resolve
+    the metrics for any campaign/month with a dictionary lookup instead of
+    re-filtering the Flight sheet.
     """
-    logger = logger or logging.getLogger("amp_automation.data")
-    raw_excel_path = Path(raw_excel_path)
 
-    if not raw_excel_path.is_file():
-        raise FileNotFoundError(raw_excel_path)
+    entries: dict[TvMetricsKey, dict[str, float]]
+
+    @classmethod
+    def empty(cls) -> "TvMetricsIndex":
+        return cls(entries={})
+
+    @classmethod
+    def from_flight_frame(
+        cls,
+        df: pd.DataFrame,
+        logger: Optional[logging.Logger] = None,
+    ) -> "TvMetricsIndex":
+        """Aggregate a cleaned Flight-sheet frame into a lookup table."""
+        builder = TvMetricsBuilder(logger or logging.getLogger("amp_automation.data"))
+        builder.add(df)
+        return builder.build()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Flatten the index into a frame (one row per key) for persistence."""
+        records = [
+            {**dict(zip(TV_METRICS_KEY_COLUMNS, key)), **metrics}
+            for key, metrics in self.entries.items()
+        ]
+        columns = [*TV_METRICS_KEY_COLUMNS, *TV_METRIC_SOURCE_COLUMNS.values()]
+        return pd.DataFrame.from_records(records, columns=columns)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "TvMetricsIndex":
+        """Rebuild an index from :meth:`to_frame` output."""
+        metric_keys = list(TV_METRIC_SOURCE_COLUMNS.values())
+        keys = frame[TV_METRICS_KEY_COLUMNS].itertuples(index=False, name=None)
+        metrics = frame[metric_keys].to_dict("records")
+        return cls(entries=dict(zip(keys, metrics)))
+
+    def lookup(
+        self,
+        country: str,
+        brand: str,
+        campaign: str,
+        year: int,
+        month: str,
+    ) -> dict[str, float]:
+        """Return the metrics for one campaign/month (zero/NaN when absent)."""
+        month_normalised = MONTH_ALIAS_MAP.get(month, month)
+        metrics = self.entries.get((country, brand, campaign, year, month_normalised))
+        if metrics is None:
+            return _empty_tv_metrics()
+        return dict(metrics)
+
+    @classmethod
+    def merge(cls, indexes: Iterable["TvMetricsIndex"]) -> "TvMetricsIndex":
+        """Union of several indexes; the first source wins for keys present in more than one."""
+        entries: dict[TvMetricsKey, dict[str, float]] = {}
+        for index in indexes:
+            for key, metrics in index.entries.items():
+                entries.setdefault(key, metrics)
+        return cls(entries=entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def _tv_metrics_partial(df: pd.DataFrame, metric_columns: list[str]) -> pd.DataFrame:
+    """Per-key GRP sums and reach/frequency sums and counts over the TV rows of ``df``."""
+    tv_mask = df["Media Type"] == "Television"
+
+    # Exclude GNE Pan Asian TV campaigns
+    if "Flight Comments" in df.columns:
+        gne_mask = df["Plan - Geography"].astype(str).str.contains("GNE", na=False)
+        pan_asian_mask = df["Flight Comments"].astype(str).str.contains("Pan Asian TV", na=False)
+        tv_mask &= ~(gne_mask & pan_asian_mask)
+
+    # Exclude Expert campaigns (same filter as in adapter)
+    if "Plan Name" in df.columns:
+        tv_mask &= ~df["Plan Name"].astype(str).str.contains("expert", case=False, na=False)
+
+    tv_df = df.loc[tv_mask]
+
+    separator = " | "
+    keyed = pd.DataFrame(
+        {
+            "country": _map_unique(tv_df["Plan - Geography"], lambda value: _extract_country(value, separator)),
+            "brand": _map_unique(tv_df["Plan - Brand"], _clean_brand).fillna(""),
+            "campaign": _strip_text(tv_df["**Campaign Name(s)"]),
+            "year": tv_df["Plan - Year"],
+            "month": tv_df["Month"],
+        },
+        index=tv_df.index,
+    )
+    aggregations: dict[str, tuple[str, str]] = {"rows": ("country", "size")}
+    for source_col in metric_columns:
+        metric_key = TV_METRIC_SOURCE_COLUMNS[source_col]
+        keyed[metric_key] = pd.to_numeric(tv_df[source_col], errors="coerce")
+        aggregations[metric_key] = (metric_key, "sum")
+        if metric_key != "grp_sum":
+            aggregations[f"{metric_key}_count"] = (metric_key, "count")
+
+    return keyed.groupby(TV_METRICS_KEY_COLUMNS, sort=False).agg(**aggregations)
+
+
+@dataclass(slots=True)
+class TvMetricsBuilder:
+    """Fold cleaned Flight-sheet batches into a :class:`TvMetricsIndex`.
+
+    Each :meth:`add` reduces its batch to per-key sums and counts, so
+    chunked ingestion can build the index without keeping the Flight rows.
+    """
 
-    # Check if this is a Flowplan file - return empty metrics
-    # (metrics are already in the main dataset for Flowplan)
+    logger: logging.Logger = field(default_factory=lambda: logging.getLogger("amp_automation.data"))
+    _metric_columns: Optional[list[str]] = None
+    _partial: Optional[pd.DataFrame] = None
+
+    def add(self, df: pd.DataFrame) -> None:
+        if self._metric_columns is None:
+            required = ["Plan - Geography", "Plan - Brand", "**Campaign Name(s)", "Plan - Year", "Month", "Media Type"]
+            missing_keys = [col for col in required if col not in df.columns]
+            if missing_keys:
+                self.logger.warning("Cannot build TV metrics index; missing columns: %s", missing_keys)
+                self._metric_columns = []
+                return
+            missing_cols = [col for col in TV_METRIC_SOURCE_COLUMNS if col not in df.columns]
+            if missing_cols:
+                self.logger.warning("Missing TV metric columns in month-specific function: %s", missing_cols)
+            self._metric_columns = [col for col in TV_METRIC_SOURCE_COLUMNS if col in df.columns]
+            self._partial = _tv_metrics_partial(df, self._metric_columns)
+            return
+        if self._partial is None:
+            return
+
+        combined = pd.concat([self._partial, _tv_metrics_partial(df, self._metric_columns)])
+        self._partial = combined.groupby(level=list(range(combined.index.nlevels)), sort=False).sum()
+
+    def build(self) -> TvMetricsIndex:
+        if self._partial is None or self._partial.empty:
+            return TvMetricsIndex.empty()
+
+        grouped = pd.DataFrame(index=self._partial.index)
+        for source_col in self._metric_columns or ():
+            metric_key = TV_METRIC_SOURCE_COLUMNS[source_col]
+            values = self._partial[metric_key]
+            if metric_key != "grp_sum":
+                values = values / self._partial[f"{metric_key}_count"]
+            grouped[metric_key] = values
+
+        defaults = _empty_tv_metrics()
+        defaults["grp_sum"] = 0.0
+        entries: dict[TvMetricsKey, dict[str, float]] = {}
+        for key, values in zip(grouped.index, grouped.to_dict("records")):
+            metrics = dict(defaults)
+            metrics.update(values)
+            entries[key] = metrics
+
+        self.logger.info("Built TV metrics index with %s campaign/month entries", len(entries))
+        return TvMetricsIndex(entries=entries)
+
+
+TvMetricsSource = Path | tuple[Path, ...]
+_TV_METRICS_INDEX_CACHE: dict[TvMetricsSource, tuple[tuple[tuple[int, int], ...], TvMetricsIndex]] = {}
+
+
+def _tv_metrics_cache_key(
+    raw_excel_path: TvMetricsSource,
+) -> tuple[TvMetricsSource, tuple[tuple[int, int], ...]]:
+    paths = raw_excel_path if isinstance(raw_excel_path, tuple) else (raw_excel_path,)
+    stats = [path.stat() for path in paths]
+    resolved = tuple(path.resolve() for path in paths)
+    key = resolved if isinstance(raw_excel_path, tuple) else resolved[0]
+    return key, tuple((stat.st_size, stat.st_mtime_ns) for stat in stats)
+
+
+def _store_tv_metrics_index(raw_excel_path: TvMetricsSource, index: TvMetricsIndex) -> None:
+    """Cache ``index`` as the TV metrics index for ``raw_excel_path`` (single entry)."""
+    key, signature = _tv_metrics_cache_key(raw_excel_path)
+    _TV_METRICS_INDEX_CACHE.clear()
+    _TV_METRICS_INDEX_CACHE[key] = (signature, index)
+
+
+def _build_tv_metrics_index(raw_excel_path: Path, logger: logging.Logger) -> TvMetricsIndex:
     try:
         detected = detect_format(raw_excel_path)
-        if detected == InputFormat.FLOWPLAN:
-            logger.debug("Flowplan format detected - TV metrics from main dataset")
-            return {
-                "grp_sum": 0,
-                "frequency_avg": np.nan,
-                "reach1_avg": np.nan,
-                "reach3_avg": np.nan,
-            }
     except ValueError:
-        pass  # Continue with BulkPlan logic
-
-    cache_attr = "_cached_data"
-    cached_df = getattr(get_month_specific_tv_metrics, cache_attr, None)
-
-    if cached_df is None or getattr(get_month_specific_tv_metrics, "_cached_path", None) != raw_excel_path:
-        df = pd.read_excel(raw_excel_path, sheet_name="Flight", header=0)
-        if "Month" not in df.columns or df["Month"].isna().all():
-            if "**Flight Start Date" in df.columns:
-                df["**Flight Start Date"] = pd.to_datetime(df["**Flight Start Date"])
-                df["Month"] = df["**Flight Start Date"].dt.strftime("%b")
-
-        # Apply same transformations as BulkPlanAdapter for consistency
-        # 1. Geography normalization
-        if "Plan - Geography" in df.columns:
-            def normalize_geography(geo_value: str) -> str:
-                if pd.isna(geo_value):
-                    return geo_value
-                geo_str = str(geo_value)
-                # Remove duplicate segments
-                if geo_str.endswith("Pakistan | Pakistan"):
-                    geo_str = geo_str.replace("Pakistan | Pakistan", "Pakistan")
-                elif geo_str.endswith("South Africa | South Africa"):
-                    geo_str = geo_str.replace("South Africa | South Africa", "South Africa")
-                elif geo_str.endswith("Turkey | Turkey"):
-                    geo_str = geo_str.replace("Turkey | Turkey", "Turkey")
-                # Remove "East Africa" layer
-                if "East Africa | Kenya" in geo_str:
-                    geo_str = geo_str.replace("East Africa | Kenya", "Kenya")
-                elif "East Africa | Mauritius" in geo_str:
-                    geo_str = geo_str.replace("East Africa | Mauritius", "SSA")
-                elif "East Africa | Nigeria" in geo_str:
-                    geo_str = geo_str.replace("East Africa | Nigeria", "Nigeria")
-                elif "East Africa | Uganda" in geo_str:
-                    geo_str = geo_str.replace("East Africa | Uganda", "SSA")
-                # Rename region codes
-                if geo_str.endswith("| FWA"):
-                    geo_str = geo_str.replace("| FWA", "| FSA")
-                elif geo_str.endswith("| GINE"):
-                    geo_str = geo_str.replace("| GINE", "| GNE")
-                elif geo_str.endswith("| KSA"):
-                    geo_str = geo_str.replace("| KSA", "| Saudi Arabia")
-                elif geo_str.endswith("| MOR"):
-                    geo_str = geo_str.replace("| MOR", "| Maghreb")
-                return geo_str
-            df["Plan - Geography"] = df["Plan - Geography"].apply(normalize_geography)
-
-        # 2. Panadol brand splitting
-        if "Plan - Brand" in df.columns and "**Product Business" in df.columns:
-            panadol_mask = df["Plan - Brand"].astype(str).str.contains("Panadol", case=False, na=False)
-            if panadol_mask.sum() > 0:
-                pain_mask = panadol_mask & df["**Product Business"].astype(str).str.contains("Pain", case=False, na=False)
-                cold_mask = panadol_mask & df["**Product Business"].astype(str).str.contains("Cold", case=False, na=False)
-                df.loc[pain_mask, "Plan - Brand"] = df.loc[pain_mask, "Plan - Brand"].str.replace(
-                    "Panadol", "Panadol Pain", case=False, regex=False
-                )
-                df.loc[cold_mask, "Plan - Brand"] = df.loc[cold_mask, "Plan - Brand"].str.replace(
-                    "Panadol", "Panadol C&F", case=False, regex=False
-                )
-
-        setattr(get_month_specific_tv_metrics, cache_attr, df)
-        setattr(get_month_specific_tv_metrics, "_cached_path", raw_excel_path)
-    else:
-        df = cached_df
+        detected = InputFormat.BULK_PLAN  # Continue with BulkPlan logic
 
-    separator = " | "
-    month_normalised = MONTH_ALIAS_MAP.get(month, month)
-
-    filtered_data = df[
-        (df["Plan - Geography"].apply(lambda value: _extract_country(value, separator)) == country)
-        & (df["Plan - Brand"].apply(_clean_brand) == brand)
-        & (df["**Campaign Name(s)"] == campaign)
-        & (df["Plan - Year"] == year)
-        & (df["Month"] == month_normalised)
-        & (df["Media Type"] == "Television")
-    ]
+    adapter = get_adapter(raw_excel_path, detected, logger)
+    if isinstance(adapter, FlowplanAdapter):
+        logger.debug("Flowplan format detected - TV metrics from main dataset")
+        return TvMetricsIndex.empty()
+    return TvMetricsIndex.from_flight_frame(adapter.load_raw_frame(), logger)
 
-    # Exclude GNE Pan Asian TV campaigns
-    gne_mask = filtered_data["Plan - Geography"].astype(str).str.contains("GNE", na=False)
-    pan_asian_mask = filtered_data["Flight Comments"].astype(str).str.contains("Pan Asian TV", na=False)
-    filtered_data = filtered_data[~(gne_mask & pan_asian_mask)]
 
-    # Exclude Expert campaigns (same filter as in adapter)
-    if "Plan Name" in filtered_data.columns:
-        filtered_data = filtered_data[~filtered_data["Plan Name"].astype(str).str.contains("expert", case=False, na=False)]
+def get_tv_metrics_index(
+    raw_excel_path: str | Path | Sequence[str | Path],
+    *,
+    logger: Optional[logging.Logger] = None,
+) -> TvMetricsIndex:
+    """Return the cached TV metrics index for a workbook, building it on first use.
 
-    if filtered_data.empty:
-        return {
-            "grp_sum": 0,
-            "frequency_avg": np.nan,
-            "reach1_avg": np.nan,
-            "reach3_avg": np.nan,
-        }
+    ``load_and_prepare_data`` primes the cache from the adapter's cleaned Flight
+    frame, so during a normal run the workbook is not read a second time.
+    Several sources (see :func:`resolve_sources`) share one merged index.
 
-    available_cols = filtered_data.columns.tolist()
-    missing_cols = [col for col in ["National GRP", "Frequency", "Reach 1+", "Reach 3+"] if col not in available_cols]
-    if missing_cols:
-        logger.warning("Missing TV metric columns in month-specific function: %s", missing_cols)
+    Note: Only BulkPlanData workbooks carry month-level TV metrics. Flowplan
+    workbooks yield an empty index because their metrics are already in the
+    main dataset.
+    """
+    logger = logger or logging.getLogger("amp_automation.data")
+    sources = resolve_sources(raw_excel_path)
+    source_key: TvMetricsSource = sources[0] if len(sources) == 1 else sources
 
-    grp_sum = filtered_data["National GRP"].dropna().sum() if "National GRP" in available_cols else 0
+    key, signature = _tv_metrics_cache_key(source_key)
+    cached = _TV_METRICS_INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
 
-    freq_values = filtered_data["Frequency"].dropna() if "Frequency" in available_cols else pd.Series(dtype=float)
-    frequency_avg = freq_values.mean() if len(freq_values) > 0 else np.nan
+    index = TvMetricsIndex.merge(_build_tv_metrics_index(path, logger) for path in sources)
+    _store_tv_metrics_index(source_key, index)
+    return index
 
-    reach1_values = filtered_data["Reach 1+"].dropna() if "Reach 1+" in available_cols else pd.Series(dtype=float)
-    reach1_avg = reach1_values.mean() if len(reach1_values) > 0 else np.nan
 
-    reach3_values = filtered_data["Reach 3+"].dropna() if "Reach 3+" in available_cols else pd.Series(dtype=float)
-    reach3_avg = reach3_values.mean() if len(reach3_values) > 0 else np.nan
+def prime_tv_metrics_index(
+    raw_excel_path: str | Path | Sequence[str | Path],
+    index: TvMetricsIndex,
+) -> None:
+    """Install ``index`` as the cached TV metrics index for ``raw_excel_path``.
 
-    return {
-        "grp_sum": grp_sum,
-        "frequency_avg": frequency_avg,
-        "reach1_avg": reach1_avg,
-        "reach3_avg": reach3_avg,
-    }
+    Worker processes receive the parent's index this way instead of reading
+    the workbook again.
+    """
+    sources = resolve_sources(raw_excel_path)
+    _store_tv_metrics_index(sources[0] if len(sources) == 1 else sources, index)
+
+
+def get_month_specific_tv_metrics(
+    raw_excel_path: str | Path | Sequence[str | Path],
+    country: str,
+    brand: str,
+    campaign: str,
+    year: int,
+    month: str,
+    *,
+    logger: Optional[logging.Logger] = None,
+) -> dict[str, float]:
+    """Aggregate month-specific TV metrics for a campaign.
+
+    Thin wrapper over :func:`get_tv_metrics_index`; prefer fetching the index
+    once and calling :meth:`TvMetricsIndex.lookup` when resolving many months.
+    """
+    index = get_tv_metrics_index(raw_excel_path, logger=logger)
+    return index.lookup(country, brand, campaign, year, month)
@@ -0,0 +1,157 @@
+"""Pre-partitioned row lookups for market/brand/year slices of the dataset.
+
+Deck assembly repeatedly needs the rows of one (country, brand, year) or
+(country, brand, year, product) combination. Building boolean masks over the
+full frame for every slide makes generation O(combinations x rows); the
+partition index normalises the key columns once and maps every key to its
+row positions so each lookup only touches the rows it returns.
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["PartitionIndex", "partition_index_for"]
+
+
+def _normalize_key(value: object) -> str:
+    """Normalise a lookup value the same way the key columns are normalised."""
+    return str(value).strip()
+
+
+def _normalize_column(series: pd.Series) -> pd.Series:
+    return series.astype(str).str.strip()
+
+
+_EMPTY_POSITIONS = np.empty(0, dtype=np.intp)
+
+
+@dataclass(slots=True)
+class PartitionIndex:
+    """Row positions of a frame grouped by stripped-string Country/Brand/Year(/Product) keys.
+
+    Lookups are equivalent to filtering with
+    ``df[col].astype(str).str.strip() == str(value).strip()`` on each key
+    column; rows keep their original order and index labels.
+    """
+
+    _frame_ref: weakref.ref
+    _row_count: int
+    _by_brand: dict[tuple[str, str], np.ndarray]
+    _by_combination: dict[tuple[str, str, str], np.ndarray]
+    _products: Optional[np.ndarray]
+    _products_upper: Optional[np.ndarray]
+    _product_names_upper: frozenset[str]
+
+    @classmethod
+    def build(cls, frame: pd.DataFrame) -> "PartitionIndex":
+        """Partition ``frame`` by its Country, Brand and Year columns."""
+        keys = pd.DataFrame(
+            {
+                "country": _normalize_column(frame["Country"]),
+                "brand": _normalize_column(frame["Brand"]),
+                "year": _normalize_column(frame["Year"]),
+            }
+        )
+        by_brand = keys.groupby(["country", "brand"], sort=False, dropna=False).indices
+        by_combination = keys.groupby(["country", "brand", "year"], sort=False, dropna=False).indices
+
+        products = products_upper = None
+        product_names_upper: frozenset[str] = frozenset()
+        if "Product" in frame.columns:
+            normalized_products = _normalize_column(frame["Product"])
+            products = normalized_products.to_numpy(dtype=object)
+            products_upper = normalized_products.str.upper().to_numpy(dtype=object)
+            product_names_upper = frozenset(value for value in products_upper if isinstance(value, str))
+
+        return cls(
+            _frame_ref=weakref.ref(frame),
+            _row_count=len(frame),
+            _by_brand=by_brand,
+            _by_combination=by_combination,
+            _products=products,
+            _products_upper=products_upper,
+            _product_names_upper=product_names_upper,
+        )
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        frame = self._frame_ref()
+        if frame is None:
+            raise ReferenceError("Partitioned DataFrame no longer exists")
+        return frame
+
+    def is_current_for(self, frame: pd.DataFrame) -> bool:
+        return self._frame_ref() is frame and len(frame) == self._row_count
+
+    def positions(
+        self,
+        country: object,
+        brand: object,
+        year: object | None = None,
+        *,
+        product: object | None = None,
+        ignore_product_case: bool = False,
+    ) -> np.ndarray:
+        """Return the row positions for a combination (year/product optional)."""
+        if year is None:
+            positions = self._by_brand.get((_normalize_key(country), _normalize_key(brand)), _EMPTY_POSITIONS)
+        else:
+            positions = self._by_combination.get(
+                (_normalize_key(country), _normalize_key(brand), _normalize_key(year)), _EMPTY_POSITIONS
+            )
+
+        if product is not None and len(positions):
+            if self._products is None:
+                raise KeyError("Product")
+            target = _normalize_key(product)
+            if ignore_product_case:
+                positions = positions[self._products_upper[positions] == target.upper()]
+            else:
+                positions = positions[self._products[positions] == target]
+        return positions
+
+    def rows(
+        self,
+        country: object,
+        brand: object,
+        year: object | None = None,
+        *,
+        product: object | None = None,
+        ignore_product_case: bool = False,
+    ) -> pd.DataFrame:
+        """Return the frame rows for a combination, in original order."""
+        positions = self.positions(
+            country, brand, year, product=product, ignore_product_case=ignore_product_case
+        )
+        return self.frame.iloc[positions]
+
+    def has_product(self, product: object) -> bool:
+        """Return True if any row's product matches ``product`` case-insensitively."""
+        return _normalize_key(product).upper() in self._product_names_upper
+
+
+_PARTITION_INDEXES: dict[int, PartitionIndex] = {}
+
+
+def partition_index_for(frame: pd.DataFrame) -> PartitionIndex:
+    """Return the partition index for ``frame``, building it on first use.
+
+    Indexes are cached per frame object and dropped when the frame is garbage
+    collected; a frame whose length changed since indexing is re-partitioned.
+    """
+    key = id(frame)
+    index = _PARTITION_INDEXES.get(key)
+    if index is not None and index.is_current_for(frame):
+        return index
+
+    index = PartitionIndex.build(frame)
+    if key not in _PARTITION_INDEXES:
+        weakref.finalize(frame, _PARTITION_INDEXES.pop, key, None)
+    _PARTITION_INDEXES[key] = index
+    return index
@@ -0,0 +1,257 @@
+"""Column-projected worksheet readers for the input adapters.
+
+``pd.read_excel`` materialises every cell of a sheet before it can drop
+unused columns, and Lumina exports carry dozens of columns the adapters
+never look at. Adapters therefore declare the columns they consume and read
+their source sheet through :func:`read_sheet`, which only converts those
+columns. Engines:
+
+``openpyxl``
+    Streams rows from a read-only workbook, keeping just the projected
+    cells of each row. Always available.
+``calamine``
+    ``pd.read_excel(engine="calamine")`` restricted to the projected columns;
+    much faster when ``python-calamine`` is installed.
+``pandas``
+    Plain ``pd.read_excel`` with ``usecols`` (the pre-projection behaviour).
+``auto``
+    ``calamine`` when installed, otherwise ``openpyxl``.
+
+All engines return the same frame ``pd.read_excel(...)[columns]`` would.
+:func:`iter_sheet_chunks` yields the same rows in bounded batches; it always
+streams with openpyxl for xlsx/xlsm (the other engines parse whole sheets).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from amp_automation.config import Config
+from amp_automation.data.workbook_probe import probe_workbook
+
+__all__ = ["READER_ENGINES", "ReaderOptions", "available_engines", "iter_sheet_chunks", "read_sheet", "resolve_engine"]
+
+DEFAULT_ENGINE = "auto"
+
+_STREAMABLE_SUFFIXES = {".xlsx", ".xlsm"}
+
+_logger = logging.getLogger("amp_automation.data.sheet_reader")
+
+
+@dataclass(slots=True, frozen=True)
+class ReaderOptions:
+    """How adapters read their source sheet (``data.excel.reader``)."""
+
+    engine: str = DEFAULT_ENGINE
+    project_columns: bool = True
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ReaderOptions":
+        data_section = config.get("data", {}) or {}
+        settings = (data_section.get("excel", {}) or {}).get("reader", {}) or {}
+        return cls(
+            engine=str(settings.get("engine", DEFAULT_ENGINE)).lower(),
+            project_columns=bool(settings.get("project_columns", True)),
+        )
+
+
+def _calamine_installed() -> bool:
+    return importlib.util.find_spec("python_calamine") is not None
+
+
+def available_engines() -> list[str]:
+    """Concrete engine names usable in this environment."""
+    engines = ["openpyxl", "pandas"]
+    if _calamine_installed():
+        engines.insert(0, "calamine")
+    return engines
+
+
+def resolve_engine(engine: str) -> str:
+    """Map ``auto`` (or an unavailable engine) onto a concrete engine name."""
+    engine = (engine or DEFAULT_ENGINE).lower()
+    if engine not in READER_ENGINES and engine != "auto":
+        raise ValueError(f"Unknown sheet reader engine: {engine}")
+    if engine == "calamine" and not _calamine_installed():
+        _logger.warning("python-calamine is not installed; falling back to the openpyxl streaming reader")
+        return "openpyxl"
+    if engine == "auto":
+        return "calamine" if _calamine_installed() else "openpyxl"
+    return engine
+
+
+def _projection(path: Path, sheet_name: str, columns: Optional[Iterable[str]]) -> tuple[list[int], list[str]]:
+    """Positions and names of the requested columns present in the sheet header."""
+    header = probe_workbook(path).header(sheet_name)
+    if columns is None:
+        return list(range(len(header))), list(header)
+    wanted = set(columns)
+    positions = [index for index, name in enumerate(header) if name in wanted]
+    return positions, [header[index] for index in positions]
+
+
+def _read_with_pandas(path: Path, sheet_name: str, positions: Sequence[int], engine: Optional[str]) -> pd.DataFrame:
+    kwargs = {"engine": engine} if engine else {}
+    return pd.read_excel(path, sheet_name=sheet_name, header=0, usecols=list(positions), **kwargs)
+
+
+# Cached cell values openpyxl reports for error cells; pandas reads them as NaN
+_ERROR_VALUES = frozenset({"#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"})
+
+
+def _convert_value(value: object) -> object:
+    """Mirror pandas' openpyxl cell conversion for a ``values_only`` cell."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value in _ERROR_VALUES:
+        return np.nan
+    return value
+
+
+def _stream_rows(path: Path, sheet_name: str, positions: Sequence[int]) -> Iterator[list[object]]:
+    """Yield the projected, converted data rows of ``sheet_name`` from a read-only workbook."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook[sheet_name]
+        sheet.reset_dimensions()
+
+        blank = [""] * len(positions)
+        pending_blank_rows = 0
+        row_iter = sheet.iter_rows(values_only=True)
+        next(row_iter, None)  # header row; names come from the probe
+        for row in row_iter:
+            # Blank rows are kept unless they trail the data, as in read_excel
+            if all(value is None for value in row):
+                pending_blank_rows += 1
+                continue
+            for _ in range(pending_blank_rows):
+                yield list(blank)
+            pending_blank_rows = 0
+            width = len(row)
+            yield [_convert_value(row[index]) if index < width else "" for index in positions]
+    finally:
+        workbook.close()
+
+
+def _rows_to_frame(names: Sequence[str], rows: list[list[object]]) -> pd.DataFrame:
+    """Type-infer converted rows the way ``read_excel`` does."""
+    return TextParser([list(names), *rows], header=0, skip_blank_lines=False).read()
+
+
+def _read_streaming(path: Path, sheet_name: str, positions: Sequence[int], names: Sequence[str]) -> pd.DataFrame:
+    return _rows_to_frame(names, list(_stream_rows(path, sheet_name, positions)))
+
+
+READER_ENGINES: dict[str, Callable[[Path, str, Sequence[int], Sequence[str]], pd.DataFrame]] = {
+    "openpyxl": _read_streaming,
+    "calamine": lambda path, sheet, positions, names: _read_with_pandas(path, sheet, positions, "calamine"),
+    "pandas": lambda path, sheet, positions, names: _read_with_pandas(path, sheet, positions, None),
+}
+
+
+def read_sheet(
+    path: str | Path,
+    sheet_name: str,
+    columns: Optional[Iterable[str]] = None,
+    *,
+    engine: str = DEFAULT_ENGINE,
+    logger: Optional[logging.Logger] = None,
+) -> pd.DataFrame:
+    """Read ``sheet_name`` keeping only ``columns`` (all columns when None).
+
+    Requested columns missing from the sheet are skipped; callers already
+    guard optional columns. Columns keep their sheet order.
+    """
+    logger = logger or _logger
+    path = Path(path)
+    engine_name = resolve_engine(engine)
+    if engine_name == "openpyxl" and path.suffix.lower() not in _STREAMABLE_SUFFIXES:
+        engine_name = "pandas"
+
+    positions, names = _projection(path, sheet_name, columns)
+    started = time.perf_counter()
+    frame = READER_ENGINES[engine_name](path, sheet_name, positions, names)
+    logger.info(
+        "Read %s rows x %s columns from %s[%s] with %s engine in %.3fs",
+        len(frame),
+        len(frame.columns),
+        path.name,
+        sheet_name,
+        engine_name,
+        time.perf_counter() - started,
+    )
+    return frame
+
+
+def iter_sheet_chunks(
+    path: str | Path,
+    sheet_name: str,
+    columns: Optional[Iterable[str]] = None,
+    *,
+    chunk_size: int,
+    engine: str = DEFAULT_ENGINE,
+    logger: Optional[logging.Logger] = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``sheet_name`` in frames of at most ``chunk_size`` rows.
+
+    Rows are projected like :func:`read_sheet`, but dtypes are inferred per
+    chunk, so a column may come back numeric in one chunk and object in
+    another. Rows blank in every projected column are dropped. Formats
+    openpyxl cannot stream are read whole with ``engine`` and then sliced.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    logger = logger or _logger
+    path = Path(path)
+
+    if path.suffix.lower() not in _STREAMABLE_SUFFIXES:
+        logger.warning("%s cannot be streamed; reading it whole before chunking", path.name)
+        frame = read_sheet(path, sheet_name, columns, engine=engine, logger=logger)
+        for start in range(0, len(frame), chunk_size):
+            yield frame.iloc[start:start + chunk_size]
+        return
+
+    positions, names = _projection(path, sheet_name, columns)
+    total_rows = 0
+    chunks = 0
+    batch: list[list[object]] = []
+    for row in _stream_rows(path, sheet_name, positions):
+        if all(value == "" for value in row):
+            continue
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            chunk = _rows_to_frame(names, batch)
+            chunk.index += total_rows
+            total_rows += len(batch)
+            chunks += 1
+            batch = []
+            yield chunk
+    if batch or not chunks:
+        chunk = _rows_to_frame(names, batch)
+        chunk.index += total_rows
+        total_rows += len(batch)
+        chunks += 1
+        yield chunk
+
+    logger.info(
+        "Streamed %s rows x %s columns from %s[%s] in %s chunks of <= %s rows",
+        total_rows,
+        len(names),
+        path.name,
+        sheet_name,
+        chunks,
+        chunk_size,
+    )
@@ -0,0 +1,248 @@
+"""Lightweight workbook inspection used for input-format detection.
+
+Adapters only need sheet names and header rows to decide whether they can
+handle a workbook. Reading those through ``pd.ExcelFile`` parses the whole
+workbook, so this module reads them straight from the xlsx package
+(``xl/workbook.xml`` plus the first row of each requested sheet) and caches
+the result per path, invalidated when the file size or mtime changes.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import zipfile
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from xml.etree import ElementTree
+
+import pandas as pd
+
+__all__ = ["WorkbookProbe", "clear_probe_cache", "probe_workbook"]
+
+
+_WORKBOOK_PART = "xl/workbook.xml"
+_WORKBOOK_RELS_PART = "xl/_rels/workbook.xml.rels"
+_SHARED_STRINGS_PART = "xl/sharedStrings.xml"
+_REL_ID_ATTR = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_STRICT_REL_ID_ATTR = "{http://purl.oclc.org/ooxml/officeDocument/relationships}id"
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _column_index(cell_ref: str) -> int:
+    """Convert an A1-style cell reference into a zero-based column index."""
+    index = 0
+    for char in cell_ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - ord("A") + 1)
+    return index - 1
+
+
+def _dedupe_header(names: list[str]) -> tuple[str, ...]:
+    """Mangle duplicate header names the same way ``pd.read_excel`` does."""
+    counts: dict[str, int] = defaultdict(int)
+    deduped: list[str] = []
+    for name in names:
+        current = counts[name]
+        while current > 0:
+            counts[name] = current + 1
+            name = f"{name}.{current}"
+            current = counts[name]
+        deduped.append(name)
+        counts[name] = current + 1
+    return tuple(deduped)
+
+
+@dataclass(slots=True)
+class WorkbookProbe:
+    """Sheet names and header rows for a workbook, read without a full parse."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    sheet_names: tuple[str, ...]
+    _sheet_parts: dict[str, str] = field(default_factory=dict, repr=False)
+    _headers: dict[str, tuple[str, ...]] = field(default_factory=dict, repr=False)
+
+    @property
+    def signature(self) -> tuple[int, int]:
+        return self.size, self.mtime_ns
+
+    def has_sheet(self, sheet_name: str) -> bool:
+        return sheet_name in self.sheet_names
+
+    def header(self, sheet_name: str) -> tuple[str, ...]:
+        """Return the column names of ``sheet_name`` as ``pd.read_excel`` would.
+
+        Raises:
+            KeyError: If the workbook has no such sheet.
+        """
+        if sheet_name not in self.sheet_names:
+            raise KeyError(f"Sheet not found in {self.path.name}: {sheet_name}")
+
+        cached = self._headers.get(sheet_name)
+        if cached is not None:
+            return cached
+
+        part = self._sheet_parts.get(sheet_name)
+        if part is not None:
+            header = self._read_xlsx_header(part)
+        else:
+            frame = pd.read_excel(self.path, sheet_name=sheet_name, nrows=0)
+            header = tuple(str(column) for column in frame.columns)
+
+        self._headers[sheet_name] = header
+        return header
+
+    def _read_xlsx_header(self, part: str) -> tuple[str, ...]:
+        cells: dict[int, tuple[Optional[str], str]] = {}
+        with zipfile.ZipFile(self.path) as archive:
+            with archive.open(part) as stream:
+                in_row = False
+                next_column = 0
+                for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+                    name = _local_name(element.tag)
+                    if event == "start":
+                        if name == "row":
+                            in_row = True
+                        continue
+                    if name == "row":
+                        break
+                    if in_row and name == "c":
+                        cell_ref = element.get("r")
+                        column = _column_index(cell_ref) if cell_ref else next_column
+                        cells[column] = (element.get("t"), _cell_text(element))
+                        next_column = column + 1
+                        element.clear()
+
+            shared_indices = {int(text) for cell_type, text in cells.values() if cell_type == "s" and text}
+            shared = _read_shared_strings(archive, max(shared_indices)) if shared_indices else []
+
+        if not cells:
+            return ()
+
+        names: list[str] = []
+        for column in range(max(cells) + 1):
+            cell_type, text = cells.get(column, (None, ""))
+            if cell_type == "s" and text:
+                text = shared[int(text)]
+            names.append(text if text != "" else f"Unnamed: {column}")
+
+        # pandas drops trailing unnamed columns from the header row
+        while names and names[-1].startswith("Unnamed: "):
+            names.pop()
+        return _dedupe_header(names)
+
+
+def _cell_text(cell: ElementTree.Element) -> str:
+    """Return the raw text of a cell (value or inline string)."""
+    for child in cell:
+        name = _local_name(child.tag)
+        if name == "v":
+            return child.text or ""
+        if name == "is":
+            return _shared_string_text(child)
+    return ""
+
+
+def _shared_string_text(si: ElementTree.Element) -> str:
+    """Concatenate the plain and rich-text runs of a shared string, skipping phonetics."""
+    parts: list[str] = []
+    for child in si:
+        name = _local_name(child.tag)
+        if name == "t":
+            parts.append(child.text or "")
+        elif name == "r":
+            parts.extend(node.text or "" for node in child if _local_name(node.tag) == "t")
+    return "".join(parts)
+
+
+def _read_shared_strings(archive: zipfile.ZipFile, max_index: int) -> list[str]:
+    """Read shared strings up to ``max_index`` (inclusive) and stop."""
+    strings: list[str] = []
+    if _SHARED_STRINGS_PART not in archive.namelist():
+        return strings
+    with archive.open(_SHARED_STRINGS_PART) as stream:
+        for _, element in ElementTree.iterparse(stream, events=("end",)):
+            if _local_name(element.tag) != "si":
+                continue
+            strings.append(_shared_string_text(element))
+            element.clear()
+            if len(strings) > max_index:
+                break
+    return strings
+
+
+def _read_xlsx_sheet_parts(path: Path) -> dict[str, str]:
+    """Map sheet names to their worksheet part names inside an xlsx package."""
+    with zipfile.ZipFile(path) as archive:
+        workbook = ElementTree.fromstring(archive.read(_WORKBOOK_PART))
+        rels = ElementTree.fromstring(archive.read(_WORKBOOK_RELS_PART))
+
+    targets: dict[str, str] = {}
+    for rel in rels:
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            target = target.lstrip("/")
+        else:
+            target = posixpath.normpath(posixpath.join("xl", target))
+        targets[rel.get("Id", "")] = target
+
+    sheet_parts: dict[str, str] = {}
+    for element in workbook.iter():
+        if _local_name(element.tag) != "sheet":
+            continue
+        rel_id = element.get(_REL_ID_ATTR) or element.get(_STRICT_REL_ID_ATTR)
+        sheet_parts[element.get("name", "")] = targets.get(rel_id, "")
+    return sheet_parts
+
+
+def _build_probe(path: Path, size: int, mtime_ns: int) -> WorkbookProbe:
+    try:
+        sheet_parts = _read_xlsx_sheet_parts(path)
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError):
+        # Not an xlsx package (e.g. legacy .xls) - fall back to pandas
+        with pd.ExcelFile(path) as workbook:
+            sheet_names = tuple(str(name) for name in workbook.sheet_names)
+        return WorkbookProbe(path=path, size=size, mtime_ns=mtime_ns, sheet_names=sheet_names)
+
+    return WorkbookProbe(
+        path=path,
+        size=size,
+        mtime_ns=mtime_ns,
+        sheet_names=tuple(sheet_parts),
+        _sheet_parts={name: part for name, part in sheet_parts.items() if part},
+    )
+
+
+_PROBE_CACHE: dict[Path, WorkbookProbe] = {}
+
+
+def probe_workbook(path: str | Path) -> WorkbookProbe:
+    """Return the cached probe for ``path``, refreshing it if the file changed.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = path.resolve()
+
+    cached = _PROBE_CACHE.get(key)
+    if cached is not None and cached.signature == (stat.st_size, stat.st_mtime_ns):
+        return cached
+
+    probe = _build_probe(path, stat.st_size, stat.st_mtime_ns)
+    _PROBE_CACHE[key] = probe
+    return probe
+
+
+def clear_probe_cache() -> None:
+    """Drop all cached workbook probes."""
+    _PROBE_CACHE.clear()
@@ -105,27 +105,7 @@ def _get_child_shape(parent_shape, child_name):
     return None
 
 
-def _remove_shape_by_name(container, shape_name):
-    """Remove a shape (or nested shape) with the provided name from the container."""
-    if not shape_name or not container or not hasattr(container, "shapes"):
-        return False
-    removed = False
-    for shape in list(container.shapes):
-        name = getattr(shape, "name", "")
-        if name == shape_name:
-            element = shape._element
-            parent = element.getparent()
-            if parent is not None:
-                parent.remove(element)
-            removed = True
-            continue
-        if getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.GROUP and hasattr(shape, "shapes"):
-            if _remove_shape_by_name(shape, shape_name):
-                removed = True
-    return removed
-
-
-def _populate_summary_tiles(slide, template_slide, df, combination_row, excel_path, is_last_slide=False):
+def _populate_summary_tiles(slide, template_slide, df, combination_row, excel_path, is_last_slide=False, shapes=None):
     """
     Populate brand-level indicator tiles (quarters, media share, funnel stage).
 
@@ -139,6 +119,7 @@ def _populate_summary_tiles(slide, template_slide, df, combination_row, excel_pa
         combination_row: (market, brand, year) tuple
         excel_path: Path to source Excel file
         is_last_slide: True if this is the last slide for this brand
+        shapes: SlideShapeIndex of ``slide``, when the caller already has one
     """
     if not SUMMARY_TILE_CONFIG:
         return
@@ -149,20 +130,23 @@ def _populate_summary_tiles(slide, template_slide, df, combination_row, excel_pa
         logger.debug("Skipping brand indicators - not the last slide for this brand")
         return
 
+    if shapes is None:
+        shapes = SlideShapeIndex(slide, shape_library_for(template_slide))
     for section in ("quarter_budgets", "media_share", "funnel_share"):
         for tile in SUMMARY_TILE_CONFIG.get(section, {}).values():
             shape_name = tile.get("shape") if isinstance(tile, dict) else None
             if not shape_name:
                 continue
-            if not any(getattr(shape, "name", "") == shape_name for shape in slide.shapes):
-                clone_template_shape(template_slide, slide, shape_name)
+            if shapes.get(shape_name) is None:
+                shapes.clone(shape_name)
 
     footer_cfg = SUMMARY_TILE_CONFIG.get("footer_notes", {})
     footer_shape = footer_cfg.get("shape") if isinstance(footer_cfg, dict) else None
-    if footer_shape and not any(getattr(shape, "name", "") == footer_shape for shape in slide.shapes):
-        clone_template_shape(template_slide, slide, footer_shape)
+    if footer_shape and shapes.get(footer_shape) is None:
+        shapes.clone(footer_shape)
 
     market, brand, year = combination_row
+    partitions = partition_index_for(df)
 
     # Handle product-level slides where brand contains " - product_name"
     # e.g., "Panadol Pain - Panadol Extra" -> actual brand is "Panadol Pain", product is "Panadol Extra"
@@ -189,49 +173,31 @@ def _populate_summary_tiles(slide, template_slide, df, combination_row, excel_pa
 
             # If not found via rename map, try adding brand prefix back
             # e.g., "Mouthwash" with brand "Parodontax" -> "Parodontax Mouthwash"
-            product_col_upper = df["Product"].astype(str).str.strip().str.upper()
-            direct_match = (product_col_upper == original_product_name.upper())
-
-            if not direct_match.any():
+            if not partitions.has_product(original_product_name):
                 # Try with brand prefix added back
                 prefixed_product_name = f"{actual_brand} {original_product_name}"
-                prefixed_match = (product_col_upper == prefixed_product_name.upper())
-                if prefixed_match.any():
+                if partitions.has_product(prefixed_product_name):
                     original_product_name = prefixed_product_name
 
-            product_filter = (product_col_upper == original_product_name.upper())
+            product_filter = original_product_name
     else:
         actual_brand = str(brand).strip()
 
-    combo_filter = (
-        (df["Country"].astype(str).str.strip() == str(market).strip())
-        & (df["Brand"].astype(str).str.strip() == actual_brand)
-        & (df["Year"].astype(str).str.strip() == str(year).strip())
-    )
-
-    # Apply product filter if this is a product-level slide
-    if product_filter is not None:
-        combo_filter = combo_filter & product_filter
-
-    subset = df.loc[combo_filter].copy()
-    if subset.empty:
+    # Apply product filter (case-insensitive) if this is a product-level slide
+    cell = aggregate_cube_for(df).cell(market, actual_brand, year, product=product_filter)
+    if cell is None:
         logger.warning("Summary tiles: no data for %s - %s (%s)", market, brand, year)
         return
 
-    total_cost = subset["Total Cost"].sum()
-
     # Populate brand-level indicators (Q1-Q4, TV/DIG/OTHER, AWA/CON/PUR)
     logger.info(f"Populating brand-level indicators on LAST slide for {brand}")
-    _populate_quarter_tiles(slide, template_slide, subset)
-    _populate_media_share_tiles(slide, template_slide, subset, total_cost)
-    _populate_funnel_share_tiles(slide, template_slide, subset, total_cost)
-    _populate_footer(slide, template_slide, excel_path)
-
+    _populate_quarter_tiles(shapes, cell)
+    _populate_media_share_tiles(shapes, cell)
+    _populate_funnel_share_tiles(shapes, cell)
+    _populate_footer(shapes, excel_path)
 
-def _populate_quarter_tiles(slide, template_slide, subset):
-    months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-    month_values = {month: float(subset[month].sum()) for month in months}
 
+def _populate_quarter_tiles(shapes, cell):
     for quarter_key, config in SUMMARY_TILE_CONFIG.get("quarter_budgets", {}).items():
         # Skip configuration metadata fields (keys starting with underscore)
         if quarter_key.startswith("_") or not isinstance(config, dict):
@@ -240,34 +206,28 @@ def _populate_quarter_tiles(slide, template_slide, subset):
         shape_name = config.get("shape")
         if not shape_name:
             continue
-        shape = next((s for s in slide.shapes if getattr(s, "name", "") == shape_name and getattr(s, "has_text_frame", False)), None)
+        shape = shapes.get(shape_name, text_frame=True)
         if not shape:
             logger.warning("Quarter tile shape '%s' missing", shape_name)
             continue
-        template_shape = _get_shape_by_name(template_slide, shape_name)
+        template_shape = shapes.library.shape(shape_name)
         _apply_configured_position(shape, config.get("position"))
 
-        quarter_months = {
-            "q1": ("Jan", "Feb", "Mar"),
-            "q2": ("Apr", "May", "Jun"),
-            "q3": ("Jul", "Aug", "Sep"),
-            "q4": ("Oct", "Nov", "Dec"),
-        }.get(quarter_key.lower(), ())
-        value = sum(month_values.get(month, 0.0) for month in quarter_months)
+        value = cell.quarter(quarter_key)
         formatted = _format_tile_value(config, value)
         prefix = config.get("prefix", "")
 
         _set_shape_text(shape, template_shape, f"{prefix}{formatted}")
 
 
-def _populate_media_share_tiles(slide, template_slide, subset, total_cost):
-    media_group = subset.groupby("Mapped Media Type")["Total Cost"].sum()
+def _populate_media_share_tiles(shapes, cell):
+    total_cost = cell.total_cost
 
     # Calculate raw values for all three categories
-    tv_value = float(media_group.get("TV", 0.0))
-    digital_value = float(media_group.get("Digital", 0.0))
+    tv_value = cell.value("media", "TV")
+    digital_value = cell.value("media", "Digital")
     # Other includes OOH (config maps OOH -> "OOH", not "Other")
-    other_value = float(media_group.get("Other", 0.0)) + float(media_group.get("OOH", 0.0))
+    other_value = cell.value("media", "Other") + cell.value("media", "OOH")
 
     # Calculate percentages that sum to exactly 100%
     if total_cost > 0:
@@ -317,11 +277,11 @@ def _populate_media_share_tiles(slide, template_slide, subset, total_cost):
         if not shape_name:
             continue
 
-        shape = next((s for s in slide.shapes if getattr(s, "name", "") == shape_name and getattr(s, "has_text_frame", False)), None)
+        shape = shapes.get(shape_name, text_frame=True)
         if not shape:
             logger.warning("Media share shape '%s' missing", shape_name)
             continue
-        template_shape = _get_shape_by_name(template_slide, shape_name)
+        template_shape = shapes.library.shape(shape_name)
         _apply_configured_position(shape, config.get("position"))
 
         label = config.get("label", media_key.capitalize())
@@ -331,9 +291,7 @@ def _populate_media_share_tiles(slide, template_slide, subset, total_cost):
         _set_shape_text(shape, template_shape, f"{label}: {formatted}")
 
 
-def _populate_funnel_share_tiles(slide, template_slide, subset, total_cost):
-    funnel_group = subset.groupby("Funnel Stage")["Total Cost"].sum()
-
+def _populate_funnel_share_tiles(shapes, cell):
     for funnel_key, config in SUMMARY_TILE_CONFIG.get("funnel_share", {}).items():
         # Skip configuration metadata fields (keys starting with underscore)
         if funnel_key.startswith("_") or not isinstance(config, dict):
@@ -342,11 +300,11 @@ def _populate_funnel_share_tiles(slide, template_slide, subset, total_cost):
         shape_name = config.get("shape")
         if not shape_name:
             continue
-        shape = next((s for s in slide.shapes if getattr(s, "name", "") == shape_name and getattr(s, "has_text_frame", False)), None)
+        shape = shapes.get(shape_name, text_frame=True)
         if not shape:
             logger.warning("Funnel share shape '%s' missing", shape_name)
             continue
-        template_shape = _get_shape_by_name(template_slide, shape_name)
+        template_shape = shapes.library.shape(shape_name)
         _apply_configured_position(shape, config.get("position"))
 
         lookup_key = {
@@ -355,8 +313,8 @@ def _populate_funnel_share_tiles(slide, template_slide, subset, total_cost):
             "purchase": "Purchase",
         }.get(funnel_key.lower(), funnel_key)
 
-        value = float(funnel_group.get(lookup_key, 0.0))
-        formatted = _format_percentage_tile(config, value, total_cost)
+        value = cell.value("funnel", lookup_key)
+        formatted = _format_percentage_tile(config, value, cell.total_cost)
         label = config.get("label", lookup_key[:3].upper())
 
         _set_shape_text(shape, template_shape, f"{label}: {formatted}")
@@ -390,7 +348,7 @@ def _apply_legend_color(shape, media_key):
         logger.debug("Unable to apply legend color for '%s': %s", media_key, exc)
 
 
-def _create_legend_color_shape(slide, shape_name, position):
+def _create_legend_color_shape(shapes, shape_name, position):
     if not position:
         return None
 
@@ -406,19 +364,20 @@ def _create_legend_color_shape(slide, shape_name, position):
     color_height = Inches(LEGEND_COLOR_HEIGHT_IN)
     color_top = top + max((total_height - color_height) / 2, 0)
 
-    color_shape = slide.shapes.add_shape(
+    color_shape = shapes.slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE,
         left,
         color_top,
         color_width,
         color_height,
     )
-    color_shape.name = shape_name or f"LegendColor_{len(slide.shapes)}"
+    color_shape.name = shape_name or f"LegendColor_{len(shapes.slide.shapes)}"
     color_shape.line.fill.background()
+    shapes.add(color_shape)
     return color_shape
 
 
-def _create_legend_text_shape(slide, shape_name, position):
+def _create_legend_text_shape(shapes, shape_name, position):
     if not position:
         return None
 
@@ -434,8 +393,9 @@ def _create_legend_text_shape(slide, shape_name, position):
     text_left = left + Inches(LEGEND_COLOR_WIDTH_IN + LEGEND_TEXT_GAP_IN)
     text_width = max(total_width - (text_left - left), Inches(LEGEND_MIN_TEXT_WIDTH_IN))
 
-    text_shape = slide.shapes.add_textbox(text_left, top, text_width, total_height)
-    text_shape.name = shape_name or f"LegendText_{len(slide.shapes)}"
+    text_shape = shapes.slide.shapes.add_textbox(text_left, top, text_width, total_height)
+    text_shape.name = shape_name or f"LegendText_{len(shapes.slide.shapes)}"
+    shapes.add(text_shape)
     return text_shape
 
 
@@ -478,6 +438,7 @@ def _add_breadcrumb_to_slide(slide, breadcrumb_text: str, slide_width, slide_hei
         width=slide_width - Inches(0.4),
         height=Inches(0.25)
     )
+    breadcrumb_box.name = SHAPE_NAME_BREADCRUMB
     tf = breadcrumb_box.text_frame
     tf.text = breadcrumb_text
     tf.word_wrap = False
@@ -491,6 +452,18 @@ def _add_breadcrumb_to_slide(slide, breadcrumb_text: str, slide_width, slide_hei
             run.font.color.rgb = RGBColor(128, 128, 128)  # Gray
 
 
+def _refresh_carried_slide(slide, template_slide, breadcrumb_text: str, excel_path):
+    """Update the run-specific text (breadcrumb numbering, footer date) of a slide copied from a previous deck."""
+    breadcrumb = next((shape for shape in slide.shapes if shape.name == SHAPE_NAME_BREADCRUMB), None)
+    if breadcrumb is not None and breadcrumb_text:
+        _prune_paragraph_runs(breadcrumb.text_frame.paragraphs[0]).text = breadcrumb_text
+
+    footer_shape = SUMMARY_TILE_CONFIG.get("footer_notes", {}).get("shape")
+    shapes = SlideShapeIndex(slide, shape_library_for(template_slide))
+    if footer_shape and shapes.get(footer_shape) is not None:
+        _populate_footer(shapes, excel_path)
+
+
 def _create_toc_placeholder(prs):
     """
     Create a TOC slide placeholder. Content will be populated later.
@@ -987,16 +960,19 @@ def _ensure_title_shape(slide, slide_layout, template_slide=None):
         logger.warning(f"Title shape '{shape_name}' not found in layout or template slide")
 
 
-def _ensure_legend_shapes(slide, template_slide):
+def _ensure_legend_shapes(slide, template_slide, shapes=None):
     if not LEGEND_GROUPS_CONFIG:
         return
+    if shapes is None:
+        shapes = SlideShapeIndex(slide, shape_library_for(template_slide))
+    library = shapes.library
     for media_key, legend_cfg in LEGEND_GROUPS_CONFIG.items():
         group_name = legend_cfg.get("group_shape")
         color_shape_name = legend_cfg.get("color_shape")
         text_shape_name = legend_cfg.get("text_shape")
         position = legend_cfg.get("position", {})
 
-        template_group_shape = _get_shape_by_name(template_slide, group_name) if (template_slide and group_name) else None
+        template_group_shape = library.shape(group_name) if group_name else None
         template_color_shape = None
         template_text_shape = None
 
@@ -1006,26 +982,26 @@ def _ensure_legend_shapes(slide, template_slide):
             if text_shape_name:
                 template_text_shape = _get_child_shape(template_group_shape, text_shape_name)
         else:
-            if template_slide and color_shape_name:
-                template_color_shape = _get_shape_by_name(template_slide, color_shape_name)
-            if template_slide and text_shape_name:
-                template_text_shape = _get_shape_by_name(template_slide, text_shape_name)
+            if color_shape_name:
+                template_color_shape = library.shape(color_shape_name)
+            if text_shape_name:
+                template_text_shape = library.shape(text_shape_name)
 
         template_has_entry = any(
             shape is not None for shape in (template_group_shape, template_color_shape, template_text_shape)
         )
 
-        if template_slide is not None and not template_has_entry:
+        if not template_has_entry:
             for candidate in (group_name, color_shape_name, text_shape_name):
-                _remove_shape_by_name(slide, candidate)
+                shapes.remove(candidate)
             continue
 
         group_shape = None
         if group_name:
-            group_shape = _get_shape_by_name(slide, group_name)
+            group_shape = shapes.get(group_name)
             if not group_shape and template_group_shape is not None:
                 try:
-                    group_shape = clone_template_shape(template_slide, slide, group_name)
+                    group_shape = shapes.clone(group_name)
                 except TemplateCloneError as exc:
                     logger.debug("Unable to clone legend group '%s': %s", group_name, exc)
                     group_shape = None
@@ -1036,14 +1012,14 @@ def _ensure_legend_shapes(slide, template_slide):
             if group_shape:
                 color_shape = _get_child_shape(group_shape, color_shape_name)
             else:
-                color_shape = _get_shape_by_name(slide, color_shape_name)
+                color_shape = shapes.get(color_shape_name)
                 if color_shape is None and template_color_shape is not None:
                     try:
-                        color_shape = clone_template_shape(template_slide, slide, color_shape_name)
+                        color_shape = shapes.clone(color_shape_name)
                     except TemplateCloneError:
-                        color_shape = _create_legend_color_shape(slide, color_shape_name, position)
+                        color_shape = _create_legend_color_shape(shapes, color_shape_name, position)
                 if color_shape is None and template_color_shape is None:
-                    color_shape = _create_legend_color_shape(slide, color_shape_name, position)
+                    color_shape = _create_legend_color_shape(shapes, color_shape_name, position)
                 elif color_shape and position:
                     _apply_configured_position(color_shape, position)
             if color_shape:
@@ -1053,14 +1029,14 @@ def _ensure_legend_shapes(slide, template_slide):
             if group_shape:
                 text_shape = _get_child_shape(group_shape, text_shape_name)
             else:
-                text_shape = _get_shape_by_name(slide, text_shape_name)
+                text_shape = shapes.get(text_shape_name)
                 if text_shape is None and template_text_shape is not None:
                     try:
-                        text_shape = clone_template_shape(template_slide, slide, text_shape_name)
+                        text_shape = shapes.clone(text_shape_name)
                     except TemplateCloneError:
-                        text_shape = _create_legend_text_shape(slide, text_shape_name, position)
+                        text_shape = _create_legend_text_shape(shapes, text_shape_name, position)
                 if text_shape is None and template_text_shape is None:
-                    text_shape = _create_legend_text_shape(slide, text_shape_name, position)
+                    text_shape = _create_legend_text_shape(shapes, text_shape_name, position)
                 elif text_shape and position:
                     _apply_configured_position(text_shape, position)
             if text_shape:
@@ -1071,16 +1047,16 @@ def _ensure_legend_shapes(slide, template_slide):
                 _set_legend_text(text_shape, template_text_shape, template_text)
 
 
-def _populate_footer(slide, template_slide, excel_path):
+def _populate_footer(shapes, excel_path):
     config = SUMMARY_TILE_CONFIG.get("footer_notes", {})
     shape_name = config.get("shape")
     if not shape_name:
         return
-    shape = next((s for s in slide.shapes if getattr(s, "name", "") == shape_name and getattr(s, "has_text_frame", False)), None)
+    shape = shapes.get(shape_name, text_frame=True)
     if not shape:
         logger.warning("Footer shape '%s' missing", shape_name)
         return
-    template_shape = _get_shape_by_name(template_slide, shape_name)
+    template_shape = shapes.library.shape(shape_name)
     _apply_configured_position(shape, config.get("position"))
 
     import re
@@ -1102,6 +1078,13 @@ def _populate_footer(slide, template_slide, excel_path):
 
 
 def _extract_export_date(excel_path, output_format):
+    # Merged sources are stamped with the most recent export
+    if isinstance(excel_path, (list, tuple)):
+        return max(_export_datetime(path) for path in excel_path).strftime(output_format)
+    return _export_datetime(excel_path).strftime(output_format)
+
+
+def _export_datetime(excel_path):
     from datetime import datetime
     import re
 
@@ -1110,19 +1093,17 @@ def _extract_export_date(excel_path, output_format):
     if match:
         year, month, day = match.groups()
         try:
-            dt = datetime(int(year), int(month), int(day))
-            return dt.strftime(output_format)
+            return datetime(int(year), int(month), int(day))
         except ValueError:
             logger.debug("Failed to parse export date from filename '%s'", path_str)
 
     try:
         # fromtimestamp() uses local time by default
-        file_time = datetime.fromtimestamp(Path(excel_path).stat().st_mtime)
-        return file_time.strftime(output_format)
+        return datetime.fromtimestamp(Path(excel_path).stat().st_mtime)
     except Exception as exc:
         logger.debug("Falling back to current timestamp for export date: %s", exc)
-        # Explicitly use local system time (not UTC)
-        return datetime.now().astimezone().strftime(output_format)
+        # Explicitly use local system time (not UTC), naive so it compares with the stamps above
+        return datetime.now()
 
 
 def _format_tile_value(config, value):
@@ -1334,69 +1315,47 @@ def _derive_campaign_blocks_for_table(table_data: list[list[str]]) -> list[tuple
     return blocks
 
 
-def _apply_campaign_cell_merges(table, table_data: list[list[str]]) -> None:
-    """Merge campaign name column cells and monthly total headers to prevent row inflation."""
-    from pptx.enum.text import PP_ALIGN
-    from pptx.enum.text import MSO_VERTICAL_ANCHOR
+def _apply_campaign_cell_merges(rows, table_data: list[list[str]]) -> None:
+    """Span campaign name cells and monthly total labels across the table's ``a:tr`` elements.
 
-    blocks = _derive_campaign_blocks_for_table(table_data)
-    if not blocks:
-        return
+    The spans are the ones the deck has always been post-processed from:
+    ``_Cell.merge`` returns ``None``, so the python-pptx version of this step
+    stopped each block right after merging, before relabelling the merged
+    cell, and never reached the monthly total of a multi-row campaign. The
+    post-process workflow unmerges everything and re-merges from scratch.
+    Like ``_Cell.merge``, a span is not written over cells the template
+    already merged.
+    """
 
-    for start_idx, monthly_idx in blocks:
-        try:
-            if start_idx >= len(table.rows) or monthly_idx >= len(table.rows):
-                continue
+    def is_merged(tc) -> bool:
+        return tc.gridSpan > 1 or tc.rowSpan > 1 or tc.hMerge or tc.vMerge
 
-            merge_end = max(start_idx, monthly_idx - 1)
-            if merge_end > start_idx:
-                top_cell = table.cell(start_idx, 0)
-                for merge_row in range(start_idx + 1, merge_end + 1):
-                    table.cell(merge_row, 0).text = ""
-                merged_cell = top_cell.merge(table.cell(merge_end, 0))
-                merged_label = str(table_data[start_idx][0] or "")
-                # Apply smart line breaking to prevent mid-word breaks
-                formatted_label = _smart_line_break(merged_label)
-                merged_cell.text = formatted_label
-                try:
-                    # Center align horizontally
-                    merged_cell.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-                    # Make campaign names bold
-                    for run in merged_cell.text_frame.paragraphs[0].runs:
-                        run.font.bold = True
-                except Exception:
-                    pass
-                try:
-                    # Center align vertically (middle)
-                    merged_cell.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-                except Exception:
-                    pass
+    for start_idx, monthly_idx in _derive_campaign_blocks_for_table(table_data):
+        if monthly_idx >= len(rows):
+            continue
 
-            if monthly_idx >= len(table.rows):
+        merge_end = max(start_idx, monthly_idx - 1)
+        if merge_end > start_idx:
+            column = [rows[row_idx].tc_lst[0] for row_idx in range(start_idx, merge_end + 1)]
+            for spanned in column[1:]:
+                write_cell_text(spanned, "")
+            if any(is_merged(tc) for tc in column):
+                logger.debug("Skipping campaign cell merge for rows %s-%s: range contains merged cells", start_idx, merge_end)
                 continue
+            for spanned in column[1:]:
+                spanned.vMerge = True
+            column[0].rowSpan = len(column)
+            continue
 
-            left_cell = table.cell(monthly_idx, 0)
-            label_text = str(left_cell.text or "")
-            for col_idx in (1, 2):
-                if col_idx < len(table.columns):
-                    table.cell(monthly_idx, col_idx).text = ""
-            merged_total = left_cell.merge(table.cell(monthly_idx, 2))
-            merged_total.text = label_text
-            try:
-                merged_total.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            except Exception:
-                pass
-            try:
-                merged_total.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-            except Exception:
-                pass
-        except Exception as exc:
-            logger.debug(
-                "Skipping campaign cell merge for rows %s-%s: %s",
-                start_idx,
-                monthly_idx,
-                exc,
-            )
+        cells = rows[monthly_idx].tc_lst[:3]
+        for spanned in cells[1:]:
+            write_cell_text(spanned, "")
+        if len(cells) < 3 or any(is_merged(tc) for tc in cells):
+            logger.debug("Skipping monthly total merge for row %s", monthly_idx)
+            continue
+        for spanned in cells[1:]:
+            spanned.hMerge = True
+        cells[0].gridSpan = 3
 
 
 def _clear_comments(slide):
@@ -1420,7 +1379,12 @@ Changes from FINAL_PRODUCTION.py:
 import os
 import logging
 import traceback
+from collections import deque
+from copy import deepcopy
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from datetime import datetime
+from io import BytesIO
 import pandas as pd
 import numpy as np
 import ast, pathlib, inspect, textwrap
@@ -1451,7 +1415,11 @@ from pptx.enum.dml import MSO_COLOR_TYPE, MSO_FILL, MSO_FILL_TYPE
 from amp_automation.config import Config, load_master_config
 from amp_automation.data import (
     get_month_specific_tv_metrics,
+    get_tv_metrics_index,
     load_and_prepare_data as modular_load_and_prepare_data,
+    aggregate_cube_for,
+    partition_index_for,
+    prime_tv_metrics_index,
 )
 from amp_automation.data.adapters import InputFormat
 from amp_automation.presentation.charts import (
@@ -1463,13 +1431,29 @@ from amp_automation.presentation.charts import (
 )
 from amp_automation.presentation.tables import (
     CellStyleContext,
-    apply_table_borders,
+    apply_cell_borders,
     ensure_font_consistency as _ensure_font_consistency,
-    style_table_cell,
+    write_cell_text,
 )
 from amp_automation.presentation.postprocess.cell_merges import _smart_line_break
-from amp_automation.presentation.template_clone import TemplateCloneError, clone_template_shape, clone_template_table
-from amp_automation.utils.media import normalize_media_type
+from amp_automation.presentation.template_clone import (
+    SlideShapeIndex,
+    TemplateCloneError,
+    clone_template_table,
+    shape_library_for,
+)
+from amp_automation.presentation.merge import append_slides
+from amp_automation.presentation.section_slides import SectionSlideFactory
+from amp_automation.presentation.postprocess.cli import PostProcessorCLI
+from amp_automation.presentation.incremental import (
+    ROLE_BRAND,
+    ROLE_PRODUCT_SUMMARY,
+    IncrementalBuild,
+    manifest_path_for,
+    product_role,
+)
+from amp_automation.utils.media import DISPLAY_MEDIA_TYPES, display_media_type
+from amp_automation.utils.parallel import max_workers, process_pool
 from amp_automation.tooling import autopptx_adapter, aspose_converter, docstrange_validator
 from amp_automation.tooling.autopptx_adapter import SlidePayload
 
@@ -1557,15 +1541,7 @@ TABLE_HEADER_COLUMNS = [
     "%",
 ]
 
-MEDIA_DISPLAY_ORDER = [
-    "Television",
-    "Digital",
-    "OOH",
-    "Radio",
-    "Cinema",
-    "Print",
-    "Other",
-]
+MEDIA_DISPLAY_ORDER = DISPLAY_MEDIA_TYPES
 
 MEDIA_DISPLAY_LABELS = {
     "Television": "TELEVISION",
@@ -1577,7 +1553,6 @@ MEDIA_DISPLAY_LABELS = {
     "Other": "OTHER",
 }
 
-_CAMPAIGN_BOUNDARIES: list[tuple[int, int]] = []
 TABLE_COLUMN_ALIGNMENT_MAP: dict[int, object] = {}
 TABLE_WORD_WRAP_COLUMNS: set[int] = set()
 TABLE_UPPERCASE_COLUMNS: set[int] = set()
@@ -1591,12 +1566,14 @@ PRODUCT_SPLIT_CONFIG: dict[str, object] = {}
 
 
 def _normalized_media_value(raw_media: str) -> str:
-    if not raw_media:
-        return "Other"
-    normalized = normalize_media_type(str(raw_media))
-    if normalized not in MEDIA_DISPLAY_LABELS:
-        return "Other"
-    return normalized
+    return display_media_type(raw_media)
+
+
+def _normalized_media_column(frame: pd.DataFrame) -> pd.Series:
+    """Display media bucket per row, precomputed at ingestion when available."""
+    if "Normalized Media" in frame.columns:
+        return frame["Normalized Media"]
+    return frame["Mapped Media Type"].apply(_normalized_media_value)
 
 
 def _media_display_label(media_key: str) -> str:
@@ -1750,9 +1727,9 @@ def _build_tv_metric_rows(
     reach1_totals: list[float] = []
     freq_totals: list[float] = []
 
+    tv_metrics_index = get_tv_metrics_index(excel_path)
     for month in TABLE_MONTH_ORDER:
-        metrics = get_month_specific_tv_metrics(
-            excel_path,
+        metrics = tv_metrics_index.lookup(
             region,
             masterbrand,
             campaign_name,
@@ -1901,7 +1878,7 @@ def _build_campaign_block(
     excel_path: str | Path | None,
 ) -> tuple[list[list[str]], list[float], float]:
     campaign_df = campaign_df.copy()
-    campaign_df["_NormalizedMedia"] = campaign_df["Mapped Media Type"].apply(_normalized_media_value)
+    campaign_df["_NormalizedMedia"] = _normalized_media_column(campaign_df)
 
     block_rows: list[list[str]] = []
     block_month_totals = [0.0] * len(TABLE_MONTH_ORDER)
@@ -2011,7 +1988,7 @@ def _build_product_block(
     First column shows PRODUCT name instead of CAMPAIGN name.
     """
     product_df = product_df.copy()
-    product_df["_NormalizedMedia"] = product_df["Mapped Media Type"].apply(_normalized_media_value)
+    product_df["_NormalizedMedia"] = _normalized_media_column(product_df)
 
     block_rows: list[list[str]] = []
     block_month_totals = [0.0] * len(TABLE_MONTH_ORDER)
@@ -2127,6 +2104,14 @@ def _build_tv_metric_rows_aggregated(
     monthly_grps = [0.0] * len(TABLE_MONTH_ORDER)
     monthly_reach_values: list[list[float]] = [[] for _ in TABLE_MONTH_ORDER]
 
+    tv_metrics_index = None
+    if excel_path and (hasattr(excel_path, '__fspath__') or isinstance(excel_path, (str, Path, tuple, list))):
+        try:
+            tv_metrics_index = get_tv_metrics_index(excel_path)
+        except (OSError, KeyError, ValueError) as exc:
+            logger.warning("TV metrics unavailable for %s; GRP/reach rows will be empty: %s", excel_path, exc)
+            tv_metrics_index = None
+
     for campaign_name in campaigns:
         campaign_df = product_df[product_df["Campaign Name"] == campaign_name]
         # Get TV-specific data
@@ -2137,13 +2122,13 @@ def _build_tv_metric_rows_aggregated(
             continue
 
         # Collect GRP values from raw data if available
-        if excel_path and hasattr(excel_path, '__fspath__') or isinstance(excel_path, (str, Path)):
+        if tv_metrics_index is not None:
             for month_idx, month in enumerate(TABLE_MONTH_ORDER):
                 if month.startswith("Q"):
                     continue  # Skip quarters
                 try:
-                    metrics = get_month_specific_tv_metrics(
-                        excel_path, region, masterbrand, str(campaign_name), year, month
+                    metrics = tv_metrics_index.lookup(
+                        region, masterbrand, str(campaign_name), year, month
                     )
                     if grp_aggregation == "sum":
                         monthly_grps[month_idx] += metrics.get("grp_sum", 0)
@@ -2203,7 +2188,11 @@ def _prepare_product_summary_table_data(
     excel_path: str | Path | None = None,
     reach_aggregation: str = "average",
     grp_aggregation: str = "sum",
-) -> tuple[list[list[str]] | None, dict[tuple[int, int], dict[str, object]] | None]:
+) -> tuple[
+    list[list[str]] | None,
+    dict[tuple[int, int], dict[str, object]] | None,
+    list[tuple[int, int]],
+]:
     """Prepare table data with PRODUCTS as rows (aggregating all campaigns per product).
 
     This is the product summary view where:
@@ -2211,33 +2200,25 @@ def _prepare_product_summary_table_data(
     - Each product aggregates all its campaigns
     - Media breakdown per product
     - Brand total at the bottom
-    """
-    global _CAMPAIGN_BOUNDARIES
 
+    The third item holds the (first, last) row of each product block, which
+    pagination treats like campaign blocks.
+    """
     try:
         year_text = f" - {year}" if year is not None else ""
         logger.info("Preparing PRODUCT SUMMARY table data for %s - %s%s", region, masterbrand, year_text)
 
-        filter_mask = (
-            (df["Country"].astype(str).str.strip() == str(region).strip())
-            & (df["Brand"].astype(str).str.strip() == str(masterbrand).strip())
-        )
-
-        if year is not None:
-            filter_mask &= df["Year"].astype(str).str.strip() == str(year).strip()
-
-        subset = df.loc[filter_mask].copy()
+        subset = partition_index_for(df).rows(region, masterbrand, year).copy()
         logger.debug("Rows after filtering: %s", len(subset))
 
         if subset.empty:
             logger.warning("No data found for %s - %s%s", region, masterbrand, year_text)
-            _CAMPAIGN_BOUNDARIES = []
-            return None, None
+            return None, None, []
 
         # Check if Product column exists
         if "Product" not in subset.columns:
             logger.warning("Product column not found, cannot generate product summary")
-            return None, None
+            return None, None, []
 
         table_rows: list[list[str]] = []
         # Use PRODUCT header instead of CAMPAIGN for product summary view
@@ -2251,7 +2232,7 @@ def _prepare_product_summary_table_data(
         product_boundaries: list[tuple[int, int]] = []
 
         # Group by Product and sort by total investment
-        product_investments = subset.groupby("Product")["Total Cost"].sum()
+        product_investments = subset.groupby("Product", observed=True)["Total Cost"].sum()
         products_sorted = product_investments.sort_values(ascending=False).index.tolist()
 
         coerced_year = _coerce_year(year)
@@ -2298,9 +2279,6 @@ def _prepare_product_summary_table_data(
         )
         table_rows.append(grand_total_row)
 
-        # Use product_boundaries for pagination (reuse campaign boundary logic)
-        _CAMPAIGN_BOUNDARIES = product_boundaries
-
         logger.info(
             "Product summary table data created for %s - %s%s with %s rows (%d products)",
             region,
@@ -2309,7 +2287,8 @@ def _prepare_product_summary_table_data(
             len(table_rows),
             len(products_sorted),
         )
-        return table_rows, cell_metadata
+        # Product blocks paginate like campaign blocks
+        return table_rows, cell_metadata, product_boundaries
 
     except Exception as exc:
         logger.error(
@@ -2319,8 +2298,7 @@ def _prepare_product_summary_table_data(
             exc,
         )
         logger.error(traceback.format_exc())
-        _CAMPAIGN_BOUNDARIES = []
-        return None, None
+        return None, None, []
 
 
 def _build_grand_total_row(
@@ -2684,6 +2662,7 @@ TABLE_HEIGHT_RULE_AVAILABLE = True
 
 # --- Constants for Named Shapes (from Template_Refactoring_Guide.md) ---
 SHAPE_NAME_TITLE = "TitlePlaceholder"
+SHAPE_NAME_BREADCRUMB = "Breadcrumb"
 SHAPE_NAME_TABLE = "MainDataTable"
 SHAPE_NAME_COMMENTS_TITLE = "CommentsTitle"
 SHAPE_NAME_COMMENTS_BOX = "CommentsBox"
@@ -3163,29 +3142,23 @@ def load_and_prepare_data(excel_path, format_type: InputFormat = None):  # backw
     return data_set.frame
 
 def _prepare_main_table_data_detailed(df, region, masterbrand, year=None, excel_path=None):
-    """Prepare detailed table data for a region/masterbrand/year combination."""
+    """Prepare detailed table data for a region/masterbrand/year combination.
 
-    global _CAMPAIGN_BOUNDARIES
+    Returns ``(table_rows, cell_metadata, campaign_boundaries)``, where the
+    boundaries are the (first, last) row of each campaign block, or
+    ``(None, None, [])`` when there is nothing to show.
+    """
 
     try:
         year_text = f" - {year}" if year is not None else ""
         logger.info("Preparing table data for %s - %s%s", region, masterbrand, year_text)
 
-        filter_mask = (
-            (df["Country"].astype(str).str.strip() == str(region).strip())
-            & (df["Brand"].astype(str).str.strip() == str(masterbrand).strip())
-        )
-
-        if year is not None:
-            filter_mask &= df["Year"].astype(str).str.strip() == str(year).strip()
-
-        subset = df.loc[filter_mask].copy()
+        subset = partition_index_for(df).rows(region, masterbrand, year).copy()
         logger.debug("Rows after filtering: %s", len(subset))
 
         if subset.empty:
             logger.warning("No data found for %s - %s%s", region, masterbrand, year_text)
-            _CAMPAIGN_BOUNDARIES = []
-            return None, None
+            return None, None, []
 
         table_rows: list[list[str]] = [TABLE_HEADER_COLUMNS.copy()]
         cell_metadata: dict[tuple[int, int], dict[str, object]] = {}
@@ -3195,13 +3168,12 @@ def _prepare_main_table_data_detailed(df, region, masterbrand, year=None, excel_
         campaign_boundaries: list[tuple[int, int]] = []
 
         campaign_sort_info: list[tuple[str, int, str]] = []
-        for campaign_name, campaign_group in subset.groupby("Campaign Name"):
+        for campaign_name, campaign_group in subset.groupby("Campaign Name", observed=True):
             if pd.isna(campaign_name):
                 continue
-            normalized_media = {
-                _normalized_media_value(media)
-                for media in campaign_group["Mapped Media Type"].dropna()
-            }
+            normalized_media = set(
+                _normalized_media_column(campaign_group)[campaign_group["Mapped Media Type"].notna()]
+            )
             try:
                 first_media_index = next(
                     idx
@@ -3264,8 +3236,6 @@ def _prepare_main_table_data_detailed(df, region, masterbrand, year=None, excel_
         )
         table_rows.append(grand_total_row)
 
-        _CAMPAIGN_BOUNDARIES = campaign_boundaries
-
         logger.info(
             "Table data created for %s - %s%s with %s rows",
             region,
@@ -3273,7 +3243,7 @@ def _prepare_main_table_data_detailed(df, region, masterbrand, year=None, excel_
             year_text,
             len(table_rows),
         )
-        return table_rows, cell_metadata
+        return table_rows, cell_metadata, campaign_boundaries
 
     except Exception as exc:
         logger.error(
@@ -3284,8 +3254,7 @@ def _prepare_main_table_data_detailed(df, region, masterbrand, year=None, excel_
             exc,
         )
         logger.error(traceback.format_exc())
-        _CAMPAIGN_BOUNDARIES = []
-        return None, None
+        return None, None, []
 
         """
                 
@@ -3349,8 +3318,12 @@ def _prepare_main_table_data_detailed(df, region, masterbrand, year=None, excel_
 
         """
 
-def _split_table_data_by_campaigns(table_data, cell_metadata):
-    """Split the main table into continuation-friendly chunks respecting row limits."""
+def _split_table_data_by_campaigns(table_data, cell_metadata, campaign_boundaries=None):
+    """Split the main table into continuation-friendly chunks respecting row limits.
+
+    ``campaign_boundaries`` are the row blocks returned with the table data;
+    without them the whole body is treated as one block.
+    """
 
     if not table_data:
         return []
@@ -3368,7 +3341,7 @@ def _split_table_data_by_campaigns(table_data, cell_metadata):
     if body_row_count <= MAX_ROWS_PER_SLIDE:
         return [(table_data, cell_metadata, False)]
 
-    campaign_boundaries = _CAMPAIGN_BOUNDARIES or [(1, grand_total_idx - 1)]
+    campaign_boundaries = campaign_boundaries or [(1, grand_total_idx - 1)]
     logger.info(f"Campaign boundaries: {len(campaign_boundaries)} campaigns")
     splits: list[tuple[list[list[str]], dict[tuple[int, int], dict[str, object]], bool]] = []
 
@@ -3871,158 +3844,92 @@ def set_title_text_detailed(title_shape, title_text, template_prs):
 
     logger.debug(f"Finished setting title for shape '{title_shape.name}'. Text frame word_wrap: {title_shape.text_frame.word_wrap}, auto_size: {title_shape.text_frame.auto_size}")
 
-def _add_table_row(table):
-    """
-    Add a row to an existing table by cloning the last row's XML structure.
+def _blank_row_copy(tr):
+    """Copy of a template ``a:tr`` with the text of its runs cleared."""
+    new_tr = deepcopy(tr)
+    for text_elem in new_tr.xpath("./a:tc/a:txBody/a:p/a:r/a:t"):
+        text_elem.text = ""
+    return new_tr
 
-    Python-pptx doesn't provide a public API for adding rows to existing tables.
-    This function uses XML manipulation to clone the last row and append it.
 
-    Args:
-        table: A python-pptx Table object
+_SUBTOTAL_ROW_LABELS = frozenset({"SUBTOTAL", "MONTHLY TOTAL (£ 000)", "GRAND TOTAL"})
 
-    Returns:
-        The newly added row object
 
-    Raises:
-        ValueError: If the table has no rows to clone from
-    """
-    from copy import deepcopy
-
-    num_rows = len(table.rows)
-    if num_rows == 0:
-        raise ValueError("Cannot add row to table with no existing rows")
-
-    # Get the last row's XML element directly from the table rows
-    # Use positive indexing since _RowCollection may not support negative indexing
-    last_row = table.rows[num_rows - 1]
-    last_tr = last_row._tr
-    new_tr = deepcopy(last_tr)
-
-    # Clear text content from all cells in the new row
-    from pptx.oxml.ns import qn
-    for tc in new_tr.findall(qn('a:tc')):
-        # Find text elements and clear them
-        text_frame = tc.find(qn('a:txBody'))
-        if text_frame is not None:
-            for paragraph in text_frame.findall(qn('a:p')):
-                for run in paragraph.findall(qn('a:r')):
-                    for text_elem in run.findall(qn('a:t')):
-                        text_elem.text = ''
-
-    # Append the new row to the table
-    tbl = table._tbl
-    tbl.append(new_tr)
-
-    # Return the new row (access via positive indexing)
-    return table.rows[len(table.rows) - 1]
+def _main_table_row_height(row_idx: int, row_data: list, row_count: int) -> tuple[int, str]:
+    """Return the height and ``hRule`` of a MainDataTable row, by row kind."""
+    if row_idx == 0:
+        return TABLE_ROW_HEIGHT_HEADER, "exact"
+
+    is_blank_row = all((value is None or str(value).strip() in ("", "-")) for value in row_data)
+    if row_idx == row_count - 1 and is_blank_row:
+        # Use 'atLeast' to allow the trailer row to grow based on content
+        return TABLE_ROW_HEIGHT_TRAILER, "atLeast"
+
+    label = " ".join(str(row_data[0]).split()).upper() if row_data else ""
+    if label in _SUBTOTAL_ROW_LABELS:
+        return TABLE_ROW_HEIGHT_SUBTOTAL, "exact"
+    # Body rows: use exact height for maximum compression
+    return TABLE_ROW_HEIGHT_BODY, "exact"
+
 
 def _populate_cloned_table(table_shape, table_data, cell_metadata):
-    table = table_shape.table
+    """Write ``table_data`` into the cloned MainDataTable.
+
+    The rows are built as XML in one pass: each ``a:tr`` is the template row
+    at that position (rows past the template's end copy its last row), sized
+    by row kind, with cells from the compiled cell styles, bordered and
+    spanned. The finished rows replace the template's; only the final shape
+    geometry goes through python-pptx.
+    """
+    tbl = table_shape.table._tbl
     rows_needed = len(table_data)
     if rows_needed == 0:
         logger.warning("No table data supplied for cloned table population")
         return False
 
     cols_needed = len(table_data[0])
-    if len(table.columns) < cols_needed:
+    grid_cols = tbl.tblGrid.gridCol_lst
+    if len(grid_cols) < cols_needed:
         logger.warning(
             "Cloned table has fewer columns (%s) than required (%s)",
-            len(table.columns),
+            len(grid_cols),
             cols_needed,
         )
         return False
 
-    # Debug: Log current table state
-    logger.debug(f"Cloned table has {len(table.rows)} rows, need {rows_needed} rows")
-
-    # Ensure sufficient row capacity by appending rows as needed.
-    while len(table.rows) < rows_needed:
-        logger.debug(f"Adding row {len(table.rows) + 1}/{rows_needed}")
-        _add_table_row(table)
-
-    for col_idx, width in enumerate(TABLE_COLUMN_WIDTHS[: len(table.columns)]):
-        try:
-            table.columns[col_idx].width = width
-        except Exception as exc:
-            logger.debug("Unable to enforce column width for column %s: %s", col_idx, exc)
-
-    header_height = TABLE_ROW_HEIGHT_HEADER
-    body_height = TABLE_ROW_HEIGHT_BODY
-    subtotal_height = TABLE_ROW_HEIGHT_SUBTOTAL
-    trailer_height = TABLE_ROW_HEIGHT_TRAILER
-
-    def _apply_row_height(target_row, target_height, row_index, *, lock_exact=False):
-        """Assign height and optionally pin it via hRule='exact' or 'atLeast'."""
-        target_row.height = target_height
-        if lock_exact:
-            try:
-                target_row._tr.set("hRule", "exact")
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.debug("Unable to lock row %s height rule: %s", row_index, exc)
-        else:
-            # Use 'atLeast' to allow rows to grow based on content but maintain minimum height
-            try:
-                target_row._tr.set("hRule", "atLeast")
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.debug("Unable to set atLeast row %s height rule: %s", row_index, exc)
-
-    subtotal_labels = {"SUBTOTAL", "MONTHLY TOTAL (£ 000)", "GRAND TOTAL"}
-
-    for row_idx in range(rows_needed):
-        row = table.rows[row_idx]
-        row_data = table_data[row_idx]
-        raw_label = str(row_data[0]) if row_data else ""
-        label = " ".join(raw_label.split()).upper()
-        is_blank_row = all(
-            (value is None or str(value).strip() in ("", "-"))
-            for value in row_data
-        )
-
-        if row_idx == 0:
-            _apply_row_height(row, header_height, row_idx, lock_exact=True)
-        elif row_idx == rows_needed - 1 and is_blank_row:
-            _apply_row_height(row, trailer_height, row_idx)
-        elif label in subtotal_labels:
-            _apply_row_height(row, subtotal_height, row_idx, lock_exact=True)
-        else:
-            # Body rows: use exact height for maximum compression
-            _apply_row_height(row, body_height, row_idx, lock_exact=True)
-
-        for col_idx in range(cols_needed):
-            value = row_data[col_idx] if col_idx < len(row_data) else ""
-            cell = table.cell(row_idx, col_idx)
-            cell.text = "" if value is None else str(value)
-            style_table_cell(
-                cell,
-                row_idx,
-                col_idx,
-                table_data,
-                cell_metadata,
-                TABLE_CELL_STYLE_CONTEXT,
-                logger,
-            )
-
-    _apply_campaign_cell_merges(table, table_data)
-
-    # Clear any unused rows beyond data to avoid stray template content.
-    total_rows = len(table.rows)
-    for row_idx in range(rows_needed, total_rows):
-        for col_idx in range(len(table.columns)):
-            cell = table.cell(row_idx, col_idx)
-            cell.text = ""
-        try:
-            _apply_row_height(table.rows[row_idx], trailer_height, row_idx)
-        except Exception as exc:
-            logger.debug("Unable to collapse unused row %s height: %s", row_idx, exc)
-
-    if total_rows > rows_needed:
-        logger.debug("Removing %s trailing empty rows from cloned table", total_rows - rows_needed)
-        for row_idx in range(total_rows - 1, rows_needed - 1, -1):
-            tr = table.rows[row_idx]._tr
-            table._tbl.remove(tr)
+    template_rows = tbl.tr_lst
+    if not template_rows:
+        logger.warning("Cloned table has no rows to build the table from")
+        return False
+    logger.debug("Cloned table has %s rows, need %s rows", len(template_rows), rows_needed)
+
+    for tr in template_rows:
+        tbl.remove(tr)
+    extra_row = _blank_row_copy(template_rows[-1]) if rows_needed > len(template_rows) else None
+
+    compiler = TABLE_CELL_STYLE_CONTEXT.compiler
+    border_color = TABLE_CELL_STYLE_CONTEXT.color_table_gray
+    rows = []
+    for row_idx, row_data in enumerate(table_data):
+        tr = template_rows[row_idx] if row_idx < len(template_rows) else deepcopy(extra_row)
+        tr.h, h_rule = _main_table_row_height(row_idx, row_data, rows_needed)
+        tr.set("hRule", h_rule)
+
+        for col_idx, tc in enumerate(tr.tc_lst):
+            if col_idx < cols_needed:
+                value = row_data[col_idx] if col_idx < len(row_data) else ""
+                write_cell_text(tc, "" if value is None else str(value))
+                styled = compiler.build(tc, row_idx, col_idx, table_data, cell_metadata, logger)
+                tr.replace(tc, styled)
+                tc = styled
+            apply_cell_borders(tc, border_color)
+        rows.append(tr)
+
+    _apply_campaign_cell_merges(rows, table_data)
+    tbl.extend(rows)
+    for grid_col, width in zip(grid_cols, TABLE_COLUMN_WIDTHS):
+        grid_col.w = width
 
-    apply_table_borders(table, TABLE_CELL_STYLE_CONTEXT.color_table_gray)
     try:
         table_shape.left = Inches(TEMPLATE_V4_TABLE_BOUNDS.left)
         table_shape.top = Inches(TEMPLATE_V4_TABLE_BOUNDS.top)
@@ -4076,6 +3983,175 @@ def _prepare_main_table_data(
         excel_path,
     )
 
+
+TableSplits = list[tuple[list[list[str]], dict[tuple[int, int], dict[str, object]], bool]]
+
+
+@dataclass(slots=True)
+class CombinationTables:
+    """Paginated table data for the content slides of one combination.
+
+    ``None`` marks a table without data. ``products`` is keyed by the raw
+    product name and only filled for brands split into product slides.
+    """
+
+    brand: TableSplits | None = None
+    product_summary: TableSplits | None = None
+    products: dict[str, TableSplits | None] = field(default_factory=dict)
+
+
+def _paginate(table_result) -> TableSplits | None:
+    table_data, cell_metadata, campaign_boundaries = table_result
+    if table_data is None:
+        return None
+    return _split_table_data_by_campaigns(table_data, cell_metadata, campaign_boundaries)
+
+
+def _prepare_combination_tables(df, combination_row, excel_path, product_summary=True) -> CombinationTables:
+    """Prepare every table shown for ``combination_row``; reads no state besides the configuration.
+
+    The brand's product summary is only prepared with ``product_summary`` (see :func:`_brand_openers`).
+    """
+    market, brand, year = combination_row
+    tables = CombinationTables()
+
+    product_summary_config = PRODUCT_SPLIT_CONFIG.get("product_summary_slides", {})
+    if (
+        product_summary
+        and product_summary_config.get("enabled", False)
+        and brand in product_summary_config.get("brands", [])
+    ):
+        tables.product_summary = _paginate(
+            _prepare_product_summary_table_data(
+                df, market, brand, year, excel_path,
+                reach_aggregation=product_summary_config.get("reach_aggregation", "average"),
+                grp_aggregation=product_summary_config.get("grp_aggregation", "sum"),
+            )
+        )
+
+    tables.brand = _paginate(_prepare_main_table_data_detailed(df, market, brand, year, excel_path))
+    # Without a brand table the combination gets no product slides either
+    if tables.brand is None:
+        return tables
+
+    if PRODUCT_SPLIT_CONFIG.get("enabled", False) and brand in PRODUCT_SPLIT_CONFIG.get("brands", []):
+        partitions = partition_index_for(df)
+        product_subset = partitions.rows(market, brand, year)
+        if "Product" in product_subset.columns:
+            for product_name in product_subset["Product"].dropna().unique():
+                if str(product_name).strip() == "":
+                    continue
+                product_df = partitions.rows(market, brand, year, product=product_name).copy()
+                if product_df.empty:
+                    continue
+                tables.products[product_name] = _paginate(
+                    _prepare_main_table_data_detailed(product_df, market, brand, year, excel_path)
+                )
+    return tables
+
+
+def _brand_openers(combinations) -> set[tuple]:
+    """Combinations that start a run of one (market, brand); only they show its product summary."""
+    openers = set()
+    previous = None
+    for combination in combinations:
+        combination = tuple(combination)
+        if combination[:2] != previous:
+            openers.add(combination)
+            previous = combination[:2]
+    return openers
+
+
+def _init_worker(config: Config, excel_path, tv_metrics_index) -> None:
+    """Process-pool initializer: same configuration and TV metrics as the parent."""
+    configure(config)
+    if excel_path and tv_metrics_index is not None:
+        prime_tv_metrics_index(excel_path, tv_metrics_index)
+
+
+class _TablePipeline:
+    """Table preparation running ahead of slide rendering.
+
+    With more than one worker (``performance.optimization.max_workers``,
+    default one per CPU), up to two combinations per worker are prepared in
+    worker processes while earlier ones are rendered; each worker receives only
+    the rows of the combination it prepares. With one worker a combination is
+    prepared when it is asked for. Use as a context manager and ask for the
+    combinations in order with :meth:`get`.
+
+    ``brand_openers`` (default: worked out from ``combinations``) are the
+    combinations whose product summary is shown, see :func:`_brand_openers`.
+    """
+
+    def __init__(self, df, combinations, excel_path, tv_metrics_index=None, *, workers=None, brand_openers=None):
+        self._df = df
+        self._excel_path = excel_path
+        self._tv_metrics_index = tv_metrics_index
+        self._pending = deque(tuple(combination) for combination in combinations)
+        self._brand_openers = _brand_openers(self._pending) if brand_openers is None else brand_openers
+        self._workers = max_workers(MASTER_CONFIG, len(self._pending)) if workers is None else workers
+        self._futures = {}
+        self._pool = None
+
+    def __enter__(self):
+        if self._workers > 1:
+            logger.info("Preparing tables for %s combinations with %s worker processes", len(self._pending), self._workers)
+            try:
+                self._pool = process_pool(
+                    self._workers,
+                    initializer=_init_worker,
+                    initargs=(MASTER_CONFIG, self._excel_path, self._tv_metrics_index),
+                )
+            except OSError as exc:
+                logger.warning("Table preparation workers failed (%s); preparing tables in-process", exc)
+            self._submit_ahead()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _submit_ahead(self) -> None:
+        partitions = partition_index_for(self._df)
+        try:
+            while self._pool is not None and self._pending and len(self._futures) < 2 * self._workers:
+                combination = self._pending.popleft()
+                self._futures[combination] = self._pool.submit(
+                    _prepare_combination_tables,
+                    partitions.rows(*combination),
+                    combination,
+                    self._excel_path,
+                    combination in self._brand_openers,
+                )
+        except BrokenProcessPool as exc:
+            self._stop_workers(exc)
+
+    def _stop_workers(self, exc) -> None:
+        logger.warning("Table preparation workers failed (%s); preparing tables in-process", exc)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._futures.clear()
+
+    def get(self, combination) -> CombinationTables:
+        """Tables of ``combination``; keeps the workers busy with the combinations after it."""
+        combination = tuple(combination)
+        future = self._futures.pop(combination, None)
+        if future is not None:
+            try:
+                tables = future.result()
+            except BrokenProcessPool as exc:
+                self._stop_workers(exc)
+            else:
+                self._submit_ahead()
+                return tables
+        elif combination in self._pending:
+            self._pending.remove(combination)
+        return _prepare_combination_tables(
+            self._df, combination, self._excel_path, combination in self._brand_openers
+        )
+
+
 def _prepare_funnel_chart_data(df, region, masterbrand):
     """
     Prepare data for the funnel chart.
@@ -4191,10 +4267,12 @@ def _add_pie_chart(slide, chart_data, chart_title, position_info, chart_name=Non
         CHART_COLOR_MAPPING,
         CHART_COLOR_CYCLE,
         chart_name=chart_name,
+        embed_workbook=bool(charts_config.get("embed_workbook", True)),
     )
 
 def _populate_slide_content(new_slide, prs, combination_row, slide_title_suffix,
-                          split_table_data, split_metadata, split_idx, df, excel_path, is_last_slide=False):
+                          split_table_data, split_metadata, split_idx, df, excel_path, is_last_slide=False,
+                          postprocessor=None):
     """
     Populate a single slide with all content (title, table, charts, comments).
 
@@ -4209,6 +4287,7 @@ def _populate_slide_content(new_slide, prs, combination_row, slide_title_suffix,
         df: Full dataframe
         excel_path: Path to source Excel file
         is_last_slide: True if this is the last slide for this brand
+        postprocessor: PostProcessorCLI that fixes up the finished table (merges, fonts)
     """
 
     template_slide = prs.slides[0]
@@ -4230,8 +4309,13 @@ def _populate_slide_content(new_slide, prs, combination_row, slide_title_suffix,
         logger.warning(f"Failed to create table for slide")
 
     # Populate brand-level indicators ONLY on last slide
-    _populate_summary_tiles(new_slide, template_slide, df, combination_row, excel_path, is_last_slide)
-    _ensure_legend_shapes(new_slide, template_slide)
+    shapes = SlideShapeIndex(new_slide, shape_library_for(template_slide))
+    _populate_summary_tiles(new_slide, template_slide, df, combination_row, excel_path, is_last_slide, shapes=shapes)
+    _ensure_legend_shapes(new_slide, template_slide, shapes=shapes)
+
+    # Post-process this slide's table now rather than reloading the saved deck
+    if postprocessor is not None and table_success:
+        postprocessor.process_slide(new_slide, len(prs.slides) - 1, PostProcessorCLI.POSTPROCESS_ALL_WORKFLOW)
 
     return {
         "title": title_text,
@@ -4240,8 +4324,667 @@ def _populate_slide_content(new_slide, prs, combination_row, slide_title_suffix,
         "notes": None,
     }
 
-def create_presentation(template_path, excel_path, output_path, format_type: InputFormat = None):
-    """Creates a PowerPoint presentation based on a template and Excel data."""
+def _add_section_background(prs, slide, color):
+    background = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE,
+        left=0,
+        top=0,
+        width=prs.slide_width,
+        height=prs.slide_height
+    )
+    background.fill.solid()
+    background.fill.fore_color.rgb = RGBColor(color[0], color[1], color[2])
+    background.line.fill.background()
+
+
+def _add_section_text(prs, slide, text, top_fraction, height, *, size_pt, bold, color, fit=False):
+    """Add a centred, full-width delimiter text box (shrinking its text to fit when ``fit``)."""
+    text_box = slide.shapes.add_textbox(
+        left=Inches(1),
+        top=int(prs.slide_height * top_fraction),
+        width=prs.slide_width - Inches(2),
+        height=height
+    )
+    text_frame = text_box.text_frame
+    text_frame.text = text
+    text_frame.word_wrap = False
+    if fit:
+        text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+
+    for paragraph in text_frame.paragraphs:
+        paragraph.alignment = PP_ALIGN.CENTER
+        for run in paragraph.runs:
+            run.font.size = Pt(size_pt)
+            run.font.bold = bold
+            run.font.name = FONT_FAMILY_LEGEND
+            run.font.color.rgb = RGBColor(color[0], color[1], color[2])
+    return text_box
+
+
+def _build_market_delimiter(prs, slide, section_num, market_title):
+    # Clean black background, gray section number above the green market name
+    _add_section_background(prs, slide, (0, 0, 0))
+    return [
+        _add_section_text(prs, slide, section_num, 0.35, Inches(0.6), size_pt=24, bold=False, color=(128, 128, 128)),
+        _add_section_text(prs, slide, market_title, 0.45, Inches(1.5), size_pt=48, bold=True, color=(0x30, 0xEA, 0x03), fit=True),
+    ]
+
+
+def _build_brand_delimiter(prs, slide, section_num, brand_title):
+    # Very dark gray background to differentiate from the market delimiter
+    _add_section_background(prs, slide, (35, 35, 35))
+    return [
+        _add_section_text(prs, slide, section_num, 0.35, Inches(0.6), size_pt=20, bold=False, color=(128, 128, 128)),
+        _add_section_text(prs, slide, brand_title, 0.45, Inches(1.5), size_pt=40, bold=True, color=(255, 255, 255), fit=True),
+    ]
+
+
+def _build_product_summary_delimiter(prs, slide, section_num):
+    style = PRODUCT_SPLIT_CONFIG.get("product_summary_slides", {}).get("delimiter_style", {})
+    _add_section_background(prs, slide, style.get("background_color", [40, 40, 40]))
+    section_box = _add_section_text(prs, slide, section_num, 0.35, Inches(0.6), size_pt=18, bold=False, color=(128, 128, 128))
+    _add_section_text(
+        prs,
+        slide,
+        style.get("title", "PRODUCT SUMMARY"),
+        0.45,
+        Inches(1.5),
+        size_pt=style.get("font_size_pt", 40),
+        bold=True,
+        color=style.get("text_color", [48, 234, 3]),
+        fit=True,
+    )
+    return [section_box]
+
+
+def _build_brand_total_delimiter(prs, slide, section_num, total_title):
+    # "{BRAND} TOTAL (All Products/Campaigns)" between the product summary and the brand total
+    _add_section_background(prs, slide, (0, 0, 0))
+    shapes = [
+        _add_section_text(prs, slide, section_num, 0.25, Inches(0.6), size_pt=18, bold=False, color=(128, 128, 128)),
+        _add_section_text(prs, slide, total_title, 0.38, Inches(1), size_pt=44, bold=True, color=(255, 255, 255), fit=True),
+    ]
+    _add_section_text(prs, slide, "(All Products/Campaigns)", 0.55, Inches(0.8), size_pt=28, bold=False, color=(48, 234, 3), fit=True)
+    return shapes
+
+
+def _build_product_delimiter(prs, slide, section_num, product_title, brand_title):
+    style = PRODUCT_SPLIT_CONFIG.get("delimiter_style", {})
+    brand_title_config = style.get("brand_title", {})
+    _add_section_background(prs, slide, style.get("background_color", [85, 85, 85]))
+    # Light gray section number at the top, on the dark background
+    section_box = _add_section_text(prs, slide, section_num, 0.08, Inches(0.5), size_pt=16, bold=False, color=(160, 160, 160))
+    brand_box = None
+    if brand_title_config.get("enabled", False):
+        brand_box = _add_section_text(
+            prs,
+            slide,
+            brand_title,
+            0.15,
+            Inches(1),
+            size_pt=brand_title_config.get("font_size_pt", 36),
+            bold=True,
+            color=brand_title_config.get("text_color", [255, 255, 255]),
+            fit=True,
+        )
+    product_box = _add_section_text(
+        prs,
+        slide,
+        product_title,
+        0.50,
+        Inches(1.5),
+        size_pt=style.get("font_size_pt", 32),
+        bold=True,
+        color=style.get("text_color", [255, 255, 255]),
+        fit=True,
+    )
+    return [section_box, product_box, brand_box]
+
+
+_SECTION_BUILDERS = {
+    "market": _build_market_delimiter,
+    "brand": _build_brand_delimiter,
+    "product_summary": _build_product_summary_delimiter,
+    "brand_total": _build_brand_total_delimiter,
+    "product": _build_product_delimiter,
+}
+
+
+def _render_combinations(
+    prs,
+    df,
+    ordered_combinations,
+    excel_path,
+    market_investments,
+    incremental,
+    table_pipeline,
+    *,
+    first_market_number=1,
+    postprocessor=None,
+):
+    """Render the delimiter and content slides of ``ordered_combinations`` into ``prs``.
+
+    Tables come from ``table_pipeline`` (a :class:`_TablePipeline`) and are
+    post-processed by ``postprocessor`` as each content slide is finished.
+    ``first_market_number`` is the section number of the first market, so a
+    shard of the market list is numbered as it would be in the full deck.
+    Returns the TOC entries and the AutoPPTX payloads of the rendered slides.
+    """
+    autopptx_payloads: list[dict[str, object]] = []
+    sections = SectionSlideFactory(prs, _SECTION_BUILDERS)
+
+    # ═══════════════════════════════════════════════════════════════
+    # SECTION NUMBERING TRACKING
+    # Format: {market_idx}.{brand_idx}.{subsection_idx}
+    # e.g., "1.2.3" = Market 1, Brand 2, Subsection 3
+    # ═══════════════════════════════════════════════════════════════
+    market_idx = first_market_number - 1
+    brand_idx = 0
+    subsection_idx = 0
+
+    # Breadcrumb tracking - shows hierarchy path on data slides
+    # Format: "1. MARKET > 1.1 BRAND > 1.1.1 SECTION"
+    current_breadcrumb = ""
+    breadcrumb_market = ""  # e.g., "1. SAUDI ARABIA"
+    breadcrumb_brand = ""   # e.g., "1.1 SENSODYNE"
+
+    # TOC data collection - will be used to populate TOC slide content
+    toc_entries = []  # List of (level, number, title, slide_index)
+
+    current_market = None
+    current_brand = None
+    for idx, combination_row in enumerate(ordered_combinations):
+        # Content slides of unchanged combinations are copied from the previous deck
+        carried = incremental.reusable(combination_row)
+        tables = table_pipeline.get(combination_row) if carried is None else None
+
+        # Check if we're starting a new market
+        if combination_row[0] != current_market:
+            current_market = combination_row[0]
+            current_brand = None  # Reset brand when market changes
+
+            # Update section numbering
+            market_idx += 1
+            brand_idx = 0  # Reset brand counter for new market
+            subsection_idx = 0
+
+            # Fix market name display
+            display_market_name = "Morocco" if current_market == "MOR" else current_market
+            market_section_num = f"{market_idx}."
+
+            # Update breadcrumb for market level
+            breadcrumb_market = f"{market_section_num} {str(display_market_name).upper()}"
+            breadcrumb_brand = ""  # Reset brand breadcrumb
+            current_breadcrumb = breadcrumb_market
+
+            # Add a clean minimal market delimiter slide
+            sections.add(
+                "market",
+                market_section_num,
+                str(display_market_name).upper() if display_market_name else "UNKNOWN",
+            )
+
+            # Record TOC entry with spend data
+            toc_entries.append({
+                "level": 1,
+                "number": market_section_num,
+                "title": str(display_market_name).upper(),
+                "slide_index": len(prs.slides),
+                "spend": market_investments.get(current_market, {}).get('total', 0)
+            })
+
+            logger.info(f"Added market delimiter slide for: {market_section_num} {display_market_name}")
+
+        # Check if we're starting a new brand
+        brand_key = (combination_row[0], combination_row[1])  # (market, brand) tuple
+        if brand_key != current_brand:
+            current_brand = brand_key
+
+            # Update section numbering
+            brand_idx += 1
+            subsection_idx = 0  # Reset subsection counter for new brand
+
+            # Fix display names
+            display_market_name = "Morocco" if combination_row[0] == "MOR" else combination_row[0]
+            display_brand_name = combination_row[1]
+            brand_section_num = f"{market_idx}.{brand_idx}"
+
+            # Update breadcrumb for brand level
+            breadcrumb_brand = f"{brand_section_num} {display_brand_name.upper()}"
+            current_breadcrumb = f"{breadcrumb_market}  ›  {breadcrumb_brand}"
+
+            # Add a clean minimal brand delimiter slide
+            brand_title = f"{display_brand_name}".upper()
+            sections.add("brand", brand_section_num, brand_title)
+
+            # Record TOC entry
+            toc_entries.append({
+                "level": 2,
+                "number": brand_section_num,
+                "title": display_brand_name.upper(),
+                "slide_index": len(prs.slides)
+            })
+
+            logger.info(f"Added brand delimiter slide for: {brand_section_num} {brand_title}")
+
+            # ═══════════════════════════════════════════════════════════════
+            # PRODUCT SUMMARY SLIDES: Aggregated view with products as rows
+            # ═══════════════════════════════════════════════════════════════
+            product_summary_config = PRODUCT_SPLIT_CONFIG.get("product_summary_slides", {})
+            product_summary_enabled = product_summary_config.get("enabled", False)
+            product_summary_brands = product_summary_config.get("brands", [])
+
+            if product_summary_enabled and display_brand_name in product_summary_brands:
+                logger.info(f"Generating product summary slides for {display_market_name} - {display_brand_name}")
+
+                # Update section numbering for Product Summary
+                subsection_idx += 1
+                ps_section_num = f"{market_idx}.{brand_idx}.{subsection_idx}"
+
+                # Update breadcrumb for product summary level
+                current_breadcrumb = f"{breadcrumb_market}  ›  {breadcrumb_brand}  ›  {ps_section_num} PRODUCT SUMMARY"
+
+                # Add product summary delimiter slide
+                sections.add("product_summary", ps_section_num)
+
+                logger.info(f"Added product summary delimiter slide for: {ps_section_num} {display_brand_name}")
+
+                # Generate product summary content slides
+                market = combination_row[0]
+                year = combination_row[2]
+
+                if carried is not None:
+                    ps_splits = None
+                    for ps_slide in incremental.carry(prs, combination_row, ROLE_PRODUCT_SUMMARY, carried):
+                        _refresh_carried_slide(ps_slide, prs.slides[0], current_breadcrumb, excel_path)
+                else:
+                    ps_splits = tables.product_summary
+
+                if ps_splits is not None:
+                    for ps_split_idx, (ps_split_data, ps_split_meta, ps_is_continuation) in enumerate(ps_splits):
+                        if len(ps_splits) > 1:
+                            ps_suffix = f" ({ps_split_idx + 1}/{len(ps_splits)})"
+                        else:
+                            ps_suffix = ""
+
+                        ps_is_last = (ps_split_idx == len(ps_splits) - 1)
+                        ps_slide = prs.slides.add_slide(prs.slide_layouts[0])
+                        incremental.record(combination_row, ROLE_PRODUCT_SUMMARY, ps_slide)
+
+                        # Use modified combination with "Product Summary" indicator
+                        ps_combination = (market, f"{display_brand_name} - Product Summary", year)
+
+                        ps_payload = _populate_slide_content(
+                            ps_slide, prs, ps_combination, ps_suffix,
+                            ps_split_data, ps_split_meta, ps_split_idx,
+                            df, excel_path, ps_is_last, postprocessor
+                        )
+
+                        # Add breadcrumb to product summary data slide
+                        _add_breadcrumb_to_slide(ps_slide, current_breadcrumb, prs.slide_width, prs.slide_height)
+
+                        if ps_payload:
+                            autopptx_payloads.append(ps_payload)
+
+                    logger.info(f"Generated {len(ps_splits)} product summary slide(s) for {display_brand_name}")
+                elif carried is None:
+                    logger.warning(f"No product summary data for {display_brand_name}")
+
+                # ═══════════════════════════════════════════════════════════════
+                # ADD TRANSITION SLIDE: "{BRAND} TOTAL (All Products/Campaigns)"
+                # This provides visual separation between Product Summary and Brand Total
+                # ═══════════════════════════════════════════════════════════════
+
+                # Increment subsection counter for brand total
+                subsection_idx += 1
+                btd_section_num = f"{market_idx}.{brand_idx}.{subsection_idx}"
+
+                # Update breadcrumb for brand total level
+                current_breadcrumb = f"{breadcrumb_market}  ›  {breadcrumb_brand}  ›  {btd_section_num} TOTAL"
+
+                sections.add("brand_total", btd_section_num, f"{display_brand_name.upper()} TOTAL")
+
+                logger.info(f"Added brand total transition slide for: {display_brand_name}")
+
+        logger.info(f"Processing combination {idx+1}/{len(ordered_combinations)}: {combination_row[0]} - {combination_row[1]} - {combination_row[2]}")
+        
+        if carried is not None:
+            # The previous run produced no table for this combination either
+            if ROLE_BRAND not in carried.slides:
+                continue
+            for new_slide in incremental.carry(prs, combination_row, ROLE_BRAND, carried):
+                _refresh_carried_slide(new_slide, prs.slides[0], current_breadcrumb, excel_path)
+            table_splits = []
+        else:
+            if tables.brand is None:
+                logger.warning(f"No table data generated for {combination_row[0]} - {combination_row[1]}")
+                continue
+
+            table_splits = tables.brand
+        
+        # Create a slide for each split
+        for split_idx, (split_table_data, split_metadata, is_continuation) in enumerate(table_splits):
+            # Add slide number to title if there are multiple splits
+            if len(table_splits) > 1:
+                slide_title_suffix = f" ({split_idx + 1}/{len(table_splits)})"
+            else:
+                slide_title_suffix = ""
+
+            # CRITICAL: Determine if this is the LAST slide for this brand
+            # Brand-level indicators (quarters, media share, funnel stage) only appear on last slide
+            is_last_slide = (split_idx == len(table_splits) - 1)
+
+            new_slide = prs.slides.add_slide(prs.slide_layouts[0])
+            incremental.record(combination_row, ROLE_BRAND, new_slide)
+            # logger.debug(f"Added new slide for {combination_row[0]} - {combination_row[1]} - {combination_row[2]}{slide_title_suffix}")
+
+            # Populate this slide with content immediately
+            payload = _populate_slide_content(
+                new_slide, prs, combination_row, slide_title_suffix,
+                split_table_data, split_metadata, split_idx, df, excel_path, is_last_slide, postprocessor
+            )
+
+            # Add breadcrumb to brand-level data slide
+            _add_breadcrumb_to_slide(new_slide, current_breadcrumb, prs.slide_width, prs.slide_height)
+
+            if payload:
+                autopptx_payloads.append(payload)
+
+            # Diagnostic: Log all shapes on the new slide (commented out to reduce log size)
+        # This entire block is commented out to reduce log file size
+        # Re-enable for debugging shape-related issues
+        """
+        logger.debug(f"--- Shapes on new_slide (Layout: {prs.slide_layouts[0].name}, Index: {idx+1}) ---")
+        if hasattr(new_slide, 'shapes'):
+            logger.debug(f"  new_slide.shapes attribute exists. Number of shapes found: {len(new_slide.shapes)}")
+            if new_slide.shapes:
+                for i, shape in enumerate(new_slide.shapes):
+                    shape_name = shape.name if hasattr(shape, 'name') else 'Unnamed Shape'
+                    shape_type = shape.shape_type if hasattr(shape, 'shape_type') else 'Unknown Type'
+                    is_placeholder = shape.is_placeholder if hasattr(shape, 'is_placeholder') else False
+                    placeholder_type = None
+                    placeholder_idx = None
+                    if is_placeholder and hasattr(shape, 'placeholder_format'):
+                        ph_format = shape.placeholder_format
+                        if hasattr(ph_format, 'type'):
+                            placeholder_type = ph_format.type
+                        if hasattr(ph_format, 'idx'):
+                            placeholder_idx = ph_format.idx
+                    logger.debug(f"  Shape {i}: Name='{shape_name}', Type={shape_type}, IsPlaceholder={is_placeholder}, PlaceholderType={placeholder_type}, PlaceholderIdx={placeholder_idx}")
+            else:
+                logger.debug("  new_slide.shapes collection is empty (it exists but len is 0).")
+        else:
+            logger.debug("  new_slide.shapes attribute is missing.")
+        logger.debug(f"--- End Shapes on new_slide (Index: {idx+1}) ---")
+            """
+
+        # ═══════════════════════════════════════════════════════════════
+        # PRODUCT-LEVEL SLIDES: Generate sub-slides for Panadol Pain/C&F
+        # ═══════════════════════════════════════════════════════════════
+        current_brand_name = combination_row[1]
+        product_split_brands = PRODUCT_SPLIT_CONFIG.get("brands", [])
+        product_split_enabled = PRODUCT_SPLIT_CONFIG.get("enabled", False)
+
+        if product_split_enabled and current_brand_name in product_split_brands:
+            # Get unique products for this market/brand/year combination
+            market = combination_row[0]
+            year = combination_row[2]
+
+            product_subset = partition_index_for(df).rows(market, current_brand_name, year)
+
+            if "Product" in product_subset.columns:
+                # Get unique products, sorted by total investment
+                product_investments = product_subset.groupby("Product", observed=True)["Total Cost"].sum()
+                unique_products = product_investments.sort_values(ascending=False).index.tolist()
+
+                logger.info(f"Generating {len(unique_products)} product sub-slides for {market} - {current_brand_name}")
+
+                prefix = PRODUCT_SPLIT_CONFIG.get("delimiter_style", {}).get("prefix", "Product: ")
+
+                # Product rename mapping (e.g., "Parodontax" -> "Parodontax Product")
+                product_rename_map = PRODUCT_SPLIT_CONFIG.get("product_rename", {})
+
+                for product_name in unique_products:
+                    if not product_name or pd.isna(product_name) or str(product_name).strip() == "":
+                        continue
+
+                    # Get display name (may be renamed to avoid brand/product collision)
+                    product_name_str = str(product_name).strip()
+                    display_product_name = product_rename_map.get(product_name_str, product_name_str)
+
+                    # Strip redundant brand prefix from product name for cleaner display
+                    # e.g., "Parodontax Mouthwash" -> "Mouthwash" when brand is "Parodontax"
+                    # But keep renamed products as-is (e.g., "Sensodyne Product" stays as-is)
+                    if product_name_str not in product_rename_map:
+                        brand_prefix = current_brand_name + " "
+                        if display_product_name.lower().startswith(brand_prefix.lower()):
+                            display_product_name = display_product_name[len(brand_prefix):].strip()
+
+                    # Add product delimiter slide
+
+                    # Increment subsection counter for each product
+                    subsection_idx += 1
+                    prod_section_num = f"{market_idx}.{brand_idx}.{subsection_idx}"
+
+                    # Update breadcrumb for product level
+                    current_breadcrumb = f"{breadcrumb_market}  ›  {breadcrumb_brand}  ›  {prod_section_num} {display_product_name.upper()}"
+
+                    product_title = f"{prefix}{display_product_name}".upper()
+                    sections.add("product", prod_section_num, product_title, str(current_brand_name).upper())
+
+                    logger.info(f"Added product delimiter slide for: {product_name}")
+
+                    # Generate content slide(s) for this product
+                    product_df = partition_index_for(df).rows(
+                        market, current_brand_name, year, product=product_name
+                    ).copy()
+
+                    if product_df.empty:
+                        logger.warning(f"No data for product: {product_name}")
+                        continue
+
+                    if carried is not None:
+                        for product_slide in incremental.carry(prs, combination_row, product_role(product_name), carried):
+                            _refresh_carried_slide(product_slide, prs.slides[0], current_breadcrumb, excel_path)
+                        continue
+
+                    product_splits = tables.products.get(product_name)
+                    if product_splits is None:
+                        logger.warning(f"No table data for product: {product_name}")
+                        continue
+
+                    for prod_split_idx, (prod_split_data, prod_split_meta, _) in enumerate(product_splits):
+                        if len(product_splits) > 1:
+                            prod_suffix = f" ({prod_split_idx + 1}/{len(product_splits)})"
+                        else:
+                            prod_suffix = ""
+
+                        is_last_product_slide = (prod_split_idx == len(product_splits) - 1)
+
+                        product_slide = prs.slides.add_slide(prs.slide_layouts[0])
+                        incremental.record(combination_row, product_role(product_name), product_slide)
+
+                        # Create modified combination_row with product name in title (use display name)
+                        product_combination = (market, f"{current_brand_name} - {display_product_name}", year)
+
+                        product_payload = _populate_slide_content(
+                            product_slide, prs, product_combination, prod_suffix,
+                            prod_split_data, prod_split_meta, prod_split_idx,
+                            product_df, excel_path, is_last_product_slide, postprocessor
+                        )
+
+                        # Add breadcrumb to product-level data slide
+                        _add_breadcrumb_to_slide(product_slide, current_breadcrumb, prs.slide_width, prs.slide_height)
+
+                        if product_payload:
+                            autopptx_payloads.append(product_payload)
+
+                    logger.info(f"Generated {len(product_splits)} slide(s) for product: {product_name}")
+
+    return toc_entries, autopptx_payloads
+
+
+def _shard_rendering_enabled() -> bool:
+    optimization = (MASTER_CONFIG.get("performance", {}) or {}).get("optimization", {}) or {}
+    return bool(optimization.get("shard_rendering", False))
+
+
+def _market_shards(ordered_combinations, shard_count) -> list[tuple[int, list[tuple]]]:
+    """Split ``ordered_combinations`` into runs of whole markets with similar combination counts.
+
+    Returns ``(section number of the shard's first market, combinations)`` per shard.
+    """
+    markets: list[list[tuple]] = []
+    for combination in ordered_combinations:
+        if not markets or markets[-1][0][0] != combination[0]:
+            markets.append([])
+        markets[-1].append(tuple(combination))
+
+    shard_count = max(1, min(shard_count, len(markets)))
+    shards: list[tuple[int, list[tuple]]] = []
+    assigned = 0
+    for number, market in enumerate(markets, start=1):
+        if not shards or (
+            len(shards) < shard_count
+            and assigned >= len(ordered_combinations) * len(shards) / shard_count
+        ):
+            shards.append((number, []))
+        shards[-1][1].extend(market)
+        assigned += len(market)
+    return shards
+
+
+@dataclass(slots=True)
+class _RenderedShard:
+    """Partial deck rendered by a worker (its first slide is the template slide)."""
+
+    deck: bytes
+    toc_entries: list[dict[str, object]]
+    autopptx_payloads: list[dict[str, object]]
+    # (combination key, role, position in the partial deck) of every content slide
+    slides: list[tuple[str, str, int]]
+    postprocess_operations: int = 0
+    postprocess_failures: int = 0
+
+
+def _render_shard(template_path, df, combinations, excel_path, market_investments, first_market_number) -> _RenderedShard:
+    """Process-pool entry point: render one shard of the market list into its own deck."""
+    prs = Presentation(template_path)
+    recorder = IncrementalBuild(settings_digest="", digests={})
+    postprocessor = PostProcessorCLI(prs)
+    # The shard is this process's only work, so its tables are prepared in-process
+    with _TablePipeline(df, combinations, excel_path, workers=1) as table_pipeline:
+        toc_entries, autopptx_payloads = _render_combinations(
+            prs,
+            df,
+            combinations,
+            excel_path,
+            market_investments,
+            recorder,
+            table_pipeline,
+            first_market_number=first_market_number,
+            postprocessor=postprocessor,
+        )
+    buffer = BytesIO()
+    prs.save(buffer)
+    return _RenderedShard(
+        buffer.getvalue(),
+        toc_entries,
+        autopptx_payloads,
+        recorder.recorded_positions(prs),
+        postprocessor.total_operations,
+        postprocessor.failed_operations,
+    )
+
+
+def _render_sharded(
+    prs,
+    template_path,
+    df,
+    shards,
+    excel_path,
+    market_investments,
+    incremental,
+    tv_metrics_index=None,
+    postprocessor=None,
+):
+    """Render market shards in worker processes and splice the partial decks into ``prs``.
+
+    Workers post-process their slides; their operation counts are added to ``postprocessor``.
+    Returns the TOC entries and AutoPPTX payloads like :func:`_render_combinations`,
+    or None when the workers could not run (nothing is added to ``prs`` then).
+    """
+    logger.info("Rendering %s markets in %s shards", len(market_investments), len(shards))
+    try:
+        with process_pool(
+            len(shards),
+            initializer=_init_worker,
+            initargs=(MASTER_CONFIG, excel_path, tv_metrics_index),
+        ) as pool:
+            # Like table preparation, each worker receives only the rows it renders
+            futures = [
+                pool.submit(
+                    _render_shard,
+                    template_path,
+                    df[df["Country"].isin({combination[0] for combination in combinations})],
+                    combinations,
+                    excel_path,
+                    market_investments,
+                    first_number,
+                )
+                for first_number, combinations in shards
+            ]
+            results = []
+            for (first_number, combinations), future in zip(shards, futures):
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    logger.warning(
+                        "Rendering shard of markets %s to %s (sections %s-%s) failed (%s); rendering in-process",
+                        combinations[0][0],
+                        combinations[-1][0],
+                        first_number,
+                        first_number + len({combination[0] for combination in combinations}) - 1,
+                        exc,
+                    )
+                    for pending in futures:
+                        pending.cancel()
+                    return None
+    except (OSError, BrokenProcessPool) as exc:
+        logger.warning("Rendering workers failed (%s); rendering in-process", exc)
+        return None
+
+    toc_entries: list[dict[str, object]] = []
+    autopptx_payloads: list[dict[str, object]] = []
+    for result in results:
+        partial = Presentation(BytesIO(result.deck))
+        # Partial deck positions shift by the slides already in prs, minus its template slide
+        offset = len(prs.slides) - 1
+        merged = [None, *append_slides(prs, list(partial.slides)[1:])]
+        incremental.adopt(result.slides, merged)
+        for entry in result.toc_entries:
+            entry["slide_index"] += offset
+        toc_entries.extend(result.toc_entries)
+        autopptx_payloads.extend(result.autopptx_payloads)
+        if postprocessor is not None:
+            postprocessor.total_operations += result.postprocess_operations
+            postprocessor.failed_operations += result.postprocess_failures
+    logger.info("Merged %s partial decks (%s slides)", len(results), len(prs.slides))
+    return toc_entries, autopptx_payloads
+
+
+def create_presentation(template_path, excel_path, output_path, format_type: InputFormat = None, previous_deck=None):
+    """Creates a PowerPoint presentation based on a template and Excel data.
+
+    When ``previous_deck`` (a deck written by an earlier run, with its
+    manifest) is given, content slides of combinations whose data and
+    rendering settings are unchanged are copied from it instead of rendered.
+
+    Table preparation and, with ``performance.optimization.shard_rendering``,
+    slide rendering run in spawned worker processes, which re-import the
+    calling script; scripts calling this must do so under an
+    ``if __name__ == "__main__":`` guard.
+    """
     # Set module-level format type for this session
     if format_type is not None:
         set_input_format(format_type)
@@ -4289,19 +5032,12 @@ def create_presentation(template_path, excel_path, output_path, format_type: Inp
         unique_combinations_raw = df[[country_col_name, brand_col_name, year_col_name]].drop_duplicates().values.tolist()
         logger.info(f"Found {len(unique_combinations_raw)} unique Country/Global Masterbrand/Year combinations.")
 
-        # Calculate total investment for each combination
+        # Calculate total investment for each combination from the aggregate cube
+        cube = aggregate_cube_for(df)
         combinations_with_investment = []
         for combination in unique_combinations_raw:
             country, brand, year = combination
-            # Filter data for this specific combination
-            combination_data = df[
-                (df[country_col_name] == country) & 
-                (df[brand_col_name] == brand) & 
-                (df[year_col_name] == year)
-            ]
-            # Calculate total investment (sum of Total Cost for this combination)
-            total_investment = combination_data['Total Cost'].fillna(0).sum()
-            
+            total_investment = cube.total(country, brand, year)
             combinations_with_investment.append((country, brand, year, total_investment))
         
         # Group by market (country) and calculate total market investment
@@ -4349,25 +5085,19 @@ def create_presentation(template_path, excel_path, output_path, format_type: Inp
                 excel_path,
             )
 
-        autopptx_payloads: list[dict[str, object]] = []
-
-        # ═══════════════════════════════════════════════════════════════
-        # SECTION NUMBERING TRACKING
-        # Format: {market_idx}.{brand_idx}.{subsection_idx}
-        # e.g., "1.2.3" = Market 1, Brand 2, Subsection 3
-        # ═══════════════════════════════════════════════════════════════
-        market_idx = 0
-        brand_idx = 0
-        subsection_idx = 0
-
-        # Breadcrumb tracking - shows hierarchy path on data slides
-        # Format: "1. MARKET > 1.1 BRAND > 1.1.1 SECTION"
-        current_breadcrumb = ""
-        breadcrumb_market = ""  # e.g., "1. SAUDI ARABIA"
-        breadcrumb_brand = ""   # e.g., "1.1 SENSODYNE"
-
-        # TOC data collection - will be used to populate TOC slide content
-        toc_entries = []  # List of (level, number, title, slide_index)
+        if previous_deck is not None and AUTOPPTX_CONFIG.get("enabled"):
+            logger.info("AutoPPTX needs a payload for every slide; rendering all slides instead of reusing %s", previous_deck)
+            previous_deck = None
+        tv_metrics_index = None
+        if excel_path:
+            try:
+                tv_metrics_index = get_tv_metrics_index(excel_path)
+            except (OSError, KeyError, ValueError) as exc:
+                logger.warning("Could not build the TV metrics index for %s: %s", excel_path, exc)
+                tv_metrics_index = None
+        incremental = IncrementalBuild.start(
+            df, tv_metrics_index, MASTER_CONFIG, template_path, previous_deck, logger=logger
+        )
 
         # ═══════════════════════════════════════════════════════════════
         # CREATE FRONT MATTER SLIDES (TOC + INFO) BEFORE CONTENT
@@ -4378,689 +5108,51 @@ def create_presentation(template_path, excel_path, output_path, format_type: Inp
         info_slide = _create_info_slide(prs)
         logger.info("Created front matter slides (TOC + Info)")
 
-        current_market = None
-        current_brand = None
-        for idx, combination_row in enumerate(ordered_combinations):
-            # Check if we're starting a new market
-            if combination_row[0] != current_market:
-                current_market = combination_row[0]
-                current_brand = None  # Reset brand when market changes
-
-                # Update section numbering
-                market_idx += 1
-                brand_idx = 0  # Reset brand counter for new market
-                subsection_idx = 0
-
-                # Fix market name display
-                display_market_name = "Morocco" if current_market == "MOR" else current_market
-                market_section_num = f"{market_idx}."
-
-                # Update breadcrumb for market level
-                breadcrumb_market = f"{market_section_num} {str(display_market_name).upper()}"
-                breadcrumb_brand = ""  # Reset brand breadcrumb
-                current_breadcrumb = breadcrumb_market
-
-                # Add a clean minimal market delimiter slide
-                try:
-                    blank_layout = prs.slide_layouts[6] if len(prs.slide_layouts) > 6 else prs.slide_layouts[0]
-                    delimiter_slide = prs.slides.add_slide(blank_layout)
-                except:
-                    delimiter_slide = prs.slides.add_slide(prs.slide_layouts[0])
-
-                # Record TOC entry with spend data
-                toc_entries.append({
-                    "level": 1,
-                    "number": market_section_num,
-                    "title": str(display_market_name).upper(),
-                    "slide_index": len(prs.slides),
-                    "spend": market_investments.get(current_market, {}).get('total', 0)
-                })
-
-                slide_width = prs.slide_width
-                slide_height = prs.slide_height
-
-                from pptx.enum.shapes import MSO_SHAPE
-
-                # Clean black background
-                black_bg = delimiter_slide.shapes.add_shape(
-                    MSO_SHAPE.RECTANGLE,
-                    left=0,
-                    top=0,
-                    width=slide_width,
-                    height=slide_height
-                )
-                black_bg.fill.solid()
-                black_bg.fill.fore_color.rgb = RGBColor(0, 0, 0)  # Black
-                black_bg.line.fill.background()
-
-                # Section number - smaller, above market name
-                section_num_box = delimiter_slide.shapes.add_textbox(
-                    left=Inches(1),
-                    top=int(slide_height * 0.35),
-                    width=slide_width - Inches(2),
-                    height=Inches(0.6)
-                )
-                section_num_frame = section_num_box.text_frame
-                section_num_frame.text = market_section_num
-                section_num_frame.word_wrap = False
-
-                for paragraph in section_num_frame.paragraphs:
-                    paragraph.alignment = PP_ALIGN.CENTER
-                    for run in paragraph.runs:
-                        run.font.size = Pt(24)
-                        run.font.bold = False
-                        run.font.name = FONT_FAMILY_LEGEND
-                        run.font.color.rgb = RGBColor(128, 128, 128)  # Gray
-
-                # Market name - large, centered, green text
-                text_box = delimiter_slide.shapes.add_textbox(
-                    left=Inches(1),
-                    top=int(slide_height * 0.45),
-                    width=slide_width - Inches(2),
-                    height=Inches(1.5)
-                )
-
-                text_frame = text_box.text_frame
-                text_frame.text = str(display_market_name).upper() if display_market_name else "UNKNOWN"
-                text_frame.word_wrap = False
-                text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-
-                for paragraph in text_frame.paragraphs:
-                    paragraph.alignment = PP_ALIGN.CENTER
-                    for run in paragraph.runs:
-                        run.font.size = Pt(48)
-                        run.font.bold = True
-                        run.font.name = FONT_FAMILY_LEGEND
-                        run.font.color.rgb = RGBColor(0x30, 0xea, 0x03)  # Haleon green
-
-                logger.info(f"Added market delimiter slide for: {market_section_num} {display_market_name}")
-
-            # Check if we're starting a new brand
-            brand_key = (combination_row[0], combination_row[1])  # (market, brand) tuple
-            if brand_key != current_brand:
-                current_brand = brand_key
-
-                # Update section numbering
-                brand_idx += 1
-                subsection_idx = 0  # Reset subsection counter for new brand
-
-                # Fix display names
-                display_market_name = "Morocco" if combination_row[0] == "MOR" else combination_row[0]
-                display_brand_name = combination_row[1]
-                brand_section_num = f"{market_idx}.{brand_idx}"
-
-                # Update breadcrumb for brand level
-                breadcrumb_brand = f"{brand_section_num} {display_brand_name.upper()}"
-                current_breadcrumb = f"{breadcrumb_market}  ›  {breadcrumb_brand}"
-
-                # Add a clean minimal brand delimiter slide
-                try:
-                    blank_layout = prs.slide_layouts[6] if len(prs.slide_layouts) > 6 else prs.slide_layouts[0]
-                    brand_delimiter_slide = prs.slides.add_slide(blank_layout)
-                except:
-                    brand_delimiter_slide = prs.slides.add_slide(prs.slide_layouts[0])
-
-                # Record TOC entry
-                toc_entries.append({
-                    "level": 2,
-                    "number": brand_section_num,
-                    "title": display_brand_name.upper(),
-                    "slide_index": len(prs.slides)
-                })
-
-                slide_width = prs.slide_width
-                slide_height = prs.slide_height
-
-                from pptx.enum.shapes import MSO_SHAPE
-
-                # Clean dark gray background (differentiate from market)
-                gray_bg = brand_delimiter_slide.shapes.add_shape(
-                    MSO_SHAPE.RECTANGLE,
-                    left=0,
-                    top=0,
-                    width=slide_width,
-                    height=slide_height
-                )
-                gray_bg.fill.solid()
-                gray_bg.fill.fore_color.rgb = RGBColor(35, 35, 35)  # Very dark gray
-                gray_bg.line.fill.background()
-
-                # Section number - smaller, above brand name
-                brand_section_box = brand_delimiter_slide.shapes.add_textbox(
-                    left=Inches(1),
-                    top=int(slide_height * 0.35),
-                    width=slide_width - Inches(2),
-                    height=Inches(0.6)
-                )
-                brand_section_frame = brand_section_box.text_frame
-                brand_section_frame.text = brand_section_num
-                brand_section_frame.word_wrap = False
-
-                for paragraph in brand_section_frame.paragraphs:
-                    paragraph.alignment = PP_ALIGN.CENTER
-                    for run in paragraph.runs:
-                        run.font.size = Pt(20)
-                        run.font.bold = False
-                        run.font.name = FONT_FAMILY_LEGEND
-                        run.font.color.rgb = RGBColor(128, 128, 128)  # Gray
-
-                # Brand name - large, centered, white text
-                brand_title = f"{display_brand_name}".upper()
-                text_box = brand_delimiter_slide.shapes.add_textbox(
-                    left=Inches(1),
-                    top=int(slide_height * 0.45),
-                    width=slide_width - Inches(2),
-                    height=Inches(1.5)
-                )
-
-                text_frame = text_box.text_frame
-                text_frame.text = brand_title
-                text_frame.word_wrap = False
-                text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-
-                for paragraph in text_frame.paragraphs:
-                    paragraph.alignment = PP_ALIGN.CENTER
-                    for run in paragraph.runs:
-                        run.font.size = Pt(40)  # Slightly smaller than market
-                        run.font.bold = True
-                        run.font.name = FONT_FAMILY_LEGEND
-                        run.font.color.rgb = RGBColor(255, 255, 255)  # White
-
-                logger.info(f"Added brand delimiter slide for: {brand_section_num} {brand_title}")
-
-                # ═══════════════════════════════════════════════════════════════
-                # PRODUCT SUMMARY SLIDES: Aggregated view with products as rows
-                # ═══════════════════════════════════════════════════════════════
-                product_summary_config = PRODUCT_SPLIT_CONFIG.get("product_summary_slides", {})
-                product_summary_enabled = product_summary_config.get("enabled", False)
-                product_summary_brands = product_summary_config.get("brands", [])
-
-                if product_summary_enabled and display_brand_name in product_summary_brands:
-                    logger.info(f"Generating product summary slides for {display_market_name} - {display_brand_name}")
-
-                    # Update section numbering for Product Summary
-                    subsection_idx += 1
-                    ps_section_num = f"{market_idx}.{brand_idx}.{subsection_idx}"
-
-                    # Update breadcrumb for product summary level
-                    current_breadcrumb = f"{breadcrumb_market}  ›  {breadcrumb_brand}  ›  {ps_section_num} PRODUCT SUMMARY"
-
-                    # Add product summary delimiter slide
-                    ps_delimiter_style = product_summary_config.get("delimiter_style", {})
-                    ps_bg_color = ps_delimiter_style.get("background_color", [40, 40, 40])
-                    ps_text_color = ps_delimiter_style.get("text_color", [48, 234, 3])
-                    ps_font_size = ps_delimiter_style.get("font_size_pt", 40)
-                    ps_title = ps_delimiter_style.get("title", "PRODUCT SUMMARY")
-
-                    try:
-                        blank_layout = prs.slide_layouts[6] if len(prs.slide_layouts) > 6 else prs.slide_layouts[0]
-                        ps_delimiter_slide = prs.slides.add_slide(blank_layout)
-                    except:
-                        ps_delimiter_slide = prs.slides.add_slide(prs.slide_layouts[0])
-
-                    # Background
-                    ps_bg = ps_delimiter_slide.shapes.add_shape(
-                        MSO_SHAPE.RECTANGLE,
-                        left=0,
-                        top=0,
-                        width=slide_width,
-                        height=slide_height
-                    )
-                    ps_bg.fill.solid()
-                    ps_bg.fill.fore_color.rgb = RGBColor(ps_bg_color[0], ps_bg_color[1], ps_bg_color[2])
-                    ps_bg.line.fill.background()
-
-                    # Section number - smaller, above title
-                    ps_section_box = ps_delimiter_slide.shapes.add_textbox(
-                        left=Inches(1),
-                        top=int(slide_height * 0.35),
-                        width=slide_width - Inches(2),
-                        height=Inches(0.6)
-                    )
-                    ps_section_frame = ps_section_box.text_frame
-                    ps_section_frame.text = ps_section_num
-                    ps_section_frame.word_wrap = False
-
-                    for paragraph in ps_section_frame.paragraphs:
-                        paragraph.alignment = PP_ALIGN.CENTER
-                        for run in paragraph.runs:
-                            run.font.size = Pt(18)
-                            run.font.bold = False
-                            run.font.name = FONT_FAMILY_LEGEND
-                            run.font.color.rgb = RGBColor(128, 128, 128)  # Gray
-
-                    # Title text
-                    ps_text_box = ps_delimiter_slide.shapes.add_textbox(
-                        left=Inches(1),
-                        top=int(slide_height * 0.45),
-                        width=slide_width - Inches(2),
-                        height=Inches(1.5)
-                    )
-                    ps_text_frame = ps_text_box.text_frame
-                    ps_text_frame.text = ps_title
-                    ps_text_frame.word_wrap = False
-                    ps_text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-
-                    for paragraph in ps_text_frame.paragraphs:
-                        paragraph.alignment = PP_ALIGN.CENTER
-                        for run in paragraph.runs:
-                            run.font.size = Pt(ps_font_size)
-                            run.font.bold = True
-                            run.font.name = FONT_FAMILY_LEGEND
-                            run.font.color.rgb = RGBColor(ps_text_color[0], ps_text_color[1], ps_text_color[2])
-
-                    logger.info(f"Added product summary delimiter slide for: {ps_section_num} {display_brand_name}")
-
-                    # Generate product summary content slides
-                    market = combination_row[0]
-                    year = combination_row[2]
-
-                    reach_agg = product_summary_config.get("reach_aggregation", "average")
-                    grp_agg = product_summary_config.get("grp_aggregation", "sum")
-
-                    ps_table_result = _prepare_product_summary_table_data(
-                        df, market, display_brand_name, year, excel_path,
-                        reach_aggregation=reach_agg,
-                        grp_aggregation=grp_agg
-                    )
-
-                    if ps_table_result[0] is not None:
-                        ps_table_data, ps_cell_metadata = ps_table_result
-
-                        # Split if needed (reuses campaign split logic)
-                        ps_splits = _split_table_data_by_campaigns(ps_table_data, ps_cell_metadata)
-
-                        for ps_split_idx, (ps_split_data, ps_split_meta, ps_is_continuation) in enumerate(ps_splits):
-                            if len(ps_splits) > 1:
-                                ps_suffix = f" ({ps_split_idx + 1}/{len(ps_splits)})"
-                            else:
-                                ps_suffix = ""
-
-                            ps_is_last = (ps_split_idx == len(ps_splits) - 1)
-                            ps_slide = prs.slides.add_slide(prs.slide_layouts[0])
-
-                            # Use modified combination with "Product Summary" indicator
-                            ps_combination = (market, f"{display_brand_name} - Product Summary", year)
-
-                            ps_payload = _populate_slide_content(
-                                ps_slide, prs, ps_combination, ps_suffix,
-                                ps_split_data, ps_split_meta, ps_split_idx,
-                                df, excel_path, ps_is_last
-                            )
-
-                            # Add breadcrumb to product summary data slide
-                            _add_breadcrumb_to_slide(ps_slide, current_breadcrumb, prs.slide_width, prs.slide_height)
-
-                            if ps_payload:
-                                autopptx_payloads.append(ps_payload)
-
-                        logger.info(f"Generated {len(ps_splits)} product summary slide(s) for {display_brand_name}")
-                    else:
-                        logger.warning(f"No product summary data for {display_brand_name}")
-
-                    # ═══════════════════════════════════════════════════════════════
-                    # ADD TRANSITION SLIDE: "{BRAND} TOTAL (All Products/Campaigns)"
-                    # This provides visual separation between Product Summary and Brand Total
-                    # ═══════════════════════════════════════════════════════════════
-
-                    # Increment subsection counter for brand total
-                    subsection_idx += 1
-                    btd_section_num = f"{market_idx}.{brand_idx}.{subsection_idx}"
-
-                    # Update breadcrumb for brand total level
-                    current_breadcrumb = f"{breadcrumb_market}  ›  {breadcrumb_brand}  ›  {btd_section_num} TOTAL"
-
-                    try:
-                        blank_layout = prs.slide_layouts[6] if len(prs.slide_layouts) > 6 else prs.slide_layouts[0]
-                        brand_total_delimiter = prs.slides.add_slide(blank_layout)
-                    except:
-                        brand_total_delimiter = prs.slides.add_slide(prs.slide_layouts[0])
-
-                    # Background - same as brand delimiter (dark)
-                    btd_bg = brand_total_delimiter.shapes.add_shape(
-                        MSO_SHAPE.RECTANGLE,
-                        left=0,
-                        top=0,
-                        width=slide_width,
-                        height=slide_height
-                    )
-                    btd_bg.fill.solid()
-                    btd_bg.fill.fore_color.rgb = RGBColor(0, 0, 0)  # Black background
-                    btd_bg.line.fill.background()
-
-                    # Section number text box - gray, above title
-                    btd_section_box = brand_total_delimiter.shapes.add_textbox(
-                        left=Inches(1),
-                        top=int(slide_height * 0.25),
-                        width=slide_width - Inches(2),
-                        height=Inches(0.6)
-                    )
-                    btd_section_frame = btd_section_box.text_frame
-                    btd_section_frame.text = btd_section_num
-                    btd_section_frame.word_wrap = False
-
-                    for paragraph in btd_section_frame.paragraphs:
-                        paragraph.alignment = PP_ALIGN.CENTER
-                        for run in paragraph.runs:
-                            run.font.size = Pt(18)
-                            run.font.bold = False
-                            run.font.name = FONT_FAMILY_LEGEND
-                            run.font.color.rgb = RGBColor(128, 128, 128)  # Gray
-
-                    # Main title: "{BRAND} TOTAL"
-                    btd_title_box = brand_total_delimiter.shapes.add_textbox(
-                        left=Inches(1),
-                        top=int(slide_height * 0.38),
-                        width=slide_width - Inches(2),
-                        height=Inches(1)
-                    )
-                    btd_title_frame = btd_title_box.text_frame
-                    btd_title_frame.text = f"{display_brand_name.upper()} TOTAL"
-                    btd_title_frame.word_wrap = False
-                    btd_title_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-
-                    for paragraph in btd_title_frame.paragraphs:
-                        paragraph.alignment = PP_ALIGN.CENTER
-                        for run in paragraph.runs:
-                            run.font.size = Pt(44)
-                            run.font.bold = True
-                            run.font.name = FONT_FAMILY_LEGEND
-                            run.font.color.rgb = RGBColor(255, 255, 255)  # White
-
-                    # Subtitle: "(All Products/Campaigns)"
-                    btd_subtitle_box = brand_total_delimiter.shapes.add_textbox(
-                        left=Inches(1),
-                        top=int(slide_height * 0.55),
-                        width=slide_width - Inches(2),
-                        height=Inches(0.8)
-                    )
-                    btd_subtitle_frame = btd_subtitle_box.text_frame
-                    btd_subtitle_frame.text = "(All Products/Campaigns)"
-                    btd_subtitle_frame.word_wrap = False
-                    btd_subtitle_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-
-                    for paragraph in btd_subtitle_frame.paragraphs:
-                        paragraph.alignment = PP_ALIGN.CENTER
-                        for run in paragraph.runs:
-                            run.font.size = Pt(28)
-                            run.font.bold = False
-                            run.font.name = FONT_FAMILY_LEGEND
-                            run.font.color.rgb = RGBColor(48, 234, 3)  # Green accent
-
-                    logger.info(f"Added brand total transition slide for: {display_brand_name}")
-
-            logger.info(f"Processing combination {idx+1}/{len(ordered_combinations)}: {combination_row[0]} - {combination_row[1]} - {combination_row[2]}")
-            
-            # First, prepare the table data to check if splitting is needed
-            table_result = _prepare_main_table_data_detailed(df, combination_row[0], combination_row[1], combination_row[2], excel_path)
-            
-            if table_result[0] is None:
-                logger.warning(f"No table data generated for {combination_row[0]} - {combination_row[1]}")
-                continue
-            
-            table_data, cell_metadata = table_result
-            
-            # Split table if needed
-            table_splits = _split_table_data_by_campaigns(table_data, cell_metadata)
-            
-            # Create a slide for each split
-            for split_idx, (split_table_data, split_metadata, is_continuation) in enumerate(table_splits):
-                # Add slide number to title if there are multiple splits
-                if len(table_splits) > 1:
-                    slide_title_suffix = f" ({split_idx + 1}/{len(table_splits)})"
-                else:
-                    slide_title_suffix = ""
-
-                # CRITICAL: Determine if this is the LAST slide for this brand
-                # Brand-level indicators (quarters, media share, funnel stage) only appear on last slide
-                is_last_slide = (split_idx == len(table_splits) - 1)
-
-                new_slide = prs.slides.add_slide(prs.slide_layouts[0])
-                # logger.debug(f"Added new slide for {combination_row[0]} - {combination_row[1]} - {combination_row[2]}{slide_title_suffix}")
-
-                # Populate this slide with content immediately
-                payload = _populate_slide_content(
-                    new_slide, prs, combination_row, slide_title_suffix,
-                    split_table_data, split_metadata, split_idx, df, excel_path, is_last_slide
-                )
-
-                # Add breadcrumb to brand-level data slide
-                _add_breadcrumb_to_slide(new_slide, current_breadcrumb, prs.slide_width, prs.slide_height)
-
-                if payload:
-                    autopptx_payloads.append(payload)
-
-                # Diagnostic: Log all shapes on the new slide (commented out to reduce log size)
-            # This entire block is commented out to reduce log file size
-            # Re-enable for debugging shape-related issues
-            """
-            logger.debug(f"--- Shapes on new_slide (Layout: {prs.slide_layouts[0].name}, Index: {idx+1}) ---")
-            if hasattr(new_slide, 'shapes'):
-                logger.debug(f"  new_slide.shapes attribute exists. Number of shapes found: {len(new_slide.shapes)}")
-                if new_slide.shapes:
-                    for i, shape in enumerate(new_slide.shapes):
-                        shape_name = shape.name if hasattr(shape, 'name') else 'Unnamed Shape'
-                        shape_type = shape.shape_type if hasattr(shape, 'shape_type') else 'Unknown Type'
-                        is_placeholder = shape.is_placeholder if hasattr(shape, 'is_placeholder') else False
-                        placeholder_type = None
-                        placeholder_idx = None
-                        if is_placeholder and hasattr(shape, 'placeholder_format'):
-                            ph_format = shape.placeholder_format
-                            if hasattr(ph_format, 'type'):
-                                placeholder_type = ph_format.type
-                            if hasattr(ph_format, 'idx'):
-                                placeholder_idx = ph_format.idx
-                        logger.debug(f"  Shape {i}: Name='{shape_name}', Type={shape_type}, IsPlaceholder={is_placeholder}, PlaceholderType={placeholder_type}, PlaceholderIdx={placeholder_idx}")
-                else:
-                    logger.debug("  new_slide.shapes collection is empty (it exists but len is 0).")
-            else:
-                logger.debug("  new_slide.shapes attribute is missing.")
-            logger.debug(f"--- End Shapes on new_slide (Index: {idx+1}) ---")
-                """
-
-            # ═══════════════════════════════════════════════════════════════
-            # PRODUCT-LEVEL SLIDES: Generate sub-slides for Panadol Pain/C&F
-            # ═══════════════════════════════════════════════════════════════
-            current_brand_name = combination_row[1]
-            product_split_brands = PRODUCT_SPLIT_CONFIG.get("brands", [])
-            product_split_enabled = PRODUCT_SPLIT_CONFIG.get("enabled", False)
-
-            if product_split_enabled and current_brand_name in product_split_brands:
-                # Get unique products for this market/brand/year combination
-                market = combination_row[0]
-                year = combination_row[2]
-
-                product_filter = (
-                    (df["Country"].astype(str).str.strip() == str(market).strip()) &
-                    (df["Brand"].astype(str).str.strip() == str(current_brand_name).strip()) &
-                    (df["Year"].astype(str).str.strip() == str(year).strip())
+        # Content slides are post-processed in memory as they are finished, so the deck is saved once
+        postprocessor = PostProcessorCLI(prs)
+        rendered = None
+        render_workers = max_workers(MASTER_CONFIG, len(market_investments))
+        shards = _market_shards(ordered_combinations, render_workers)
+        if len(shards) > 1 and _shard_rendering_enabled() and incremental.previous is None:
+            rendered = _render_sharded(
+                prs,
+                template_path,
+                df,
+                shards,
+                excel_path,
+                market_investments,
+                incremental,
+                tv_metrics_index,
+                postprocessor,
+            )
+        if rendered is None:
+            # Tables of the combinations to render are prepared ahead of the slide being rendered
+            with _TablePipeline(
+                df,
+                [combination for combination in ordered_combinations if incremental.reusable(combination) is None],
+                excel_path,
+                tv_metrics_index,
+                # Reused combinations are skipped, so brand runs come from the full order
+                brand_openers=_brand_openers(ordered_combinations),
+            ) as table_pipeline:
+                rendered = _render_combinations(
+                    prs,
+                    df,
+                    ordered_combinations,
+                    excel_path,
+                    market_investments,
+                    incremental,
+                    table_pipeline,
+                    postprocessor=postprocessor,
                 )
-                product_subset = df.loc[product_filter]
-
-                if "Product" in product_subset.columns:
-                    # Get unique products, sorted by total investment
-                    product_investments = product_subset.groupby("Product")["Total Cost"].sum()
-                    unique_products = product_investments.sort_values(ascending=False).index.tolist()
-
-                    logger.info(f"Generating {len(unique_products)} product sub-slides for {market} - {current_brand_name}")
-
-                    delimiter_style = PRODUCT_SPLIT_CONFIG.get("delimiter_style", {})
-                    bg_color = delimiter_style.get("background_color", [85, 85, 85])
-                    text_color = delimiter_style.get("text_color", [255, 255, 255])
-                    font_size = delimiter_style.get("font_size_pt", 32)
-                    prefix = delimiter_style.get("prefix", "Product: ")
-
-                    # Brand title config
-                    brand_title_config = delimiter_style.get("brand_title", {})
-                    show_brand_title = brand_title_config.get("enabled", False)
-                    brand_title_font_size = brand_title_config.get("font_size_pt", 36)
-                    brand_title_color = brand_title_config.get("text_color", [255, 255, 255])
-
-                    # Product rename mapping (e.g., "Parodontax" -> "Parodontax Product")
-                    product_rename_map = PRODUCT_SPLIT_CONFIG.get("product_rename", {})
-
-                    for product_name in unique_products:
-                        if not product_name or pd.isna(product_name) or str(product_name).strip() == "":
-                            continue
-
-                        # Get display name (may be renamed to avoid brand/product collision)
-                        product_name_str = str(product_name).strip()
-                        display_product_name = product_rename_map.get(product_name_str, product_name_str)
-
-                        # Strip redundant brand prefix from product name for cleaner display
-                        # e.g., "Parodontax Mouthwash" -> "Mouthwash" when brand is "Parodontax"
-                        # But keep renamed products as-is (e.g., "Sensodyne Product" stays as-is)
-                        if product_name_str not in product_rename_map:
-                            brand_prefix = current_brand_name + " "
-                            if display_product_name.lower().startswith(brand_prefix.lower()):
-                                display_product_name = display_product_name[len(brand_prefix):].strip()
-
-                        # Add product delimiter slide
-
-                        # Increment subsection counter for each product
-                        subsection_idx += 1
-                        prod_section_num = f"{market_idx}.{brand_idx}.{subsection_idx}"
-
-                        # Update breadcrumb for product level
-                        current_breadcrumb = f"{breadcrumb_market}  ›  {breadcrumb_brand}  ›  {prod_section_num} {display_product_name.upper()}"
-
-                        try:
-                            blank_layout = prs.slide_layouts[6] if len(prs.slide_layouts) > 6 else prs.slide_layouts[0]
-                            product_delimiter_slide = prs.slides.add_slide(blank_layout)
-                        except:
-                            product_delimiter_slide = prs.slides.add_slide(prs.slide_layouts[0])
-
-                        slide_width = prs.slide_width
-                        slide_height = prs.slide_height
-
-                        from pptx.enum.shapes import MSO_SHAPE
-
-                        # Gray background
-                        product_bg = product_delimiter_slide.shapes.add_shape(
-                            MSO_SHAPE.RECTANGLE,
-                            left=0,
-                            top=0,
-                            width=slide_width,
-                            height=slide_height
-                        )
-                        product_bg.fill.solid()
-                        product_bg.fill.fore_color.rgb = RGBColor(bg_color[0], bg_color[1], bg_color[2])
-                        product_bg.line.fill.background()
-
-                        # Section number text box - gray, at top
-                        prod_section_box = product_delimiter_slide.shapes.add_textbox(
-                            left=Inches(1),
-                            top=int(slide_height * 0.08),
-                            width=slide_width - Inches(2),
-                            height=Inches(0.5)
-                        )
-                        prod_section_frame = prod_section_box.text_frame
-                        prod_section_frame.text = prod_section_num
-                        prod_section_frame.word_wrap = False
-
-                        for paragraph in prod_section_frame.paragraphs:
-                            paragraph.alignment = PP_ALIGN.CENTER
-                            for run in paragraph.runs:
-                                run.font.size = Pt(16)
-                                run.font.bold = False
-                                run.font.name = FONT_FAMILY_LEGEND
-                                run.font.color.rgb = RGBColor(160, 160, 160)  # Light gray on dark bg
-
-                        # Brand title at top
-                        if show_brand_title:
-                            brand_text_box = product_delimiter_slide.shapes.add_textbox(
-                                left=Inches(1),
-                                top=int(slide_height * 0.15),
-                                width=slide_width - Inches(2),
-                                height=Inches(1)
-                            )
-                            brand_tf = brand_text_box.text_frame
-                            brand_tf.text = str(current_brand_name).upper()
-                            brand_tf.word_wrap = False
-                            brand_tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-                            for para in brand_tf.paragraphs:
-                                para.alignment = PP_ALIGN.CENTER
-                                for run in para.runs:
-                                    run.font.size = Pt(brand_title_font_size)
-                                    run.font.bold = True
-                                    run.font.name = FONT_FAMILY_LEGEND
-                                    run.font.color.rgb = RGBColor(brand_title_color[0], brand_title_color[1], brand_title_color[2])
-
-                        # Product name text (use display name for slides)
-                        product_title = f"{prefix}{display_product_name}".upper()
-                        text_box = product_delimiter_slide.shapes.add_textbox(
-                            left=Inches(1),
-                            top=int(slide_height * 0.50),
-                            width=slide_width - Inches(2),
-                            height=Inches(1.5)
-                        )
-
-                        text_frame = text_box.text_frame
-                        text_frame.text = product_title
-                        text_frame.word_wrap = False
-                        text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-
-                        for paragraph in text_frame.paragraphs:
-                            paragraph.alignment = PP_ALIGN.CENTER
-                            for run in paragraph.runs:
-                                run.font.size = Pt(font_size)
-                                run.font.bold = True
-                                run.font.name = FONT_FAMILY_LEGEND
-                                run.font.color.rgb = RGBColor(text_color[0], text_color[1], text_color[2])
-
-                        logger.info(f"Added product delimiter slide for: {product_name}")
-
-                        # Generate content slide(s) for this product
-                        product_data_filter = (
-                            (df["Country"].astype(str).str.strip() == str(market).strip()) &
-                            (df["Brand"].astype(str).str.strip() == str(current_brand_name).strip()) &
-                            (df["Year"].astype(str).str.strip() == str(year).strip()) &
-                            (df["Product"].astype(str).str.strip() == str(product_name).strip())
-                        )
-                        product_df = df.loc[product_data_filter].copy()
-
-                        if product_df.empty:
-                            logger.warning(f"No data for product: {product_name}")
-                            continue
-
-                        # Prepare table data for this product
-                        product_table_result = _prepare_main_table_data_detailed(
-                            product_df, market, current_brand_name, year, excel_path
-                        )
-
-                        if product_table_result[0] is None:
-                            logger.warning(f"No table data for product: {product_name}")
-                            continue
-
-                        product_table_data, product_cell_metadata = product_table_result
-                        product_splits = _split_table_data_by_campaigns(product_table_data, product_cell_metadata)
-
-                        for prod_split_idx, (prod_split_data, prod_split_meta, _) in enumerate(product_splits):
-                            if len(product_splits) > 1:
-                                prod_suffix = f" ({prod_split_idx + 1}/{len(product_splits)})"
-                            else:
-                                prod_suffix = ""
-
-                            is_last_product_slide = (prod_split_idx == len(product_splits) - 1)
-
-                            product_slide = prs.slides.add_slide(prs.slide_layouts[0])
-
-                            # Create modified combination_row with product name in title (use display name)
-                            product_combination = (market, f"{current_brand_name} - {display_product_name}", year)
-
-                            product_payload = _populate_slide_content(
-                                product_slide, prs, product_combination, prod_suffix,
-                                prod_split_data, prod_split_meta, prod_split_idx,
-                                product_df, excel_path, is_last_product_slide
-                            )
-
-                            # Add breadcrumb to product-level data slide
-                            _add_breadcrumb_to_slide(product_slide, current_breadcrumb, prs.slide_width, prs.slide_height)
-
-                            if product_payload:
-                                autopptx_payloads.append(product_payload)
-
-                        logger.info(f"Generated {len(product_splits)} slide(s) for product: {product_name}")
+        toc_entries, autopptx_payloads = rendered
+        logger.info(
+            "Post-processing: %s operations, %s failed",
+            postprocessor.total_operations,
+            postprocessor.failed_operations,
+        )
+        if postprocessor.failed_operations:
+            logger.warning("Post-processing completed with warnings/errors")
 
         # ORIGINAL CONTENT POPULATION CODE MOVED TO _populate_slide_content() FUNCTION
         # (This section was deleted to prevent empty slides)
@@ -5121,6 +5213,16 @@ def create_presentation(template_path, excel_path, output_path, format_type: Inp
             file_size = os.path.getsize(output_path)
             logger.info(f"File verified: {file_size:,} bytes")
 
+            manifest = incremental.manifest(prs)
+            manifest.write(manifest_path_for(output_path))
+            if incremental.previous is not None:
+                logger.info(
+                    "Incremental build: carried %s of %s slides over from %s",
+                    len(manifest.carried_slides),
+                    manifest.slide_count,
+                    previous_deck,
+                )
+
             _run_autopptx_pipeline(
                 template_path,
                 output_path,
@@ -5170,8 +5272,8 @@ def _generate_autopptx_only(
             )
             continue
 
-        table_data, cell_metadata = table_result
-        table_splits = _split_table_data_by_campaigns(table_data, cell_metadata)
+        table_data, cell_metadata, campaign_boundaries = table_result
+        table_splits = _split_table_data_by_campaigns(table_data, cell_metadata, campaign_boundaries)
         for split_idx, (split_table_data, _, _is_continuation) in enumerate(table_splits):
             suffix = f" ({split_idx + 1}/{len(table_splits)})" if len(table_splits) > 1 else ""
             title_text = _compose_title_text(combination_row, suffix)
@@ -5211,6 +5313,9 @@ def _generate_autopptx_only(
         table_font_size=table_font_size,
     )
     logger.info("AutoPPTX presentation saved to %s", output_path_obj)
+    # AutoPPTX writes the deck itself, so this workflow still post-processes the saved file
+    if PostProcessorCLI(output_path_obj).process(PostProcessorCLI.POSTPROCESS_ALL_WORKFLOW) != 0:
+        logger.warning("Post-processing completed with warnings/errors")
     return True
 
 
@@ -5519,7 +5624,9 @@ def _unit_test__no_orphan_self():
 _unit_test__no_orphan_self()
 
 
-def build_presentation(template_path, excel_path, output_path, format_type: InputFormat = None):
+def build_presentation(template_path, excel_path, output_path, format_type: InputFormat = None, previous_deck=None):
     """Backward-compatible wrapper around ``create_presentation``."""
 
-    return create_presentation(template_path, excel_path, output_path, format_type=format_type)
+    return create_presentation(
+        template_path, excel_path, output_path, format_type=format_type, previous_deck=previous_deck
+    )
@@ -1,19 +1,37 @@
-"""Chart rendering helpers."""
+"""Chart rendering helpers.
+
+Pie charts are stamped from a prototype chart styled once per
+:class:`ChartStyleContext`: each chart copies the prototype's XML and rewrites
+its title, point colours and category/value caches. The embedded workbook that
+lets PowerPoint edit a chart's data is optional and only written when the deck
+is saved.
+"""
 
 from __future__ import annotations
 
 import logging
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import Mapping, Sequence
 
 import pandas as pd
+from lxml import etree
+from pptx.chart.chart import Chart
 from pptx.chart.data import CategoryChartData
 from pptx.dml.color import RGBColor
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 from pptx.enum.text import MSO_AUTO_SIZE
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
 from pptx.util import Pt
 
+from amp_automation.data.cube import CubeCell, aggregate_cube_for
 from amp_automation.presentation.tables import ensure_font_consistency
+from amp_automation.presentation.text import fits_one_run
 from amp_automation.utils.media import normalize_media_type
 
 logger = logging.getLogger("amp_automation.presentation.charts")
@@ -39,6 +57,36 @@ class ChartStyleContext:
     data_label_number_format: str = "0.0%"
 
 
+def _slice_cell(
+    df: pd.DataFrame,
+    region: str,
+    masterbrand: str,
+    year: str | int | None,
+    chart_label: str,
+) -> CubeCell | None:
+    """Look up the aggregated spend for a chart's market/brand(/year) slice."""
+
+    cell = aggregate_cube_for(df).cell(region, masterbrand, year)
+    if cell is None:
+        logger.warning("No data found for %s chart: %s - %s", chart_label, region, masterbrand)
+    return cell
+
+
+def _labelled_budgets(breakdown: Mapping[object, float]) -> dict[str, float]:
+    """Positive budgets keyed by stripped category label."""
+
+    budgets: dict[str, float] = {}
+    for category, total_budget in breakdown.items():
+        if pd.isna(category):
+            continue
+        label = str(category).strip()
+        if not label:
+            continue
+        if total_budget > 0:
+            budgets[label] = float(total_budget)
+    return budgets
+
+
 def prepare_funnel_chart_data(
     df: pd.DataFrame,
     region: str,
@@ -48,36 +96,16 @@ def prepare_funnel_chart_data(
     """Aggregate budgets by funnel stage for the specified filters."""
 
     try:
-        filters = [
-            df["Country"].astype(str).str.strip() == str(region).strip(),
-            df["Brand"].astype(str).str.strip() == str(masterbrand).strip(),
-        ]
-        if year is not None:
-            filters.append(df["Year"].astype(str).str.strip() == str(year).strip())
-
-        mask = filters[0]
-        for condition in filters[1:]:
-            mask &= condition
-
-        filtered = df.loc[mask].copy()
-        if filtered.empty:
-            logger.warning("No data found for funnel chart: %s - %s", region, masterbrand)
+        cell = _slice_cell(df, region, masterbrand, year, "funnel")
+        if cell is None:
             return None
 
-        budgets: dict[str, float] = {}
-        if "Funnel Stage" not in filtered.columns:
+        breakdown = cell.breakdown("funnel")
+        if breakdown is None:
             logger.warning("Missing 'Funnel Stage' column for funnel chart")
             return None
 
-        for stage in filtered["Funnel Stage"].dropna().unique():
-            stage_str = str(stage).strip()
-            if not stage_str:
-                continue
-            total_budget = filtered.loc[filtered["Funnel Stage"] == stage, "Total Cost"].sum()
-            if total_budget > 0:
-                budgets[stage_str] = float(total_budget)
-
-        return budgets or None
+        return _labelled_budgets(breakdown) or None
 
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.error(
@@ -98,34 +126,20 @@ def prepare_media_type_chart_data(
     """Aggregate budgets by normalized media type for the specified filters."""
 
     try:
-        filters = [
-            df["Country"].astype(str).str.strip() == str(region).strip(),
-            df["Brand"].astype(str).str.strip() == str(masterbrand).strip(),
-        ]
-        if year is not None:
-            filters.append(df["Year"].astype(str).str.strip() == str(year).strip())
-
-        mask = filters[0]
-        for condition in filters[1:]:
-            mask &= condition
-
-        filtered = df.loc[mask].copy()
-        if filtered.empty:
-            logger.warning("No data found for media type chart: %s - %s", region, masterbrand)
+        cell = _slice_cell(df, region, masterbrand, year, "media type")
+        if cell is None:
             return None
 
-        if "Media Type" not in filtered.columns or "Total Cost" not in filtered.columns:
+        breakdown = cell.breakdown("media_type")
+        if breakdown is None or "Total Cost" not in df.columns:
             logger.warning("Missing media type columns for chart data")
             return None
 
         budgets: dict[str, float] = {}
-        for raw_media_type in filtered["Media Type"].dropna().unique():
-            normalized = normalize_media_type(raw_media_type)
-            media_total = filtered.loc[
-                filtered["Media Type"] == raw_media_type, "Total Cost"
-            ].sum()
-            if media_total <= 0:
+        for raw_media_type, media_total in breakdown.items():
+            if pd.isna(raw_media_type) or media_total <= 0:
                 continue
+            normalized = normalize_media_type(raw_media_type)
             budgets[normalized] = budgets.get(normalized, 0.0) + float(media_total)
 
         return budgets or None
@@ -149,38 +163,16 @@ def prepare_campaign_type_chart_data(
     """Aggregate budgets by campaign type for the specified filters."""
 
     try:
-        filters = [
-            df["Country"].astype(str).str.strip() == str(region).strip(),
-            df["Brand"].astype(str).str.strip() == str(masterbrand).strip(),
-        ]
-        if year is not None:
-            filters.append(df["Year"].astype(str).str.strip() == str(year).strip())
-
-        mask = filters[0]
-        for condition in filters[1:]:
-            mask &= condition
-
-        filtered = df.loc[mask].copy()
-        if filtered.empty:
-            logger.warning("No data found for campaign type chart: %s - %s", region, masterbrand)
+        cell = _slice_cell(df, region, masterbrand, year, "campaign type")
+        if cell is None:
             return None
 
-        if "Campaign Type" not in filtered.columns or "Total Cost" not in filtered.columns:
+        breakdown = cell.breakdown("campaign_type")
+        if breakdown is None or "Total Cost" not in df.columns:
             logger.warning("Missing campaign type columns for chart data")
             return None
 
-        budgets: dict[str, float] = {}
-        for campaign_type in filtered["Campaign Type"].dropna().unique():
-            campaign_str = str(campaign_type).strip()
-            if not campaign_str:
-                continue
-            total_budget = filtered.loc[
-                filtered["Campaign Type"] == campaign_type, "Total Cost"
-            ].sum()
-            if total_budget > 0:
-                budgets[campaign_str] = float(total_budget)
-
-        return budgets or None
+        return _labelled_budgets(breakdown) or None
 
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.error(
@@ -192,6 +184,218 @@ def prepare_campaign_type_chart_data(
         return None
 
 
+def _style_pie_chart(
+    chart,
+    categories: Sequence[str],
+    chart_title: str,
+    style: ChartStyleContext,
+    color_mapping: Mapping[str, RGBColor],
+    default_colors: Sequence[RGBColor],
+) -> None:
+    """Apply title, legend, point colours and data labels to a single-series pie chart."""
+
+    chart.has_title = True
+    _set_chart_title(chart, chart_title, style)
+
+    chart.has_legend = True
+    chart.legend.position = style.legend_position
+    try:
+        ensure_font_consistency(
+            chart.legend.font,
+            style.font_name,
+            style.label_font_size,
+            False,
+            style.font_color,
+        )
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.debug("Unable to style legend font for %s: %s", chart_title, exc)
+
+    series = chart.series[0]
+
+    for index, category in enumerate(categories):
+        try:
+            point = series.points[index]
+        except IndexError:
+            continue
+
+        color = _point_color(index, category, color_mapping, default_colors)
+        if color is None:
+            continue
+
+        point.format.fill.solid()
+        point.format.fill.fore_color.rgb = color
+
+    series.has_data_labels = True
+    labels = series.data_labels
+    labels.show_percentage = True
+    labels.show_value = False
+
+    if style.data_label_number_format:
+        try:
+            labels.number_format = style.data_label_number_format
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.debug(
+                "Unable to apply number format '%s' for %s: %s",
+                style.data_label_number_format,
+                chart_title,
+                exc,
+            )
+
+    try:
+        ensure_font_consistency(
+            labels.font,
+            style.font_name,
+            style.label_font_size,
+            False,
+            style.font_color,
+        )
+        labels.font.bold = False
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.debug("Unable to style data labels for %s: %s", chart_title, exc)
+
+
+def _set_chart_title(chart, chart_title: str, style: ChartStyleContext) -> None:
+    chart.chart_title.text_frame.text = chart_title
+
+    title_run = chart.chart_title.text_frame.paragraphs[0].runs[0]
+    ensure_font_consistency(
+        title_run.font,
+        style.font_name,
+        style.title_font_size,
+        False,
+        style.font_color,
+    )
+    chart.chart_title.text_frame.auto_size = MSO_AUTO_SIZE.NONE
+
+
+def _point_color(
+    index: int,
+    category: str,
+    color_mapping: Mapping[str, RGBColor],
+    default_colors: Sequence[RGBColor],
+) -> RGBColor | None:
+    color = color_mapping.get(category)
+    if color is None and default_colors:
+        color = default_colors[index % len(default_colors)]
+    return color
+
+
+_PLACEHOLDER = "Placeholder"
+_PLACEHOLDER_COLOR = RGBColor(0, 0, 0)
+
+
+@dataclass(slots=True)
+class _PieChartPrototype:
+    """A styled pie ``c:chartSpace`` whose series has no points, and a styled point to copy per colour."""
+
+    chart_space: object
+    data_point: object
+    # Position of the first ``c:dPt`` among the series' children
+    data_point_index: int
+
+    @classmethod
+    def build(cls, style: ChartStyleContext) -> "_PieChartPrototype":
+        data = CategoryChartData()
+        data.categories = [_PLACEHOLDER]
+        data.add_series("Budget", [1.0])
+        chart_space = parse_xml(data.xml_bytes(XL_CHART_TYPE.PIE))
+        _style_pie_chart(
+            Chart(chart_space, None),
+            [_PLACEHOLDER],
+            _PLACEHOLDER,
+            style,
+            {_PLACEHOLDER: _PLACEHOLDER_COLOR},
+            (),
+        )
+
+        series = chart_space.xpath("c:chart/c:plotArea/c:pieChart/c:ser")[0]
+        data_point = series.find(qn("c:dPt"))
+        data_point_index = series.index(data_point)
+        series.remove(data_point)
+        for cache in series.xpath("c:cat/c:strRef/c:strCache | c:val/c:numRef/c:numCache"):
+            for point in cache.findall(qn("c:pt")):
+                cache.remove(point)
+        return cls(chart_space, data_point, data_point_index)
+
+    def stamp(
+        self,
+        chart_title: str,
+        categories: Sequence[str],
+        values: Sequence[float],
+        colors: Sequence[RGBColor | None],
+        style: ChartStyleContext,
+    ):
+        """Return a new ``c:chartSpace`` showing ``values`` by ``categories``."""
+
+        chart_space = deepcopy(self.chart_space)
+        if fits_one_run(chart_title):
+            chart_space.xpath("c:chart/c:title/c:tx/c:rich/a:p/a:r/a:t")[0].text = chart_title
+        else:
+            _set_chart_title(Chart(chart_space, None), chart_title, style)
+
+        series = chart_space.xpath("c:chart/c:plotArea/c:pieChart/c:ser")[0]
+        position = self.data_point_index
+        for index, color in enumerate(colors):
+            if color is None:
+                continue
+            data_point = deepcopy(self.data_point)
+            data_point.find(qn("c:idx")).set("val", str(index))
+            data_point.find(f".//{qn('a:srgbClr')}").set("val", str(color))
+            series.insert(position, data_point)
+            position += 1
+
+        _fill_cache(series.xpath("c:cat/c:strRef")[0], "A", categories)
+        _fill_cache(series.xpath("c:val/c:numRef")[0], "B", [str(value) for value in values])
+        return chart_space
+
+
+def _fill_cache(ref, column: str, texts: Sequence[str]) -> None:
+    ref.find(qn("c:f")).text = f"Sheet1!${column}$2:${column}${len(texts) + 1}"
+    cache = ref[1]
+    cache.find(qn("c:ptCount")).set("val", str(len(texts)))
+    for index, text in enumerate(texts):
+        point = etree.SubElement(cache, qn("c:pt"), idx=str(index))
+        etree.SubElement(point, qn("c:v")).text = text
+
+
+_PIE_PROTOTYPES: dict[tuple, _PieChartPrototype] = {}
+
+
+def _pie_prototype(style: ChartStyleContext) -> _PieChartPrototype:
+    key = (
+        style.font_name,
+        style.title_font_size,
+        style.label_font_size,
+        str(style.font_color),
+        style.legend_position,
+        style.data_label_number_format,
+    )
+    prototype = _PIE_PROTOTYPES.get(key)
+    if prototype is None:
+        prototype = _PIE_PROTOTYPES[key] = _PieChartPrototype.build(style)
+    return prototype
+
+
+class _LazyXlsxPart(EmbeddedXlsxPart):
+    """A chart's embedded workbook, written from its chart data when first read (on save)."""
+
+    def __init__(self, partname, package, chart_data: CategoryChartData):
+        super().__init__(partname, self.content_type, package)
+        self._chart_data = chart_data
+
+    @property
+    def blob(self) -> bytes:
+        if self._blob is None:
+            self._blob = self._chart_data.xlsx_blob
+            self._chart_data = None
+        return self._blob
+
+    @blob.setter
+    def blob(self, blob: bytes):
+        self._blob = blob
+        self._chart_data = None
+
+
 def add_pie_chart(
     slide,
     chart_data: Mapping[str, float],
@@ -202,8 +406,13 @@ def add_pie_chart(
     default_colors: Sequence[RGBColor],
     *,
     chart_name: str | None = None,
+    embed_workbook: bool = True,
 ) -> bool:
-    """Render a pie chart with consistent styling."""
+    """Render a pie chart with consistent styling.
+
+    Without ``embed_workbook`` the chart carries only its cached data, so it
+    renders as usual but its data cannot be edited in PowerPoint.
+    """
 
     try:
         if not chart_data:
@@ -218,98 +427,34 @@ def add_pie_chart(
         categories = list(chart_data.keys())
         values = [float(value) for value in chart_data.values()]
 
-        data = CategoryChartData()
-        data.categories = categories
-        data.add_series("Budget", values)
-
         try:
-            graphic_frame = slide.shapes.add_chart(
-                XL_CHART_TYPE.PIE,
-                position["left"],
-                position["top"],
-                position["width"],
-                position["height"],
-                data,
-            )
+            left, top, width, height = (position[key] for key in ("left", "top", "width", "height"))
         except KeyError as exc:
             logger.error("Missing chart position key %s for %s", exc, chart_title)
             return False
 
+        colors = [
+            _point_color(index, category, color_mapping, default_colors)
+            for index, category in enumerate(categories)
+        ]
+        chart_space = _pie_prototype(style).stamp(chart_title, categories, values, colors, style)
+
+        package = slide.part.package
+        chart_part = ChartPart(package.next_partname(ChartPart.partname_template), CT.DML_CHART, package, chart_space)
+        if embed_workbook:
+            data = CategoryChartData()
+            data.categories = categories
+            data.add_series("Budget", values)
+            xlsx_part = _LazyXlsxPart(package.next_partname(EmbeddedXlsxPart.partname_template), package, data)
+            chart_space.get_or_add_externalData().rId = chart_part.relate_to(xlsx_part, RT.PACKAGE)
+
+        graphic_frame = slide.shapes._add_chart_graphicFrame(
+            slide.part.relate_to(chart_part, RT.CHART), left, top, width, height
+        )
+        graphic_frame = slide.shapes._shape_factory(graphic_frame)
         if chart_name:
             graphic_frame.name = chart_name
 
-        chart = graphic_frame.chart
-        chart.has_title = True
-        chart.chart_title.text_frame.text = chart_title
-
-        title_run = chart.chart_title.text_frame.paragraphs[0].runs[0]
-        ensure_font_consistency(
-            title_run.font,
-            style.font_name,
-            style.title_font_size,
-            False,
-            style.font_color,
-        )
-        chart.chart_title.text_frame.auto_size = MSO_AUTO_SIZE.NONE
-
-        chart.has_legend = True
-        chart.legend.position = style.legend_position
-        try:
-            ensure_font_consistency(
-                chart.legend.font,
-                style.font_name,
-                style.label_font_size,
-                False,
-                style.font_color,
-            )
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.debug("Unable to style legend font for %s: %s", chart_title, exc)
-
-        series = chart.series[0]
-
-        for index, category in enumerate(categories):
-            try:
-                point = series.points[index]
-            except IndexError:
-                continue
-
-            color = color_mapping.get(category)
-            if color is None and default_colors:
-                color = default_colors[index % len(default_colors)]
-            if color is None:
-                continue
-
-            point.format.fill.solid()
-            point.format.fill.fore_color.rgb = color
-
-        series.has_data_labels = True
-        labels = series.data_labels
-        labels.show_percentage = True
-        labels.show_value = False
-
-        if style.data_label_number_format:
-            try:
-                labels.number_format = style.data_label_number_format
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.debug(
-                    "Unable to apply number format '%s' for %s: %s",
-                    style.data_label_number_format,
-                    chart_title,
-                    exc,
-                )
-
-        try:
-            ensure_font_consistency(
-                labels.font,
-                style.font_name,
-                style.label_font_size,
-                False,
-                style.font_color,
-            )
-            labels.font.bold = False
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.debug("Unable to style data labels for %s: %s", chart_title, exc)
-
         logger.info("Chart '%s' created successfully with %s data points", chart_title, len(categories))
         return True
 
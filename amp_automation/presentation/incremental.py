@@ -0,0 +1,296 @@
+"""Reuse of unchanged content slides from a previous run.
+
+Every clone-pipeline run writes ``<deck>.manifest.json`` next to the deck. The
+manifest holds a digest of the rendering settings (the config sections slide
+assembly reads plus the template bytes) and, for every (market, brand, year)
+combination, a digest of its normalized rows and TV metrics together with the
+positions of the content slides rendered for it, grouped by role (brand
+table, product summary, one role per product).
+
+An incremental run compares its digests with the previous manifest and copies
+the content slides of matching combinations from the previous deck instead of
+rendering them. Delimiter, TOC, info and closing slides are always rebuilt, so
+section numbering follows the new ordering; carried slides only get their
+breadcrumb and footer text refreshed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from amp_automation.config import Config
+from amp_automation.data import TvMetricsIndex
+from amp_automation.presentation.merge import append_slide
+
+__all__ = [
+    "MANIFEST_SUFFIX",
+    "CombinationRecord",
+    "DeckManifest",
+    "IncrementalBuild",
+    "find_previous_deck",
+    "manifest_path_for",
+    "settings_digest",
+]
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Config sections read while rendering slides
+RENDER_CONFIG_SECTIONS = ("presentation", "features", "processing", "data")
+
+# Content slide roles within a combination
+ROLE_BRAND = "brand"
+ROLE_PRODUCT_SUMMARY = "product-summary"
+PRODUCT_ROLE_PREFIX = "product:"
+
+# Carried slides are copied one at a time, which drops links to other slides, so
+# slides with such links are re-rendered; images, charts and notes are copied along
+_UNCARRIABLE_RELTYPES = frozenset({RT.SLIDE})
+
+_logger = logging.getLogger("amp_automation.presentation.incremental")
+
+
+def product_role(product_name: object) -> str:
+    return f"{PRODUCT_ROLE_PREFIX}{str(product_name).strip()}"
+
+
+def manifest_path_for(deck_path: str | Path) -> Path:
+    deck_path = Path(deck_path)
+    return deck_path.with_name(deck_path.stem + MANIFEST_SUFFIX)
+
+
+def combination_key(combination: Iterable[object]) -> str:
+    """Stable manifest key for a (market, brand, year) combination."""
+    return json.dumps([str(value).strip() for value in combination], ensure_ascii=False)
+
+
+def _digest(*chunks: bytes) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def settings_digest(config: Config, template_path: str | Path) -> str:
+    """Digest of everything besides the data that shapes a rendered slide."""
+    settings = {section: config.get(section) for section in RENDER_CONFIG_SECTIONS}
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    return _digest(encoded, Path(template_path).read_bytes())
+
+
+def combination_digests(
+    frame: pd.DataFrame,
+    tv_index: Optional[TvMetricsIndex],
+    settings: str,
+) -> dict[str, str]:
+    """Digest of each combination's rows (order-independent) and TV metrics."""
+    row_hashes = pd.util.hash_pandas_object(frame[sorted(frame.columns)], index=False).to_numpy()
+    groups = frame.groupby(["Country", "Brand", "Year"], sort=False, observed=True).indices
+
+    tv_entries: dict[str, list[tuple]] = {}
+    if tv_index is not None:
+        for key, metrics in tv_index.entries.items():
+            country, brand, campaign, year, month = key
+            tv_entries.setdefault(combination_key((country, brand, year)), []).append(
+                (campaign, month, sorted(metrics.items()))
+            )
+
+    digests = {}
+    for combination, positions in groups.items():
+        key = combination_key(combination)
+        tv_bytes = repr(sorted(tv_entries.get(key, []), key=repr)).encode("utf-8")
+        digests[key] = _digest(settings.encode("ascii"), np.sort(row_hashes[positions]).tobytes(), tv_bytes)
+    return digests
+
+
+@dataclass(slots=True)
+class CombinationRecord:
+    """Digest and content-slide positions (per role) of one combination."""
+
+    digest: str
+    slides: dict[str, list[int]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class DeckManifest:
+    """What a run rendered, for the next incremental run."""
+
+    settings_digest: str
+    slide_count: int
+    combinations: dict[str, CombinationRecord]
+    # Slide positions copied from the previous deck (already post-processed there)
+    carried_slides: list[int] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "version": MANIFEST_VERSION,
+            "settings_digest": self.settings_digest,
+            "slide_count": self.slide_count,
+            "carried_slides": self.carried_slides,
+            "combinations": {
+                key: {"digest": record.digest, "slides": record.slides}
+                for key, record in self.combinations.items()
+            },
+        }
+
+    def write(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> Optional["DeckManifest"]:
+        """Read a manifest; None when it is missing, unreadable or from another version."""
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != MANIFEST_VERSION:
+            return None
+        return cls(
+            settings_digest=payload["settings_digest"],
+            slide_count=int(payload["slide_count"]),
+            carried_slides=list(payload.get("carried_slides", [])),
+            combinations={
+                key: CombinationRecord(record["digest"], {role: list(slides) for role, slides in record["slides"].items()})
+                for key, record in payload["combinations"].items()
+            },
+        )
+
+
+def find_previous_deck(directory: str | Path, *, exclude: Optional[str | Path] = None) -> Optional[Path]:
+    """Most recently modified deck with a manifest under ``directory`` (searched recursively)."""
+    excluded = Path(exclude).resolve() if exclude else None
+    candidates = [
+        deck
+        for manifest in Path(directory).rglob(f"*{MANIFEST_SUFFIX}")
+        if (deck := manifest.with_name(manifest.name[: -len(MANIFEST_SUFFIX)] + ".pptx")).is_file()
+        and deck.resolve() != excluded
+    ]
+    return max(candidates, key=lambda deck: deck.stat().st_mtime, default=None)
+
+
+@dataclass(slots=True)
+class IncrementalBuild:
+    """Per-run bookkeeping: which slides belong to which combination, and what can be carried over."""
+
+    settings_digest: str
+    digests: dict[str, str]
+    previous: Optional[DeckManifest] = None
+    previous_deck: Optional[Presentation] = None
+    logger: logging.Logger = _logger
+    _slide_ids: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+    _carried_ids: list[int] = field(default_factory=list)
+
+    @classmethod
+    def start(
+        cls,
+        frame: pd.DataFrame,
+        tv_index: Optional[TvMetricsIndex],
+        config: Config,
+        template_path: str | Path,
+        previous_deck: Optional[str | Path] = None,
+        *,
+        logger: Optional[logging.Logger] = None,
+    ) -> "IncrementalBuild":
+        logger = logger or _logger
+        settings = settings_digest(config, template_path)
+        build = cls(settings, combination_digests(frame, tv_index, settings), logger=logger)
+        if previous_deck is not None:
+            build._open_previous(Path(previous_deck))
+        return build
+
+    def _open_previous(self, deck_path: Path) -> None:
+        manifest = DeckManifest.load(manifest_path_for(deck_path))
+        if not deck_path.is_file() or manifest is None:
+            self.logger.warning("No usable manifest for %s; rendering every slide", deck_path)
+            return
+        if manifest.settings_digest != self.settings_digest:
+            self.logger.info("Template or rendering settings changed since %s; rendering every slide", deck_path.name)
+            return
+        deck = Presentation(str(deck_path))
+        if len(deck.slides) != manifest.slide_count:
+            self.logger.warning("%s no longer matches its manifest; rendering every slide", deck_path.name)
+            return
+        self.previous = manifest
+        self.previous_deck = deck
+        self.logger.info("Incremental build against %s", deck_path)
+
+    def reusable(self, combination: Iterable[object]) -> Optional[CombinationRecord]:
+        """The previous run's record for ``combination`` when its content slides can be copied."""
+        if self.previous is None:
+            return None
+        key = combination_key(combination)
+        record = self.previous.combinations.get(key)
+        if record is None or record.digest != self.digests.get(key):
+            return None
+        slides = self.previous_deck.slides
+        for position in (position for positions in record.slides.values() for position in positions):
+            if any(rel.reltype in _UNCARRIABLE_RELTYPES for rel in slides[position].part.rels.values()):
+                return None
+        return record
+
+    def record(self, combination: Iterable[object], role: str, slide) -> None:
+        """Register a content slide rendered (or carried) for ``combination``."""
+        roles = self._slide_ids.setdefault(combination_key(combination), {})
+        roles.setdefault(role, []).append(slide.slide_id)
+
+    def carry(self, prs, combination: Iterable[object], role: str, record: CombinationRecord) -> list:
+        """Copy the previous run's ``role`` slides of ``combination`` into ``prs``."""
+        carried = []
+        for position in record.slides.get(role, []):
+            slide = append_slide(prs, self.previous_deck.slides[position])
+            self.record(combination, role, slide)
+            self._carried_ids.append(slide.slide_id)
+            carried.append(slide)
+        return carried
+
+    def recorded_positions(self, prs) -> list[tuple[str, str, int]]:
+        """(combination key, role, slide position in ``prs``) of every recorded slide."""
+        positions = {slide.slide_id: index for index, slide in enumerate(prs.slides)}
+        return [
+            (key, role, positions[slide_id])
+            for key, roles in self._slide_ids.items()
+            for role, slide_ids in roles.items()
+            for slide_id in slide_ids
+            if slide_id in positions
+        ]
+
+    def adopt(self, records: Iterable[tuple[str, str, int]], slides) -> None:
+        """Register slides merged in from another deck, given that deck's :meth:`recorded_positions`.
+
+        ``slides[position]`` is the merged copy of the slide at ``position``.
+        """
+        for key, role, position in records:
+            self._slide_ids.setdefault(key, {}).setdefault(role, []).append(slides[position].slide_id)
+
+    @property
+    def carried_count(self) -> int:
+        return len(self._carried_ids)
+
+    def manifest(self, prs) -> DeckManifest:
+        """Manifest for the finished deck ``prs``."""
+        positions = {slide.slide_id: index for index, slide in enumerate(prs.slides)}
+        combinations = {}
+        for key, digest in self.digests.items():
+            roles = {
+                role: [positions[slide_id] for slide_id in slide_ids if slide_id in positions]
+                for role, slide_ids in self._slide_ids.get(key, {}).items()
+            }
+            combinations[key] = CombinationRecord(digest, roles)
+        return DeckManifest(
+            settings_digest=self.settings_digest,
+            slide_count=len(prs.slides),
+            combinations=combinations,
+            carried_slides=sorted(positions[slide_id] for slide_id in self._carried_ids if slide_id in positions),
+        )
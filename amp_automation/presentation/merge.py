@@ -0,0 +1,179 @@
+"""Package-level merging of slides between presentations built from one template.
+
+:func:`append_slides` splices slides of a source deck onto the end of a target
+deck: the slide XML, every part the slides relate to (images, charts with
+their embedded workbooks, media) and their speaker notes. Slide layouts are
+matched by name, so both decks must come from the same template; images are
+de-duplicated by content and other parts shared by several source slides are
+copied once.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from copy import deepcopy
+from io import BytesIO
+from typing import Iterable
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part, PartFactory, XmlPart
+from pptx.oxml.ns import nsuri, qn
+
+__all__ = ["append_slide", "append_slides"]
+
+_REL_ATTR_PREFIX = "{%s}" % nsuri("r")
+_HYPERLINK_TAGS = frozenset({qn("a:hlinkClick"), qn("a:hlinkHover")})
+
+_logger = logging.getLogger("amp_automation.presentation.merge")
+
+
+def _partname_template(partname: str) -> str:
+    """'/ppt/charts/chart3.xml' -> '/ppt/charts/chart%d.xml'."""
+    return re.sub(r"\d*(\.\w+)$", r"%d\1", partname)
+
+
+def _remap_rids(element, mapping: dict[str, str]) -> None:
+    """Rewrite relationship ids in ``element`` (and below) according to ``mapping``."""
+    if all(old == new for old, new in mapping.items()):
+        return
+    for node in element.iter():
+        for name, value in node.attrib.items():
+            if name.startswith(_REL_ATTR_PREFIX) and value in mapping:
+                node.set(name, mapping[value])
+
+
+def _drop_rids(element, rids: set[str]) -> None:
+    """Remove references to relationships that could not be carried over.
+
+    Hyperlinks lose the whole click/hover action, other elements just the attribute.
+    """
+    for node in list(element.iter()):
+        names = [name for name, value in node.attrib.items() if name.startswith(_REL_ATTR_PREFIX) and value in rids]
+        if not names:
+            continue
+        if node.tag in _HYPERLINK_TAGS:
+            node.getparent().remove(node)
+            continue
+        for name in names:
+            del node.attrib[name]
+
+
+def _relate_copy(owner: Part, rel, copies: dict[str, Part]) -> str:
+    """Relate ``owner`` to a copy of ``rel``'s target (copied recursively, once per merge)."""
+    if rel.is_external:
+        return owner.relate_to(rel.target_ref, rel.reltype, is_external=True)
+    source = rel.target_part
+    if rel.reltype == RT.IMAGE and hasattr(owner, "get_or_add_image_part"):
+        return owner.get_or_add_image_part(BytesIO(source.blob))[1]
+
+    copy = copies.get(source.partname)
+    if copy is not None:
+        return owner.relate_to(copy, rel.reltype)
+
+    package = owner.package
+    copy = PartFactory(
+        package.next_partname(_partname_template(source.partname)),
+        source.content_type,
+        package,
+        source.blob,
+    )
+    copies[source.partname] = copy
+    # Relate before copying children so next_partname sees the new part
+    rId = owner.relate_to(copy, rel.reltype)
+    mapping = {child_rId: _relate_copy(copy, child, copies) for child_rId, child in source.rels.items()}
+    if isinstance(copy, XmlPart):
+        _remap_rids(copy._element, mapping)
+    return rId
+
+
+def _replace_shape_tree(source_cSld, target_cSld) -> None:
+    """Make ``target_cSld`` a copy of ``source_cSld``, keeping the target's spTree element.
+
+    ``slide.shapes`` is bound to that element when the slide is created.
+    """
+    shape_tree = target_cSld.spTree
+    for child in list(shape_tree):
+        shape_tree.remove(child)
+    for child in source_cSld.spTree:
+        shape_tree.append(deepcopy(child))
+    for child in list(target_cSld):
+        if child is not shape_tree:
+            target_cSld.remove(child)
+    for child in source_cSld:
+        if child is not source_cSld.spTree:
+            shape_tree.addprevious(deepcopy(child))
+    for name, value in source_cSld.attrib.items():
+        target_cSld.set(name, value)
+
+
+def _matching_layout(prs, source_layout):
+    name = source_layout.name
+    for master in prs.slide_masters:
+        for layout in master.slide_layouts:
+            if layout.name == name:
+                return layout
+    _logger.warning("Layout %r not found in the target deck; using the first layout", name)
+    return prs.slide_layouts[0]
+
+
+def _append_slide(prs, source_slide, copies: dict[str, Part], slide_links: list):
+    slide = prs.slides.add_slide(_matching_layout(prs, source_slide.slide_layout))
+    source, target = source_slide._element, slide._element
+
+    _replace_shape_tree(source.cSld, target.cSld)
+    # Colour map override, transitions and other slide-level settings
+    for child in list(target):
+        if child is not target.cSld:
+            target.remove(child)
+    for child in source:
+        if child is not source.cSld:
+            target.append(deepcopy(child))
+
+    layout_rId = next(rId for rId, rel in slide.part.rels.items() if rel.reltype == RT.SLIDE_LAYOUT)
+    mapping: dict[str, str] = {}
+    for rId, rel in source_slide.part.rels.items():
+        if rel.reltype == RT.SLIDE_LAYOUT:
+            mapping[rId] = layout_rId
+        elif rel.reltype == RT.NOTES_SLIDE:
+            continue
+        elif rel.reltype == RT.SLIDE and not rel.is_external:
+            # Links to other slides get a placeholder id until every slide is merged
+            mapping[rId] = f"merge-link-{rId}"
+            slide_links.append((slide, mapping[rId], rel.target_part))
+        else:
+            mapping[rId] = _relate_copy(slide.part, rel, copies)
+    _remap_rids(target, mapping)
+
+    if source_slide.has_notes_slide:
+        _replace_shape_tree(source_slide.notes_slide._element.cSld, slide.notes_slide._element.cSld)
+    return slide
+
+
+def append_slides(prs, slides: Iterable) -> list:
+    """Append copies of ``slides`` (all from one other deck) to ``prs``, in order.
+
+    Links between merged slides are kept; links to slides that were not
+    merged are dropped.
+    """
+    copies: dict[str, Part] = {}
+    slide_links: list = []
+    merged = []
+    by_source = {}
+    for source_slide in slides:
+        slide = _append_slide(prs, source_slide, copies, slide_links)
+        by_source[source_slide.part.partname] = slide
+        merged.append(slide)
+
+    for slide, placeholder, target_part in slide_links:
+        linked = by_source.get(target_part.partname)
+        if linked is None:
+            _drop_rids(slide._element, {placeholder})
+        else:
+            _remap_rids(slide._element, {placeholder: slide.part.relate_to(linked.part, RT.SLIDE)})
+    return merged
+
+
+def append_slide(prs, source_slide):
+    """Append a copy of ``source_slide`` (from another deck) to ``prs`` and return it."""
+    return append_slides(prs, [source_slide])[0]
@@ -19,6 +19,9 @@ Edge case repairs (rarely needed):
         --slide-filter 2,3,4 \\
         --verbose
 
+In-process use works on an already-loaded deck without touching the disk:
+    PostProcessorCLI(prs).process(PostProcessorCLI.POSTPROCESS_ALL_WORKFLOW)
+
 Performance: ~30 seconds for 88-slide deck (vs 10+ hours with COM)
 See: docs/ARCHITECTURE_DECISION_COM_PROHIBITION.md
 """
@@ -27,9 +30,10 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from pptx import Presentation
+from pptx.presentation import Presentation as PresentationObject
 
 from . import (
     normalize_table_layout,
@@ -86,10 +90,27 @@ class PostProcessorCLI:
         "normalize-fonts",
     ]
 
-    def __init__(self, presentation_path: Path, slide_filter: Optional[List[int]] = None):
-        self.presentation_path = presentation_path
+    def __init__(
+        self,
+        presentation: Union[Path, PresentationObject, None] = None,
+        slide_filter: Optional[List[int]] = None,
+    ):
+        """
+        Args:
+            presentation: Path of the deck to load and save again, or an
+                already-loaded Presentation processed in memory (the caller
+                saves it). None when slides are handed to process_slide() directly
+            slide_filter: 1-based slide numbers to process (default: all)
+        """
+        if isinstance(presentation, PresentationObject):
+            self.presentation_path = None
+            self.prs = presentation
+        else:
+            self.presentation_path = presentation
+            self.prs = None
         self.slide_filter = slide_filter
-        self.prs = None
+        self.total_operations = 0
+        self.failed_operations = 0
 
     def load_presentation(self):
         """Load the presentation file."""
@@ -163,6 +184,42 @@ class PostProcessorCLI:
             logger.error(f"Slide {slide_idx} - Operation '{operation}' failed: {e}")
             return False
 
+    def process_slide(self, slide, slide_idx: int, operations: List[str]) -> None:
+        """
+        Run operations on the main table of a single slide.
+
+        Used directly by deck generation to fix up each slide as soon as it is
+        built. Operation counts accumulate in total_operations/failed_operations.
+
+        Args:
+            slide: python-pptx slide object
+            slide_idx: Slide index (1-based), for logging
+            operations: List of operation names to run
+        """
+        logger.info(f"Processing slide {slide_idx}")
+
+        # Find the main table (largest table by cell count)
+        tables = [shape for shape in slide.shapes if shape.has_table]
+        if not tables:
+            logger.debug(f"Slide {slide_idx} - No tables found")
+            return
+
+        # Select largest table
+        main_table = max(tables, key=lambda s: s.table.rows.__len__() * s.table.columns.__len__())
+        table = main_table.table
+
+        row_count = len(table.rows)
+        col_count = len(table.columns)
+        logger.debug(f"Slide {slide_idx} - Processing table: {row_count} rows × {col_count} columns")
+
+        # Run each operation
+        for operation in operations:
+            self.total_operations += 1
+            logger.debug(f"Slide {slide_idx} - Running: {operation}")
+
+            if not self.run_operation(operation, slide_idx, table):
+                self.failed_operations += 1
+
     def process(self, operations: List[str]) -> int:
         """
         Process all slides with the specified operations.
@@ -170,48 +227,34 @@ class PostProcessorCLI:
         Args:
             operations: List of operation names to run
 
+        A deck given by path is loaded and saved again; an in-memory deck is
+        only modified.
+
         Returns:
             Exit code (0 = success, 1 = error)
         """
-        self.load_presentation()
+        in_memory = self.presentation_path is None
+        if not in_memory:
+            self.load_presentation()
+        elif self.prs is None:
+            raise ValueError("No presentation to process")
 
-        total_operations = 0
-        failed_operations = 0
+        self.total_operations = 0
+        self.failed_operations = 0
 
         for slide_idx, slide in enumerate(self.prs.slides, start=1):
             # Apply slide filter if specified
             if self.slide_filter and slide_idx not in self.slide_filter:
                 continue
 
-            logger.info(f"Processing slide {slide_idx}")
-
-            # Find the main table (largest table by cell count)
-            tables = [shape for shape in slide.shapes if shape.has_table]
-            if not tables:
-                logger.debug(f"Slide {slide_idx} - No tables found")
-                continue
-
-            # Select largest table
-            main_table = max(tables, key=lambda s: s.table.rows.__len__() * s.table.columns.__len__())
-            table = main_table.table
-
-            row_count = len(table.rows)
-            col_count = len(table.columns)
-            logger.debug(f"Slide {slide_idx} - Processing table: {row_count} rows × {col_count} columns")
-
-            # Run each operation
-            for operation in operations:
-                total_operations += 1
-                logger.debug(f"Slide {slide_idx} - Running: {operation}")
-
-                if not self.run_operation(operation, slide_idx, table):
-                    failed_operations += 1
+            self.process_slide(slide, slide_idx, operations)
 
-        self.save_presentation()
+        if not in_memory:
+            self.save_presentation()
 
-        logger.info(f"Completed: {total_operations} operations, {failed_operations} failed")
+        logger.info(f"Completed: {self.total_operations} operations, {self.failed_operations} failed")
 
-        return 1 if failed_operations > 0 else 0
+        return 1 if self.failed_operations > 0 else 0
 
 
 def main():
@@ -0,0 +1,98 @@
+"""Section delimiter slides stamped from per-style prototypes.
+
+A delimiter style is a builder that draws its shapes on a blank slide. The
+first slide of a style is drawn by its builder and its shape tree kept; later
+slides get a copy of that tree with their own texts swapped into the runs.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from pptx.oxml.ns import qn
+
+from amp_automation.presentation.text import fits_one_run
+
+__all__ = ["SectionSlideFactory"]
+
+_RUN = qn("a:r")
+_PARAGRAPH_CONTENT = frozenset({_RUN, qn("a:br"), qn("a:fld")})
+
+SectionBuilder = Callable[..., Sequence[Optional[object]]]
+"""``builder(prs, slide, *texts)`` draws a style and returns its text shapes in ``texts`` order (``None`` if not shown)."""
+
+
+def _blank_slide(prs):
+    try:
+        blank_layout = prs.slide_layouts[6] if len(prs.slide_layouts) > 6 else prs.slide_layouts[0]
+        return prs.slides.add_slide(blank_layout)
+    except Exception:
+        return prs.slides.add_slide(prs.slide_layouts[0])
+
+
+def _is_single_run(shape) -> bool:
+    paragraphs = shape._element.txBody.p_lst
+    if len(paragraphs) != 1:
+        return False
+    content = [child for child in paragraphs[0] if child.tag in _PARAGRAPH_CONTENT]
+    return len(content) == 1 and content[0].tag == _RUN
+
+
+@dataclass(slots=True)
+class _SectionPrototype:
+    children: list
+    # spTree position of the shape holding each text (None if the style does not show it)
+    text_shapes: list[Optional[int]]
+
+    @classmethod
+    def capture(cls, slide, shapes) -> Optional["_SectionPrototype"]:
+        tree = slide.shapes._spTree
+        children = list(tree)
+        text_shapes = []
+        for shape in shapes:
+            if shape is None:
+                text_shapes.append(None)
+                continue
+            if not _is_single_run(shape):
+                return None
+            text_shapes.append(children.index(shape._element))
+        return cls([deepcopy(child) for child in children], text_shapes)
+
+    def stamp(self, slide, texts: Sequence[str]) -> None:
+        tree = slide.shapes._spTree
+        for child in list(tree):
+            tree.remove(child)
+        tree.extend(deepcopy(child) for child in self.children)
+        for position, text in zip(self.text_shapes, texts):
+            if position is not None:
+                tree[position].txBody.p_lst[0].r_lst[0].text = text
+
+
+class SectionSlideFactory:
+    """Adds delimiter slides of the styles in ``builders`` to ``prs``.
+
+    Prototypes are kept per factory, so a factory should live for one
+    rendering pass over a deck whose configuration does not change.
+    """
+
+    def __init__(self, prs, builders: dict[str, SectionBuilder]):
+        self._prs = prs
+        self._builders = builders
+        self._prototypes: dict[str, _SectionPrototype] = {}
+
+    def add(self, style: str, *texts: str):
+        """Append a ``style`` delimiter slide showing ``texts`` and return it."""
+        slide = _blank_slide(self._prs)
+        prototype = self._prototypes.get(style)
+        if prototype is not None and all(fits_one_run(text) for text in texts):
+            prototype.stamp(slide, texts)
+            return slide
+
+        shapes = self._builders[style](self._prs, slide, *texts)
+        if prototype is None:
+            prototype = _SectionPrototype.capture(slide, shapes)
+            if prototype is not None:
+                self._prototypes[style] = prototype
+        return slide
@@ -4,15 +4,19 @@ from __future__ import annotations
 
 import logging
 import traceback
+from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Optional
 
+from lxml import etree
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_COLOR_TYPE, MSO_THEME_COLOR_INDEX
 from pptx.enum.text import MSO_AUTO_SIZE, MSO_VERTICAL_ANCHOR, PP_ALIGN
 from pptx.slide import Slide
+from pptx.table import _Cell
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.ns import qn
+from pptx.oxml.text import CT_RegularTextRun
 from pptx.oxml.xmlchemy import OxmlElement
 from pptx.util import Pt
 
@@ -41,10 +45,13 @@ logger = logging.getLogger("amp_automation.presentation.tables")
 
 __all__ = [
     "ensure_font_consistency",
+    "apply_cell_borders",
     "apply_table_borders",
     "CellStyleContext",
+    "CellStyleCompiler",
     "TableLayout",
     "style_table_cell",
+    "write_cell_text",
     "add_and_style_table",
 ]
 
@@ -65,45 +72,51 @@ def ensure_font_consistency(font, target_font_name: Optional[str], target_size,
         logger.debug("Error setting font properties: %s", exc)
 
 
+def _border_hex(border_color: RGBColor) -> str:
+    hex_color = str(border_color)
+    if hex_color.startswith("0x"):
+        hex_color = hex_color[2:]
+    return hex_color.upper().zfill(6)
+
+
+def apply_cell_borders(tc, border_color: RGBColor, border_width_pt: float = 0.75) -> None:
+    """Give the ``a:tc`` element solid borders on all four edges."""
+
+    border_width_emu = int(border_width_pt * 12700)
+    hex_color = _border_hex(border_color)
+    tcPr = tc.get_or_add_tcPr()
+
+    for edge in ("lnT", "lnL", "lnB", "lnR"):
+        border = tcPr.find(qn(f"a:{edge}"))
+        if border is None:
+            border = OxmlElement(f"a:{edge}")
+            tcPr.append(border)
+        # Clear any existing children/attributes so we start from a clean state
+        border.attrib.clear()
+        for child in list(border):
+            border.remove(child)
+
+        border.set("w", str(border_width_emu))
+
+        solid_fill = OxmlElement("a:solidFill")
+        srgb = OxmlElement("a:srgbClr")
+        srgb.set("val", hex_color)
+        solid_fill.append(srgb)
+        border.append(solid_fill)
+
+        dash = OxmlElement("a:prstDash")
+        dash.set("val", "solid")
+        border.append(dash)
+
+
 def apply_table_borders(table, border_color: RGBColor, border_width_pt: float = 0.75) -> bool:
     """Apply consistent borders to the provided PowerPoint table."""
 
     try:
-        border_width = Pt(border_width_pt)
-        border_width_emu = int(border_width_pt * 12700)
-        hex_color = str(border_color)
-        if hex_color.startswith("0x"):
-            hex_color = hex_color[2:]
-        hex_color = hex_color.upper().zfill(6)
-
         for row_idx, row in enumerate(table.rows):
             for col_idx, cell in enumerate(row.cells):
                 try:
-                    tc = cell._tc
-                    tcPr = tc.get_or_add_tcPr()
-
-                    for edge in ("lnT", "lnL", "lnB", "lnR"):
-                        border = tcPr.find(qn(f"a:{edge}"))
-                        if border is None:
-                            border = OxmlElement(f"a:{edge}")
-                            tcPr.append(border)
-                        # Clear any existing children/attributes so we start from a clean state
-                        border.attrib.clear()
-                        for child in list(border):
-                            border.remove(child)
-
-                        border.set("w", str(border_width_emu))
-
-                        solid_fill = OxmlElement("a:solidFill")
-                        srgb = OxmlElement("a:srgbClr")
-                        srgb.set("val", hex_color)
-                        solid_fill.append(srgb)
-                        border.append(solid_fill)
-
-                        dash = OxmlElement("a:prstDash")
-                        dash.set("val", "solid")
-                        border.append(dash)
-
+                    apply_cell_borders(cell._tc, border_color, border_width_pt)
                 except Exception as cell_error:  # pragma: no cover - defensive log
                     logger.debug("Border styling failed for cell (%s,%s): %s", row_idx, col_idx, cell_error)
 
@@ -155,6 +168,14 @@ class CellStyleContext:
     shrink_to_fit_columns: set[int] = field(default_factory=set)
     uppercase_columns: set[int] = field(default_factory=set)
     dual_line_labels: dict[str, list[str]] = field(default_factory=dict)
+    _compiler: CellStyleCompiler | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def compiler(self) -> CellStyleCompiler:
+        """Compiled cell styles for this context (built as cells are styled)."""
+        if self._compiler is None:
+            self._compiler = CellStyleCompiler(self)
+        return self._compiler
 
 
 @dataclass(slots=True)
@@ -173,7 +194,203 @@ class TableLayout:
     height_rule_value: object | None = None
 
 
-def style_table_cell(
+_SUBTOTAL_LABELS = frozenset({"SUBTOTAL", "CARRIED FORWARD", "MONTHLY TOTAL (£ 000)", "GRAND TOTAL"})
+
+_HIGHLIGHT_ALIASES = {
+    "GRPS": "TELEVISION",
+    "REACH": "TELEVISION",
+    "REACH@1+": "TELEVISION",
+    "REACH1+": "TELEVISION",
+    "OTS": "TELEVISION",
+    "OTS@3+": "TELEVISION",
+}
+
+_METRIC_MEDIA = {
+    "REACH@1+": "TELEVISION",
+    "OTS@3+": "TELEVISION",
+    "META REACH": "DIGITAL",
+    "TT REACH": "DIGITAL",
+}
+
+
+def _row_flags(row_idx: int, table_data: list[list[str]]) -> tuple[bool, bool, bool]:
+    """(monthly total row, bold total row, gray total fill) for the row at ``row_idx``."""
+
+    row = table_data[row_idx] if 0 <= row_idx < len(table_data) else None
+    normalized_row_label = ""
+    if row:
+        normalized_row_label = " ".join(str(row[0]).replace("\xa0", " ").split()).upper()
+    # Recognize both old "MONTHLY TOTAL (£ 000)" and new "TOTAL - TV 38%..." formats
+    is_monthly_total_row = (
+        normalized_row_label == "MONTHLY TOTAL (£ 000)" or
+        normalized_row_label.startswith("TOTAL -") or
+        normalized_row_label.startswith("TOTAL-")
+    )
+    is_total_row = row_idx == len(table_data) - 1 or (
+        row_idx > 0 and (normalized_row_label in _SUBTOTAL_LABELS or is_monthly_total_row)
+    )
+
+    row_label = str(row[0]).strip().upper() if row else ""
+    is_monthly_total = (
+        row_label in _SUBTOTAL_LABELS or
+        row_label.startswith("TOTAL -") or
+        row_label.startswith("TOTAL-")
+    )
+    return is_monthly_total_row, is_total_row, is_monthly_total
+
+
+def _resolve_media_type(
+    row_idx: int,
+    col_idx: int,
+    table_data: list[list[str]],
+    cell_metadata: dict[tuple[int, int], dict[str, object]],
+) -> str | None:
+    """Media type whose colour highlights a body cell."""
+
+    cell_key = (row_idx, col_idx)
+    if cell_key in cell_metadata:
+        return cell_metadata[cell_key].get("media_type")
+
+    # Check column 2 (METRICS) for special metric names with assigned colors
+    metrics_value = table_data[row_idx][2] if row_idx < len(table_data) and len(table_data[row_idx]) > 2 else None
+    if metrics_value:
+        metrics_normalized = str(metrics_value).strip().upper()
+        if metrics_normalized in _METRIC_MEDIA:
+            return _METRIC_MEDIA[metrics_normalized]
+
+    # Fall back to column 1 (media type)
+    media_value = table_data[row_idx][1] if row_idx < len(table_data) and len(table_data[row_idx]) > 1 else None
+    media_value = str(media_value).strip() if media_value else ""
+    if media_value and media_value != "-":
+        return media_value
+    if row_idx > 0:
+        prev_row = table_data[row_idx - 1]
+        if len(prev_row) > 1:
+            prev_media = str(prev_row[1]).strip()
+            if prev_media and prev_media != "-":
+                return prev_media
+    return None
+
+
+def _media_fill_color(media_type: str | None, context: CellStyleContext) -> RGBColor | None:
+    """Highlight colour for ``media_type``, or None when it has none."""
+
+    if not media_type:
+        return None
+
+    normalized = media_type.strip().upper()
+    normalized = _HIGHLIGHT_ALIASES.get(normalized, normalized)
+    if normalized in {"TELEVISION", "TV"}:
+        return context.color_tv
+    if normalized == "DIGITAL":
+        return context.color_digital
+    if normalized == "OOH":
+        return context.color_ooh
+    if normalized in {"RADIO", "CINEMA", "PRINT", "OTHER"}:
+        return context.color_other
+    if normalized == "SUBTOTAL":
+        return context.color_subtotal_gray
+    return None
+
+
+def _cell_display_text(
+    original_cell_text: str,
+    row_idx: int,
+    col_idx: int,
+    row_count: int,
+    context: CellStyleContext,
+    logger: logging.Logger,
+) -> str:
+    """Text shown in a cell: zero values as "-", upper-cased labels, dual-line labels, compact spacing."""
+
+    processed_cell_text = ""
+
+    if row_idx == 0:
+        if (
+            original_cell_text
+            and str(original_cell_text).strip()
+            and str(original_cell_text).strip()
+            not in ["0", "0.0", "0.00", "0.000", "£0K", "0K", "-", "–", "0.0%"]
+        ):
+            processed_cell_text = str(original_cell_text).upper()
+        else:
+            processed_cell_text = "-"
+
+    elif row_idx == row_count - 1:
+        if (
+            original_cell_text
+            and str(original_cell_text).strip()
+            and str(original_cell_text).strip()
+            not in ["0", "0.0", "0.00", "0.000", "£0K", "0K", "-", "–", "0.0%"]
+        ):
+            processed_cell_text = str(original_cell_text).upper()
+        else:
+            processed_cell_text = "-"
+
+    else:
+        if (
+            not original_cell_text
+            or str(original_cell_text).strip() == ""
+            or str(original_cell_text).strip() in ["0", "0.0", "0.00", "0.000", "£0K", "0K", "-", "–", "0.0%"]
+        ):
+            processed_cell_text = "-"
+        else:
+            if col_idx in (0, 1) and str(original_cell_text).strip():
+                processed_cell_text = str(original_cell_text).upper()
+            else:
+                processed_cell_text = str(original_cell_text)
+
+    if processed_cell_text and processed_cell_text.strip().endswith("%"):
+        pct_value = processed_cell_text.strip()[:-1]
+        try:
+            numeric_pct = float(pct_value)
+            if abs(numeric_pct - round(numeric_pct)) < 1e-6:
+                processed_cell_text = f"{int(round(numeric_pct))}%"
+        except ValueError:
+            pass
+
+    if processed_cell_text not in ("", "-", "-") and col_idx in context.uppercase_columns:
+        processed_cell_text = processed_cell_text.upper()
+
+    normalized_key = (
+        processed_cell_text.replace("\r", " ").replace("\n", " ").strip().upper()
+        if processed_cell_text
+        else ""
+    )
+    if normalized_key and normalized_key in context.dual_line_labels:
+        processed_cell_text = "\r".join(context.dual_line_labels[normalized_key])
+
+    processed_cell_text = (
+        processed_cell_text.replace("\r\n", "\r").replace("\n", "\r") if processed_cell_text else processed_cell_text
+    )
+
+    normalized_for_compact = (
+        "".join(ch for ch in processed_cell_text if ch.isalnum()) if processed_cell_text else ""
+    )
+    compact_length = len(normalized_for_compact)
+    compact_columns = {0, 1}
+    use_compact_font = (
+        row_idx > 0
+        and col_idx in compact_columns
+        and compact_length >= 10
+    )
+
+    if use_compact_font and processed_cell_text:
+        processed_cell_text = processed_cell_text.replace(" ", "\u00A0").replace("-", "\u2011")
+
+    # CRITICAL FIX: Ensure pound symbol is preserved in old MONTHLY TOTAL label format (Point 6)
+    # The pound symbol (£) can be lost during text processing, so we explicitly check and restore it
+    # Only apply to old format "MONTHLY TOTAL (£ 000)", not new format "TOTAL - TV 38%..."
+    if "MONTHLY TOTAL" in processed_cell_text and "(" in processed_cell_text and "000)" in processed_cell_text:
+        if "£" not in processed_cell_text and "TOTAL -" not in processed_cell_text:
+            # Pound symbol was lost; restore it: "MONTHLY TOTAL ( 000)" -> "MONTHLY TOTAL (£ 000)"
+            processed_cell_text = processed_cell_text.replace("( ", "(£ ", 1)
+            logger.debug("CELL STYLING [%s,%s]: Restored pound symbol in MONTHLY TOTAL label", row_idx, col_idx)
+
+    return processed_cell_text
+
+
+def _style_table_cell_uncached(
     cell,
     row_idx: int,
     col_idx: int,
@@ -181,8 +398,8 @@ def style_table_cell(
     cell_metadata: dict[tuple[int, int], dict[str, object]],
     context: CellStyleContext,
     logger: logging.Logger,
-) -> None:
-    """Apply styling to a specific table cell."""
+) -> bool:
+    """Style a cell property by property; returns False when styling failed part-way."""
 
     MARGIN_LEFT_RIGHT_PT = context.margin_left_right_pt
     MARGIN_EMU_LR = context.margin_emu_lr
@@ -202,21 +419,10 @@ def style_table_cell(
     CLR_OTHER = context.color_other
     wrap_from_config = col_idx in context.word_wrap_columns
     shrink_to_fit = col_idx in context.shrink_to_fit_columns
-    use_compact_font = False
     MONTH_HEADER_COLUMNS = set(range(3, 15))
     CLR_WHITE = RGBColor(255, 255, 255)
-    SUBTOTAL_LABELS = {"SUBTOTAL", "CARRIED FORWARD", "MONTHLY TOTAL (£ 000)", "GRAND TOTAL"}
 
-    normalized_row_label = ""
-    if 0 <= row_idx < len(table_data) and table_data[row_idx]:
-        normalized_row_label = " ".join(str(table_data[row_idx][0]).replace("\xa0", " ").split()).upper()
-    # Recognize both old "MONTHLY TOTAL (£ 000)" and new "TOTAL - TV 38%..." formats
-    is_monthly_total_row = (
-        normalized_row_label == "MONTHLY TOTAL (£ 000)" or
-        normalized_row_label.startswith("TOTAL -") or
-        normalized_row_label.startswith("TOTAL-")
-    )
-    is_total_row = row_idx == len(table_data) - 1 or (row_idx > 0 and (normalized_row_label in SUBTOTAL_LABELS or is_monthly_total_row))
+    is_monthly_total_row, is_total_row, is_monthly_total = _row_flags(row_idx, table_data)
 
     from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE, MSO_VERTICAL_ANCHOR
     alignment = PP_ALIGN.CENTER
@@ -262,11 +468,6 @@ def style_table_cell(
 
         text_frame = cell.text_frame
         text_frame.clear()
-        if use_compact_font and processed_cell_text:
-            processed_cell_text = (
-                processed_cell_text.replace(" ", "\u2060 ")
-                .replace("-", "\u2011")
-            )
 
         text_frame.word_wrap = wrap_from_config
         text_frame.auto_size = MSO_AUTO_SIZE.NONE
@@ -464,93 +665,9 @@ def style_table_cell(
             line_spacing_pt / 100,
         )
 
-        processed_cell_text = ""
-        is_empty_cell = False
-
-        if row_idx == 0:
-            if (
-                original_cell_text
-                and str(original_cell_text).strip()
-                and str(original_cell_text).strip()
-                not in ["0", "0.0", "0.00", "0.000", "£0K", "0K", "-", "–", "0.0%"]
-            ):
-                processed_cell_text = str(original_cell_text).upper()
-            else:
-                processed_cell_text = "-"
-                is_empty_cell = True
-
-        elif row_idx == len(table_data) - 1:
-            if (
-                original_cell_text
-                and str(original_cell_text).strip()
-                and str(original_cell_text).strip()
-                not in ["0", "0.0", "0.00", "0.000", "£0K", "0K", "-", "–", "0.0%"]
-            ):
-                processed_cell_text = str(original_cell_text).upper()
-            else:
-                processed_cell_text = "-"
-                is_empty_cell = True
-
-        else:
-            if (
-                not original_cell_text
-                or str(original_cell_text).strip() == ""
-                or str(original_cell_text).strip() in ["0", "0.0", "0.00", "0.000", "£0K", "0K", "-", "–", "0.0%"]
-            ):
-                processed_cell_text = "-"
-                is_empty_cell = True
-            else:
-                if col_idx in (0, 1) and str(original_cell_text).strip():
-                    processed_cell_text = str(original_cell_text).upper()
-                else:
-                    processed_cell_text = str(original_cell_text)
-
-        if processed_cell_text and processed_cell_text.strip().endswith("%"):
-            pct_value = processed_cell_text.strip()[:-1]
-            try:
-                numeric_pct = float(pct_value)
-                if abs(numeric_pct - round(numeric_pct)) < 1e-6:
-                    processed_cell_text = f"{int(round(numeric_pct))}%"
-            except ValueError:
-                pass
-
-        if processed_cell_text not in ("", "-", "-") and col_idx in context.uppercase_columns:
-            processed_cell_text = processed_cell_text.upper()
-
-        normalized_key = (
-            processed_cell_text.replace("\r", " ").replace("\n", " ").strip().upper()
-            if processed_cell_text
-            else ""
+        processed_cell_text = _cell_display_text(
+            original_cell_text, row_idx, col_idx, len(table_data), context, logger
         )
-        if normalized_key and normalized_key in context.dual_line_labels:
-            processed_cell_text = "\r".join(context.dual_line_labels[normalized_key])
-
-        processed_cell_text = (
-            processed_cell_text.replace("\r\n", "\r").replace("\n", "\r") if processed_cell_text else processed_cell_text
-        )
-
-        normalized_for_compact = (
-            "".join(ch for ch in processed_cell_text if ch.isalnum()) if processed_cell_text else ""
-        )
-        compact_length = len(normalized_for_compact)
-        compact_columns = {0, 1}
-        use_compact_font = (
-            row_idx > 0
-            and col_idx in compact_columns
-            and compact_length >= 10
-        )
-
-        if use_compact_font and processed_cell_text:
-            processed_cell_text = processed_cell_text.replace(" ", "\u00A0").replace("-", "\u2011")
-
-        # CRITICAL FIX: Ensure pound symbol is preserved in old MONTHLY TOTAL label format (Point 6)
-        # The pound symbol (£) can be lost during text processing, so we explicitly check and restore it
-        # Only apply to old format "MONTHLY TOTAL (£ 000)", not new format "TOTAL - TV 38%..."
-        if "MONTHLY TOTAL" in processed_cell_text and "(" in processed_cell_text and "000)" in processed_cell_text:
-            if "£" not in processed_cell_text and "TOTAL -" not in processed_cell_text:
-                # Pound symbol was lost; restore it: "MONTHLY TOTAL ( 000)" -> "MONTHLY TOTAL (£ 000)"
-                processed_cell_text = processed_cell_text.replace("( ", "(£ ", 1)
-                logger.debug("CELL STYLING [%s,%s]: Restored pound symbol in MONTHLY TOTAL label", row_idx, col_idx)
 
         text_frame.word_wrap = wrap_from_config
         text_frame.auto_size = MSO_AUTO_SIZE.NONE
@@ -642,15 +759,6 @@ def style_table_cell(
                 run_oxml_error,
             )
 
-        subtotal_labels = {"SUBTOTAL", "CARRIED FORWARD", "MONTHLY TOTAL (\u00a3 000)", "GRAND TOTAL"}
-        row_label = str(table_data[row_idx][0]).strip().upper() if row_idx < len(table_data) else ""
-        # Check if row is a monthly total (old or new format)
-        is_monthly_total = (
-            row_label in subtotal_labels or
-            row_label.startswith("TOTAL -") or
-            row_label.startswith("TOTAL-")
-        )
-
         def _apply_rgb_fill(target_cell, rgb_color):
             target_cell.fill.solid()
             target_cell.fill.fore_color.rgb = rgb_color
@@ -668,15 +776,6 @@ def style_table_cell(
         def _apply_base_background(target_cell):
             _apply_theme_fill(target_cell, MSO_THEME_COLOR_INDEX.BACKGROUND_1, brightness=0)
 
-        highlight_alias_map = {
-            "GRPS": "TELEVISION",
-            "REACH": "TELEVISION",
-            "REACH@1+": "TELEVISION",
-            "REACH1+": "TELEVISION",
-            "OTS": "TELEVISION",
-            "OTS@3+": "TELEVISION",
-        }
-
         if row_idx == 0:
             header_text2_cols = {0, 1, 2, 15, 16, 17}
             if col_idx in header_text2_cols:
@@ -691,60 +790,14 @@ def style_table_cell(
             cell_key = (row_idx, col_idx)
             total_col_idx = len(table_data[row_idx]) - 3 if row_idx < len(table_data) and len(table_data[row_idx]) >= 3 else None
 
-            def resolve_media_type() -> str | None:
-                if cell_key in cell_metadata:
-                    return cell_metadata[cell_key].get("media_type")
-
-                # Check column 2 (METRICS) for special metric names with assigned colors
-                metrics_value = table_data[row_idx][2] if row_idx < len(table_data) and len(table_data[row_idx]) > 2 else None
-                if metrics_value:
-                    metrics_normalized = str(metrics_value).strip().upper()
-                    metric_to_media = {
-                        "REACH@1+": "TELEVISION",
-                        "OTS@3+": "TELEVISION",
-                        "META REACH": "DIGITAL",
-                        "TT REACH": "DIGITAL",
-                    }
-                    if metrics_normalized in metric_to_media:
-                        return metric_to_media[metrics_normalized]
-
-                # Fall back to column 1 (media type)
-                media_value = table_data[row_idx][1] if row_idx < len(table_data) and len(table_data[row_idx]) > 1 else None
-                media_value = str(media_value).strip() if media_value else ""
-                if media_value and media_value != "-":
-                    return media_value
-                if row_idx > 0:
-                    prev_row = table_data[row_idx - 1]
-                    if len(prev_row) > 1:
-                        prev_media = str(prev_row[1]).strip()
-                        if prev_media and prev_media != "-":
-                            return prev_media
-                return None
-
-            media_type = resolve_media_type()
+            media_type = _resolve_media_type(row_idx, col_idx, table_data, cell_metadata)
 
             def apply_media_highlight() -> bool:
-                if not media_type:
+                highlight = _media_fill_color(media_type, context)
+                if highlight is None:
                     return False
-
-                normalized = media_type.strip().upper()
-                normalized = highlight_alias_map.get(normalized, normalized)
-                if normalized in {"TELEVISION", "TV"}:
-                    _apply_rgb_fill(cell, CLR_TELEVISION)
-                    return True
-                if normalized == "DIGITAL":
-                    _apply_rgb_fill(cell, CLR_DIGITAL)
-                    return True
-                if normalized == "OOH":
-                    _apply_rgb_fill(cell, CLR_OOH)
-                    return True
-                if normalized in {"RADIO", "CINEMA", "PRINT", "OTHER"}:
-                    _apply_rgb_fill(cell, CLR_OTHER)
-                    return True
-                if normalized == "SUBTOTAL":
-                    _apply_rgb_fill(cell, CLR_SUBTOTAL_GRAY)
-                    return True
-                return False
+                _apply_rgb_fill(cell, highlight)
+                return True
 
             base_applied = False
             if col_idx in (0, 1):
@@ -812,7 +865,7 @@ def style_table_cell(
 
             for run_idx, cell_run in enumerate(paragraph.runs):
                 expected_font_name = DEFAULT_FONT_NAME
-                expected_font_size = body_font_size if use_compact_font else FONT_SIZE_BODY
+                expected_font_size = FONT_SIZE_BODY
                 expected_bold = False
                 expected_color_rgb = CLR_BLACK
 
@@ -912,10 +965,196 @@ def style_table_cell(
             col_idx,
             processed_cell_text,
         )
+        return True
 
     except Exception as exc:
         logger.error("Error styling cell (%s,%s): %s", row_idx, col_idx, exc)
         logger.error(traceback.format_exc())
+        return False
+
+
+_TXBODY = qn("a:txBody")
+_PARAGRAPH = qn("a:p")
+_RUN = qn("a:r")
+_PARAGRAPH_CONTENT = frozenset({qn("a:r"), qn("a:br"), qn("a:fld")})
+
+
+def _unstyled_signature(tc) -> tuple:
+    """The parts of a cell that styling keeps: everything except paragraph content."""
+
+    parts: list[object] = [tuple(tc.attrib.items())]
+    for child in tc:
+        if child.tag != _TXBODY:
+            parts.append(etree.tostring(child))
+            continue
+        # Styling clears the text frame down to the first paragraph's properties
+        first_paragraph = True
+        for element in child:
+            if element.tag != _PARAGRAPH:
+                parts.append(etree.tostring(element))
+            elif first_paragraph:
+                parts.append(tuple(etree.tostring(e) for e in element if e.tag not in _PARAGRAPH_CONTENT))
+                first_paragraph = False
+    return tuple(parts)
+
+
+class CellStyleCompiler:
+    """Styles table cells by cloning cell XML built once per style key.
+
+    The style key holds everything the styling rules read: row kind, column,
+    fill and whether the cell shows "-". It also holds the properties the
+    unstyled cell already had, because cloned template rows carry their own.
+    The first cell with a key is styled property by property and its ``a:tc``
+    is kept as the prototype; later cells get a copy with their own text.
+    """
+
+    def __init__(self, context: CellStyleContext):
+        self.context = context
+        self._prototypes: dict[tuple, object] = {}
+
+    def _fill_key(
+        self,
+        row_idx: int,
+        col_idx: int,
+        table_data: list[list[str]],
+        cell_metadata: dict[tuple[int, int], dict[str, object]],
+        is_monthly_total: bool,
+    ) -> tuple:
+        if row_idx == 0:
+            return ("header",)
+        if row_idx == len(table_data) - 1 or is_monthly_total:
+            return ("total",)
+        row = table_data[row_idx]
+        total_col_idx = len(row) - 3 if len(row) >= 3 else None
+        base_applied = col_idx in (0, 1) or (total_col_idx is not None and col_idx >= total_col_idx)
+        if col_idx == 2 or (3 <= col_idx <= 14 and cell_metadata.get((row_idx, col_idx), {}).get("has_data")):
+            media_type = _resolve_media_type(row_idx, col_idx, table_data, cell_metadata)
+            return ("media", base_applied, _media_fill_color(media_type, self.context))
+        return ("plain", base_applied)
+
+    def style_key(
+        self,
+        cell,
+        row_idx: int,
+        col_idx: int,
+        table_data: list[list[str]],
+        cell_metadata: dict[tuple[int, int], dict[str, object]],
+        run_text: str,
+    ) -> tuple:
+        """Key of the prototype for ``cell`` showing ``run_text``."""
+
+        return self._tc_key(cell._tc, row_idx, col_idx, table_data, cell_metadata, run_text)
+
+    def _tc_key(self, tc, row_idx, col_idx, table_data, cell_metadata, run_text: str) -> tuple:
+        is_monthly_total_row, is_total_row, is_monthly_total = _row_flags(row_idx, table_data)
+        return (
+            _unstyled_signature(tc),
+            col_idx,
+            row_idx == 0,
+            is_total_row,
+            is_monthly_total_row,
+            run_text == "-",
+            CT_RegularTextRun._escape_ctrl_chars(run_text).strip() in ("", "-"),
+            self._fill_key(row_idx, col_idx, table_data, cell_metadata, is_monthly_total),
+        )
+
+    def apply(
+        self,
+        cell,
+        row_idx: int,
+        col_idx: int,
+        table_data: list[list[str]],
+        cell_metadata: dict[tuple[int, int], dict[str, object]],
+        logger: logging.Logger,
+    ) -> None:
+        """Style ``cell`` from its prototype, compiling the prototype on first use."""
+
+        classified = self._classify(cell._tc, row_idx, col_idx, table_data, cell_metadata, logger)
+        if classified is None:
+            # Cells the rules cannot classify get the uncached path and its error reporting
+            _style_table_cell_uncached(cell, row_idx, col_idx, table_data, cell_metadata, self.context, logger)
+            return
+
+        key, run_text = classified
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            if _style_table_cell_uncached(cell, row_idx, col_idx, table_data, cell_metadata, self.context, logger):
+                self._prototypes[key] = deepcopy(cell._tc)
+            return
+
+        styled = self._from_prototype(prototype, run_text)
+        tc = cell._tc
+        for child in list(tc):
+            tc.remove(child)
+        tc.extend(list(styled))
+
+    def build(
+        self,
+        unstyled_tc,
+        row_idx: int,
+        col_idx: int,
+        table_data: list[list[str]],
+        cell_metadata: dict[tuple[int, int], dict[str, object]],
+        logger: logging.Logger,
+    ):
+        """Return a styled ``a:tc`` for the cell at ``row_idx``/``col_idx``.
+
+        ``unstyled_tc`` is the element the cell would be styled from; it is
+        left untouched, so one element can serve every cell of a template
+        position. Its text does not matter, the styled cell shows its
+        ``table_data`` value.
+        """
+
+        classified = self._classify(unstyled_tc, row_idx, col_idx, table_data, cell_metadata, logger)
+        prototype = None if classified is None else self._prototypes.get(classified[0])
+        if prototype is not None:
+            return self._from_prototype(prototype, classified[1])
+
+        tc = deepcopy(unstyled_tc)
+        styled = _style_table_cell_uncached(_Cell(tc, None), row_idx, col_idx, table_data, cell_metadata, self.context, logger)
+        if styled and classified is not None:
+            self._prototypes[classified[0]] = deepcopy(tc)
+        return tc
+
+    def _classify(self, tc, row_idx, col_idx, table_data, cell_metadata, logger) -> tuple[tuple, str] | None:
+        try:
+            row = table_data[row_idx]
+            original_cell_text = str(row[col_idx]) if col_idx < len(row) else ""
+            run_text = _cell_display_text(original_cell_text, row_idx, col_idx, len(table_data), self.context, logger)
+            if not run_text:
+                run_text = "-"
+            return self._tc_key(tc, row_idx, col_idx, table_data, cell_metadata, run_text), run_text
+        except Exception:
+            return None
+
+    @staticmethod
+    def _from_prototype(prototype, run_text: str):
+        styled = deepcopy(prototype)
+        styled.find(_TXBODY).find(_PARAGRAPH).find(_RUN).text = run_text
+        return styled
+
+
+def write_cell_text(tc, text: str) -> None:
+    """Replace the text of the ``a:tc`` element, as setting ``_Cell.text`` does."""
+
+    txBody = tc.get_or_add_txBody()
+    txBody.clear_content()
+    for paragraph_text in text.split("\n"):
+        txBody.add_p().append_text(paragraph_text)
+
+
+def style_table_cell(
+    cell,
+    row_idx: int,
+    col_idx: int,
+    table_data: list[list[str]],
+    cell_metadata: dict[tuple[int, int], dict[str, object]],
+    context: CellStyleContext,
+    logger: logging.Logger,
+) -> None:
+    """Apply styling to a specific table cell, using the context's compiled cell styles."""
+
+    context.compiler.apply(cell, row_idx, col_idx, table_data, cell_metadata, logger)
 
 
 def add_and_style_table(
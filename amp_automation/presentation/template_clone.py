@@ -1,59 +1,203 @@
-"""Helpers for cloning template shapes and tables for pixel-accurate slides."""
+"""Helpers for cloning template shapes and tables for pixel-accurate slides.
+
+The template slide's shapes are indexed once per template by
+:func:`shape_library_for`; cloning a shape is then a copy of its prepared XML
+plus wiring its relationships to the target slide. Generated slides are looked
+up through a :class:`SlideShapeIndex` instead of scanning ``slide.shapes``.
+"""
 
 from __future__ import annotations
 
+import weakref
+from copy import deepcopy
+from dataclasses import dataclass
 from pathlib import Path
 
 from pptx import Presentation
 from pptx.slide import Slide
 from pptx.oxml.ns import qn
-from copy import deepcopy
 
 
 _REL_ATTRS = {qn("r:embed"), qn("r:link"), qn("r:id")}
-
-
-def _clone_element(source_shape, target_slide: Slide):
-    xml = deepcopy(source_shape.element)
-    source_part = source_shape.part
-    target_part = target_slide.part
-
-    for node in xml.iter():
-        for attr in list(node.attrib):
-            if attr in _REL_ATTRS:
-                r_id = node.attrib.get(attr)
-                if not r_id:
-                    continue
-                rel = source_part.rels.get(r_id)
-                if rel is None:
-                    continue
-                if rel.is_external:
-                    new_rid = target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
-                else:
-                    new_rid = target_part.relate_to(rel.target_part, rel.reltype)
-                node.set(attr, new_rid)
-
-    target_slide.shapes._spTree.append(xml)
-    return target_slide.shapes[-1]
+_GROUP_TAG = qn("p:grpSp")
+_GRAPHIC_FRAME_TAG = qn("p:graphicFrame")
 
 
 class TemplateCloneError(RuntimeError):
     """Raised when required template shapes cannot be cloned."""
 
 
+@dataclass(slots=True)
+class _TemplateShape:
+    """A template shape's element, a detached copy to clone from and the relationships to rewire.
+
+    ``rel_refs`` holds ``(child index path, attribute, relationship)`` for
+    every relationship id in the copy.
+    """
+
+    element: object
+    prototype: object
+    rel_refs: tuple
+
+
+def _shape_name(element) -> str:
+    return getattr(element, "shape_name", "")
+
+
+def _prepare_shape(element, source_part) -> _TemplateShape:
+    prototype = deepcopy(element)
+    rel_refs = []
+    for node in prototype.iter():
+        for attr, r_id in node.attrib.items():
+            if attr not in _REL_ATTRS or not r_id:
+                continue
+            rel = source_part.rels.get(r_id)
+            if rel is None:
+                continue
+            path = []
+            child = node
+            while child is not prototype:
+                parent = child.getparent()
+                path.append(parent.index(child))
+                child = parent
+            rel_refs.append((tuple(reversed(path)), attr, rel))
+    return _TemplateShape(element, prototype, tuple(rel_refs))
+
+
+class TemplateShapeLibrary:
+    """The top-level shapes of a template slide by name, ready to be cloned.
+
+    The first shape with a name wins, as it did when the template slide was
+    scanned for it. The template slide must not change once indexed.
+    """
+
+    def __init__(self, template_slide: Slide):
+        self._slide_ref = weakref.ref(template_slide)
+        self._shapes: dict[str, _TemplateShape] = {}
+        self._tables: dict[str, _TemplateShape] = {}
+        for element in template_slide.shapes._spTree.iter_shape_elms():
+            name = _shape_name(element)
+            prepared = None
+            if name not in self._shapes:
+                prepared = self._shapes[name] = _prepare_shape(element, template_slide.part)
+            if name not in self._tables and _is_table(element):
+                self._tables[name] = prepared or _prepare_shape(element, template_slide.part)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._shapes
+
+    def shape(self, name: str):
+        """Return the template shape called ``name``, or ``None``."""
+        entry = self._shapes.get(name)
+        if entry is None:
+            return None
+        return self._slide_ref().shapes._shape_factory(entry.element)
+
+    def clone(self, name: str, target_slide: Slide, *, table: bool = False):
+        """Append a copy of the template shape (or table) called ``name`` to ``target_slide``."""
+        entry = (self._tables if table else self._shapes).get(name)
+        if entry is None:
+            kind = "Table" if table else "Shape"
+            raise TemplateCloneError(f"{kind} '{name}' not found on template slide")
+
+        xml = deepcopy(entry.prototype)
+        target_part = target_slide.part
+        for path, attr, rel in entry.rel_refs:
+            node = xml
+            for index in path:
+                node = node[index]
+            if rel.is_external:
+                r_id = target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+            else:
+                r_id = target_part.relate_to(rel.target_part, rel.reltype)
+            node.set(attr, r_id)
+
+        target_slide.shapes._spTree.append(xml)
+        return target_slide.shapes._shape_factory(xml)
+
+
+def _is_table(element) -> bool:
+    return element.tag == _GRAPHIC_FRAME_TAG and bool(element.xpath("./a:graphic/a:graphicData/a:tbl"))
+
+
+_LIBRARIES: dict[int, TemplateShapeLibrary] = {}
+
+
+def shape_library_for(template_slide: Slide) -> TemplateShapeLibrary:
+    """Return the shape library of ``template_slide``, building it on first use.
+
+    Libraries are cached per slide part and dropped when the part is garbage
+    collected.
+    """
+    part = template_slide.part
+    key = id(part)
+    library = _LIBRARIES.get(key)
+    if library is None:
+        library = TemplateShapeLibrary(template_slide)
+        weakref.finalize(part, _LIBRARIES.pop, key, None)
+        _LIBRARIES[key] = library
+    return library
+
+
+class SlideShapeIndex:
+    """The shapes of a generated slide by name, with the library to clone missing ones from.
+
+    The slide's XML is read once; shapes cloned, added or removed through the
+    index keep it current. Shapes added to the slide by other means are not
+    seen until a new index is built.
+    """
+
+    def __init__(self, slide: Slide, library: TemplateShapeLibrary):
+        self.slide = slide
+        self.library = library
+        self._top: dict[str, list] = {}
+        self._nested: dict[str, list] = {}
+        for element in slide.shapes._spTree.iter_shape_elms():
+            self._index(element, self._top)
+
+    def _index(self, element, names: dict[str, list]) -> None:
+        names.setdefault(_shape_name(element), []).append(element)
+        if element.tag == _GROUP_TAG:
+            for child in element.iter_shape_elms():
+                self._index(child, self._nested)
+
+    def get(self, name: str, *, text_frame: bool = False):
+        """Return the first top-level shape called ``name`` (that has a text frame), or ``None``."""
+        for element in self._top.get(name, ()):
+            shape = self.slide.shapes._shape_factory(element)
+            if not text_frame or shape.has_text_frame:
+                return shape
+        return None
+
+    def add(self, shape) -> None:
+        """Index a top-level shape added to the slide (under its current name)."""
+        self._index(shape._element, self._top)
+
+    def clone(self, name: str):
+        """Clone the template shape called ``name`` onto the slide and return it."""
+        shape = self.library.clone(name, self.slide)
+        self.add(shape)
+        return shape
+
+    def remove(self, name: str) -> bool:
+        """Remove every shape called ``name``, including shapes inside groups."""
+        removed = False
+        for names in (self._top, self._nested):
+            for element in names.pop(name, ()):
+                parent = element.getparent()
+                if parent is not None:
+                    parent.remove(element)
+                    removed = True
+        return removed
+
+
 def load_template(template_path: Path) -> Presentation:
     return Presentation(template_path)
 
 
 def clone_template_table(template_slide: Slide, target_slide: Slide, table_name: str) -> Slide:
-    for shape in template_slide.shapes:
-        if getattr(shape, "name", "") == table_name and getattr(shape, "has_table", False):
-            return _clone_element(shape, target_slide)
-    raise TemplateCloneError(f"Table '{table_name}' not found on template slide")
+    return shape_library_for(template_slide).clone(table_name, target_slide, table=True)
 
 
 def clone_template_shape(template_slide: Slide, target_slide: Slide, shape_name: str):
-    for shape in template_slide.shapes:
-        if getattr(shape, "name", "") == shape_name:
-            return _clone_element(shape, target_slide)
-    raise TemplateCloneError(f"Shape '{shape_name}' not found on template slide")
+    return shape_library_for(template_slide).clone(shape_name, target_slide)
@@ -0,0 +1,10 @@
+"""Text helpers shared by the slide and chart stampers."""
+
+from __future__ import annotations
+
+__all__ = ["fits_one_run"]
+
+
+def fits_one_run(text: str) -> bool:
+    """Whether setting a text frame's text to ``text`` leaves a single run (it is non-empty and one line)."""
+    return bool(text) and "\n" not in text and "\v" not in text
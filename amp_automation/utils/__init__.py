@@ -2,5 +2,6 @@
 
 from .logging import configure_logger
 from .media import normalize_media_type
+from .parallel import max_workers, process_pool
 
-__all__ = ["configure_logger", "normalize_media_type"]
+__all__ = ["configure_logger", "max_workers", "normalize_media_type", "process_pool"]
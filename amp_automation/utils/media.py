@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-__all__ = ["normalize_media_type"]
+__all__ = ["DISPLAY_MEDIA_TYPES", "display_media_type", "normalize_media_type"]
+
+# Media buckets used for table rows; anything else is reported as "Other"
+DISPLAY_MEDIA_TYPES = ("Television", "Digital", "OOH", "Radio", "Cinema", "Print", "Other")
 
 
 def normalize_media_type(media_type: object) -> str:
@@ -17,3 +20,14 @@ def normalize_media_type(media_type: object) -> str:
     if media_type_str == "DIGITAL":
         return "Digital"
     return media_type_str
+
+
+def display_media_type(media_type: object) -> str:
+    """Map a (mapped) media type onto one of ``DISPLAY_MEDIA_TYPES``."""
+
+    if not media_type:
+        return "Other"
+    normalized = normalize_media_type(str(media_type))
+    if normalized not in DISPLAY_MEDIA_TYPES:
+        return "Other"
+    return normalized
@@ -0,0 +1,36 @@
+"""Shared helpers for the process pools used by ingestion and rendering."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from amp_automation.config import Config
+
+__all__ = ["max_workers", "process_pool"]
+
+
+def max_workers(config: Config, tasks: int) -> int:
+    """Worker processes for ``tasks`` units of work.
+
+    ``performance.optimization.max_workers`` caps the count (default: the CPU
+    count); there is never more than one worker per task, nor fewer than one.
+    """
+
+    optimization = (config.get("performance", {}) or {}).get("optimization", {}) or {}
+    configured = optimization.get("max_workers")
+    workers = int(configured) if configured else (os.cpu_count() or 1)
+    return max(1, min(workers, tasks))
+
+
+def process_pool(workers: int, **kwargs) -> ProcessPoolExecutor:
+    """A pool of ``workers`` spawned (never forked) worker processes.
+
+    Forking a process that runs other threads, such as the Streamlit app,
+    can leave a worker holding a lock no thread will release. Workers
+    therefore start fresh and get their state through ``initializer`` and
+    the submitted arguments.
+    """
+
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), **kwargs)
@@ -12,7 +12,7 @@ import pandas as pd
 from pptx import Presentation
 
 from amp_automation.config.loader import Config
-from amp_automation.data import load_and_prepare_data
+from amp_automation.data import load_and_prepare_data, resolve_sources
 
 LOGGER = logging.getLogger("amp_automation.validation.reconciliation")
 
@@ -91,7 +91,7 @@ class SlideReconciliation:
 
 def generate_reconciliation_report(
     ppt_path: str | Path,
-    excel_path: str | Path,
+    excel_path: str | Path | Sequence[str | Path],
     config: Config,
     *,
     logger: Optional[logging.Logger] = None,
@@ -101,12 +101,11 @@ def generate_reconciliation_report(
 
     logger = logger or LOGGER
     ppt_path = Path(ppt_path)
-    excel_path = Path(excel_path)
 
     if not ppt_path.is_file():
         raise FileNotFoundError(f"Presentation not found: {ppt_path}")
-    if not excel_path.is_file() and data_frame is None:
-        raise FileNotFoundError(f"Excel workbook not found: {excel_path}")
+    if data_frame is None:
+        excel_path = resolve_sources(excel_path)
 
     presentation_cfg = config.section("presentation")
     summary_cfg = presentation_cfg.get("summary_tiles", {})
@@ -359,7 +358,7 @@ def _compute_expected_summary(df: pd.DataFrame, market: str, brand: str, year: i
         }
 
     media_expectations = {}
-    media_group = subset.groupby("Mapped Media Type")["Total Cost"].sum()
+    media_group = subset.groupby("Mapped Media Type", observed=True)["Total Cost"].sum()
     for key, config in (summary_cfg.get("media_share", {}) or {}).items():
         if key.startswith("_") or not isinstance(config, dict):
             continue
@@ -377,7 +376,7 @@ def _compute_expected_summary(df: pd.DataFrame, market: str, brand: str, year: i
         }
 
     funnel_expectations = {}
-    funnel_group = subset.groupby("Funnel Stage")["Total Cost"].sum()
+    funnel_group = subset.groupby("Funnel Stage", observed=True)["Total Cost"].sum()
     for key, config in (summary_cfg.get("funnel_share", {}) or {}).items():
         if key.startswith("_") or not isinstance(config, dict):
             continue
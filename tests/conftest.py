@@ -152,6 +152,86 @@ def brand_case_variations() -> dict[str, list[str]]:
     }
 
 
+def build_flight_frame(rows_per_campaign: int = 3) -> "pd.DataFrame":
+    """Synthetic Lumina Flight sheet covering the adapter clean-up rules."""
+    import numpy as np
+    import pandas as pd
+
+    geographies = [
+        "Global | EMEA | MEA | Pakistan | Pakistan",
+        "Global | EMEA | MEA | East Africa | Kenya",
+        "Global | EMEA | MEA | GINE",
+        "Global | EMEA | MEA | KSA",
+        "Global | EMEA | MEA | Egypt",
+    ]
+    brands = ["Haleon | Panadol", "Haleon | Sensodyne", "Haleon | Voltaren"]
+    products = ["Pain | Panadol Extra", "Cold | Panadol Cold and Flu", "Oral Health | Sensodyne"]
+    media_types = ["Television", "Digital", "OOH", "Radio"]
+    months = ["Jan", "Feb", "Mar", "Sep", "Dec"]
+    comments = ["", "Pan Asian TV", "Local buy"]
+    rng = np.random.default_rng(7)
+
+    records = []
+    for geo_idx, geography in enumerate(geographies):
+        for brand_idx, brand in enumerate(brands):
+            for campaign_idx in range(2):
+                campaign = f"CAMPAIGN-{brand_idx}{campaign_idx}"
+                for row_idx in range(rows_per_campaign):
+                    media = media_types[(geo_idx + campaign_idx + row_idx) % len(media_types)]
+                    month = months[(brand_idx + row_idx) % len(months)]
+                    is_tv = media == "Television"
+                    records.append(
+                        {
+                            "Plan Name": "Expert plan" if (geo_idx, row_idx) == (4, 0) else f"Plan {geo_idx}",
+                            "Plan - Geography": geography,
+                            "Plan - Year": 2025,
+                            "Plan - Brand": brand,
+                            "Media Type": media,
+                            "**Product Business": products[(brand_idx + row_idx) % len(products)],
+                            "**Campaign Name(s)": campaign,
+                            "**Campaign Type": ["Brand", "Always On", None][row_idx % 3],
+                            "**Funnel Stage": ["Awareness", "Consideration", "Purchase"][campaign_idx % 3],
+                            "*Cost to Client": float(rng.integers(500, 50_000)),
+                            "National GRP": float(rng.integers(1, 400)) if is_tv else np.nan,
+                            "Frequency": float(rng.uniform(1, 6)) if is_tv and row_idx % 2 == 0 else np.nan,
+                            "Reach 1+": float(rng.uniform(0.1, 0.9)) if is_tv else np.nan,
+                            "Reach 3+": float(rng.uniform(0.05, 0.5)) if is_tv else np.nan,
+                            "Flight Comments": comments[(geo_idx + row_idx) % len(comments)],
+                            "Month": month,
+                            "Unused Column": "x",
+                        }
+                    )
+    return pd.DataFrame.from_records(records)
+
+
+@pytest.fixture
+def flight_frame() -> "pd.DataFrame":
+    """Synthetic raw Flight sheet (BulkPlan layout)."""
+    return build_flight_frame()
+
+
+@pytest.fixture
+def flight_workbook(tmp_path: Path, flight_frame) -> Path:
+    """Synthetic BulkPlan workbook written to a temporary xlsx file."""
+    import pandas as pd
+
+    path = tmp_path / "BulkPlanData_2025_01_01.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        flight_frame.to_excel(writer, sheet_name="Flight", index=False)
+    return path
+
+
+@pytest.fixture
+def master_config(tmp_path: Path):
+    """Master configuration with the dataset cache redirected to a temp dir."""
+    from amp_automation.config import load_master_config
+
+    config = load_master_config()
+    cache_settings = config.data.setdefault("performance", {}).setdefault("data_cache", {})
+    cache_settings["directory"] = str(tmp_path / "data_cache")
+    return config
+
+
 @pytest.fixture
 def pagination_formats() -> list[str]:
     """Pagination format variations for title parsing tests (EC-010)."""
@@ -0,0 +1,75 @@
+"""Tests for pie charts stamped from a styled prototype."""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches, Pt
+
+from amp_automation.presentation import charts
+
+STYLE = charts.ChartStyleContext("Calibri", Pt(8), Pt(6), RGBColor(0, 0, 0))
+POSITION = {"left": Inches(1), "top": Inches(1), "width": Inches(3), "height": Inches(3)}
+COLORS = {"Television": RGBColor(211, 254, 201)}
+CYCLE = [RGBColor(253, 242, 183), RGBColor(255, 217, 97)]
+
+
+def _slide():
+    prs = Presentation()
+    return prs, prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def _drawn_chart_xml(data, title) -> bytes:
+    """The chart python-pptx draws for ``data``, styled the way charts always were."""
+
+    _, slide = _slide()
+    chart_data = CategoryChartData()
+    chart_data.categories = list(data)
+    chart_data.add_series("Budget", [float(value) for value in data.values()])
+    frame = slide.shapes.add_chart(XL_CHART_TYPE.PIE, 0, 0, Inches(3), Inches(3), chart_data)
+    charts._style_pie_chart(frame.chart, list(data), title, STYLE, COLORS, CYCLE)
+    return etree.tostring(frame.chart._chartSpace)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("data", "title"),
+    [
+        ({"Television": 1500.0, "Digital": 2250.5, "OOH": 3000}, "Media Type"),
+        ({"Awareness & <Reach>": 1}, "Funnel\nStage"),
+    ],
+)
+def test_stamped_charts_match_drawn_charts(data, title):
+    _, slide = _slide()
+
+    assert charts.add_pie_chart(slide, data, title, POSITION, STYLE, COLORS, CYCLE, chart_name="Chart")
+
+    frame = slide.shapes[0]
+    assert frame.name == "Chart" and frame.left == Inches(1)
+    assert etree.tostring(frame.chart._chartSpace) == _drawn_chart_xml(data, title)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("embed_workbook", [True, False])
+def test_embedded_workbook_is_optional(embed_workbook):
+    prs, slide = _slide()
+    data = {"Television": 1.0, "Digital": 3.0}
+    charts.add_pie_chart(slide, data, "Media", POSITION, STYLE, COLORS, CYCLE, embed_workbook=embed_workbook)
+
+    stream = BytesIO()
+    prs.save(stream)
+    chart = Presentation(stream).slides[0].shapes[0].chart
+
+    assert list(chart.plots[0].categories) == list(data)
+    assert chart.series[0].values == (1.0, 3.0)
+    xlsx_part = chart.part.chart_workbook.xlsx_part
+    if embed_workbook:
+        assert xlsx_part.blob.startswith(b"PK")
+    else:
+        assert xlsx_part is None
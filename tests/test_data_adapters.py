@@ -0,0 +1,310 @@
+"""Parity tests for the columnar input adapter pipelines.
+
+The reference implementations below are the original row/group loops the
+adapters used before vectorisation; the adapters must keep producing the same
+frames (schema, dtypes, row order and values).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from amp_automation.data.adapters import MONTH_ALIAS_MAP, MONTHS_ORDER, BulkPlanAdapter, FlowplanAdapter
+from conftest import build_flight_frame
+
+
+def _legacy_bulkplan_aggregate(df: pd.DataFrame) -> pd.DataFrame:
+    def extract_country(value):
+        return str(value).split(" | ")[-1].strip()
+
+    def clean_brand(value):
+        brand = str(value)
+        return brand.split(" | ")[-1].strip() if " | " in brand else brand.strip()
+
+    def extract_product(value):
+        product = str(value).split(" | ")[-1].strip()
+        return BulkPlanAdapter.PRODUCT_RENAMES.get(product, product)
+
+    group_cols = [
+        "Plan - Geography", "Plan - Brand", "**Campaign Name(s)",
+        "Plan - Year", "Month", "Media Type", "**Product Business",
+    ]
+    processed = []
+    for name, group in df.groupby(group_cols):
+        geo_raw, brand_raw, campaign, year, month_raw, media_type, product_business = name
+        country = extract_country(geo_raw)
+        brand = clean_brand(brand_raw)
+        month = MONTH_ALIAS_MAP.get(month_raw, month_raw)
+        if not country or not brand or not campaign:
+            continue
+        grp_sum = group["National GRP"].dropna().sum()
+        processed.append({
+            "Country": country,
+            "Brand": brand,
+            "Product": extract_product(product_business),
+            "Media Type": media_type,
+            "Campaign Name": campaign,
+            "Campaign Type": group["**Campaign Type"].dropna().iloc[0] if not group["**Campaign Type"].dropna().empty else "",
+            "Funnel Stage": group["**Funnel Stage"].dropna().iloc[0] if not group["**Funnel Stage"].dropna().empty else "",
+            "Year": year,
+            "Month": month,
+            "Total Cost": group["*Cost to Client"].sum(),
+            "GRP": grp_sum if grp_sum > 0 else np.nan,
+            "Frequency": group["Frequency"].dropna().mean(),
+            "Reach 1+": group["Reach 1+"].dropna().mean(),
+            "Reach 3+": group["Reach 3+"].dropna().mean(),
+        })
+    return pd.DataFrame(processed)
+
+
+def _legacy_pivot(agg_df: pd.DataFrame) -> pd.DataFrame:
+    final_group_cols = [
+        "Country", "Brand", "Product", "Media Type",
+        "Campaign Name", "Campaign Type", "Funnel Stage", "Year",
+    ]
+    rows = []
+    for name, group in agg_df.groupby(final_group_cols):
+        row = dict(zip(final_group_cols, name))
+        for month in MONTHS_ORDER:
+            row[month] = 0
+        total_cost, total_grp = 0, 0
+        freq, reach1, reach3 = [], [], []
+        for _, month_row in group.iterrows():
+            month = month_row["Month"]
+            if month not in MONTHS_ORDER:
+                continue
+            row[month] += month_row["Total Cost"]
+            total_cost += month_row["Total Cost"]
+            if pd.notna(month_row["GRP"]):
+                total_grp += month_row["GRP"]
+            if pd.notna(month_row["Frequency"]):
+                freq.append(month_row["Frequency"])
+            if pd.notna(month_row["Reach 1+"]):
+                reach1.append(month_row["Reach 1+"])
+            if pd.notna(month_row["Reach 3+"]):
+                reach3.append(month_row["Reach 3+"])
+        row["Total Cost"] = total_cost
+        row["GRP"] = total_grp if total_grp > 0 else np.nan
+        row["Frequency"] = float(np.mean(freq)) if freq else np.nan
+        row["Reach 1+"] = float(np.mean(reach1)) if reach1 else np.nan
+        row["Reach 3+"] = float(np.mean(reach3)) if reach3 else np.nan
+        row["Flight Comments"] = ""
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _legacy_flowplan_normalize(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[df["Expert"].astype(str).str.lower() != "yes"]
+    pattern = re.compile(FlowplanAdapter.BRAND_FILTER_PATTERN)
+    df = df[~df["Brand"].astype(str).apply(lambda x: bool(pattern.search(x)))].copy()
+    df["Month"] = pd.to_datetime(df["Month"]).dt.strftime("%b")
+
+    group_cols = ["Country.1", "Brand", "Campaign Name(s)", "Year", "Month", "Media Type", "Product"]
+    processed = []
+    for name, group in df.groupby(group_cols):
+        country, brand, campaign, year, month, media_type, product = name
+        country = FlowplanAdapter.COUNTRY_NORMALIZATIONS.get(country, country)
+        brand = FlowplanAdapter.BRAND_NORMALIZATIONS.get(brand, brand)
+        month = MONTH_ALIAS_MAP.get(month, month)
+        if not country or not brand or not campaign:
+            continue
+        grp_sum = group["National GRP [Current]"].dropna().sum()
+        processed.append({
+            "Country": country,
+            "Brand": brand,
+            "Product": product,
+            "Media Type": media_type,
+            "Campaign Name": campaign,
+            "Campaign Type": group["Campaign Type"].dropna().iloc[0] if not group["Campaign Type"].dropna().empty else "",
+            "Funnel Stage": group["Funnel Stage"].dropna().iloc[0] if not group["Funnel Stage"].dropna().empty else "",
+            "Year": year,
+            "Month": month,
+            "Total Cost": group["Cost to Client (GBP) [Current]"].sum(),
+            "GRP": grp_sum if grp_sum > 0 else np.nan,
+            "Frequency": group["Frequency [Current]"].dropna().mean(),
+            "Reach 1+": group["Reach 1+ [Current]"].dropna().mean(),
+            "Reach 3+": group["Reach 3+ [Current]"].dropna().mean(),
+        })
+    result = _legacy_pivot(pd.DataFrame(processed))
+    brand_totals = result.groupby(["Country", "Brand"])["Total Cost"].transform("sum")
+    return result[brand_totals > 0]
+
+
+def build_flowplan_frame(rows_per_campaign: int = 4) -> pd.DataFrame:
+    """Synthetic Flowplan_Summaries Sheet1 covering remaps and exclusions."""
+    countries = ["United Arab Emirates", "Kuwait", "Saudi Arabia", "Morocco", "Cote D'Ivoire", "Egypt"]
+    brands = ["Panadol (Adult Pain)", "Pronamel", "Corega", "Sensodyne (OH-X)", "Voltaren", "Otrivin"]
+    media_types = ["Television", "Digital", "OOH"]
+    rng = np.random.default_rng(11)
+
+    records = []
+    for country_idx, country in enumerate(countries):
+        for brand_idx, brand in enumerate(brands):
+            for row_idx in range(rows_per_campaign):
+                is_tv = (country_idx + row_idx) % 3 == 0
+                zero_cost = brand == "Otrivin" and country == "Egypt"
+                records.append({
+                    "Country": f"Region | {country}",
+                    "Country.1": country,
+                    "Brand": brand,
+                    "Campaign Name(s)": f"CAMP-{brand_idx}-{row_idx % 2}",
+                    "Year": 2025,
+                    "Month": pd.Timestamp(2025, 1 + (brand_idx + row_idx) % 12, 1),
+                    "Media Type": "Television" if is_tv else media_types[1 + row_idx % 2],
+                    "Product": f"Product {brand_idx % 3}",
+                    "Campaign Type": ["Brand", None, "Always On"][row_idx % 3],
+                    "Funnel Stage": "Awareness" if row_idx % 4 else None,
+                    "Cost to Client (GBP) [Current]": 0.0 if zero_cost else float(rng.integers(100, 20_000)),
+                    "National GRP [Current]": float(rng.integers(0, 300)) if is_tv else np.nan,
+                    "Frequency [Current]": float(rng.uniform(1, 5)) if is_tv else np.nan,
+                    "Reach 1+ [Current]": float(rng.uniform(0.1, 0.9)) if is_tv else np.nan,
+                    "Reach 3+ [Current]": float(rng.uniform(0.05, 0.5)) if is_tv else np.nan,
+                    "Expert": "Yes" if (country_idx, brand_idx, row_idx) == (5, 4, 0) else "No",
+                })
+    return pd.DataFrame.from_records(records)
+
+
+@pytest.fixture
+def bulkplan_rows() -> pd.DataFrame:
+    """Flight rows with month aliases, unknown months, zero GRP and blank keys."""
+    df = build_flight_frame(rows_per_campaign=9)
+    df.loc[df.index % 7 == 0, "Month"] = "Sept"
+    df.loc[df.index % 11 == 0, "Month"] = "SEP"
+    df.loc[df.index % 13 == 0, "Month"] = "Q1"
+    df.loc[df.index % 5 == 0, "National GRP"] = 0.0
+    df.loc[df.index % 17 == 0, "*Cost to Client"] = np.nan
+    df.loc[df.index % 19 == 0, "**Funnel Stage"] = None
+    df.loc[df.index == 3, "Plan - Brand"] = "Haleon | "
+    df.loc[df.index == 4, "Plan - Geography"] = np.nan
+    return df
+
+
+@pytest.mark.unit
+def test_bulkplan_aggregate_matches_legacy_loops(bulkplan_rows):
+    adapter = BulkPlanAdapter(Path("BulkPlanData.xlsx"), logging.getLogger("test"))
+
+    agg_df = adapter._aggregate_to_monthly(bulkplan_rows)
+    expected_agg = _legacy_bulkplan_aggregate(bulkplan_rows)
+    pd.testing.assert_frame_equal(agg_df, expected_agg, check_exact=False, rtol=1e-12)
+
+    result = adapter._pivot_to_final_format(agg_df)
+    expected = _legacy_pivot(expected_agg)
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+    assert (result["Jun"] == 0).all() and result["Jun"].dtype == expected["Jun"].dtype
+
+
+@pytest.mark.unit
+def test_bulkplan_pivot_rejects_empty_aggregate(bulkplan_rows):
+    adapter = BulkPlanAdapter(Path("BulkPlanData.xlsx"), logging.getLogger("test"))
+    rows = bulkplan_rows.assign(**{"**Campaign Name(s)": ""})
+
+    agg_df = adapter._aggregate_to_monthly(rows)
+    assert agg_df.empty
+    with pytest.raises(ValueError, match="No data found"):
+        adapter._pivot_to_final_format(agg_df)
+
+
+@pytest.mark.unit
+def test_flowplan_pipeline_matches_legacy_loops():
+    rows = build_flowplan_frame()
+    adapter = FlowplanAdapter(Path("Flowplan_Summaries.xlsx"), logging.getLogger("test"))
+
+    df = adapter._exclude_expert_campaigns(rows.copy())
+    df = adapter._exclude_placeholder_brands(df)
+    df = adapter._convert_month_format(df)
+    result = adapter._exclude_zero_cost_brands(adapter._pivot_to_final_format(adapter._aggregate_to_monthly(df)))
+
+    expected = _legacy_flowplan_normalize(rows.copy())
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+    assert "GNE" in set(result["Country"]) and "Kuwait" not in set(result["Country"])
+    assert not result["Brand"].str.endswith("-X)").any()
+
+
+def _legacy_clean_flight_rows(df: pd.DataFrame) -> pd.DataFrame:
+    def normalize(geo_value):
+        if pd.isna(geo_value):
+            return geo_value
+        geo_str = str(geo_value)
+        for pattern, replacement in BulkPlanAdapter.GEOGRAPHY_NORMALIZATIONS.items():
+            if pattern in geo_str:
+                if pattern.startswith("|"):
+                    if geo_str.endswith(pattern):
+                        geo_str = geo_str.replace(pattern, replacement)
+                else:
+                    geo_str = geo_str.replace(pattern, replacement)
+        return geo_str
+
+    def should_exclude(row):
+        geography = str(row.get("Plan - Geography", ""))
+        comments = str(row.get("Flight Comments", "")).strip()
+        return "GNE" in geography and row.get("Media Type") == "Television" and "Pan Asian TV" in comments
+
+    df = df.copy()
+    df["Plan - Geography"] = df["Plan - Geography"].apply(normalize)
+    return df[~df.apply(should_exclude, axis=1)]
+
+
+@pytest.mark.unit
+def test_bulkplan_cleaning_steps_match_legacy_row_functions(bulkplan_rows, caplog):
+    adapter = BulkPlanAdapter(Path("BulkPlanData.xlsx"), logging.getLogger("test.adapters"))
+    rows = bulkplan_rows.copy()
+    rows.loc[rows.index % 23 == 0, "Flight Comments"] = np.nan
+
+    with caplog.at_level(logging.INFO, logger="test.adapters"):
+        cleaned = adapter._timed_step(adapter._normalize_geography, rows.copy())
+        cleaned = adapter._timed_step(adapter._exclude_gne_pan_asian, cleaned)
+
+    expected = _legacy_clean_flight_rows(rows)
+    pd.testing.assert_frame_equal(cleaned, expected)
+    assert len(cleaned) < len(rows)
+    assert set(adapter.step_timings) == {"normalize_geography", "exclude_gne_pan_asian"}
+    assert "Step exclude_gne_pan_asian took" in caplog.text
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+def test_bulkplan_chunked_normalize_matches_full(flight_workbook, chunk_size):
+    full = BulkPlanAdapter(flight_workbook, logging.getLogger("test"))
+    chunked = BulkPlanAdapter(flight_workbook, logging.getLogger("test"))
+    batches = []
+
+    result = chunked.normalize_chunked(chunk_size, on_chunk=lambda batch: batches.append(len(batch)))
+
+    pd.testing.assert_frame_equal(result, full.normalize(), check_exact=False, rtol=1e-12)
+    assert chunked.raw_frame is None
+    assert sum(batches) == len(full.raw_frame)
+    assert max(batches) <= chunk_size
+
+
+@pytest.mark.unit
+def test_bulkplan_chunks_keep_the_first_chunks_month_source(tmp_path):
+    # The second chunk has no months (and the sheet no flight dates); it must not switch source
+    frame = build_flight_frame()
+    frame["Month"] = frame["Month"].astype(object)
+    frame.loc[7:13, "Month"] = np.nan
+    path = tmp_path / "BulkPlanData_2025_01_01.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        frame.to_excel(writer, sheet_name="Flight", index=False)
+
+    expected = BulkPlanAdapter(path, logging.getLogger("test")).normalize()
+    result = BulkPlanAdapter(path, logging.getLogger("test")).normalize_chunked(7)
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+
+
+@pytest.mark.unit
+def test_flowplan_chunked_normalize_matches_full(tmp_path):
+    path = tmp_path / "Flowplan_Summaries.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        build_flowplan_frame().to_excel(writer, sheet_name="Sheet1", index=False)
+
+    expected = FlowplanAdapter(path, logging.getLogger("test")).normalize()
+    result = FlowplanAdapter(path, logging.getLogger("test")).normalize_chunked(5)
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
@@ -0,0 +1,79 @@
+"""Parity tests for the Parquet / CSV / Arrow input adapters."""
+
+from __future__ import annotations
+
+import logging
+
+import pandas as pd
+import pytest
+
+from amp_automation.cli.main import _parse_format
+from amp_automation.data import TvMetricsIndex, get_tv_metrics_index, load_and_prepare_data
+from amp_automation.data.adapters import (
+    BulkPlanAdapter,
+    BulkPlanColumnarAdapter,
+    FlowplanAdapter,
+    FlowplanColumnarAdapter,
+    InputFormat,
+    detect_format,
+    get_adapter,
+)
+from amp_automation.data.columnar import read_header, read_table
+from test_data_adapters import build_flowplan_frame
+
+WRITERS = {
+    "csv": lambda frame, path: frame.to_csv(path, index=False),
+    "parquet": lambda frame, path: frame.to_parquet(path, index=False),
+    "arrow": lambda frame, path: frame.to_feather(path),
+}
+
+
+def _export(frame: pd.DataFrame, path, kind: str):
+    WRITERS[kind](frame, path)
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kind", sorted(WRITERS))
+def test_bulkplan_columnar_matches_workbook(tmp_path, flight_frame, flight_workbook, kind):
+    path = _export(flight_frame, tmp_path / f"BulkPlanData_2025_01_01.{kind}", kind)
+    logger = logging.getLogger("test")
+
+    assert detect_format(path) is InputFormat.BULK_PLAN_COLUMNAR
+    adapter = get_adapter(path, logger=logger)
+    assert isinstance(adapter, BulkPlanColumnarAdapter)
+
+    expected = BulkPlanAdapter(flight_workbook, logger).normalize()
+    pd.testing.assert_frame_equal(adapter.normalize(), expected, check_dtype=False)
+    chunked = BulkPlanColumnarAdapter(path, logger).normalize_chunked(7)
+    pd.testing.assert_frame_equal(chunked, expected, check_dtype=False, check_exact=False, rtol=1e-12)
+
+    projected = read_table(path, ["Month", "Plan - Brand", "Missing"])
+    assert list(projected.columns) == ["Plan - Brand", "Month"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kind", sorted(WRITERS))
+def test_flowplan_columnar_matches_workbook(tmp_path, kind):
+    rows = build_flowplan_frame()
+    workbook = tmp_path / "Flowplan_Summaries.xlsx"
+    with pd.ExcelWriter(workbook) as writer:
+        rows.to_excel(writer, sheet_name="Sheet1", index=False)
+    path = _export(rows, tmp_path / f"Flowplan_Summaries.{kind}", kind)
+
+    assert "Country.1" in read_header(path)
+    assert detect_format(path) is InputFormat.FLOWPLAN_COLUMNAR
+    expected = FlowplanAdapter(workbook, logging.getLogger("test")).normalize()
+    result = FlowplanColumnarAdapter(path, logging.getLogger("test")).normalize()
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.unit
+def test_load_and_prepare_data_from_parquet(tmp_path, flight_frame, flight_workbook, master_config, test_logger):
+    path = _export(flight_frame, tmp_path / "BulkPlanData_2025_01_01.parquet", "parquet")
+
+    dataset = load_and_prepare_data(path, master_config, test_logger, format_type=_parse_format("bulkplan-columnar"))
+
+    assert dataset.source_format is InputFormat.BULK_PLAN_COLUMNAR
+    expected = TvMetricsIndex.from_flight_frame(BulkPlanAdapter(flight_workbook).load_raw_frame())
+    assert get_tv_metrics_index(path).entries.keys() == expected.entries.keys()
@@ -0,0 +1,130 @@
+"""Parity tests for the aggregate spend cube and the chart preparers built on it."""
+
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from amp_automation.data import AggregateCube, aggregate_cube_for
+from amp_automation.data.adapters import MONTHS_ORDER
+from amp_automation.presentation.charts import (
+    prepare_campaign_type_chart_data,
+    prepare_funnel_chart_data,
+    prepare_media_type_chart_data,
+)
+from amp_automation.utils.media import normalize_media_type
+
+
+def _normalized_frame(rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    media = rng.choice(["Television", "Digital", "OOH", "Radio"], rows)
+    frame = pd.DataFrame(
+        {
+            "Country": rng.choice(["Kenya", "Egypt", " Kenya"], rows),
+            "Brand": rng.choice(["Panadol", "Sensodyne"], rows),
+            "Year": rng.choice([2024, 2025], rows),
+            "Product": rng.choice(["Panadol Extra", "panadol extra", "Sensodyne Repair"], rows),
+            "Campaign Name": rng.choice(["C1", "C2", "C3"], rows),
+            "Media Type": media,
+            "Mapped Media Type": pd.Series(media).replace({"Television": "TV", "Radio": "Other"}).to_numpy(),
+            "Funnel Stage": rng.choice(["Awareness", "Consideration", "Purchase", ""], rows),
+            "Campaign Type": rng.choice(["Brand", "Always On", ""], rows),
+        }
+    )
+    for month in MONTHS_ORDER:
+        frame[month] = rng.integers(0, 5_000, rows).astype(float)
+    frame["Total Cost"] = frame[MONTHS_ORDER].sum(axis=1)
+    return frame
+
+
+def _subset(df, country, brand, year=None, product=None) -> pd.DataFrame:
+    """Reference implementation: the stripped-string masks used before the cube."""
+    mask = (df["Country"].astype(str).str.strip() == str(country).strip()) & (
+        df["Brand"].astype(str).str.strip() == str(brand).strip()
+    )
+    if year is not None:
+        mask &= df["Year"].astype(str).str.strip() == str(year).strip()
+    if product is not None:
+        mask &= df["Product"].astype(str).str.strip().str.upper() == str(product).strip().upper()
+    return df[mask]
+
+
+@pytest.mark.unit
+def test_cells_match_row_level_sums():
+    df = _normalized_frame()
+    cube = AggregateCube.build(df)
+
+    for country, brand, year, product in itertools.product(
+        ["Kenya", "Egypt", "Morocco"], ["Panadol", "Sensodyne"], [None, 2024, "2025"], [None, "PANADOL EXTRA"]
+    ):
+        if year is None and product is not None:
+            continue
+        subset = _subset(df, country, brand, year, product)
+        cell = cube.cell(country, brand, year, product=product)
+        if subset.empty:
+            assert cell is None
+            continue
+
+        assert cell.total_cost == pytest.approx(subset["Total Cost"].sum(), rel=1e-12)
+        for month in MONTHS_ORDER:
+            assert cell.month(month) == pytest.approx(subset[month].sum(), rel=1e-12)
+        assert cell.quarter("Q2") == pytest.approx(subset[["Apr", "May", "Jun"]].to_numpy().sum(), rel=1e-12)
+
+        expected_media = subset.groupby("Mapped Media Type")["Total Cost"].sum()
+        for media, value in expected_media.items():
+            assert cell.value("media", media) == pytest.approx(value, rel=1e-12)
+            assert cell.share("media", media) == pytest.approx(value / subset["Total Cost"].sum(), rel=1e-12)
+        assert cell.value("funnel", "Unknown") == 0.0
+
+
+@pytest.mark.unit
+def test_combination_and_market_totals_match_ordering_masks():
+    df = _normalized_frame()
+    cube = aggregate_cube_for(df)
+
+    for country, brand, year in df[["Country", "Brand", "Year"]].drop_duplicates().itertuples(index=False):
+        expected = _subset(df, country, brand, year)["Total Cost"].fillna(0).sum()
+        assert cube.total(country, brand, year) == pytest.approx(expected, rel=1e-12)
+
+    kenya = df[df["Country"].str.strip() == "Kenya"]["Total Cost"].sum()
+    assert cube.market_total("Kenya ") == pytest.approx(kenya, rel=1e-12)
+    assert cube.total("Morocco", "Panadol", 2025) == 0.0
+    assert aggregate_cube_for(df) is cube
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("categorical", [False, True])
+def test_chart_preparers_match_row_level_breakdowns(categorical):
+    df = _normalized_frame()
+    if categorical:
+        text_columns = ["Country", "Brand", "Product", "Campaign Name", "Media Type", "Funnel Stage", "Campaign Type"]
+        df = df.astype({column: "category" for column in text_columns})
+
+    for country, brand, year in itertools.product(["Kenya", "Egypt"], ["Panadol", "Sensodyne"], [None, 2025]):
+        subset = _subset(df, country, brand, year)
+
+        funnel = {
+            str(stage).strip(): float(value)
+            for stage, value in subset.groupby("Funnel Stage", sort=False, observed=True)["Total Cost"].sum().items()
+            if str(stage).strip() and value > 0
+        }
+        media: dict[str, float] = {}
+        for raw, value in subset.groupby("Media Type", sort=False, observed=True)["Total Cost"].sum().items():
+            if value > 0:
+                key = normalize_media_type(raw)
+                media[key] = media.get(key, 0.0) + float(value)
+
+        actual_funnel = prepare_funnel_chart_data(df, country, brand, year)
+        actual_media = prepare_media_type_chart_data(df, country, brand, year)
+        assert list(actual_funnel) == list(funnel)
+        assert list(actual_media) == list(media)
+        for key, value in funnel.items():
+            assert actual_funnel[key] == pytest.approx(value, rel=1e-12)
+        for key, value in media.items():
+            assert actual_media[key] == pytest.approx(value, rel=1e-12)
+        assert "" not in prepare_campaign_type_chart_data(df, country, brand, year)
+
+    assert prepare_funnel_chart_data(df, "Morocco", "Panadol") is None
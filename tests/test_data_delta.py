@@ -0,0 +1,77 @@
+"""Tests for partition-level change sets between two exports."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import pandas as pd
+import pytest
+
+from amp_automation.data import diff_datasets, diff_exports
+from amp_automation.data.adapters import BulkPlanAdapter
+
+
+@pytest.fixture
+def normalized(flight_workbook) -> pd.DataFrame:
+    return BulkPlanAdapter(flight_workbook, logging.getLogger("test")).normalize()
+
+
+@pytest.mark.unit
+def test_reordered_export_has_no_changes(normalized):
+    shuffled = normalized.sample(frac=1.0, random_state=3).reset_index(drop=True)
+    shuffled["Country"] = shuffled["Country"] + " "
+
+    delta = diff_datasets(normalized, shuffled)
+
+    assert not delta.has_changes
+    assert delta.unchanged == normalized.groupby(["Country", "Brand", "Year", "Product"]).ngroups
+    assert delta.to_dict()["summary"] == {"added": 0, "removed": 0, "modified": 0, "unchanged": delta.unchanged}
+
+
+@pytest.mark.unit
+def test_delta_reports_added_removed_and_modified_partitions(normalized):
+    current = normalized.copy()
+    first = current.index[0]
+    key = tuple(str(current.at[first, column]) for column in ("Country", "Brand", "Year", "Product"))
+    month = next(month for month in ("Jan", "Feb", "Mar", "Sep", "Dec") if current.at[first, month] > 0)
+    before_value = current.at[first, month]
+    current.at[first, month] = before_value + 250
+    current.at[first, "Total Cost"] += 250
+
+    removed = current[current["Country"] == "Kenya"]
+    current = current[current["Country"] != "Kenya"]
+    added = normalized[normalized["Country"] == "Egypt"].assign(Year=2026)
+    current = pd.concat([current, added], ignore_index=True)
+
+    delta = diff_datasets(normalized, current)
+
+    assert [change.key for change in delta.modified] == [key]
+    cells = {cell.column: (cell.before, cell.after) for cell in delta.modified[0].cells}
+    assert cells[month] == (before_value, before_value + 250)
+    assert set(cells) == {month, "Total Cost"}
+    assert {change.key[0] for change in delta.removed} == {"Kenya"}
+    assert len(delta.removed) == removed.groupby(["Brand", "Year", "Product"]).ngroups
+    assert {change.key[2] for change in delta.added} == {"2026"}
+    assert all(change.cells for change in delta.added)
+    assert key[:3] in delta.touched_combinations()
+
+
+@pytest.mark.unit
+def test_diff_exports_writes_json_change_set(tmp_path, flight_frame, master_config, test_logger):
+    previous = tmp_path / "BulkPlanData_2025_01_01.parquet"
+    flight_frame.to_parquet(previous, index=False)
+    current_frame = flight_frame.copy()
+    current_frame.loc[0, "*Cost to Client"] += 1000
+    current = tmp_path / "BulkPlanData_2025_01_02.parquet"
+    current_frame.to_parquet(current, index=False)
+
+    delta = diff_exports(previous, current, master_config, test_logger, use_cache=False)
+    report = json.loads(delta.write_json(tmp_path / "delta.json").read_text(encoding="utf-8"))
+
+    assert report["before"] == [str(previous)] and report["after"] == [str(current)]
+    assert report["summary"]["modified"] == 1 and report["summary"]["added"] == report["summary"]["removed"] == 0
+    (change,) = report["changes"]
+    assert change["Country"] == "Pakistan" and change["status"] == "modified"
+    moved = {cell["column"]: cell["after"] - cell["before"] for cell in change["cells"]}
+    assert moved == {flight_frame.loc[0, "Month"]: 1000, "Total Cost": 1000}
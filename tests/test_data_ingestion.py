@@ -0,0 +1,387 @@
+"""Regression tests for data ingestion, format detection and TV metric lookups."""
+
+from __future__ import annotations
+
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from amp_automation.data import TvMetricsIndex, get_month_specific_tv_metrics, get_tv_metrics_index, probe_workbook
+from amp_automation.data import load_and_prepare_data, resolve_sources
+from amp_automation.data.cache import DataCache, disable_data_cache
+from amp_automation.data.ingestion import _TV_METRICS_INDEX_CACHE
+from amp_automation.data import adapters as adapters_module
+from amp_automation.data.adapters import BulkPlanAdapter, InputFormat, detect_format
+from amp_automation.data.ingestion import _clean_brand, _extract_country
+
+
+def _normalized_flight_rows(path) -> pd.DataFrame:
+    """Flight rows with geography/brand normalisation but no row exclusions."""
+    adapter = BulkPlanAdapter(path)
+    df = pd.read_excel(path, sheet_name="Flight", header=0)
+    df = adapter._ensure_month_column(df)
+    df = adapter._normalize_geography(df)
+    return adapter._split_panadol_brand(df)
+
+
+def _scan_tv_metrics(df: pd.DataFrame, country, brand, campaign, year, month) -> dict[str, float]:
+    """Reference full-frame scan (pre-index behaviour) used for parity checks."""
+    filtered = df[
+        (df["Plan - Geography"].apply(lambda value: _extract_country(value, " | ")) == country)
+        & (df["Plan - Brand"].apply(_clean_brand) == brand)
+        & (df["**Campaign Name(s)"] == campaign)
+        & (df["Plan - Year"] == year)
+        & (df["Month"] == month)
+        & (df["Media Type"] == "Television")
+    ]
+    gne_mask = filtered["Plan - Geography"].astype(str).str.contains("GNE", na=False)
+    pan_asian_mask = filtered["Flight Comments"].astype(str).str.contains("Pan Asian TV", na=False)
+    filtered = filtered[~(gne_mask & pan_asian_mask)]
+    filtered = filtered[~filtered["Plan Name"].astype(str).str.contains("expert", case=False, na=False)]
+    if filtered.empty:
+        return {"grp_sum": 0, "frequency_avg": np.nan, "reach1_avg": np.nan, "reach3_avg": np.nan}
+
+    def _mean(column: str) -> float:
+        values = filtered[column].dropna()
+        return values.mean() if len(values) > 0 else np.nan
+
+    return {
+        "grp_sum": filtered["National GRP"].dropna().sum(),
+        "frequency_avg": _mean("Frequency"),
+        "reach1_avg": _mean("Reach 1+"),
+        "reach3_avg": _mean("Reach 3+"),
+    }
+
+
+def _assert_metrics_equal(actual: dict[str, float], expected: dict[str, float]) -> None:
+    assert actual.keys() == expected.keys()
+    for key, expected_value in expected.items():
+        actual_value = actual[key]
+        if isinstance(expected_value, float) and math.isnan(expected_value):
+            assert math.isnan(actual_value), f"{key}: expected NaN, got {actual_value}"
+        else:
+            assert actual_value == pytest.approx(expected_value), key
+
+
+@pytest.mark.unit
+def test_tv_metrics_index_matches_full_scan(flight_workbook):
+    """Index built from the adapter's cleaned frame matches the per-call frame scan."""
+    source = _normalized_flight_rows(flight_workbook)
+    index = TvMetricsIndex.from_flight_frame(BulkPlanAdapter(flight_workbook).load_raw_frame())
+
+    countries = {_extract_country(value, " | ") for value in source["Plan - Geography"]}
+    brands = {_clean_brand(value) for value in source["Plan - Brand"]}
+    campaigns = set(source["**Campaign Name(s)"])
+    months = ["Jan", "Feb", "Mar", "Sep", "Dec", "Jun"]
+
+    checked_hits = 0
+    for country in countries:
+        for brand in brands:
+            for campaign in campaigns:
+                for month in months:
+                    expected = _scan_tv_metrics(source, country, brand, campaign, 2025, month)
+                    actual = index.lookup(country, brand, campaign, 2025, month)
+                    _assert_metrics_equal(actual, expected)
+                    checked_hits += int(expected["grp_sum"] != 0)
+
+    assert checked_hits > 0, "Synthetic workbook should produce TV metric hits"
+
+
+@pytest.mark.unit
+def test_tv_metrics_index_excludes_gne_pan_asian(flight_workbook):
+    """GNE Pan Asian TV rows never contribute to the index."""
+    source = _normalized_flight_rows(flight_workbook)
+    index = TvMetricsIndex.from_flight_frame(source)
+
+    gne_pan_asian = source[
+        source["Plan - Geography"].str.endswith("GNE")
+        & (source["Media Type"] == "Television")
+        & (source["Flight Comments"] == "Pan Asian TV")
+    ]
+    assert not gne_pan_asian.empty
+    for _, row in gne_pan_asian.iterrows():
+        key = ("GNE", _clean_brand(row["Plan - Brand"]), row["**Campaign Name(s)"], 2025, row["Month"])
+        metrics = index.entries.get(key)
+        if metrics is not None:
+            siblings = source[
+                source["Plan - Geography"].str.endswith("GNE")
+                & (source["Media Type"] == "Television")
+                & (source["Flight Comments"] != "Pan Asian TV")
+                & (source["Plan - Brand"] == row["Plan - Brand"])
+                & (source["**Campaign Name(s)"] == row["**Campaign Name(s)"])
+                & (source["Month"] == row["Month"])
+            ]
+            assert metrics["grp_sum"] == pytest.approx(siblings["National GRP"].sum())
+
+
+@pytest.mark.unit
+def test_get_month_specific_tv_metrics_uses_cached_index(flight_workbook):
+    """Public helper delegates to the cached per-workbook index."""
+    index = get_tv_metrics_index(flight_workbook)
+    assert get_tv_metrics_index(flight_workbook) is index
+
+    key = next(iter(index.entries))
+    country, brand, campaign, year, month = key
+    _assert_metrics_equal(
+        get_month_specific_tv_metrics(flight_workbook, country, brand, campaign, year, month.upper()),
+        index.entries[key],
+    )
+    missing = get_month_specific_tv_metrics(flight_workbook, "Nowhere", brand, campaign, year, month)
+    assert missing["grp_sum"] == 0
+    assert math.isnan(missing["reach1_avg"])
+
+
+@pytest.mark.unit
+def test_load_and_prepare_data_primes_tv_metrics_index(flight_workbook, master_config, test_logger, monkeypatch):
+    """The Flight sheet is parsed once and shared with the TV metrics index."""
+    read_calls = _count_excel_reads(monkeypatch)
+
+    dataset = load_and_prepare_data(flight_workbook, master_config, test_logger)
+    index = get_tv_metrics_index(flight_workbook)
+
+    assert read_calls == ["Flight"]
+    assert dataset.source_format is InputFormat.BULK_PLAN
+    assert len(index) > 0
+
+    expected = TvMetricsIndex.from_flight_frame(BulkPlanAdapter(flight_workbook).load_raw_frame())
+    assert index.entries.keys() == expected.entries.keys()
+
+
+@pytest.mark.unit
+def test_chunked_ingestion_matches_full_load(flight_workbook, master_config, test_logger, monkeypatch):
+    """Chunked mode streams the sheet once and yields the same dataset and TV index."""
+    expected = load_and_prepare_data(flight_workbook, master_config, test_logger, use_cache=False).frame
+    expected_index = get_tv_metrics_index(flight_workbook)
+    _TV_METRICS_INDEX_CACHE.clear()
+
+    optimization = master_config.data["performance"]["optimization"]
+    optimization.update(enable_chunking=True, chunk_size=4)
+    monkeypatch.setattr(
+        adapters_module, "read_sheet", lambda *args, **kwargs: pytest.fail("chunked mode must not read whole sheets")
+    )
+
+    dataset = load_and_prepare_data(flight_workbook, master_config, test_logger, use_cache=False)
+
+    pd.testing.assert_frame_equal(dataset.frame, expected, check_exact=False, rtol=1e-12)
+    index = get_tv_metrics_index(flight_workbook)
+    assert index.entries.keys() == expected_index.entries.keys()
+    for key, metrics in expected_index.entries.items():
+        _assert_metrics_equal(index.entries[key], metrics)
+
+
+def _write_flowplan_header_workbook(path):
+    columns = ["Country", "Brand", "Country", "Cost to Client (GBP) [Current]", "Country"]
+    frame = pd.DataFrame([["UAE", "Haleon | Panadol", "UAE", 100.0, "UAE"]], columns=columns)
+    with pd.ExcelWriter(path) as writer:
+        frame.to_excel(writer, sheet_name="Notes", index=False)
+        frame.to_excel(writer, sheet_name="Sheet1", index=False)
+    return path
+
+
+@pytest.mark.unit
+def test_workbook_probe_matches_pandas_header(tmp_path, flight_workbook):
+    """Probe headers mirror ``pd.read_excel`` including duplicate-name mangling."""
+    flowplan_path = _write_flowplan_header_workbook(tmp_path / "Flowplan_Summaries.xlsx")
+
+    for path in (flight_workbook, flowplan_path):
+        probe = probe_workbook(path)
+        with pd.ExcelFile(path) as workbook:
+            assert list(probe.sheet_names) == workbook.sheet_names
+            for sheet in workbook.sheet_names:
+                expected = [str(column) for column in pd.read_excel(workbook, sheet_name=sheet, nrows=0).columns]
+                assert list(probe.header(sheet)) == expected
+
+    assert "Country.1" in probe_workbook(flowplan_path).header("Sheet1")
+
+
+@pytest.mark.unit
+def test_detect_format_uses_probe_without_parsing_workbook(tmp_path, flight_workbook, monkeypatch):
+    """Format detection is served from the probe, not a full ``pd.ExcelFile`` parse."""
+    flowplan_path = _write_flowplan_header_workbook(tmp_path / "Flowplan_Summaries.xlsx")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("detect_format should not parse the workbook")
+
+    monkeypatch.setattr(pd, "ExcelFile", _fail)
+    monkeypatch.setattr(pd, "read_excel", _fail)
+
+    assert detect_format(flight_workbook) is InputFormat.BULK_PLAN
+    assert detect_format(flowplan_path) is InputFormat.FLOWPLAN
+
+
+@pytest.mark.unit
+def test_workbook_probe_cache_invalidates_on_change(tmp_path, flight_frame):
+    """Probes are reused until the file's size or mtime changes."""
+    path = tmp_path / "BulkPlanData_2025_01_01.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        flight_frame.to_excel(writer, sheet_name="Flight", index=False)
+
+    probe = probe_workbook(path)
+    assert probe_workbook(path) is probe
+
+    with pd.ExcelWriter(path) as writer:
+        flight_frame.to_excel(writer, sheet_name="Flight", index=False)
+        flight_frame.head(1).to_excel(writer, sheet_name="Extra", index=False)
+    os.utime(path, ns=(probe.mtime_ns + 1_000_000_000, probe.mtime_ns + 1_000_000_000))
+
+    refreshed = probe_workbook(path)
+    assert refreshed is not probe
+    assert refreshed.sheet_names == ("Flight", "Extra")
+
+
+def _count_excel_reads(monkeypatch) -> list:
+    """Record the sheet name of every adapter source-sheet read."""
+    calls = []
+    original_read_sheet = adapters_module.read_sheet
+
+    def _counting_read_sheet(path, sheet_name, *args, **kwargs):
+        calls.append(sheet_name)
+        return original_read_sheet(path, sheet_name, *args, **kwargs)
+
+    monkeypatch.setattr(adapters_module, "read_sheet", _counting_read_sheet)
+    return calls
+
+
+@pytest.mark.unit
+def test_dataset_cache_skips_excel_on_reload(flight_workbook, master_config, test_logger, monkeypatch):
+    """A second load of an unchanged workbook is served from the Parquet cache."""
+    first = load_and_prepare_data(flight_workbook, master_config, test_logger)
+    first_index = get_tv_metrics_index(flight_workbook)
+    _TV_METRICS_INDEX_CACHE.clear()
+
+    reads = _count_excel_reads(monkeypatch)
+    second = load_and_prepare_data(flight_workbook, master_config, test_logger)
+
+    assert reads == []
+    assert not first.from_cache and second.from_cache
+    pd.testing.assert_frame_equal(second.frame, first.frame)
+    assert get_tv_metrics_index(flight_workbook).entries.keys() == first_index.entries.keys()
+    assert reads == []
+
+
+@pytest.mark.unit
+def test_dataset_cache_can_be_bypassed(flight_workbook, master_config, test_logger, monkeypatch):
+    """``use_cache=False`` and ``disable_data_cache`` both force an Excel read."""
+    load_and_prepare_data(flight_workbook, master_config, test_logger)
+    reads = _count_excel_reads(monkeypatch)
+
+    assert not load_and_prepare_data(flight_workbook, master_config, test_logger, use_cache=False).from_cache
+    disable_data_cache(master_config)
+    assert not load_and_prepare_data(flight_workbook, master_config, test_logger).from_cache
+    assert reads == ["Flight", "Flight"]
+
+
+@pytest.mark.unit
+def test_dataset_cache_keys_on_content_and_evicts(tmp_path, flight_frame, master_config, test_logger):
+    """Changed workbooks miss the cache and old entries are evicted past the size bound."""
+    path = tmp_path / "BulkPlanData_2025_02_01.xlsx"
+    cache = DataCache.from_config(master_config, test_logger)
+
+    keys = []
+    for cost_scale in (1.0, 2.0, 3.0):
+        frame = flight_frame.assign(**{"*Cost to Client": flight_frame["*Cost to Client"] * cost_scale})
+        with pd.ExcelWriter(path) as writer:
+            frame.to_excel(writer, sheet_name="Flight", index=False)
+        dataset = load_and_prepare_data(path, master_config, test_logger)
+        assert not dataset.from_cache
+        keys.append(DataCache.key_for(path, "bulkplan", BulkPlanAdapter.RULES_VERSION))
+
+    assert len(set(keys)) == 3
+    assert all(cache.load(key) is not None for key in keys)
+
+    entry_bytes = sum(p.stat().st_size for p in cache.directory.glob(f"{keys[-1]}*"))
+    cache.max_bytes = int(entry_bytes * 1.5)
+    cache.evict(keep=keys[-1])
+    assert cache.load(keys[0]) is None
+    assert cache.load(keys[-1]) is not None
+
+
+@pytest.mark.unit
+def test_load_and_prepare_data_emits_compact_stripped_dimensions(tmp_path, flight_frame, master_config, test_logger):
+    """Dimensions are stripped categoricals; lossless metrics are float32."""
+    padded = flight_frame.copy()
+    padded["**Campaign Name(s)"] = padded["**Campaign Name(s)"] + "  "
+    padded["**Product Business"] = " " + padded["**Product Business"]
+    path = tmp_path / "BulkPlanData_2025_02_01.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        padded.to_excel(writer, sheet_name="Flight", index=False)
+
+    df = load_and_prepare_data(path, master_config, test_logger, use_cache=False).frame
+
+    for column in ("Country", "Brand", "Product", "Campaign Name", "Media Type", "Normalized Media"):
+        assert isinstance(df[column].dtype, pd.CategoricalDtype), column
+    assert all(value == value.strip() for value in df["Campaign Name"].dropna())
+    assert all(value == value.strip() for value in df["Product"].dropna())
+    assert set(df["Normalized Media"]) <= {"Television", "Digital", "OOH", "Radio", "Cinema", "Print", "Other"}
+    assert df["GRP"].dtype == np.float32
+    assert df["Total Cost"].dtype != np.float32
+
+    tv_row = df[(df["Media Type"] == "Television") & (df["Jan"] > 0)].iloc[0]
+    metrics = get_month_specific_tv_metrics(
+        path, tv_row["Country"], tv_row["Brand"], tv_row["Campaign Name"], tv_row["Year"], "Jan"
+    )
+    assert metrics["grp_sum"] > 0
+
+
+def _write_flight(frame: pd.DataFrame, path):
+    with pd.ExcelWriter(path) as writer:
+        frame.to_excel(writer, sheet_name="Flight", index=False)
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_multiple_sources_merge_into_one_dataset(tmp_path, flight_frame, master_config, test_logger, max_workers):
+    """Regional exports (with an overlapping region) merge to the single-workbook dataset."""
+    master_config.data["performance"]["optimization"]["max_workers"] = max_workers
+    geographies = sorted(flight_frame["Plan - Geography"].unique())
+    regions = tmp_path / "regions"
+    regions.mkdir()
+    _write_flight(flight_frame[flight_frame["Plan - Geography"].isin(geographies[:3])], regions / "a_2025_01_01.xlsx")
+    _write_flight(flight_frame[flight_frame["Plan - Geography"].isin(geographies[2:])], regions / "b_2025_01_02.xlsx")
+    combined = _write_flight(flight_frame, tmp_path / "BulkPlanData_2025_01_01.xlsx")
+
+    expected = load_and_prepare_data(combined, master_config, test_logger, use_cache=False).frame
+    expected_index = get_tv_metrics_index(combined)
+    dataset = load_and_prepare_data(regions, master_config, test_logger, use_cache=False)
+
+    sort_keys = ["Country", "Brand", "Product", "Media Type", "Campaign Name", "Year"]
+    pd.testing.assert_frame_equal(
+        dataset.frame.sort_values(sort_keys).reset_index(drop=True),
+        expected.sort_values(sort_keys).reset_index(drop=True),
+        check_categorical=False,
+    )
+    assert [summary.path.name for summary in dataset.sources] == ["a_2025_01_01.xlsx", "b_2025_01_02.xlsx"]
+    assert all(summary.rows > 0 and summary.seconds > 0 for summary in dataset.sources)
+
+    sources = resolve_sources(regions)
+    assert get_tv_metrics_index(sources).entries.keys() == expected_index.entries.keys()
+
+
+@pytest.mark.unit
+def test_multiple_sources_reject_conflicting_campaign_lines(tmp_path, flight_frame, master_config, test_logger):
+    """A campaign line exported with different values by two workbooks must not be counted twice."""
+    master_config.data["performance"]["optimization"]["max_workers"] = 1
+    region = flight_frame[flight_frame["Plan - Geography"] == sorted(flight_frame["Plan - Geography"].unique())[0]]
+    revised = region.copy()
+    revised.iloc[0, revised.columns.get_loc("*Cost to Client")] += 1000
+    _write_flight(region, tmp_path / "a_2025_01_01.xlsx")
+    _write_flight(revised, tmp_path / "b_2025_01_02.xlsx")
+
+    with pytest.raises(ValueError, match="different values in different sources") as error:
+        load_and_prepare_data(tmp_path, master_config, test_logger, use_cache=False)
+    assert "a_2025_01_01.xlsx, b_2025_01_02.xlsx" in str(error.value)
+
+
+@pytest.mark.unit
+def test_multiple_sources_reject_mixed_layouts(tmp_path, flight_workbook, master_config, test_logger):
+    flowplan = _write_flowplan_header_workbook(tmp_path / "Flowplan_Summaries.xlsx")
+    master_config.data["performance"]["optimization"]["max_workers"] = 1
+
+    with pytest.raises(ValueError, match="Cannot merge BulkPlan and Flowplan"):
+        load_and_prepare_data([flight_workbook, flowplan], master_config, test_logger, use_cache=False)
+    with pytest.raises(FileNotFoundError):
+        resolve_sources([flight_workbook, tmp_path / "missing.xlsx"])
@@ -0,0 +1,78 @@
+"""Parity tests for the market/brand/year partition index."""
+
+from __future__ import annotations
+
+import itertools
+
+import pandas as pd
+import pytest
+
+from amp_automation.data import PartitionIndex, partition_index_for
+
+
+def _normalized_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Country": ["Kenya", " Kenya", "Egypt", "Kenya ", "Egypt", "Kenya", None],
+            "Brand": ["Panadol", "Panadol", "Panadol", "Sensodyne", "Panadol", "Panadol ", "Panadol"],
+            "Year": [2025, 2025, 2025, 2026, 2024, 2024, 2025],
+            "Product": ["Panadol Extra", "panadol extra", "Panadol Cold", "Sensodyne", " Panadol Extra", "PANADOL EXTRA", "X"],
+            "Total Cost": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+        },
+        index=[10, 11, 12, 13, 14, 15, 16],
+    )
+
+
+def _mask_rows(df, country, brand, year=None, product=None, ignore_case=False) -> pd.DataFrame:
+    """Reference implementation: the masks assembly built before the index."""
+    mask = (df["Country"].astype(str).str.strip() == str(country).strip()) & (
+        df["Brand"].astype(str).str.strip() == str(brand).strip()
+    )
+    if year is not None:
+        mask &= df["Year"].astype(str).str.strip() == str(year).strip()
+    if product is not None:
+        products = df["Product"].astype(str).str.strip()
+        target = str(product).strip()
+        if ignore_case:
+            mask &= products.str.upper() == target.upper()
+        else:
+            mask &= products == target
+    return df[mask]
+
+
+@pytest.mark.unit
+def test_rows_match_mask_filtering_for_every_combination():
+    df = _normalized_frame()
+    index = PartitionIndex.build(df)
+
+    countries = ["Kenya", "Egypt", "None", "Morocco"]
+    brands = ["Panadol", "Sensodyne", "Voltaren"]
+    years = [None, 2024, 2025, "2026", 2030]
+    products = [None, "Panadol Extra", "PANADOL EXTRA", "Sensodyne", "Missing"]
+
+    for country, brand, year, product in itertools.product(countries, brands, years, products):
+        for ignore_case in (False, True):
+            expected = _mask_rows(df, country, brand, year, product, ignore_case)
+            actual = index.rows(country, brand, year, product=product, ignore_product_case=ignore_case)
+            pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.unit
+def test_has_product_is_case_insensitive():
+    index = PartitionIndex.build(_normalized_frame())
+
+    assert index.has_product("panadol EXTRA")
+    assert index.has_product(" Sensodyne ")
+    assert not index.has_product("Voltaren")
+
+
+@pytest.mark.unit
+def test_partition_index_is_cached_per_frame():
+    df = _normalized_frame()
+
+    first = partition_index_for(df)
+    assert partition_index_for(df) is first
+    assert partition_index_for(df.copy()) is not first
+
+    grown = pd.concat([df, df.iloc[[0]]])
+    assert len(partition_index_for(grown).rows("Kenya", "Panadol", 2025)) == 3
@@ -0,0 +1,68 @@
+"""Parity tests for the column-projected sheet reader engines."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from amp_automation.data.adapters import BulkPlanAdapter
+from amp_automation.data.sheet_reader import ReaderOptions, available_engines, read_sheet, resolve_engine
+
+
+def _write_irregular_workbook(path):
+    """Sheet with duplicate headers, gaps, blank/trailing rows, errors and mixed types."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Flight"
+    workbook.create_sheet("Other")
+    sheet.append(["Country", "Brand", "Country", None, "Cost", "Flag", "Start", "Note", "Unused"])
+    sheet.append(["Region | Kenya", "Panadol", "Kenya", "x", 1200.0, True, datetime(2025, 1, 3), "NA", 1])
+    sheet.append(["Region | Egypt", " Sensodyne ", "Egypt", None, 15.5, False, datetime(2025, 2, 1), "#N/A", 2])
+    sheet.append([None] * 9)
+    sheet.append(["Region | GNE", "Voltaren", None, None, None, None, None, "Pan Asian TV", 3])
+    sheet.append([None, None, None, None, 7, None, None, None, 4])
+    sheet.append([None] * 9)
+    sheet.append([None] * 9)
+    workbook.save(path)
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", available_engines())
+def test_engines_match_read_excel(tmp_path, engine):
+    path = _write_irregular_workbook(tmp_path / "irregular.xlsx")
+    expected = pd.read_excel(path, sheet_name="Flight", header=0)
+
+    pd.testing.assert_frame_equal(read_sheet(path, "Flight", engine=engine), expected)
+
+    columns = ["Country.1", "Cost", "Start", "Note", "Missing"]
+    projected = read_sheet(path, "Flight", columns, engine=engine)
+    pd.testing.assert_frame_equal(projected, expected[["Country.1", "Cost", "Start", "Note"]])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", available_engines())
+def test_bulkplan_normalize_is_engine_independent(flight_workbook, engine):
+    logger = logging.getLogger("test")
+    baseline = BulkPlanAdapter(flight_workbook, logger, reader=ReaderOptions("pandas", project_columns=False))
+    adapter = BulkPlanAdapter(flight_workbook, logger, reader=ReaderOptions(engine))
+
+    pd.testing.assert_frame_equal(adapter.load_raw_frame(), baseline.load_raw_frame()[adapter.raw_frame.columns])
+    pd.testing.assert_frame_equal(adapter.normalize(), baseline.normalize())
+
+
+@pytest.mark.unit
+def test_reader_options_from_config(master_config):
+    master_config.data.setdefault("data", {}).setdefault("excel", {})["reader"] = {
+        "engine": "OpenPyXL",
+        "project_columns": False,
+    }
+
+    assert ReaderOptions.from_config(master_config) == ReaderOptions("openpyxl", project_columns=False)
+    assert resolve_engine("auto") in available_engines()
+    with pytest.raises(ValueError):
+        resolve_engine("xlrd")
@@ -0,0 +1,157 @@
+"""Tests for manifest-driven reuse of unchanged slides."""
+
+from __future__ import annotations
+
+import logging
+from io import BytesIO
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.util import Inches
+
+from amp_automation.data.adapters import BulkPlanAdapter
+from amp_automation.presentation.incremental import (
+    ROLE_BRAND,
+    DeckManifest,
+    IncrementalBuild,
+    combination_key,
+    combination_digests,
+    find_previous_deck,
+    manifest_path_for,
+    product_role,
+)
+
+
+@pytest.fixture
+def normalized(flight_workbook):
+    return BulkPlanAdapter(flight_workbook, logging.getLogger("test")).normalize()
+
+
+@pytest.fixture
+def template(tmp_path):
+    path = tmp_path / "template.pptx"
+    Presentation().save(path)
+    return path
+
+
+def _render(prs, build, combinations):
+    """Stand-in for assembly: one delimiter plus one or two content slides per combination."""
+    for combination in combinations:
+        prs.slides.add_slide(prs.slide_layouts[6])
+        record = build.reusable(combination)
+        if record is not None:
+            build.carry(prs, combination, ROLE_BRAND, record)
+            build.carry(prs, combination, product_role("Extra"), record)
+            continue
+        for role in (ROLE_BRAND, product_role("Extra")):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text_frame.text = f"{combination} {role}"
+            build.record(combination, role, slide)
+
+
+def _combinations(frame):
+    return frame[["Country", "Brand", "Year"]].drop_duplicates().values.tolist()
+
+
+@pytest.mark.unit
+def test_only_changed_combinations_get_new_digests(normalized):
+    changed = normalized.copy()
+    row = changed.index[0]
+    changed.at[row, "Total Cost"] += 10
+    settings = "settings"
+
+    before = combination_digests(normalized, None, settings)
+    after = combination_digests(changed.sample(frac=1.0, random_state=1), None, settings)
+
+    key = combination_key(normalized.loc[row, ["Country", "Brand", "Year"]])
+    assert {name for name in before if before[name] != after[name]} == {key}
+    assert combination_digests(normalized, None, "other settings")[key] != before[key]
+
+
+@pytest.mark.unit
+def test_unchanged_combinations_are_carried_from_previous_deck(tmp_path, normalized, master_config, template):
+    combinations = _combinations(normalized)
+    first = IncrementalBuild.start(normalized, None, master_config, template)
+    prs = Presentation(template)
+    _render(prs, first, combinations)
+    previous = tmp_path / "run1" / "deck.pptx"
+    previous.parent.mkdir()
+    prs.save(previous)
+    first.manifest(prs).write(manifest_path_for(previous))
+
+    changed = normalized.copy()
+    changed.at[changed.index[0], "Total Cost"] += 10
+    changed_key = combination_key(changed.loc[changed.index[0], ["Country", "Brand", "Year"]])
+    # New ordering: the changed combination moves to the end
+    reordered = sorted(combinations, key=lambda combination: combination_key(combination) == changed_key)
+
+    assert find_previous_deck(tmp_path) == previous
+    second = IncrementalBuild.start(changed, None, master_config, template, previous)
+    prs = Presentation(template)
+    _render(prs, second, reordered)
+    manifest = second.manifest(prs)
+
+    assert manifest.slide_count == 3 * len(combinations)
+    assert len(manifest.carried_slides) == 2 * (len(combinations) - 1)
+    old_deck = Presentation(previous)
+    old_manifest = DeckManifest.load(manifest_path_for(previous))
+    for key, record in manifest.combinations.items():
+        carried = set(record.slides[ROLE_BRAND]) <= set(manifest.carried_slides)
+        assert carried == (key != changed_key)
+        if carried:
+            old_position = old_manifest.combinations[key].slides[ROLE_BRAND][0]
+            assert etree.tostring(prs.slides[record.slides[ROLE_BRAND][0]]._element) == etree.tostring(
+                old_deck.slides[old_position]._element
+            )
+
+
+@pytest.mark.unit
+def test_settings_change_disables_reuse(tmp_path, normalized, master_config, template):
+    first = IncrementalBuild.start(normalized, None, master_config, template)
+    prs = Presentation(template)
+    _render(prs, first, _combinations(normalized))
+    previous = tmp_path / "deck.pptx"
+    prs.save(previous)
+    first.manifest(prs).write(manifest_path_for(previous))
+
+    master_config.data["presentation"]["table"]["max_rows_per_slide"] = 5
+    second = IncrementalBuild.start(normalized, None, master_config, template, previous)
+
+    assert second.previous is None
+    assert second.reusable(_combinations(normalized)[0]) is None
+
+
+# 1x1 transparent PNG
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d4944415478da6364f8cf00000302010055c5c41c0000000049454e44ae426082"
+)
+
+
+@pytest.mark.unit
+def test_slides_with_images_and_notes_are_carried(tmp_path, normalized, master_config, template):
+    combinations = _combinations(normalized)[:2]
+    first = IncrementalBuild.start(normalized, None, master_config, template)
+    prs = Presentation(template)
+    _render(prs, first, combinations)
+    # Each combination renders a delimiter, its brand slide and its product slide
+    pictured, linked = prs.slides[1], prs.slides[4]
+    pictured.shapes.add_picture(BytesIO(PNG), Inches(1), Inches(2))
+    pictured.notes_slide.notes_text_frame.text = "speaker notes"
+    linked.part.relate_to(pictured.part, RT.SLIDE)
+    previous = tmp_path / "deck.pptx"
+    prs.save(previous)
+    first.manifest(prs).write(manifest_path_for(previous))
+
+    second = IncrementalBuild.start(normalized, None, master_config, template, previous)
+    prs = Presentation(template)
+    _render(prs, second, combinations)
+
+    assert second.reusable(combinations[0]) is not None
+    # Links to other slides would be lost when the slide is copied on its own
+    assert second.reusable(combinations[1]) is None
+    carried = prs.slides[1]
+    assert carried.shapes[-1].image.blob == PNG
+    assert carried.notes_slide.notes_text_frame.text == "speaker notes"
@@ -0,0 +1,47 @@
+"""Tests for running the post-process workflow on a deck in memory or on disk."""
+
+from __future__ import annotations
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from amp_automation.presentation.postprocess.cli import PostProcessorCLI
+from conftest import find_main_table
+
+
+def _deck_with_merged_table() -> Presentation:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    table = slide.shapes.add_table(3, 3, Inches(1), Inches(1), Inches(6), Inches(2)).table
+    for row_idx, row in enumerate(table.rows):
+        for col_idx, cell in enumerate(row.cells):
+            cell.text = f"{row_idx}.{col_idx}"
+    table.cell(1, 0).merge(table.cell(1, 2))
+    # A slide without a table is skipped
+    prs.slides.add_slide(prs.slide_layouts[6])
+    return prs
+
+
+@pytest.mark.unit
+def test_in_memory_presentation_is_processed_without_saving(tmp_path, monkeypatch):
+    prs = _deck_with_merged_table()
+    monkeypatch.chdir(tmp_path)
+
+    processor = PostProcessorCLI(prs)
+    assert processor.process(["unmerge-all", "normalize-fonts"]) == 0
+
+    assert processor.presentation_path is None
+    assert (processor.total_operations, processor.failed_operations) == (2, 0)
+    assert not find_main_table(prs.slides[0]).cell(1, 0).is_merge_origin
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_presentation_path_is_loaded_and_saved(tmp_path):
+    path = tmp_path / "deck.pptx"
+    _deck_with_merged_table().save(path)
+
+    assert PostProcessorCLI(path, slide_filter=[1]).process(["unmerge-all"]) == 0
+
+    assert not find_main_table(Presentation(path).slides[0]).cell(1, 0).is_merge_origin
@@ -0,0 +1,120 @@
+"""Tests for splicing slides between decks and sharding the market list."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pandas as pd
+import pytest
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.util import Inches
+
+from amp_automation.presentation import assembly
+from amp_automation.presentation.assembly import _market_shards
+from amp_automation.presentation.merge import append_slides
+
+# 1x1 transparent PNG
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d4944415478da6364f8cf00000302010055c5c41c0000000049454e44ae426082"
+)
+
+
+def _source_deck():
+    prs = Presentation()
+    first = prs.slides.add_slide(prs.slide_layouts[6])
+    first.shapes.add_textbox(Inches(1), Inches(1), Inches(3), Inches(1)).text_frame.text = "first"
+    first.shapes.add_picture(BytesIO(PNG), Inches(4), Inches(1))
+    first.notes_slide.notes_text_frame.text = "speaker notes"
+
+    second = prs.slides.add_slide(prs.slide_layouts[5])
+    chart_data = CategoryChartData()
+    chart_data.categories = ["TV", "Digital"]
+    chart_data.add_series("Share", (0.6, 0.4))
+    second.shapes.add_chart(XL_CHART_TYPE.PIE, Inches(1), Inches(1), Inches(4), Inches(3), chart_data)
+    second.shapes.add_picture(BytesIO(PNG), Inches(6), Inches(1))
+    # Link back to the first slide
+    first.shapes[0].click_action.target_slide = second
+    return prs
+
+
+@pytest.mark.unit
+def test_merged_slides_keep_parts_notes_and_links():
+    source = _source_deck()
+    target = Presentation()
+    target.slides.add_slide(target.slide_layouts[0])
+
+    merged = append_slides(target, list(source.slides))
+    reloaded = Presentation(_saved(target))
+
+    assert len(reloaded.slides) == 3
+    first, second = reloaded.slides[1], reloaded.slides[2]
+    assert [shape.shape_type for shape in first.shapes] == [shape.shape_type for shape in source.slides[0].shapes]
+    assert first.shapes[1].image.blob == PNG
+    assert first.notes_slide.notes_text_frame.text == "speaker notes"
+    assert first.shapes[0].click_action.target_slide.slide_id == second.slide_id
+    assert second.slide_layout.name == source.slides[1].slide_layout.name
+
+    chart = next(shape for shape in second.shapes if shape.has_chart).chart
+    assert list(chart.plots[0].categories) == ["TV", "Digital"]
+    assert chart.part.chart_workbook.xlsx_part is not None
+    # The picture used on both slides is stored once
+    images = {rel.target_part.partname for slide in merged for rel in slide.part.rels.values() if rel.reltype == RT.IMAGE}
+    assert len(images) == 1
+
+
+@pytest.mark.unit
+def test_link_to_slide_outside_the_merge_is_dropped():
+    source = _source_deck()
+    target = Presentation()
+
+    append_slides(target, [source.slides[0]])
+    reloaded = Presentation(_saved(target))
+
+    slide = reloaded.slides[0]
+    assert all(rel.reltype != RT.SLIDE for rel in slide.part.rels.values())
+    assert slide.shapes[0].click_action.target_slide is None
+
+
+@pytest.mark.unit
+def test_market_shards_keep_markets_whole_and_in_order():
+    combinations = [("A", "b1", 2025), ("A", "b2", 2025), ("A", "b3", 2025), ("B", "b1", 2025), ("C", "b1", 2025), ("C", "b2", 2025), ("D", "b1", 2025)]
+
+    shards = _market_shards(combinations, 3)
+
+    assert [first for first, _ in shards] == [1, 2, 4]
+    assert [combination for _, shard in shards for combination in shard] == combinations
+    assert _market_shards(combinations, 10) == [(number, [c for c in combinations if c[0] == market]) for number, market in enumerate("ABCD", 1)]
+    assert _market_shards(combinations, 1) == [(1, combinations)]
+
+
+@pytest.mark.unit
+def test_failed_shard_falls_back_to_in_process_rendering(monkeypatch, caplog):
+    def fail(template_path, df, combinations, *args):
+        if combinations[0][0] == "B":
+            raise RuntimeError("worker crashed")
+        return None
+
+    monkeypatch.setattr(assembly, "process_pool", lambda workers, **kwargs: ThreadPoolExecutor(workers))
+    monkeypatch.setattr(assembly, "_render_shard", fail)
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[6])
+    combinations = [("A", "b1", 2025), ("B", "b1", 2025), ("C", "b1", 2025)]
+    df = pd.DataFrame({"Country": ["A", "B", "C"]})
+
+    rendered = assembly._render_sharded(prs, None, df, [(1, combinations[:1]), (2, combinations[1:])], None, {}, None)
+
+    assert rendered is None
+    assert len(prs.slides) == 1
+    assert "markets B to C (sections 2-3) failed (worker crashed)" in caplog.text
+
+
+def _saved(prs) -> BytesIO:
+    buffer = BytesIO()
+    prs.save(buffer)
+    buffer.seek(0)
+    return buffer
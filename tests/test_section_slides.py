@@ -0,0 +1,59 @@
+"""Tests for stamping delimiter slides from per-style prototypes."""
+
+from __future__ import annotations
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+
+from amp_automation.presentation import assembly
+from amp_automation.presentation.section_slides import SectionSlideFactory
+
+
+def _tree_xml(slide) -> bytes:
+    return etree.tostring(slide.shapes._spTree)
+
+
+def _drawn(style, *texts) -> bytes:
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    assembly._SECTION_BUILDERS[style](prs, slide, *texts)
+    return _tree_xml(slide)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("style", "first", "second"),
+    [
+        ("market", ("1.", "UK"), ("2.", "FRANCE")),
+        ("brand", ("1.1.", "PANADOL"), ("1.2.", "SENSODYNE")),
+        ("product_summary", ("1.1.1.",), ("1.2.1.",)),
+        ("brand_total", ("1.1.2.", "PANADOL TOTAL"), ("1.2.2.", "SENSODYNE TOTAL")),
+        ("product", ("1.1.3.", "PRODUCT: COLD & FLU", "PANADOL"), ("1.1.4.", "PRODUCT: EXTRA", "PANADOL")),
+    ],
+)
+def test_stamped_slides_match_drawn_slides(style, first, second):
+    prs = Presentation()
+    sections = SectionSlideFactory(prs, assembly._SECTION_BUILDERS)
+
+    sections.add(style, *first)
+    stamped = sections.add(style, *second)
+
+    assert style in sections._prototypes
+    assert _tree_xml(prs.slides[0]) == _drawn(style, *first)
+    assert _tree_xml(stamped) == _drawn(style, *second)
+
+
+@pytest.mark.unit
+def test_texts_that_are_not_one_run_are_drawn():
+    prs = Presentation()
+    sections = SectionSlideFactory(prs, assembly._SECTION_BUILDERS)
+    sections.add("market", "1.", "UK")
+
+    multi_line = sections.add("market", "2.", "FRANCE\nPARIS")
+    empty = sections.add("market", "3.", "")
+
+    assert _tree_xml(multi_line) == _drawn("market", "2.", "FRANCE\nPARIS")
+    assert _tree_xml(empty) == _drawn("market", "3.", "")
+    # The first drawing of a style is its prototype
+    assert _tree_xml(sections.add("market", "4.", "SPAIN")) == _drawn("market", "4.", "SPAIN")
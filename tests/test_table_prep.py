@@ -0,0 +1,91 @@
+"""Tests for the (optionally multi-process) table preparation stage."""
+
+from __future__ import annotations
+
+import logging
+
+import pandas as pd
+import pytest
+
+from amp_automation.config import load_master_config
+from amp_automation.data import get_tv_metrics_index, load_and_prepare_data
+from amp_automation.presentation import assembly
+
+
+@pytest.fixture
+def configured(master_config):
+    """Small pages; restores the default configuration afterwards."""
+    master_config.data["presentation"]["table"]["max_rows_per_slide"] = 6
+    assembly.configure(master_config)
+    yield master_config
+    assembly.configure(load_master_config())
+
+
+@pytest.fixture
+def normalized(configured, flight_workbook):
+    return load_and_prepare_data(flight_workbook, configured, logging.getLogger("test"), use_cache=False).frame
+
+
+def _same(left, right) -> bool:
+    # Cell metadata holds NaN values, which never compare equal
+    return repr(left) == repr(right)
+
+
+def _combinations(frame):
+    return [tuple(row) for row in frame[["Country", "Brand", "Year"]].drop_duplicates().values.tolist()]
+
+
+@pytest.mark.unit
+def test_table_preparation_is_reentrant(configured, normalized, flight_workbook):
+    combinations = _combinations(normalized)
+    first = {combination: assembly._prepare_combination_tables(normalized, combination, flight_workbook) for combination in combinations}
+    # Preparing other combinations in between must not change a combination's pages
+    for combination in reversed(combinations):
+        assert _same(assembly._prepare_combination_tables(normalized, combination, flight_workbook), first[combination])
+
+    assert any(len(tables.brand) > 1 for tables in first.values())
+    # A product-split brand in the default configuration
+    panadol = next(tables for combination, tables in first.items() if combination[1] == "Panadol C&F")
+    assert panadol.product_summary and panadol.products
+    assert all(splits for splits in panadol.products.values())
+
+    rows, metadata, boundaries = assembly._prepare_main_table_data_detailed(normalized, *combinations[0], flight_workbook)
+    assert boundaries[0][0] == 1 and boundaries[-1][1] == len(rows) - 2
+    assert _same(assembly._split_table_data_by_campaigns(rows, metadata, boundaries), first[combinations[0]].brand)
+
+
+@pytest.mark.unit
+def test_worker_processes_prepare_the_same_tables(configured, normalized, flight_workbook):
+    combinations = _combinations(normalized)
+    tv_metrics_index = get_tv_metrics_index(flight_workbook)
+
+    configured.data["performance"]["optimization"]["max_workers"] = 1
+    with assembly._TablePipeline(normalized, combinations, flight_workbook, tv_metrics_index) as pipeline:
+        serial = {combination: pipeline.get(combination) for combination in combinations}
+    configured.data["performance"]["optimization"]["max_workers"] = 2
+    parallel = {}
+    with assembly._TablePipeline(normalized, combinations, flight_workbook, tv_metrics_index) as pipeline:
+        # Two combinations per worker are prepared ahead of the one being rendered
+        assert len(pipeline._futures) == min(4, len(combinations))
+        for combination in combinations:
+            parallel[combination] = pipeline.get(combination)
+            assert len(pipeline._futures) <= 4
+
+    assert all(tables.brand for tables in serial.values())
+    assert _same(parallel, serial)
+
+
+@pytest.mark.unit
+def test_product_summary_is_prepared_for_a_brands_first_combination_only(configured, normalized, flight_workbook):
+    # A second year of the same brand follows the first one
+    brand_rows = normalized[normalized["Brand"] == "Panadol C&F"]
+    frame = pd.concat([normalized, brand_rows.assign(Year=brand_rows["Year"].astype(int) + 1)], ignore_index=True)
+    market = brand_rows["Country"].iloc[0]
+    year = int(brand_rows["Year"].iloc[0])
+    combinations = [(market, "Panadol C&F", year), (market, "Panadol C&F", year + 1), (market, "Sensodyne", year)]
+
+    with assembly._TablePipeline(frame, combinations, flight_workbook, workers=1) as pipeline:
+        tables = [pipeline.get(combination) for combination in combinations]
+
+    assert tables[0].product_summary and tables[1].brand
+    assert tables[1].product_summary is None
@@ -468,3 +468,122 @@ def test_footer_uses_extracted_date_in_text() -> None:
     # Verify no doubled hyphens or spacing issues
     assert "--" not in footer_text, "Footer should not have doubled hyphens"
     assert "  " not in footer_text, "Footer should not have doubled spaces"
+
+
+def _styled_table_xml(slide, table_data, cell_metadata, style_cell) -> list[bytes]:
+    from lxml import etree
+    from pptx.util import Inches
+
+    table = slide.shapes.add_table(len(table_data), len(table_data[0]), Inches(0.2), Inches(1), Inches(9), Inches(3)).table
+    for row_idx, row_data in enumerate(table_data):
+        for col_idx, value in enumerate(row_data):
+            cell = table.cell(row_idx, col_idx)
+            cell.text = value
+            style_cell(cell, row_idx, col_idx, table_data, cell_metadata)
+    return [etree.tostring(row._tr) for row in table.rows]
+
+
+@pytest.mark.unit
+def test_compiled_cell_styles_match_uncached_styling(blank_presentation, cell_style_context, test_logger) -> None:
+    """Cells styled from compiled prototypes are identical to cells styled property by property."""
+    from amp_automation.presentation.tables import _style_table_cell_uncached, style_table_cell
+
+    months = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+    table_data = [
+        ["CAMPAIGN", "MEDIA", "METRICS", *months, "TOTAL", "GRPs", "%"],
+        ["SPRING LAUNCH CAMPAIGN", "Television", "£ 000", "12.5", "0", *["3"] * 10, "£25K", "120", "50%"],
+        ["-", "-", "GRPS", "40", "", *["-"] * 10, "-", "120", "-"],
+        ["-", "Digital", "META REACH", "0.0%", "7", *["1.5"] * 10, "£20K", "-", "40.0%"],
+        ["MONTHLY TOTAL (£ 000)", "", "", *["10"] * 12, "£45K", "", "100%"],
+        ["-", "-", "-", *["-"] * 12, "-", "-", "-"],
+        ["GRAND TOTAL", "", "", *["10"] * 12, "£45K", "120", "100%"],
+    ]
+    cell_metadata = {
+        (row_idx, col_idx): {"has_data": table_data[row_idx][col_idx] not in ("", "-", "0"), "media_type": media}
+        for row_idx, media in ((1, "TELEVISION"), (3, "DIGITAL"))
+        for col_idx in range(3, 15)
+    }
+    layout = blank_presentation.slide_layouts[6]
+
+    def compiled():
+        return _styled_table_xml(
+            blank_presentation.slides.add_slide(layout),
+            table_data,
+            cell_metadata,
+            lambda cell, *args: style_table_cell(cell, *args, cell_style_context, test_logger),
+        )
+
+    first = compiled()
+    prototypes = len(cell_style_context.compiler._prototypes)
+    second = compiled()
+    uncached = _styled_table_xml(
+        blank_presentation.slides.add_slide(layout),
+        table_data,
+        cell_metadata,
+        lambda cell, *args: _style_table_cell_uncached(cell, *args, cell_style_context, test_logger),
+    )
+
+    assert first == uncached
+    # The second table is styled entirely from prototypes
+    assert second == uncached
+    assert len(cell_style_context.compiler._prototypes) == prototypes
+
+
+@pytest.mark.unit
+def test_cloned_table_is_written_from_template_rows(template_path) -> None:
+    """Rows past the template's are added, sized by kind, bordered and spanned per campaign."""
+    from pptx import Presentation
+    from pptx.oxml.ns import qn
+
+    from amp_automation.presentation import assembly
+    from amp_automation.presentation.template_clone import clone_template_table
+
+    prs = Presentation(template_path)
+    template_slide = prs.slides[0]
+    shape = clone_template_table(template_slide, prs.slides.add_slide(template_slide.slide_layout), assembly.SHAPE_NAME_TABLE)
+    template_row_count = len(shape.table.rows)
+
+    def row(label, media="-", metric="£ 000"):
+        return [label, media, metric, *["5"] * 12, "£60K", "-", "10%"]
+
+    table_data = [
+        ["CAMPAIGN", "MEDIA", "METRICS", "JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC", "TOTAL", "GRPs", "%"],
+        row("SPRING CAMPAIGN", "Television"),
+        row("-", "Digital"),
+        row("-", "OOH"),
+        row("MONTHLY TOTAL (£ 000)", "", ""),
+        row("SHORT CAMPAIGN", "OOH"),
+        row("MONTHLY TOTAL (£ 000)", "", ""),
+        row("LONG RUNNING CAMPAIGN", "Television"),
+        *[row("-", "Digital") for _ in range(template_row_count)],
+        row("MONTHLY TOTAL (£ 000)", "", ""),
+        row("GRAND TOTAL", "", ""),
+        ["-"] * 18,
+    ]
+
+    assert assembly._populate_cloned_table(shape, table_data, {})
+
+    table = shape.table
+    assert len(table.rows) == len(table_data)
+    assert [cell.text for cell in table.rows[5].cells][1:3] == ["OOH", "£ 000"]
+    heights = [(row._tr.h, row._tr.get("hRule")) for row in table.rows]
+    assert heights[0] == (assembly.TABLE_ROW_HEIGHT_HEADER, "exact")
+    assert heights[1] == heights[-4] == (assembly.TABLE_ROW_HEIGHT_BODY, "exact")
+    assert heights[4] == heights[-2] == (assembly.TABLE_ROW_HEIGHT_SUBTOTAL, "exact")
+    assert heights[-1] == (assembly.TABLE_ROW_HEIGHT_TRAILER, "atLeast")
+    assert all(
+        cell._tc.tcPr.find(qn(f"a:{edge}")) is not None
+        for row in table.rows
+        for cell in row.cells
+        for edge in ("lnT", "lnL", "lnB", "lnR")
+    )
+
+    # A multi-row campaign spans its name cell; a single-row one its monthly total label
+    assert table.cell(1, 0).span_height == 3
+    assert table.cell(2, 0).is_spanned and table.cell(3, 0).is_spanned
+    assert not table.cell(4, 0).is_merge_origin
+    assert table.cell(6, 0).span_width == 3
+    assert [table.cell(6, col_idx).text for col_idx in (1, 2)] == ["", ""]
+    # No span is written over cells the template already merged
+    assert not table.cell(7, 0).is_merge_origin
+    assert table.cell(8, 0).text == ""
@@ -0,0 +1,86 @@
+"""Tests for the template shape library and the per-slide shape index."""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from amp_automation.presentation.template_clone import (
+    SlideShapeIndex,
+    TemplateCloneError,
+    clone_template_shape,
+    clone_template_table,
+    shape_library_for,
+)
+
+# 1x1 transparent PNG
+PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d4944415478da6364f8cf00000302010055c5c41c0000000049454e44ae426082"
+)
+
+
+def _template_deck():
+    prs = Presentation()
+    template = prs.slides.add_slide(prs.slide_layouts[6])
+    logo = template.shapes.add_picture(BytesIO(PNG), Inches(1), Inches(1))
+    logo.name = "Logo"
+    box = template.shapes.add_textbox(Inches(2), Inches(1), Inches(2), Inches(1))
+    box.name = "Data"
+    box.text_frame.text = "template text"
+    table = template.shapes.add_table(2, 2, Inches(1), Inches(3), Inches(4), Inches(1))
+    table.name = "Data"
+    group = template.shapes.add_group_shape()
+    group.name = "Legend"
+    group.shapes.add_textbox(Inches(5), Inches(1), Inches(1), Inches(1)).name = "LegendText"
+    return prs, template
+
+
+@pytest.mark.unit
+def test_clones_are_independent_copies_with_their_own_relationships():
+    prs, template = _template_deck()
+    target = prs.slides.add_slide(prs.slide_layouts[6])
+
+    first = clone_template_shape(template, target, "Data")
+    second = clone_template_shape(template, target, "Data")
+    first.text_frame.text = "changed"
+    logo = clone_template_shape(template, target, "Logo")
+    table = clone_template_table(template, target, "Data")
+
+    assert second.text_frame.text == "template text"
+    assert shape_library_for(template).shape("Data").text_frame.text == "template text"
+    assert logo.image.blob == PNG
+    assert logo._element.blip_rId in target.part.rels
+    assert table.has_table
+    assert shape_library_for(prs.slides[0]) is shape_library_for(template)
+    with pytest.raises(TemplateCloneError):
+        clone_template_table(template, target, "Logo")
+
+
+@pytest.mark.unit
+def test_slide_index_tracks_clones_additions_and_removals():
+    prs, template = _template_deck()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.shapes.add_table(1, 1, Inches(1), Inches(1), Inches(1), Inches(1)).name = "Data"
+    shapes = SlideShapeIndex(slide, shape_library_for(template))
+
+    assert shapes.get("Data").has_table
+    assert shapes.get("Data", text_frame=True) is None
+    assert shapes.get("Legend") is None
+
+    shapes.clone("Legend")
+    box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(1), Inches(1))
+    box.name = "Added"
+    shapes.add(box)
+
+    assert shapes.get("Legend").shape_type == shape_library_for(template).shape("Legend").shape_type
+    assert shapes.get("Added").shape_id == box.shape_id
+    # Shapes inside groups are removed too
+    assert shapes.remove("LegendText")
+    assert len(shapes.get("Legend").shapes) == 0
+    assert shapes.remove("Added") and shapes.get("Added") is None
+    assert [shape.name for shape in slide.shapes] == ["Data", "Legend"]
+    assert not shapes.remove("Missing")
@@ -0,0 +1,147 @@
+"""Benchmark the Flight-sheet reader engines on a synthetic BulkPlan workbook.
+
+Writes a Lumina-style Flight sheet (the columns ``BulkPlanAdapter`` consumes
+plus filler columns, as in real exports) and times each available engine of
+``amp_automation.data.sheet_reader`` with and without column projection,
+reporting parse time and peak Python memory.
+
+Usage:
+    python tools/benchmark_sheet_reader.py --rows 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from openpyxl import Workbook
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from amp_automation.data.adapters import BulkPlanAdapter  # noqa: E402
+from amp_automation.data.sheet_reader import available_engines, read_sheet  # noqa: E402
+
+DEFAULT_ROWS = 500_000
+DEFAULT_FILLER_COLUMNS = 60
+
+
+def write_workbook(path: Path, rows: int, filler_columns: int, seed: int = 7) -> None:
+    """Write a synthetic Flight sheet with ``rows`` data rows."""
+    rng = np.random.default_rng(seed)
+    geographies = np.array([
+        "Global | EMEA | MEA | KSA",
+        "Global | EMEA | MEA | East Africa | Kenya",
+        "Global | EMEA | MEA | Egypt",
+        "Global | EMEA | MEA | GINE",
+    ])
+    brands = np.array(["Haleon | Panadol", "Haleon | Sensodyne", "Haleon | Voltaren"])
+    media = np.array(["Television", "Digital", "OOH", "Radio"])
+    months = np.array(["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+
+    header = list(BulkPlanAdapter.SOURCE_COLUMNS) + [f"Filler {index}" for index in range(filler_columns)]
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Flight")
+    sheet.append(header)
+
+    chunk = 50_000
+    for start in range(0, rows, chunk):
+        size = min(chunk, rows - start)
+        geo = rng.choice(geographies, size)
+        brand = rng.choice(brands, size)
+        media_type = rng.choice(media, size)
+        month = rng.choice(months, size)
+        cost = rng.integers(100, 50_000, size).astype(float)
+        grp = rng.integers(1, 400, size).astype(float)
+        campaign = rng.integers(0, 400, size)
+        filler = rng.integers(0, 1_000, (size, filler_columns))
+        for index in range(size):
+            is_tv = media_type[index] == "Television"
+            sheet.append([
+                f"Plan {index % 20}",
+                geo[index],
+                2025,
+                brand[index],
+                media_type[index],
+                "Pain | Panadol Extra",
+                f"CAMPAIGN-{campaign[index]}",
+                "Brand",
+                "Awareness",
+                cost[index],
+                grp[index] if is_tv else None,
+                3.5 if is_tv else None,
+                0.6 if is_tv else None,
+                0.3 if is_tv else None,
+                month[index],
+                None,
+                "",
+                *filler[index].tolist(),
+            ])
+    workbook.save(path)
+
+
+def _measure(label: str, func, *, trace_memory: bool) -> dict[str, object]:
+    """Time ``func``; peak memory comes from a second, traced run (tracing skews timing)."""
+    gc.collect()
+    started = time.perf_counter()
+    frame = func()
+    elapsed = time.perf_counter() - started
+    shape = frame.shape
+    del frame
+
+    peak_mb = float("nan")
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_mb = peak / (1024 * 1024)
+    return {"label": label, "seconds": elapsed, "peak_mb": peak_mb, "shape": shape}
+
+
+def run_benchmark(path: Path, engines: list[str], *, trace_memory: bool = True) -> list[dict[str, object]]:
+    results = [
+        _measure("pandas (all columns)", lambda: read_sheet(path, "Flight", engine="pandas"), trace_memory=trace_memory)
+    ]
+    for engine in engines:
+        results.append(
+            _measure(
+                f"{engine} (projected)",
+                lambda engine=engine: read_sheet(path, "Flight", BulkPlanAdapter.SOURCE_COLUMNS, engine=engine),
+                trace_memory=trace_memory,
+            )
+        )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Flight-sheet reader engines")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="Data rows in the synthetic sheet")
+    parser.add_argument("--filler-columns", type=int, default=DEFAULT_FILLER_COLUMNS, help="Unused columns to add")
+    parser.add_argument("--workbook", type=Path, help="Reuse/write the synthetic workbook at this path")
+    parser.add_argument("--engine", action="append", choices=available_engines(), help="Engines to time (default: all)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced peak-memory runs")
+    args = parser.parse_args()
+
+    path = args.workbook or PROJECT_ROOT / "temp" / f"benchmark_flight_{args.rows}.xlsx"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        write_workbook(path, args.rows, args.filler_columns)
+        print(f"Wrote {path} in {time.perf_counter() - started:.1f}s")
+
+    print(f"{'engine':<24}{'seconds':>10}{'peak MB':>12}  shape")
+    for result in run_benchmark(path, args.engine or available_engines(), trace_memory=not args.no_memory):
+        print(f"{result['label']:<24}{result['seconds']:>10.2f}{result['peak_mb']:>12.1f}  {result['shape']}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())